@@ -165,6 +165,10 @@ def load_payload_data():
         logging.error(f"读取配置文件时发生错误: {e}")
         return None
 
+    return build_payload_data(surge_config_content, clash_yaml_content, singbox_json_content)
+
+def build_payload_data(surge_config_content, clash_yaml_content, singbox_json_content):
+    """由三种配置文本组装请求体"""
     return {
         "subscribe_template_surfboard": surge_config_content,
         "subscribe_template_stash": clash_yaml_content,
@@ -174,8 +178,13 @@ def load_payload_data():
         "subscribe_template_clashmeta": clash_yaml_content
     }
 
-def main():
-    payload_data = load_payload_data()
+def main(payload_data=None):
+    """
+    :param payload_data: (可选) 已生成好的请求体 (如 ss2all.py 的转换结果)，
+                         为 None 时从 FILE_PATHS 读取配置文件
+    """
+    if payload_data is None:
+        payload_data = load_payload_data()
     if not payload_data:
         sys.exit(1)
 
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+一次读取、一次解析，同时生成 Clash / sing-box / Surge 三种配置，转换逻辑在 ss_all.py 中。
+用法: python3 ss2all.py output.txt [--post]
+"""
+
+from ss_all import main  # 需与本脚本位于同一目录
+
+if __name__ == '__main__':
+    payload_data = main()
+    if payload_data is not None:
+        import post
+        post.main(payload_data)
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ss2all.py 的转换逻辑：一次读取、一次解析，同时生成 Clash / sing-box / Surge 三种配置，
+代替依次运行 ss2clash.py、ss2singbox.py、ss2surge.py。main() 返回 post.py 的上传数据 (未指定 --post 时为 None)。
+需要与 ss_clash.py、ss_clash_template.py、ss_singbox.py、ss_surge.py、ss_common.py 放在同一目录。
+"""
+
+import argparse
+import sys
+import json
+import io
+
+import ss_clash
+import ss_singbox
+import ss_surge
+from ss_common import NameDeduper, WarningSummary, ParseWarning, WARN_RENAME, WARNING_EXAMPLE_LIMIT, parse_link_file, print_warning
+
+# 默认输出文件，与 post.py 中的 FILE_PATHS 保持一致
+DEFAULT_OUTPUT_FILES = {
+    'clash': 'clash.yaml',
+    'singbox': 'singbox.json',
+    'surge': 'surge_config.conf'
+}
+
+
+def collect_nodes(input_file, jobs=1, warn=print_warning):
+    """
+    读取并解析链接文件，返回 (nodes, surge_names)。
+    nodes 为去重后的 SocksNode 列表，其 name 为 Clash / sing-box 使用的名称；
+    surge_names 与 nodes 一一对应，为 Surge 使用的名称 (空格替换为下划线后单独去重)。
+    两者与分别运行三个脚本得到的名称一致。jobs > 1 时使用多进程解析，结果不变。
+    无效链接和重名以 ss_common.ParseWarning 调用 warn。
+    """
+    nodes = []
+    deduper = NameDeduper()
+    surge_deduper = NameDeduper()
+
+    for line_number, node in parse_link_file(input_file, jobs, warn):
+        original_name = node.name
+        surge_name = ss_surge.surge_proxy_name(node)
+
+        node.name = deduper.claim(original_name)
+        if node.name != original_name:
+            warn(ParseWarning(WARN_RENAME, line_number, f"代理名称 '{original_name}' 重复。已重命名为 '{node.name}'。"))
+
+        final_surge_name = surge_deduper.claim(surge_name)
+        # 只有空格替换造成的额外重名才需要单独提示
+        if final_surge_name != ss_surge.surge_proxy_name(node):
+            warn(ParseWarning(WARN_RENAME, line_number, f"Surge 代理名称 '{surge_name}' 重复。已重命名为 '{final_surge_name}'。"))
+
+        nodes.append(node)
+
+    return nodes, surge_deduper.names
+
+
+def write_clash(nodes, out, cache_dir=ss_clash.TEMPLATE_CACHE_DIR):
+    """将节点写为 Clash YAML 配置。"""
+    proxy_names = [node.name for node in nodes]
+    clash_config = ss_clash.build_clash_config(ss_clash.ClashProxiesView(nodes), proxy_names, cache_dir)
+    ss_clash.write_clash_config(clash_config, out, rules_text=ss_clash.template_rules_block())
+
+
+def write_singbox(nodes, out):
+    """将节点写为 sing-box JSON 配置。"""
+    outbounds_list = [ss_singbox.singbox_outbound_from_node(node) for node in nodes]
+    outbound_tags = [node.name for node in nodes]
+    singbox_config = ss_singbox.build_singbox_config(outbounds_list, outbound_tags)
+    out.write(json.dumps(singbox_config, indent=2, ensure_ascii=False))
+
+
+def write_surge(nodes, surge_names, out):
+    """将节点写为 Surge .conf 配置。"""
+    proxy_lines = (ss_surge.surge_proxy_line(name, node) for name, node in zip(surge_names, nodes))
+    out.write(ss_surge.build_surge_config(proxy_lines, surge_names))
+
+
+def convert_all(nodes, surge_names, output_files, return_payload=False):
+    """
+    将 collect_nodes 的结果依次写入 output_files ({目标: 文件路径}，路径为 None 时不写文件)。
+    return_payload 为 True 时返回 post.py 所需的请求体字典，无需再从磁盘读回配置文件；
+    否则各配置直接流式写入文件，返回 None。
+    """
+    writers = {
+        'clash': lambda out: write_clash(nodes, out),
+        'singbox': lambda out: write_singbox(nodes, out),
+        'surge': lambda out: write_surge(nodes, surge_names, out)
+    }
+
+    contents = {}
+    for target, writer in writers.items():
+        path = output_files.get(target)
+        if return_payload:
+            buffer = io.StringIO()
+            writer(buffer)
+            contents[target] = buffer.getvalue()
+            if path:
+                with open(path, 'w', encoding='utf-8') as f_out:
+                    f_out.write(contents[target])
+        elif path:
+            with open(path, 'w', encoding='utf-8') as f_out:
+                writer(f_out)
+
+    if not return_payload:
+        return None
+
+    from post import build_payload_data  # post.py 依赖 requests，仅在需要时导入
+    return build_payload_data(contents['surge'], contents['clash'], contents['singbox'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="解析一次TXT文件中的SOCKS链接，同时生成Clash、sing-box和Surge配置。")
+    parser.add_argument("input_file", help="包含SOCKS链接的TXT文件路径 (每行一个链接)。")
+    parser.add_argument("--clash", default=DEFAULT_OUTPUT_FILES['clash'], help=f"Clash YAML 输出路径 (默认 {DEFAULT_OUTPUT_FILES['clash']})。")
+    parser.add_argument("--singbox", default=DEFAULT_OUTPUT_FILES['singbox'], help=f"sing-box JSON 输出路径 (默认 {DEFAULT_OUTPUT_FILES['singbox']})。")
+    parser.add_argument("--surge", default=DEFAULT_OUTPUT_FILES['surge'], help=f"Surge .conf 输出路径 (默认 {DEFAULT_OUTPUT_FILES['surge']})。")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="解析链接使用的进程数 (默认 1)。超大文件可设为CPU核数，输出与单进程完全一致。")
+    parser.add_argument("--post", action="store_true", help="生成后直接调用 post.py 上传，不再从磁盘读回配置文件。")
+    parser.add_argument("--warning-limit", type=int, default=WARNING_EXAMPLE_LIMIT, metavar="N", help=f"每种警告 (无效协议、缺少主机或端口、解析错误、重名) 只显示前 N 条，其余只计数并在最后汇总 (默认 {WARNING_EXAMPLE_LIMIT})。")
+    parser.add_argument("--warnings-json", metavar="FILE", help="把按原因汇总的警告 (条数和前 N 条示例) 写为 JSON 文件。")
+
+    args = parser.parse_args()
+    import yaml  # 需要安装 PyYAML: pip install PyYAML；-h 时不导入
+    warnings = WarningSummary(args.warning_limit)  # 按原因计数，只保留前 N 条示例，内存占用与输入大小无关
+
+    try:
+        nodes, surge_names = collect_nodes(args.input_file, args.jobs, warnings)
+    except FileNotFoundError:
+        print(f"错误: 输入文件 '{args.input_file}' 未找到。", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"错误: 读取或处理文件 '{args.input_file}' 时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    warnings.report()
+    if args.warnings_json:
+        warnings.write_json(args.warnings_json)
+
+    if not nodes:
+        print("输入文件中未找到有效的SOCKS链接。未生成配置。", file=sys.stderr)
+        sys.exit(0)
+
+    output_files = {'clash': args.clash, 'singbox': args.singbox, 'surge': args.surge}
+    try:
+        payload_data = convert_all(nodes, surge_names, output_files, return_payload=args.post)
+    except yaml.YAMLError as e:
+        print(f"错误: 内部YAML模板解析失败: {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"错误: 生成或写入配置时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for target, path in output_files.items():
+        print(f"{target} 配置已成功写入到 '{path}'")
+
+    return payload_data
@@ -0,0 +1,635 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SOCKS 链接转换脚本的性能测试。
+用法: python3 ss_bench.py dedupe --lines 200000
+      python3 ss_bench.py reader --lines 2000000
+      python3 ss_bench.py phases --sizes 1000,100000 -o results.json [--compare old.json]
+      python3 ss_bench.py golden [socks_links.txt]
+      python3 ss_bench.py yaml --lines 100000
+      python3 ss_bench.py startup [--baseline /tmp/base] [--importtime 8]
+      python3 ss_bench.py audit --lines 200000 -j 4
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from ss_common import NameDeduper, WarningSummary, iter_link_lines, iter_link_lines_mmap, parse_socks_node  # 需与本脚本位于同一目录
+
+
+def generate_names(count, collision_rate, seed=0):
+    """生成 count 个节点名称，其中约 collision_rate 比例使用同一个名称 (模拟大量 "#Ningbo1")。"""
+    rng = random.Random(seed)
+    names = []
+    for i in range(count):
+        if rng.random() < collision_rate:
+            names.append("Ningbo1")
+        else:
+            # 少量名称带 _N 后缀，覆盖与自动重命名结果撞名的情况
+            names.append(f"Node{rng.randint(1, count // 10 + 1)}" + (f"_{rng.randint(2, 5)}" if rng.random() < 0.05 else ""))
+    return names
+
+
+def generate_link_file(path, count, collision_rate=0.3, auth_rate=0.5, junk_rate=0.1, seed=0):
+    """
+    生成包含 count 行的合成链接文件：约 collision_rate 比例的节点同名，auth_rate 比例带认证信息，
+    junk_rate 比例为空行、注释或无效链接。
+    """
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        for i in range(count):
+            r = rng.random()
+            if r < junk_rate:
+                f.write(rng.choice(["", "# 注释", f"http://10.0.0.{i % 256}:80#bad", f"socks://10.0.0.{i % 256}#noport"]) + "\n")
+                continue
+            host = f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+            port = rng.randint(1024, 65535)
+            auth = "Og%3D%3D@" if rng.random() < auth_rate else ""
+            name = "Ningbo1" if rng.random() < collision_rate else f"Node{i}"
+            f.write(f"socks://{auth}{host}:{port}#{name}\n")
+
+
+def legacy_read_lines(input_file):
+    """原先各转换脚本中的文本模式逐行读取，作为对照。"""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        for i, line in enumerate(f):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            yield i + 1, line
+
+
+READERS = {
+    'text': legacy_read_lines,
+    'mmap': iter_link_lines_mmap
+}
+
+
+def peak_rss_mb():
+    """当前进程的峰值常驻内存 (MB)。"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux 上单位为 KB，macOS 上为字节
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def legacy_dedupe(names):
+    """原先各转换脚本中的列表 + while 循环去重，作为对照。"""
+    result = []
+    for original_name in names:
+        name_to_check = original_name
+        count = 1
+        while name_to_check in result:
+            count += 1
+            name_to_check = f"{original_name}_{count}"
+        result.append(name_to_check)
+    return result
+
+
+def bench_dedupe(args):
+    names = generate_names(args.lines, args.collision_rate, args.seed)
+
+    start = time.perf_counter()
+    deduper = NameDeduper()
+    for name in names:
+        deduper.claim(name)
+    elapsed = time.perf_counter() - start
+    print(f"NameDeduper: {len(names)} 个名称, 耗时 {elapsed:.3f}s")
+
+    if args.legacy_lines:
+        subset = names[:args.legacy_lines]
+        start = time.perf_counter()
+        legacy = legacy_dedupe(subset)
+        legacy_elapsed = time.perf_counter() - start
+        print(f"原列表去重: {len(subset)} 个名称, 耗时 {legacy_elapsed:.3f}s")
+        if legacy != deduper.names[:len(subset)]:
+            print("错误: NameDeduper 的结果与原去重逻辑不一致。", file=sys.stderr)
+            sys.exit(1)
+        print("结果与原去重逻辑一致。")
+
+
+def run_reader(args):
+    """在独立子进程中运行单个读取方式，以 JSON 输出耗时和峰值内存。"""
+    start = time.perf_counter()
+    lines = sum(1 for _ in READERS[args.reader](args.input_file))
+    print(json.dumps({
+        'reader': args.reader,
+        'lines': lines,
+        'seconds': time.perf_counter() - start,
+        'peak_rss_mb': peak_rss_mb()
+    }))
+
+
+def bench_reader(args):
+    input_file = args.input_file
+    tmp_dir = None
+    if not input_file:
+        tmp_dir = tempfile.TemporaryDirectory()
+        input_file = os.path.join(tmp_dir.name, "links.txt")
+        generate_link_file(input_file, args.lines, junk_rate=args.junk_rate, seed=args.seed)
+    print(f"输入文件: {input_file} ({os.path.getsize(input_file) / (1024 * 1024):.1f} MB)")
+
+    try:
+        results = []
+        for reader in READERS:
+            # 每种读取方式在单独的进程中运行，峰值内存互不影响
+            output = subprocess.run([sys.executable, os.path.abspath(__file__), "_run-reader", reader, input_file],
+                                    check=True, capture_output=True, text=True).stdout
+            results.append(json.loads(output))
+    finally:
+        if tmp_dir:
+            tmp_dir.cleanup()
+
+    for result in results:
+        print(f"{result['reader']:>5}: {result['lines']} 行有效链接, 耗时 {result['seconds']:.3f}s, 峰值内存 {result['peak_rss_mb']:.1f} MB")
+    if len({result['lines'] for result in results}) != 1:
+        print("错误: 不同读取方式得到的行数不一致。", file=sys.stderr)
+        sys.exit(1)
+
+
+PHASE_TARGETS = ('clash', 'singbox', 'surge')
+
+
+def phase_target_steps():
+    """
+    phases 子命令中每种输出格式的 (模板加载, 序列化) 函数。模板加载包含填入节点，序列化写入内存缓冲区。
+    转换脚本在这里才导入，dedupe / reader 子命令不依赖 PyYAML。
+    """
+    import ss_clash
+    import ss_singbox
+    import ss_surge
+
+    return {
+        'clash': (
+            lambda nodes, names, cache_dir: ss_clash.build_clash_config(ss_clash.ClashProxiesView(nodes), names, cache_dir),
+            lambda config, out: ss_clash.write_clash_config(config, out, rules_text=ss_clash.template_rules_block())
+        ),
+        'singbox': (
+            lambda nodes, names, cache_dir: ss_singbox.build_singbox_config([ss_singbox.singbox_outbound_from_node(node) for node in nodes], names),
+            lambda config, out: out.write(json.dumps(config, indent=2, ensure_ascii=False))
+        ),
+        'surge': (
+            None,  # Surge 配置由代码直接拼接，没有模板
+            lambda nodes_and_names, out: out.write(ss_surge.build_surge_config(
+                [ss_surge.surge_proxy_line(name, node) for node, name in zip(*nodes_and_names)], nodes_and_names[1]))
+        )
+    }
+
+
+def timed(func, *args):
+    """运行 func(*args)，返回 (结果, 耗时秒数)。"""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_phases(input_file, target_steps, cache_dir, output_dir):
+    """
+    按转换脚本的实际流程逐阶段计时：read (读取并过滤行)、parse (parse_socks_node)、dedupe，
+    以及每种格式的 template_load (加载模板并填入节点)、serialize (生成配置文本) 和 write (写入文件)。
+    parse 的警告与转换脚本一样交给 WarningSummary 计数，只是不打印。
+    """
+    phases = {}
+    lines, phases['read'] = timed(lambda: list(iter_link_lines(input_file)))
+
+    def parse_all():
+        warnings = WarningSummary(echo=False)
+        return [node for node in (parse_socks_node(line_number, line, warnings) for line_number, line in lines) if node]
+    nodes, phases['parse'] = timed(parse_all)
+
+    def dedupe_all():
+        deduper = NameDeduper()
+        for node in nodes:
+            node.name = deduper.claim(node.name)
+        return deduper.names
+    names, phases['dedupe'] = timed(dedupe_all)
+
+    result = {'valid_nodes': len(nodes), 'phases': phases, 'targets': {}}
+    for target, (load, serialize) in target_steps.items():
+        target_phases = {}
+        if load:
+            config, target_phases['template_load'] = timed(load, nodes, names, cache_dir)
+        else:
+            config = (nodes, names)
+        buffer = io.StringIO()
+        _, target_phases['serialize'] = timed(serialize, config, buffer)
+
+        def write_output():
+            with open(os.path.join(output_dir, target), 'w', encoding='utf-8') as f_out:
+                f_out.write(buffer.getvalue())
+        _, target_phases['write'] = timed(write_output)
+        target_phases['output_mb'] = os.path.getsize(os.path.join(output_dir, target)) / (1024 * 1024)
+        result['targets'][target] = target_phases
+    return result
+
+
+def git_commit():
+    """本脚本所在仓库的当前提交，无法获取时为 None。"""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def case_key(case):
+    return (case['lines'], case['collision_rate'], case['auth_rate'])
+
+
+def print_case(case, baseline=None):
+    """打印一个用例各阶段的耗时，提供 baseline 时附上与之相比的倍数。"""
+    def fmt(name, seconds, base_phases):
+        text = f"{name} {seconds:.3f}s"
+        if base_phases and base_phases.get(name):
+            text += f" ({seconds / base_phases[name]:.2f}x)"
+        return text
+
+    print(f"{case['lines']} 行, 重名 {case['collision_rate']}, 认证 {case['auth_rate']}: {case['valid_nodes']} 个有效节点")
+    base = baseline['phases'] if baseline else None
+    print("  " + ", ".join(fmt(name, seconds, base) for name, seconds in case['phases'].items()))
+    for target, target_phases in case['targets'].items():
+        base = baseline['targets'].get(target) if baseline else None
+        parts = [fmt(name, value, base) for name, value in target_phases.items() if name != 'output_mb']
+        print(f"  {target:>7}: " + ", ".join(parts) + f", 输出 {target_phases['output_mb']:.1f} MB")
+
+
+def bench_phases(args):
+    steps = phase_target_steps()
+    target_steps = {target: steps[target] for target in args.targets}
+
+    baseline = {}
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = {case_key(case): case for case in json.load(f)['cases']}
+
+    results = {
+        'meta': {
+            'commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'time': datetime.datetime.now().isoformat(timespec='seconds'),
+            'template_cache': not args.no_template_cache,
+            'seed': args.seed
+        },
+        'cases': []
+    }
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = None if args.no_template_cache else os.path.join(tmp_dir, "cache")
+        if cache_dir and 'clash' in target_steps:
+            import ss_clash
+            ss_clash.load_clash_template(cache_dir)  # 预先生成模板缓存，测的是日常运行的情况
+
+        for lines in args.sizes:
+            for collision_rate in args.collision_rates:
+                for auth_rate in args.auth_rates:
+                    input_file = os.path.join(tmp_dir, "links.txt")
+                    generate_link_file(input_file, lines, collision_rate, auth_rate, args.junk_rate, args.seed)
+                    case = {'lines': lines, 'collision_rate': collision_rate, 'auth_rate': auth_rate}
+                    case.update(run_phases(input_file, target_steps, cache_dir, tmp_dir))
+                    results['cases'].append(case)
+                    print_case(case, baseline.get(case_key(case)))
+
+    if args.output_file:
+        with open(args.output_file, 'w', encoding='utf-8') as f_out:
+            json.dump(results, f_out, indent=2, ensure_ascii=False)
+        print(f"结果已写入到 '{args.output_file}'")
+
+
+def golden_variants():
+    """
+    golden 子命令对照的 (名称, 完整生成, 片段拼接) 列表。完整生成先构造整个配置再序列化 (ss2all.py 仍使用这条路径)，
+    片段拼接与 ss2clash.py / ss2singbox.py 的默认输出相同；两者都接收 (nodes, names, cache_dir)，返回 UTF-8 bytes。
+    """
+    import ss_clash
+    import ss_singbox
+
+    def clash_full(optimize_rules=False, rule_providers=None):
+        def render(nodes, names, cache_dir):
+            config = ss_clash.build_clash_config(ss_clash.ClashProxiesView(nodes), list(names), cache_dir, optimize_rules, rule_providers)
+            buffer = io.StringIO()
+            rules_text = None if optimize_rules or rule_providers else ss_clash.template_rules_block()
+            ss_clash.write_clash_config(config, buffer, rules_text=rules_text)
+            return buffer.getvalue().encode('utf-8')
+        return render
+
+    def clash_spliced(optimize_rules=False, rule_providers=None):
+        def render(nodes, names, cache_dir):
+            buffer = io.BytesIO()
+            fragments = ss_clash.clash_cached_fragments(cache_dir, optimize_rules, rule_providers)
+            ss_clash.write_clash_spliced(fragments, nodes, names, buffer)
+            return buffer.getvalue()
+        return render
+
+    def singbox_full(local_rule_sets=None):
+        def render(nodes, names, cache_dir):
+            config = ss_singbox.build_singbox_config([ss_singbox.singbox_outbound_from_node(node) for node in nodes], list(names),
+                                                     local_rule_sets)
+            return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+        return render
+
+    def singbox_spliced(local_rule_sets=None):
+        def render(nodes, names, cache_dir):
+            buffer = io.BytesIO()
+            ss_singbox.write_singbox_spliced(ss_singbox.singbox_cached_fragments(cache_dir, local_rule_sets), nodes, names, buffer)
+            return buffer.getvalue()
+        return render
+
+    # 只影响配置内容的选项，不写出 provider / rule-set 文件
+    rule_providers = ss_clash.RuleProviderOptions(None, './providers', 'yaml', None)
+    local_rule_sets = ss_singbox.LocalRuleSetOptions(None, './rule-sets', 'source', False, None)
+    return [
+        ('clash', clash_full(), clash_spliced()),
+        ('clash --optimize-rules', clash_full(True), clash_spliced(True)),
+        ('clash --rule-providers', clash_full(rule_providers=rule_providers), clash_spliced(rule_providers=rule_providers)),
+        ('singbox', singbox_full(), singbox_spliced()),
+        ('singbox --rule-sets', singbox_full(local_rule_sets), singbox_spliced(local_rule_sets)),
+    ]
+
+
+def golden(args):
+    """
+    对照完整生成与片段拼接两条路径的输出：先比较字节，再比较 yaml.safe_load / json.loads 的结果。
+    片段拼接各运行两次，分别覆盖生成片段缓存和读取片段缓存的情况。有任何不一致时以状态码 1 退出。
+    """
+    import yaml
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = args.input_file
+        if not input_file:
+            input_file = os.path.join(tmp_dir, "links.txt")
+            generate_link_file(input_file, args.lines, seed=args.seed)
+        with contextlib.redirect_stderr(io.StringIO()):
+            nodes = [node for line_number, line in iter_link_lines(input_file) for node in [parse_socks_node(line_number, line)] if node]
+        deduper = NameDeduper()
+        for node in nodes:
+            node.name = deduper.claim(node.name)
+        names = deduper.names
+
+        failures = 0
+        cache_dir = os.path.join(tmp_dir, "cache")
+        for name, full, spliced in golden_variants():
+            # 完整生成运行两次，第二次的耗时不含首次解析模板 (模板解析缓存已生成)
+            expected, full_seconds = [timed(full, nodes, names, cache_dir) for _ in range(2)][-1]
+            outputs = [timed(spliced, nodes, names, cache_dir) for _ in range(2)]
+            load = json.loads if name.startswith('singbox') else yaml.safe_load
+            problems = []
+            for run, (output, _) in zip(("生成缓存", "读取缓存"), outputs):
+                if output != expected:
+                    same = load(output.decode('utf-8')) == load(expected.decode('utf-8'))
+                    problems.append(f"{run}时字节不同" + ("，解析结果相同" if same else "，解析结果也不同"))
+            status = "一致" if not problems else "；".join(problems)
+            print(f"{name:>24}: {status} ({len(expected) / (1024 * 1024):.1f} MB, 完整生成 {full_seconds:.3f}s, "
+                  f"片段拼接 {outputs[0][1]:.3f}s / 命中缓存 {outputs[1][1]:.3f}s)")
+            failures += bool(problems)
+
+    print(f"{len(nodes)} 个节点，{failures} 个对照不一致。", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+def bench_yaml(args):
+    """
+    对比 PyYAML 纯 Python 实现 (SafeLoader / SafeDumper) 与 libyaml (CSafeLoader / CSafeDumper)：
+    解析 Clash 模板、yaml.dump 整个配置、以及 write_clash_config 流式写出 (只有小段经过 yaml.dump) 的耗时。
+    未编译 libyaml 时只测纯 Python 实现。两种实现的解析结果和写出结果不一致时以状态码 1 退出。
+    """
+    import yaml
+    import ss_clash
+    from ss_clash_template import CLASH_TEMPLATE_YAML
+
+    implementations = [('python', yaml.SafeLoader, yaml.SafeDumper)]
+    if hasattr(yaml, 'CSafeLoader'):
+        implementations.append(('libyaml', yaml.CSafeLoader, yaml.CSafeDumper))
+    else:
+        print("警告: PyYAML 未编译 libyaml，只测试纯 Python 实现。", file=sys.stderr)
+    print(f"ss2clash.py 当前使用: {ss_clash.clash_yaml()[2]}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_file = os.path.join(tmp_dir, "links.txt")
+        generate_link_file(input_file, args.lines, seed=args.seed)
+        with contextlib.redirect_stderr(io.StringIO()):
+            nodes = [node for line_number, line in iter_link_lines(input_file) for node in [parse_socks_node(line_number, line)] if node]
+    deduper = NameDeduper()
+    for node in nodes:
+        node.name = deduper.claim(node.name)
+
+    results = {}
+    for name, loader, dumper in implementations:
+        template, load_seconds = timed(yaml.load, CLASH_TEMPLATE_YAML, loader)
+        config = ss_clash.build_clash_config([ss_clash.clash_proxy_from_node(node) for node in nodes], list(deduper.names), None)
+        dumped, dump_seconds = timed(lambda: yaml.dump(config, Dumper=dumper, **ss_clash.YAML_DUMP_OPTIONS))
+
+        def stream():
+            buffer = io.StringIO()
+            ss_clash.write_clash_config(config, buffer, rules_text=ss_clash.template_rules_block())
+            return buffer.getvalue()
+        saved = ss_clash.clash_yaml
+        ss_clash.clash_yaml = lambda: (loader, dumper, name)  # 临时替换 write_clash_config 使用的写出器
+        try:
+            streamed, stream_seconds = timed(stream)
+        finally:
+            ss_clash.clash_yaml = saved
+        results[name] = (template, yaml.load(dumped, loader), streamed)
+        print(f"{name:>8}: 模板解析 {load_seconds:.3f}s, yaml.dump 整个配置 {dump_seconds:.3f}s ({len(dumped) / (1024 * 1024):.1f} MB), "
+              f"write_clash_config {stream_seconds:.3f}s")
+
+    outputs = list(results.values())
+    problems = [label for index, label in enumerate(("模板解析结果", "整个配置 dump 后的解析结果", "write_clash_config 输出"))
+                if any(output[index] != outputs[0][index] for output in outputs[1:])]
+    print(f"{len(nodes)} 个节点，" + (f"两种实现的{'、'.join(problems)}不一致。" if problems else "两种实现的结果一致。"), file=sys.stderr)
+    if problems:
+        sys.exit(1)
+
+
+STARTUP_SCRIPTS = ('ss2clash', 'ss2singbox', 'ss2surge')
+
+
+def median_run_ms(command, cwd, env, repeat):
+    """在 cwd 中以 python3 运行 command repeat 次，返回墙钟时间中位数 (毫秒)。第一次运行预先生成 .pyc，不计入。"""
+    import statistics
+
+    subprocess.run([sys.executable, *command], cwd=cwd, env=env, capture_output=True)
+    seconds = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *command], cwd=cwd, env=env, capture_output=True, check=True)
+        seconds.append(time.perf_counter() - start)
+    return statistics.median(seconds) * 1000
+
+
+def top_level_imports(script, cwd, env):
+    """python3 -X importtime 脚本.py -h 中的顶层导入，返回 [(累计微秒, 模块名), ...]，按耗时从大到小排列。"""
+    stderr = subprocess.run([sys.executable, "-X", "importtime", f"{script}.py", "-h"], cwd=cwd, env=env,
+                            capture_output=True, text=True).stderr
+    # 格式: "import time: self [us] | cumulative | imported package"，只看顶层 (包名前没有缩进) 的导入
+    return sorted(((int(cumulative), name.strip()) for _, cumulative, name in
+                   (line.split('|') for line in stderr.splitlines() if line.startswith("import time:") and '|' in line)
+                   if cumulative.strip().isdigit() and not name.startswith('  ')), reverse=True)
+
+
+def bench_startup(args):
+    """
+    各转换脚本的启动耗时：以 `python3 脚本.py -h` 和 `python3 -m 脚本 -h` 运行 repeat 次，取墙钟时间的中位数。
+    启动时间主要是编译 (直接运行的脚本作为 __main__ 不会缓存 .pyc) 和导入模块；
+    --baseline 为另一个提交的检出目录 (如 git worktree add /tmp/base <提交>)，同样的命令在其中运行作为对照；
+    --importtime 时再用 python3 -X importtime 列出累计耗时最多的顶层导入及顶层导入的合计。
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)  # 测的是日常运行的情况，被导入的模块使用 .pyc 缓存
+    directories = [('当前', script_dir)] + ([('基准', args.baseline)] if args.baseline else [])
+    for script in STARTUP_SCRIPTS:
+        for command in ([f"{script}.py", "-h"], ["-m", script, "-h"]):
+            timings = [f"{label} {median_run_ms(command, cwd, env, args.repeat):.1f} ms" for label, cwd in directories]
+            print(f"{' '.join(command):>20}: {', '.join(timings)}")
+        if args.importtime:
+            for label, cwd in directories:
+                imports = top_level_imports(script, cwd, env)
+                print(f"{'':>22}{label}: 顶层导入合计 {sum(cumulative for cumulative, _ in imports) / 1000:.1f} ms")
+                for cumulative, name in imports[:args.importtime]:
+                    print(f"{'':>24}{name:<20} {cumulative / 1000:.1f} ms")
+
+
+def generate_audit_log(path, count, blank_rate=0.05, seed=0, csv_format=False):
+    """
+    生成 ss_match.py audit 使用的访问日志，返回 (行数, 应计为无效的行数)。
+    约 blank_rate 比例的行主机名和 IP 都为空 (纯文本为 ','，CSV 为两列均为空)，同样比例的行 IP 无效。
+    csv_format 为 True 时写为带表头的 'time,host,ip' CSV。
+    """
+    rng = random.Random(seed)
+    hosts = ["www.google.com", "api.openai.com", "github.com", "example.org", "cdn.jsdelivr.net"]
+    invalid = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        if csv_format:
+            f.write("time,host,ip\n")
+        for i in range(count):
+            roll = rng.random()
+            if roll < blank_rate:
+                host, ip = "", ""
+                invalid += 1
+            elif roll < blank_rate * 2:
+                host, ip = "", "300.1.2.3"
+                invalid += 1
+            elif roll < 0.5:
+                host, ip = rng.choice(hosts), ""
+            else:
+                host, ip = "", f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+            f.write(f"{i},{host},{ip}\n" if csv_format else f"{host},{ip}\n")
+    return count, invalid
+
+
+def bench_audit(args):
+    """
+    用内置模板的规则回放生成的访问日志 (纯文本和 CSV 各一份，含空行和无效 IP)，
+    检查单进程与 -j 个进程的统计一致、无效行数与预期相同。有任何不一致时以状态码 1 退出。
+    """
+    import ss_match
+
+    matcher = ss_match.RuleMatcher(ss_match.load_clash_rules())
+    failures = 0
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for name, csv_format, csv_columns in (("text", False, None), ("csv", True, (1, 2))):
+            log_file = os.path.join(tmp_dir, f"access.{name}")
+            lines, expected_invalid = generate_audit_log(log_file, args.lines, args.blank_rate, args.seed, csv_format)
+            summaries = []
+            for jobs in (1, args.jobs):
+                summary, seconds = timed(ss_match.audit_log, matcher, log_file, jobs, csv_columns, ',', csv_format)
+                summaries.append(summary)
+                problems = []
+                if summary['lines'] != lines:
+                    problems.append(f"行数 {summary['lines']} != {lines}")
+                if summary['invalid'] != expected_invalid:
+                    problems.append(f"无效行 {summary['invalid']} != {expected_invalid}")
+                print(f"{name:>6} -j {jobs}: {'；'.join(problems) or '一致'} ({seconds:.3f}s, {summary['invalid']} 行无效)")
+                failures += bool(problems)
+            single, parallel = summaries
+            if (single['groups'], single['rules']) != (parallel['groups'], parallel['rules']):
+                print(f"{name:>6}: 单进程与 -j {args.jobs} 的命中统计不同")
+                failures += 1
+
+    print(f"{failures} 个对照不一致。", file=sys.stderr)
+    if failures:
+        sys.exit(1)
+
+
+def number_list(value, type_=int):
+    """解析逗号分隔的数字列表参数。"""
+    return [type_(item) for item in value.split(',') if item]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SOCKS 链接转换脚本的性能测试。")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    dedupe_parser = subparsers.add_parser("dedupe", help="测试节点名称去重的耗时。")
+    dedupe_parser.add_argument("--lines", type=int, default=200000, help="生成的节点数量 (默认 200000)。")
+    dedupe_parser.add_argument("--collision-rate", type=float, default=0.5, help="使用同一名称的节点比例 (默认 0.5)。")
+    dedupe_parser.add_argument("--legacy-lines", type=int, default=2000, help="用原去重逻辑对照的前若干个节点，原逻辑在大量重名时非常慢 (默认 2000，0 表示不对照)。")
+    dedupe_parser.add_argument("--seed", type=int, default=0, help="随机数种子。")
+    dedupe_parser.set_defaults(func=bench_dedupe)
+
+    reader_parser = subparsers.add_parser("reader", help="对比文本模式与 mmap 读取链接文件的耗时和峰值内存。")
+    reader_parser.add_argument("input_file", nargs="?", help="要读取的链接文件，未提供时生成临时文件。")
+    reader_parser.add_argument("--lines", type=int, default=2000000, help="生成的行数 (默认 2000000)。")
+    reader_parser.add_argument("--junk-rate", type=float, default=0.1, help="空行、注释和无效链接的比例 (默认 0.1)。")
+    reader_parser.add_argument("--seed", type=int, default=0, help="随机数种子。")
+    reader_parser.set_defaults(func=bench_reader)
+
+    phases_parser = subparsers.add_parser("phases", help="按阶段 (读取/解析/去重/模板加载/序列化/写入) 测试各转换脚本，结果可保存为 JSON。")
+    phases_parser.add_argument("--sizes", type=number_list, default=[1000, 10000, 100000, 1000000], help="生成的行数，逗号分隔 (默认 1000,10000,100000,1000000)。")
+    phases_parser.add_argument("--collision-rates", type=lambda value: number_list(value, float), default=[0.0, 0.5], help="同名节点比例，逗号分隔 (默认 0,0.5)。")
+    phases_parser.add_argument("--auth-rates", type=lambda value: number_list(value, float), default=[0.0, 1.0], help="带认证信息的链接比例，逗号分隔 (默认 0,1)。")
+    phases_parser.add_argument("--junk-rate", type=float, default=0.1, help="空行、注释和无效链接的比例 (默认 0.1)。")
+    phases_parser.add_argument("--targets", type=lambda value: [target for target in value.split(',') if target in PHASE_TARGETS], default=list(PHASE_TARGETS), help="要测试的输出格式，逗号分隔 (默认 clash,singbox,surge)。")
+    phases_parser.add_argument("--no-template-cache", action="store_true", help="Clash 模板不使用 pickle 缓存，测量直接解析 YAML 的耗时。")
+    phases_parser.add_argument("--seed", type=int, default=0, help="随机数种子。")
+    phases_parser.add_argument("-o", "--output-file", help="把结果保存为 JSON 文件，便于在不同提交之间对比。")
+    phases_parser.add_argument("--compare", help="之前保存的 JSON 结果，打印各阶段相对它的耗时倍数。")
+    phases_parser.set_defaults(func=bench_phases)
+
+    golden_parser = subparsers.add_parser("golden", help="对照完整生成与模板片段拼接两条路径的 Clash / sing-box 输出，不一致时返回状态码 1。")
+    golden_parser.add_argument("input_file", nargs="?", help="链接文件，未提供时生成临时文件。")
+    golden_parser.add_argument("--lines", type=int, default=10000, help="生成的行数 (默认 10000)。")
+    golden_parser.add_argument("--seed", type=int, default=0, help="随机数种子。")
+    golden_parser.set_defaults(func=golden)
+
+    yaml_parser = subparsers.add_parser("yaml", help="对比 PyYAML 纯 Python 实现与 libyaml 解析 Clash 模板和写出配置的耗时。")
+    yaml_parser.add_argument("--lines", type=int, default=100000, help="生成的行数 (默认 100000)。")
+    yaml_parser.add_argument("--seed", type=int, default=0, help="随机数种子。")
+    yaml_parser.set_defaults(func=bench_yaml)
+
+    startup_parser = subparsers.add_parser("startup", help="测量各转换脚本直接运行和以 python3 -m 运行时的启动耗时。")
+    startup_parser.add_argument("--repeat", type=int, default=15, help="每种方式运行的次数，取中位数 (默认 15)。")
+    startup_parser.add_argument("--importtime", type=int, default=0, metavar="N", help="同时列出 -X importtime 中累计耗时最多的 N 个顶层导入。")
+    startup_parser.add_argument("--baseline", metavar="DIR", help="另一个提交的检出目录 (如 git worktree add /tmp/base <提交>)，在其中运行同样的命令作为对照。")
+    startup_parser.set_defaults(func=bench_startup)
+
+    audit_parser = subparsers.add_parser("audit", help="回放含空行和无效 IP 的访问日志，检查 ss_match.py audit 的单进程与多进程统计一致、无效行计数正确。")
+    audit_parser.add_argument("--lines", type=int, default=200000, help="生成的日志行数 (默认 200000)。")
+    audit_parser.add_argument("--blank-rate", type=float, default=0.05, help="主机名和 IP 都为空的行的比例，无效 IP 的比例与之相同 (默认 0.05)。")
+    audit_parser.add_argument("-j", "--jobs", type=int, default=2, help="与单进程对照的进程数 (默认 2)。")
+    audit_parser.add_argument("--seed", type=int, default=0, help="随机数种子。")
+    audit_parser.set_defaults(func=bench_audit)
+
+    run_reader_parser = subparsers.add_parser("_run-reader")  # 供 reader 子命令内部调用
+    run_reader_parser.add_argument("reader", choices=list(READERS))
+    run_reader_parser.add_argument("input_file")
+    run_reader_parser.set_defaults(func=run_reader)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,622 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ss2clash.py 的转换逻辑：解析 SOCKS 链接并生成 Clash 配置，模板在 ss_clash_template.py 中。
+作为模块导入时缓存为 .pyc，命令行入口为 ss2clash.py (也可以 python3 -m ss2clash 运行)。
+需要安装 PyYAML (pip install PyYAML)，在第一次用到时才导入，ss2clash.py -h 不需要它。
+需要与 ss_common.py、ss_clash_template.py 放在同一目录；--optimize-rules 等选项还需要 ss_rules.py、ss_match.py。
+"""
+
+import argparse
+import sys
+import os
+import json
+import re
+import collections.abc
+import functools
+import io
+
+from ss_common import (  # 需与本脚本位于同一目录
+    WarningSummary, ParseWarning, WARN_RENAME, WARNING_EXAMPLE_LIMIT,
+    NameDeduper, SocksNode, IncrementalState, parse_link_file, parse_socks_node,
+    split_fragments, write_fragments, load_cached_fragments, StageProfiler, config_relative_dir, yaml_implementation,
+    PROXIES_SENTINEL, MEMBERS_SENTINEL, TEMPLATE_CACHE_DIR
+)
+
+TEMPLATE_CACHE_PREFIX = "clash_template_"
+
+
+@functools.lru_cache(maxsize=None)
+def clash_yaml():
+    """
+    返回 (Loader, Dumper, 名称)：有 libyaml 时为 C 实现，否则为纯 Python 实现 (见 ss_common.yaml_implementation)。
+    第一次解析模板或调用 yaml.dump 时才确定，命中模板片段缓存的运行不需要。
+    """
+    return yaml_implementation()
+
+
+def load_clash_template(cache_dir=TEMPLATE_CACHE_DIR):
+    """
+    加载 CLASH_TEMPLATE_YAML 并返回解析后的配置字典。
+    解析结果以模板文本的 SHA-256 为键 pickle 到 cache_dir，之后的运行直接反序列化；
+    模板改动后哈希变化，缓存会自动重建。cache_dir 为 None 或缓存读写失败时直接解析模板。
+    """
+    import yaml
+    from ss_clash_template import CLASH_TEMPLATE_YAML  # 模板较大，放在单独的模块中以便缓存为 .pyc，ss2clash.py -h 不需要它
+
+    if not cache_dir:
+        return yaml.load(CLASH_TEMPLATE_YAML, Loader=clash_yaml()[0])
+
+    import hashlib  # 只有模板缓存用到，不在启动时导入
+    import pickle
+
+    digest = hashlib.sha256(CLASH_TEMPLATE_YAML.encode('utf-8')).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{TEMPLATE_CACHE_PREFIX}{digest[:16]}.pickle")
+
+    try:
+        with open(cache_path, 'rb') as f:
+            cached_digest, clash_config = pickle.load(f)
+        if cached_digest == digest:
+            return clash_config
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"警告: 模板缓存 '{cache_path}' 损坏，将重新生成: {e}", file=sys.stderr)
+
+    clash_config = yaml.load(CLASH_TEMPLATE_YAML, Loader=clash_yaml()[0])
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # 先写临时文件再原子替换，避免并发运行读到写了一半的缓存
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((digest, clash_config), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+        # 清理旧模板留下的缓存
+        for entry in os.listdir(cache_dir):
+            if entry.startswith(TEMPLATE_CACHE_PREFIX) and entry.endswith('.pickle') and entry != os.path.basename(cache_path):
+                os.remove(os.path.join(cache_dir, entry))
+    except OSError as e:
+        print(f"警告: 无法写入模板缓存 '{cache_path}': {e}", file=sys.stderr)
+
+    return clash_config
+
+
+# yaml.dump 的统一参数 (Dumper 另由 clash_yaml() 提供)：保持键顺序、允许中文、缩进 2、加大宽度以避免不必要的换行。
+# libyaml 的写出器会把 BMP 以外的字符 (如 emoji) 转义为 "\U0001F680"，含这类字符的规则和代理组由 yaml_scalar 写出
+YAML_DUMP_OPTIONS = dict(sort_keys=False, allow_unicode=True, default_flow_style=False, indent=2, width=1000)
+
+# 可以安全地以 plain 形式写出的字符串：首字符不是 YAML 指示符，且不含控制字符等不可打印字符
+_YAML_PLAIN_RE = re.compile(r"[^\s\-?:,\[\]{}#&*!|>'\"%@`\x00-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff][^\x00-\x1f\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]*\Z")
+# JSON 不会转义、但在 YAML 中属于换行或不可打印的字符
+_YAML_UNSAFE_CHAR_RE = re.compile(r"[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufeff\ufffe\uffff]")
+_YAML_STR_TAG = 'tag:yaml.org,2002:str'
+
+
+# PyYAML 隐式类型解析器的 resolve 方法 (已绑定 ScalarNode)，第一次写出 YAML 标量时才创建
+_yaml_resolve = None
+
+
+def _load_yaml_resolve():
+    """创建并记住 _yaml_resolve。yaml_scalar 对每个字符串都会调用它，因此不再包一层函数。"""
+    global _yaml_resolve
+    import yaml
+    _yaml_resolve = functools.partial(yaml.resolver.Resolver().resolve, yaml.ScalarNode)
+    return _yaml_resolve
+
+
+def yaml_scalar(value):
+    """
+    将单个标量 (str/int/bool/None) 转换为块上下文中的 YAML 文本。
+    字符串能以 plain 形式原样读回时不加引号 (与 yaml.dump 的输出一致)，否则输出双引号字符串。
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if not isinstance(value, str):
+        raise TypeError(f"不支持的标量类型: {type(value).__name__}")
+    if (_YAML_PLAIN_RE.match(value)
+            and not value.endswith((' ', ':'))
+            and ': ' not in value and ' #' not in value
+            and not value.startswith('...')
+            # plain 形式读回时仍须是字符串 (而不是 true、1.5、null 等)
+            and (_yaml_resolve or _load_yaml_resolve())(value, (True, False)) == _YAML_STR_TAG):
+        return value
+    # JSON 字符串 (补充转义少数字符后) 同时也是合法的 YAML 双引号标量
+    return _YAML_UNSAFE_CHAR_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", json.dumps(value, ensure_ascii=False))
+
+
+def _is_plain_item(item):
+    """判断列表元素是否为只包含标量或标量列表的映射，可由流式写出器直接处理。"""
+    scalar_types = (str, int, bool, type(None))
+    if not isinstance(item, dict) or not item:
+        return False
+    for key, value in item.items():
+        if not isinstance(key, str):
+            return False
+        if isinstance(value, list):
+            if not all(isinstance(v, scalar_types) for v in value):
+                return False
+        elif not isinstance(value, scalar_types):
+            return False
+    return True
+
+
+def yaml_block_list_entry(value):
+    """块格式列表中的一个标量元素 (如代理组成员)，缩进与 write_yaml_block_list 一致。"""
+    return f"  - {yaml_scalar(value)}\n"
+
+
+def yaml_block_item(item):
+    """将顶层列表中的一个元素渲染为块格式文本。结构较复杂的元素交给 yaml.dump 处理。"""
+    if isinstance(item, (str, int, bool, type(None))):  # 如 rules 中的一条规则
+        return f"- {yaml_scalar(item)}\n"
+    if not _is_plain_item(item):
+        import yaml
+        return yaml.dump([item], Dumper=clash_yaml()[1], **YAML_DUMP_OPTIONS)
+    parts = []
+    prefix = '- '
+    for field, value in item.items():
+        if isinstance(value, list):
+            if value:
+                parts.append(f"{prefix}{yaml_scalar(field)}:\n")
+                parts.extend(yaml_block_list_entry(v) for v in value)
+            else:
+                parts.append(f"{prefix}{yaml_scalar(field)}: []\n")
+        else:
+            parts.append(f"{prefix}{yaml_scalar(field)}: {yaml_scalar(value)}\n")
+        prefix = '  '
+    return ''.join(parts)
+
+
+def write_yaml_block_list(key, items, out):
+    """
+    以块格式流式写出顶层列表 key (如 proxies / proxy-groups)，逐个元素写入 out，
+    不在内存中拼接整段字符串。
+    """
+    if not items:
+        out.write(f"{key}: []\n")
+        return
+    out.write(f"{key}:\n")
+    for item in items:
+        out.write(yaml_block_item(item))
+
+
+def template_rules_block():
+    """返回 CLASH_TEMPLATE_YAML 中从 'rules:' 开始直到结尾的原始文本，未找到时返回 None。"""
+    from ss_clash_template import CLASH_TEMPLATE_YAML
+
+    index = CLASH_TEMPLATE_YAML.find("\nrules:\n")
+    return CLASH_TEMPLATE_YAML[index + 1:] if index != -1 else None
+
+
+def write_clash_config(clash_config, out, rules_text=None):
+    """
+    按顶层段 (general、dns、proxies、proxy-groups、rules 等) 依次把 Clash 配置流式写入 out。
+    proxies 和 proxy-groups 逐项写出；rules_text 不为 None 时 rules 段直接拷贝该原始文本，
+    不再经过 PyYAML 的 representer。其余小段仍用 yaml.dump 生成。
+    """
+    import yaml
+
+    keys = list(clash_config)
+    for key in keys:
+        value = clash_config[key]
+        if key == 'rules' and rules_text is not None and key == keys[-1]:
+            out.write(rules_text)
+        elif key in ('proxies', 'proxy-groups', 'rules') and isinstance(value, collections.abc.Sequence) and not isinstance(value, str):
+            write_yaml_block_list(key, value, out)
+        else:
+            out.write(yaml.dump({key: value}, Dumper=clash_yaml()[1], **YAML_DUMP_OPTIONS))
+
+
+def clash_proxy_from_node(node):
+    """将 ss_common.SocksNode 转换为Clash代理字典。"""
+    return {
+        'name': node.name,
+        'type': 'socks5',  # Clash 中 SOCKS 代理统一为 socks5 类型
+        'server': node.server,
+        'port': node.port,
+        'udp': True  # SOCKS5 代理通常建议开启 UDP转发
+    }
+
+
+class ClashProxiesView(collections.abc.Sequence):
+    """
+    SocksNode 列表的只读视图，取元素时才生成对应的Clash代理字典，
+    不必为每个节点常驻一个字典。可直接作为 clash_config['proxies'] 交给 write_clash_config。
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [clash_proxy_from_node(node) for node in self.nodes[index]]
+        return clash_proxy_from_node(self.nodes[index])
+
+
+def parse_socks_link(line_number, link_string):
+    """
+    解析单条SOCKS链接字符串并转换为Clash代理字典。
+    """
+    node = parse_socks_node(line_number, link_string)
+    return clash_proxy_from_node(node) if node else None
+
+
+def optimize_clash_rules(rules):
+    """
+    对模板规则做保持第一条命中语义的优化 (见 ss_rules)，并在标准错误中报告规则数量的变化：
+    删除被前面规则覆盖的 DOMAIN-SUFFIX / DOMAIN 规则；合并相邻/重叠的 IP-CIDR、IP-CIDR6 网段，
+    删除被前面同策略组规则覆盖的网段。
+    """
+    from ss_rules import IP_CIDR_RULE_TYPES, aggregate_ip_cidr_rules, remove_shadowed_domain_rules  # 只在使用 --optimize-rules 时导入
+
+    optimized, removed_by_group = remove_shadowed_domain_rules(rules)
+    if removed_by_group:
+        details = ", ".join(f"{group} {count} 条" for group, count in sorted(removed_by_group.items(), key=lambda item: -item[1]))
+        print(f"规则优化: 删除被前面规则覆盖的域名规则 {sum(removed_by_group.values())} 条 ({details})。", file=sys.stderr)
+
+    count_ip_rules = lambda rule_list: sum(1 for rule in rule_list if rule.split(',', 1)[0] in IP_CIDR_RULE_TYPES)
+    ip_rules_before = count_ip_rules(optimized)
+    optimized = aggregate_ip_cidr_rules(optimized)
+    print(f"规则优化: IP-CIDR/IP-CIDR6 规则 {ip_rules_before} 条 -> {count_ip_rules(optimized)} 条。", file=sys.stderr)
+    print(f"规则优化: 共 {len(rules)} 条 -> {len(optimized)} 条。", file=sys.stderr)
+    return optimized
+
+
+@functools.lru_cache(maxsize=None)
+def optimized_template_rules(cache_dir=TEMPLATE_CACHE_DIR):
+    """经 optimize_clash_rules 处理的模板规则 (元组)。同一进程内只计算一次，报告也只打印一次。"""
+    return tuple(optimize_clash_rules(load_clash_template(cache_dir)['rules']))
+
+
+@functools.lru_cache(maxsize=None)
+def reordered_template_rules(cache_dir=TEMPLATE_CACHE_DIR, optimize_rules=False, reorder_log=None):
+    """
+    按访问日志 reorder_log 中的命中频率重排模板规则 (optimize_rules 为 True 时先优化)，返回元组。
+    重排见 ss_rules.reorder_rules：只交换不会同时命中同一请求 (或策略组相同) 的规则，高频命中的前移。
+    重排后再用同一份日志并排回放新旧两份规则，任何查询的策略组不一致时放弃重排、返回原规则。
+    """
+    from ss_match import RuleMatcher, audit_log, compare_rule_lists  # 只在使用 --reorder-rules 时导入
+    from ss_rules import reorder_rules
+
+    rules = optimized_template_rules(cache_dir) if optimize_rules else tuple(load_clash_template(cache_dir)['rules'])
+    rule_hits = audit_log(RuleMatcher(rules), reorder_log)['rules']
+    order = reorder_rules(rules, rule_hits)
+    reordered = tuple(rules[index] for index in order)
+
+    comparison = compare_rule_lists(rules, reordered, reorder_log)
+    if comparison['mismatches']:
+        print(f"警告: 规则重排后有 {comparison['mismatches']} 个查询的策略组发生变化，已放弃重排。例如:", file=sys.stderr)
+        for query, old_target, new_target in comparison['examples']:
+            print(f"  {query}: {old_target} -> {new_target}", file=sys.stderr)
+        return rules
+    moved = sum(1 for position, index in enumerate(order) if position != index)
+    print(f"规则重排: 按 '{reorder_log}' 中 {sum(rule_hits.values())} 个请求的命中频率移动 {moved} 条规则，"
+          f"平均检查深度 {comparison['old_depth']:.1f} -> {comparison['new_depth']:.1f}。", file=sys.stderr)
+    print(f"规则重排: 已并排回放 {comparison['requests']} 个查询，策略组全部一致。", file=sys.stderr)
+    return reordered
+
+
+def template_rules(cache_dir=TEMPLATE_CACHE_DIR, optimize_rules=False, reorder_log=None):
+    """按 --optimize-rules / --reorder-rules 处理后的模板规则。"""
+    if reorder_log:
+        return reordered_template_rules(cache_dir, optimize_rules, reorder_log)
+    if optimize_rules:
+        return optimized_template_rules(cache_dir)
+    return load_clash_template(cache_dir)['rules']
+
+
+# rule-provider 文件格式对应的扩展名；mrs 为 mihomo 的二进制格式，不支持 classical
+RULE_PROVIDER_EXTENSIONS = {'yaml': '.yaml', 'text': '.txt', 'mrs': '.mrs'}
+# type: http 的 rule-provider 的更新间隔 (秒)
+RULE_PROVIDER_INTERVAL = 86400
+
+# --rule-providers 的参数：directory 为写出 provider 文件的目录，path_prefix 为配置中引用这些文件的路径前缀，
+# format 为 yaml / text / mrs，url_base 不为空时使用 type: http 从该地址下载
+RuleProviderOptions = collections.namedtuple('RuleProviderOptions', 'directory path_prefix format url_base')
+
+
+def rule_provider_format(provider, options):
+    """provider 实际使用的文件格式：classical 不支持 mrs，退回 yaml。"""
+    return 'yaml' if options.format == 'mrs' and provider.behavior == 'classical' else options.format
+
+
+def rule_provider_filename(provider, options):
+    return provider.name + RULE_PROVIDER_EXTENSIONS[rule_provider_format(provider, options)]
+
+
+def apply_rule_providers(clash_config, options):
+    """
+    把 clash_config 的 rules 拆分为 rule-provider (见 ss_rules.split_rule_providers)，
+    在 rules 之前插入 rule-providers 段，返回 [RuleProvider, ...] 供 write_rule_provider_files 写出。
+    """
+    from ss_rules import split_rule_providers  # 只在使用 --rule-providers 时导入
+
+    rules, providers = split_rule_providers(clash_config['rules'])
+    rule_providers = {}
+    for provider in providers:
+        filename = rule_provider_filename(provider, options)
+        entry = {'type': 'http' if options.url_base else 'file', 'behavior': provider.behavior,
+                 'format': rule_provider_format(provider, options), 'path': f"{options.path_prefix}/{filename}"}
+        if options.url_base:
+            entry['url'] = f"{options.url_base.rstrip('/')}/{filename}"
+            entry['interval'] = RULE_PROVIDER_INTERVAL
+        rule_providers[provider.name] = entry
+
+    # rules 保持在最后，rule-providers 紧挨在它之前
+    del clash_config['rules']
+    clash_config['rule-providers'] = rule_providers
+    clash_config['rules'] = rules
+    return providers
+
+
+def clash_rule_providers(cache_dir=TEMPLATE_CACHE_DIR, optimize_rules=False, reorder_log=None):
+    """模板规则 (经 template_rules 处理) 拆分出的 [RuleProvider, ...]，与 apply_rule_providers 的结果一致。"""
+    from ss_rules import split_rule_providers
+
+    return split_rule_providers(template_rules(cache_dir, optimize_rules, reorder_log))[1]
+
+
+def write_rule_provider_files(providers, options):
+    """
+    把 provider 写到 options.directory。yaml 格式为 'payload:' 列表，text 格式每行一条；
+    mrs 格式先写成 text，再调用 mihomo convert-ruleset 转换，需要 PATH 中有 mihomo。
+    """
+    os.makedirs(options.directory, exist_ok=True)
+    for provider in providers:
+        path = os.path.join(options.directory, rule_provider_filename(provider, options))
+        file_format = rule_provider_format(provider, options)
+        if file_format == 'mrs':
+            import shutil  # 只有 mrs 格式用到，不在启动时导入
+            import subprocess
+            import tempfile
+
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', suffix='.txt', delete=False) as f_text:
+                f_text.write(''.join(f"{entry}\n" for entry in provider.payload))
+            try:
+                subprocess.run([shutil.which('mihomo'), 'convert-ruleset', provider.behavior, 'text', f_text.name, path],
+                               check=True, capture_output=True)
+            finally:
+                os.remove(f_text.name)
+            continue
+        with open(path, 'w', encoding='utf-8') as f_out:
+            if file_format == 'yaml':
+                write_yaml_block_list('payload', provider.payload, f_out)
+            else:
+                f_out.write(''.join(f"{entry}\n" for entry in provider.payload))
+
+
+def build_clash_config(proxies_list, proxy_names, cache_dir=TEMPLATE_CACHE_DIR, optimize_rules=False, rule_providers=None,
+                       reorder_log=None):
+    """
+    加载模板 (cache_dir 为 None 时不使用磁盘缓存)，填入代理列表 (字典列表或 ClashProxiesView)，
+    并把节点名称加入 "自动选择" 和 "🚀 节点选择" 组。模板解析失败时抛出 yaml.YAMLError。
+    optimize_rules 为 True 时用 optimize_clash_rules 替换 rules，reorder_log 不为空时再按该访问日志重排；
+    rule_providers (RuleProviderOptions) 不为 None 时把规则拆分为 rule-provider 引用 (provider 文件由调用方用
+    write_rule_provider_files 写出)。这些情况下写出时都不能再直接拷贝模板中 rules 的原文。
+    """
+    clash_config = load_clash_template(cache_dir)
+    if optimize_rules or reorder_log:
+        clash_config['rules'] = list(template_rules(cache_dir, optimize_rules, reorder_log))
+    if rule_providers:
+        apply_rule_providers(clash_config, rule_providers)
+
+    # 1. 将解析出的代理列表添加到配置的 'proxies' 键
+    clash_config['proxies'] = proxies_list
+
+    # 2. 将代理名称添加到指定的 'proxy-groups'
+    if 'proxy-groups' in clash_config and isinstance(clash_config['proxy-groups'], list):
+        for group in clash_config['proxy-groups']:
+            if not isinstance(group, dict) or 'name' not in group:
+                continue
+            
+            # 将所有节点添加到 "自动选择" 组 (url-test)
+            if group['name'] == '自动选择':
+                group['proxies'] = proxy_names
+            
+            # 将所有节点添加到 "🚀 节点选择" 组 (select)
+            elif group['name'] == '🚀 节点选择':
+                # 在现有代理（即 "自动选择"）之后追加新节点
+                group['proxies'].extend(proxy_names)
+    
+    else:
+        print("警告: YAML模板中未找到 'proxy-groups' 列表，无法自动添加节点。", file=sys.stderr)
+
+    return clash_config
+
+
+def clash_template_fragments(cache_dir=TEMPLATE_CACHE_DIR, optimize_rules=False, rule_providers=None, reorder_log=None):
+    """
+    用占位节点渲染模板，切分为静态片段和 ('proxies', '')、('members', '') 两类占位。
+    在占位处拼接 yaml_block_item / yaml_block_list_entry 的结果，即得到与 write_clash_config 相同的输出。
+    """
+    sentinel_proxy = clash_proxy_from_node(SocksNode(PROXIES_SENTINEL, PROXIES_SENTINEL, 1))
+    clash_config = build_clash_config([sentinel_proxy], [MEMBERS_SENTINEL], cache_dir, optimize_rules, rule_providers, reorder_log)
+    buffer = io.StringIO()
+    rules_text = None if optimize_rules or rule_providers or reorder_log else template_rules_block()
+    write_clash_config(clash_config, buffer, rules_text=rules_text)
+    return split_fragments(buffer.getvalue(), {
+        yaml_block_item(sentinel_proxy): ('proxies', ''),
+        yaml_block_list_entry(MEMBERS_SENTINEL): ('members', '')
+    })
+
+
+def clash_fragments_key(optimize_rules=False, rule_providers=None, reorder_log=None):
+    """模板片段的缓存键：模板内容的哈希加上所有影响渲染结果的选项 (rule-provider 的本地目录不影响配置内容)。"""
+    import hashlib
+    from ss_clash_template import CLASH_TEMPLATE_YAML
+
+    template_digest = hashlib.sha256(CLASH_TEMPLATE_YAML.encode('utf-8')).hexdigest()
+    # 重排结果取决于日志内容，日志改动后片段也要重新生成
+    reorder_key = reorder_log and (reorder_log, os.stat(reorder_log).st_mtime_ns, os.stat(reorder_log).st_size)
+    return (template_digest, optimize_rules, rule_providers and tuple(rule_providers[1:]), reorder_key)
+
+
+def clash_cached_fragments(cache_dir=TEMPLATE_CACHE_DIR, optimize_rules=False, rule_providers=None, reorder_log=None):
+    """
+    clash_template_fragments 的结果，静态片段为 bytes 并缓存在 cache_dir (见 ss_common.load_cached_fragments)，
+    缓存命中时不再解析和序列化模板。
+    """
+    return load_cached_fragments(cache_dir, 'clash', clash_fragments_key(optimize_rules, rule_providers, reorder_log),
+                                 lambda: clash_template_fragments(cache_dir, optimize_rules, rule_providers, reorder_log))
+
+
+def write_clash_spliced(fragments, nodes, proxy_names, out):
+    """
+    拼接模式的输出，out 为二进制流：在 clash_cached_fragments 的静态片段之间只序列化节点列表和组成员。
+    输出与 build_clash_config + write_clash_config 逐字节相同。
+    """
+    write_fragments(fragments, {
+        'proxies': (yaml_block_item(clash_proxy_from_node(node)) for node in nodes),
+        'members': (yaml_block_list_entry(name) for name in proxy_names)
+    }, out)
+
+
+def write_clash_incremental(nodes, proxy_names, out, state, cache_dir=TEMPLATE_CACHE_DIR, optimize_rules=False, rule_providers=None,
+                            reorder_log=None):
+    """
+    增量模式的输出：模板的静态片段和未变化节点的文本取自 state (ss_common.IncrementalState)，
+    只渲染新增或改动的节点。输出与 write_clash_config 逐字节相同。
+    """
+    fragments_key = clash_fragments_key(optimize_rules, rule_providers, reorder_log)
+    fragments = state.fragments(fragments_key, lambda: clash_template_fragments(cache_dir, optimize_rules, rule_providers, reorder_log))
+    pieces = {
+        'proxies': [state.piece(('proxy', node.name, node.server, node.port),
+                                lambda node=node: yaml_block_item(clash_proxy_from_node(node)))
+                    for node in nodes],
+        'members': [state.piece(('member', name), lambda name=name: yaml_block_list_entry(name))
+                    for name in proxy_names]
+    }
+    write_fragments(fragments, pieces, out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="将TXT文件中的SOCKS链接转换为Clash YAML配置。")
+    parser.add_argument("input_file", help="包含SOCKS链接的TXT文件路径 (每行一个链接)。")
+    parser.add_argument("-o", "--output-file", help="保存生成的Clash YAML文件的路径。如果未提供，则打印到标准输出。")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="解析链接使用的进程数 (默认 1)。超大文件可设为CPU核数，输出与单进程完全一致。")
+    parser.add_argument("--no-template-cache", action="store_true", help="不读写模板解析缓存和模板片段缓存，每次都重新解析内置YAML模板。")
+    parser.add_argument("--optimize-rules", action="store_true", help="在不改变匹配结果的前提下精简模板规则 (合并 IP-CIDR 网段等)，输出更小、客户端匹配更快。")
+    parser.add_argument("--reorder-rules", metavar="LOG", help="按访问日志 (每行 'host'、'ip' 或 'host,ip') 中的命中频率重排互不冲突的规则，高频命中的前移；重排后用同一日志逐条验证策略组不变。")
+    parser.add_argument("--rule-providers", metavar="DIR", help="按策略组把模板规则拆分为 rule-provider 文件写入 DIR，主配置只保留 RULE-SET 引用。")
+    parser.add_argument("--rule-provider-format", choices=list(RULE_PROVIDER_EXTENSIONS), default="yaml", help="rule-provider 文件格式 (默认 yaml)。mrs 需要 PATH 中有 mihomo，classical 规则仍使用 yaml。")
+    parser.add_argument("--rule-provider-url", metavar="URL", help="provider 文件发布的地址前缀。提供时使用 type: http，客户端下载后缓存并定期更新；否则使用 type: file。")
+    parser.add_argument("--state", help="增量模式的状态文件路径。未变化的链接和模板片段直接复用上次的结果 (此模式下忽略 --jobs)。")
+    parser.add_argument("--warning-limit", type=int, default=WARNING_EXAMPLE_LIMIT, metavar="N", help=f"每种警告 (无效协议、缺少主机或端口、解析错误、重名) 只显示前 N 条，其余只计数并在最后汇总 (默认 {WARNING_EXAMPLE_LIMIT})。")
+    parser.add_argument("--warnings-json", metavar="FILE", help="把按原因汇总的警告 (条数和前 N 条示例) 写为 JSON 文件。")
+    parser.add_argument("--profile", action="store_true", help="在标准错误中报告各阶段的墙钟时间、CPU 时间和峰值内存 (tracemalloc 会明显拖慢运行)。")
+    parser.add_argument("--profile-output", help="同时用 cProfile 记录运行过程，并把 pstats 结果写入该文件 (隐含 --profile)。")
+
+    args = parser.parse_args()
+    import yaml  # 下面捕获 yaml.YAMLError；-h 等只解析参数的运行不导入 PyYAML
+
+    nodes = []
+    deduper = NameDeduper() # 用于检查重名
+    proxy_names = deduper.names
+    state = IncrementalState(args.state, 'clash') if args.state else None
+    profiler = StageProfiler(args.profile, args.profile_output)
+    warnings = WarningSummary(args.warning_limit)  # 按原因计数，只保留前 N 条示例，内存占用与输入大小无关
+    if profiler.enabled:
+        loader, dumper, implementation = clash_yaml()
+        profiler.note(f"YAML 实现: {implementation} ({loader.__name__} / {dumper.__name__})")
+    cache_dir = None if args.no_template_cache else TEMPLATE_CACHE_DIR
+
+    if args.reorder_rules and not os.path.isfile(args.reorder_rules):
+        print(f"错误: 访问日志 '{args.reorder_rules}' 未找到。", file=sys.stderr)
+        sys.exit(1)
+
+    rule_providers = None
+    if args.rule_providers:
+        provider_format = args.rule_provider_format
+        import shutil
+
+        if provider_format == 'mrs' and not shutil.which('mihomo'):
+            print("警告: PATH 中未找到 mihomo，无法生成 mrs 格式的 rule-provider，改用 yaml。", file=sys.stderr)
+            provider_format = 'yaml'
+        # 配置中的 provider 路径相对于配置文件所在目录
+        path_prefix = config_relative_dir(args.rule_providers, args.output_file)
+        rule_providers = RuleProviderOptions(args.rule_providers, path_prefix, provider_format, args.rule_provider_url)
+
+    try:
+        with profiler.stage("parse"):  # 读取、解析和去重
+            node_source = state.iter_nodes(args.input_file, warnings) if state else parse_link_file(args.input_file, args.jobs, warnings)
+            for line_number, node in node_source:
+                # 处理潜在的重名节点
+                original_name = node.name
+                name_to_check = deduper.claim(original_name)
+            
+                if name_to_check != original_name:
+                    warnings(ParseWarning(WARN_RENAME, line_number, f"代理名称 '{original_name}' 重复。已重命名为 '{name_to_check}'。"))
+                    node.name = name_to_check
+            
+                nodes.append(node)
+
+    except FileNotFoundError:
+        print(f"错误: 输入文件 '{args.input_file}' 未找到。", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"错误: 读取或处理文件 '{args.input_file}' 时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    warnings.report()
+    if args.warnings_json:
+        warnings.write_json(args.warnings_json)
+
+    if not nodes:
+        print("输入文件中未找到有效的SOCKS链接。未生成Clash配置。", file=sys.stderr)
+        sys.exit(0)
+
+    binary = False
+    if state:
+        # 增量模式：模板静态片段和未变化节点的文本直接复用，只渲染改动的部分
+        render = lambda out: write_clash_incremental(nodes, proxy_names, out, state, cache_dir, args.optimize_rules, rule_providers,
+                                                     args.reorder_rules)
+    else:
+        # 模板的静态片段 (优先使用磁盘缓存) 之间只拼接节点和组成员，片段缓存失效时才解析YAML模板
+        try:
+            with profiler.stage("template"):
+                fragments = clash_cached_fragments(cache_dir, args.optimize_rules, rule_providers, args.reorder_rules)
+        except yaml.YAMLError as e:
+            print(f"错误: 内部YAML模板解析失败: {e}", file=sys.stderr)
+            sys.exit(1)
+        binary = True
+        render = lambda out: write_clash_spliced(fragments, nodes, proxy_names, out)
+
+    # 流式生成最终的 YAML 输出
+    try:
+        with profiler.stage("write"):  # 序列化并写出
+            if args.output_file:
+                with (open(args.output_file, 'wb') if binary else open(args.output_file, 'w', encoding='utf-8')) as f_out:
+                    render(f_out)
+                print(f"Clash 配置已成功写入到 '{args.output_file}'")
+            else:
+                # 如果有警告信息，先打印一个分隔符
+                if warnings.total:
+                     print("\n---\n")
+                if binary:
+                    sys.stdout.flush()  # 分隔符等已写入文本层的内容先输出
+                render(sys.stdout.buffer if binary else sys.stdout)
+
+        if rule_providers:
+            with profiler.stage("providers"):
+                providers = clash_rule_providers(cache_dir, args.optimize_rules, args.reorder_rules)
+                write_rule_provider_files(providers, rule_providers)
+            print(f"{len(providers)} 个 rule-provider 文件已写入到 '{rule_providers.directory}'", file=sys.stderr)
+
+        if state:
+            with profiler.stage("state"):
+                state.save()
+            print(f"增量模式: 复用 {state.reused_nodes} 个节点，重新解析 {state.parsed_nodes} 个节点。", file=sys.stderr)
+
+    except Exception as e:
+        print(f"错误: 生成或写入YAML时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    profiler.report()
@@ -0,0 +1,9251 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ss_clash.py 使用的 Clash YAML 模板。
+模板单独放在这个模块中：被导入的模块会缓存为 .pyc，近万行的模板字符串只在改动后编译一次；
+ss_clash.py 只在需要模板时才导入它 (ss2clash.py -h 等不需要)。需要与 ss_clash.py 放在同一目录。
+"""
+
+# ==================== 新的 YAML 模板 ====================
+# 将您提供的 YAML 文件内容作为多行字符串模板
+CLASH_TEMPLATE_YAML = """
+port: 7890
+socks-port: 7891
+redir-port: 7892
+mixed-port: 7893
+allow-lan: false
+mode: Rule
+log-level: info
+ipv6: true
+unified-delay: true
+hosts:
+external-controller: 127.0.0.1:65000
+clash-for-android:
+  append-system-dns: false
+profile:
+  tracing: true
+dns:
+  enable: true
+  listen: 127.0.0.1:8853
+  default-nameserver:
+    - 223.5.5.5
+    - 223.6.6.6
+    - 119.29.29.29
+    - 1.1.1.1
+    - 9.9.9.9
+  ipv6: true
+  enhanced-mode: fake-ip
+  fake-ip-filter:
+    - "*.lan"
+    - stun.*.*.*
+    - stun.*.*
+    - time.windows.com
+    - time.nist.gov
+    - time.apple.com
+    - time.asia.apple.com
+    - "*.ntp.org.cn"
+    - "*.openwrt.pool.ntp.org"
+    - time1.cloud.tencent.com
+    - time.ustc.edu.cn
+    - pool.ntp.org
+    - ntp.ubuntu.com
+    - ntp.aliyun.com
+    - ntp1.aliyun.com
+    - ntp2.aliyun.com
+    - ntp3.aliyun.com
+    - ntp4.aliyun.com
+    - ntp5.aliyun.com
+    - ntp6.aliyun.com
+    - ntp7.aliyun.com
+    - time1.aliyun.com
+    - time2.aliyun.com
+    - time3.aliyun.com
+    - time4.aliyun.com
+    - time5.aliyun.com
+    - time6.aliyun.com
+    - time7.aliyun.com
+    - "*.time.edu.cn"
+    - time1.apple.com
+    - time2.apple.com
+    - time3.apple.com
+    - time4.apple.com
+    - time5.apple.com
+    - time6.apple.com
+    - time7.apple.com
+    - time1.google.com
+    - time2.google.com
+    - time3.google.com
+    - time4.google.com
+    - music.163.com
+    - "*.music.163.com"
+    - "*.126.net"
+    - musicapi.taihe.com
+    - music.taihe.com
+    - songsearch.kugou.com
+    - trackercdn.kugou.com
+    - "*.kuwo.cn"
+    - api-jooxtt.sanook.com
+    - api.joox.com
+    - joox.com
+    - y.qq.com
+    - "*.y.qq.com"
+    - streamoc.music.tc.qq.com
+    - mobileoc.music.tc.qq.com
+    - isure.stream.qqmusic.qq.com
+    - dl.stream.qqmusic.qq.com
+    - aqqmusic.tc.qq.com
+    - amobile.music.tc.qq.com
+    - "*.xiami.com"
+    - "*.music.migu.cn"
+    - music.migu.cn
+    - "*.msftconnecttest.com"
+    - "*.msftncsi.com"
+    - localhost.ptlogin2.qq.com
+    - "*.*.*.srv.nintendo.net"
+    - "*.*.stun.playstation.net"
+    - xbox.*.*.microsoft.com
+    - "*.ipv6.microsoft.com"
+    - "*.*.xboxlive.com"
+    - speedtest.cros.wr.pvp.net
+  nameserver:
+    - https://223.6.6.6/dns-query
+    - tls://223.5.5.5:853
+    - tls://120.53.53.53
+    - tls://1.12.12.12
+    - https://dns.pub/dns-query
+  fallback:
+    - https://dns.cloudflare.com/dns-query
+    - https://doh.dns.sb/dns-query
+    - https://1.0.0.1/dns-query
+    - https://public.dns.iij.jp/dns-query
+    - tls://8.8.4.4:853
+  fallback-filter:
+    geoip: true
+    ipcidr:
+      - 240.0.0.0/4
+      - 0.0.0.0/32
+      - 127.0.0.1/32
+    domain:
+      - +.google.com
+      - +.facebook.com
+      - +.twitter.com
+      - +.youtube.com
+      - +.xn--ngstr-lra8j.com
+      - +.google.cn
+      - +.googleapis.cn
+      - +.googleapis.com
+      - +.gvt1.com
+proxies: []
+proxy-groups:
+  - name: 🚀 节点选择
+    type: select
+    proxies:
+      ["自动选择"]
+  - name: 自动选择
+    type: url-test
+    proxies:
+      []
+    url: "http://clients3.google.com/generate_204"
+    interval: 600
+    tolerance: 150
+  - name: 📲 Telegram
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 📹 YouTube
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🎥 Netflix
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🎥 Disney+
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 📺 巴哈姆特
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 📺 哔哩哔哩
+    type: select
+    proxies:
+      - DIRECT
+      - 🚀 节点选择
+  - name: 📺 EMBY
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🌍 国外媒体
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🌏 国内媒体
+    type: select
+    proxies:
+      - DIRECT
+      - 🚀 节点选择
+  - name: 📢 谷歌 FCM
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 😺 GitHub
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: Ⓜ️ 微软云盘
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: Ⓜ️ 微软服务
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🍎 苹果服务
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🎮 游戏平台
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🎶 ChatGPT
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+  - name: 🎯 全球直连
+    type: select
+    proxies:
+      - DIRECT
+      - 🚀 节点选择
+  - name: 🛑 广告拦截
+    type: select
+    proxies:
+      - DIRECT
+      - REJECT
+  - name: 🍃 应用净化
+    type: select
+    proxies:
+      - DIRECT
+      - REJECT
+  - name: 🐟 漏网之鱼
+    type: select
+    proxies:
+      - 🚀 节点选择
+      - DIRECT
+rules:
+
+ - DOMAIN,ipraft.com,🚀 节点选择
+ - DOMAIN,night-furyx.com,🚀 节点选择
+ - DOMAIN,dl.google.com,🚀 节点选择
+ - DOMAIN,services.googleapis.cn,🚀 节点选择
+ - DOMAIN,uua8f.com,🎯 全球直连
+ - DOMAIN-SUFFIX,acl4.ssr,🎯 全球直连
+ - DOMAIN-SUFFIX,ip6-localhost,🎯 全球直连
+ - DOMAIN-SUFFIX,ip6-loopback,🎯 全球直连
+ - DOMAIN-SUFFIX,local,🎯 全球直连
+ - DOMAIN-SUFFIX,localhost,🎯 全球直连
+ - DOMAIN-SUFFIX,xn--ngstr-lra8j.com,🚀 节点选择
+ - IP-CIDR,10.0.0.0/8,🎯 全球直连,no-resolve
+ - IP-CIDR,100.64.0.0/10,🎯 全球直连,no-resolve
+ - IP-CIDR,127.0.0.0/8,🎯 全球直连,no-resolve
+ - IP-CIDR,172.16.0.0/12,🎯 全球直连,no-resolve
+ - IP-CIDR,192.168.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,198.18.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR6,::1/128,🎯 全球直连,no-resolve
+ - IP-CIDR6,fc00::/7,🎯 全球直连,no-resolve
+ - IP-CIDR6,fe80::/10,🎯 全球直连,no-resolve
+ - IP-CIDR6,fd00::/8,🎯 全球直连,no-resolve
+ - DOMAIN,router.asus.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hiwifi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,leike.cc,🎯 全球直连
+ - DOMAIN-SUFFIX,steamserver.net,🎯 全球直连
+ - DOMAIN,steamcdn-a.akamaihd.net,🎯 全球直连
+ - DOMAIN-SUFFIX,miwifi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,my.router,🎯 全球直连
+ - DOMAIN-SUFFIX,p.to,🎯 全球直连
+ - DOMAIN-SUFFIX,peiluyou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,phicomm.me,🎯 全球直连
+ - DOMAIN-SUFFIX,routerlogin.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tendawifi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zte.home,🎯 全球直连
+ - DOMAIN-SUFFIX,ol.epicgames.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dizhensubao.getui.com,🎯 全球直连
+ - DOMAIN-SUFFIX,googletraveladservices.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tracking-protection.cdn.mozilla.net,🎯 全球直连
+ - DOMAIN,origin-a.akamaihd.net,🎯 全球直连
+ - DOMAIN,fairplay.l.qq.com,🎯 全球直连
+ - DOMAIN,livew.l.qq.com,🎯 全球直连
+ - DOMAIN,vd.l.qq.com,🎯 全球直连
+ - DOMAIN,analytics.strava.com,🎯 全球直连
+ - DOMAIN,msg.umeng.com,🎯 全球直连
+ - DOMAIN,msg.umengcloud.com,🎯 全球直连
+ - DOMAIN,tracking.miui.com,🎯 全球直连
+ - DOMAIN,app.adjust.com,🎯 全球直连
+ - DOMAIN,bdtj.tagtic.cn,🎯 全球直连
+ - DOMAIN-KEYWORD,admarvel,🛑 广告拦截
+ - DOMAIN-KEYWORD,admaster,🛑 广告拦截
+ - DOMAIN-KEYWORD,adsage,🛑 广告拦截
+ - DOMAIN-KEYWORD,adsensor,🛑 广告拦截
+ - DOMAIN-KEYWORD,adservice,🛑 广告拦截
+ - DOMAIN-KEYWORD,adsmogo,🛑 广告拦截
+ - DOMAIN-KEYWORD,adsrvmedia,🛑 广告拦截
+ - DOMAIN-KEYWORD,adsserving,🛑 广告拦截
+ - DOMAIN-KEYWORD,adsystem,🛑 广告拦截
+ - DOMAIN-KEYWORD,adwords,🛑 广告拦截
+ - DOMAIN-KEYWORD,analysis,🛑 广告拦截
+ - DOMAIN-KEYWORD,applovin,🛑 广告拦截
+ - DOMAIN-KEYWORD,appsflyer,🛑 广告拦截
+ - DOMAIN-KEYWORD,domob,🛑 广告拦截
+ - DOMAIN-KEYWORD,duomeng,🛑 广告拦截
+ - DOMAIN-KEYWORD,dwtrack,🛑 广告拦截
+ - DOMAIN-KEYWORD,guanggao,🛑 广告拦截
+ - DOMAIN-KEYWORD,omgmta,🛑 广告拦截
+ - DOMAIN-KEYWORD,omniture,🛑 广告拦截
+ - DOMAIN-KEYWORD,openx,🛑 广告拦截
+ - DOMAIN-KEYWORD,partnerad,🛑 广告拦截
+ - DOMAIN-KEYWORD,pingfore,🛑 广告拦截
+ - DOMAIN-KEYWORD,socdm,🛑 广告拦截
+ - DOMAIN-KEYWORD,supersonicads,🛑 广告拦截
+ - DOMAIN-KEYWORD,usage,🛑 广告拦截
+ - DOMAIN-KEYWORD,wlmonitor,🛑 广告拦截
+ - DOMAIN-KEYWORD,zjtoolbar,🛑 广告拦截
+ - DOMAIN-SUFFIX,admob.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ads.gmodules.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ads.google.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adservice.google.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,afd.l.google.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,badad.googleplex.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,csi.gstatic.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,doubleclick.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,doubleclick.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,google-analytics.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,googleadservices.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,googleadsserving.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,googlecommerce.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,googlesyndication.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobileads.google.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,pagead-tpc.l.google.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,pagead.google.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,pagead.l.google.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,service.urchin.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,09mk.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,100peng.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,114la.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,123juzi.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,138lm.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,17un.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,2cnt.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,3gmimo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,3xx.vip,🛑 广告拦截
+ - DOMAIN-SUFFIX,51.la,🛑 广告拦截
+ - DOMAIN-SUFFIX,51taifu.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,51yes.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,600ad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,6dad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,70e.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,86.cc,🛑 广告拦截
+ - DOMAIN-SUFFIX,8le8le.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,8ox.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,95558000.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,99click.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,99youmeng.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,a3p4.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,acs86.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,acxiom-online.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad-brix.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad-delivery.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad-locus.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad-plus.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad7.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adadapted.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adadvisor.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,adap.tv,🛑 广告拦截
+ - DOMAIN-SUFFIX,adbana.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adchina.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adcome.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,ader.mobi,🛑 广告拦截
+ - DOMAIN-SUFFIX,adform.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,adfuture.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,adhouyi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adinfuse.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adirects.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adjust.io,🛑 广告拦截
+ - DOMAIN-SUFFIX,adkmob.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adlive.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,adlocus.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,admaji.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,admin6.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,admon.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,adnyg.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adpolestar.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,adpro.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,adpush.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,adquan.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adreal.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,ads8.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsame.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsmogo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsmogo.org,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsunflower.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsunion.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adtrk.me,🛑 广告拦截
+ - DOMAIN-SUFFIX,adups.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,aduu.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,advertising.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adview.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,advmob.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,adwetec.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adwhirl.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adwo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adxmi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adyun.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adzerk.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,agrant.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,agrantsem.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,aihaoduo.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,ajapk.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,allyes.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,allyes.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,amazon-adsystem.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,analysys.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,angsrvr.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,anquan.org,🛑 广告拦截
+ - DOMAIN-SUFFIX,anysdk.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,appadhoc.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,appads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,appboy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,appdriver.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,appjiagu.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,applifier.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,appsflyer.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,atdmt.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,baifendian.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,banmamedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,baoyatu.cc,🛑 广告拦截
+ - DOMAIN-SUFFIX,baycode.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,bayimob.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,behe.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,bfshan.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,biddingos.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,biddingx.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,bjvvqu.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,bjxiaohua.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,bloggerads.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,branch.io,🛑 广告拦截
+ - DOMAIN-SUFFIX,bsdev.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,bshare.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,btyou.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,bugtags.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,buysellads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,c0563.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cacafly.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,casee.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,cdnmaster.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,chance-ad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,chanet.com.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,chartbeat.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,chartboost.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,chengadx.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,chmae.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,clickadu.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,clicki.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,clicktracks.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,clickzs.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cloudmobi.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,cmcore.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cnxad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cnzz.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cnzzlink.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cocounion.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,coocaatv.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cooguo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,coolguang.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,coremetrics.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,cpmchina.co,🛑 广告拦截
+ - DOMAIN-SUFFIX,cpx24.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,crasheye.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,crosschannel.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ctrmi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,customer-security.online,🛑 广告拦截
+ - DOMAIN-SUFFIX,daoyoudao.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,datouniao.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ddapp.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,dianjoy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,dianru.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,disqusads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,domob.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,domob.com.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,domob.org,🛑 广告拦截
+ - DOMAIN-SUFFIX,dotmore.com.tw,🛑 广告拦截
+ - DOMAIN-SUFFIX,doubleverify.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,doudouguo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,doumob.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,duanat.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,duiba.com.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,duomeng.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,dxpmedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,edigitalsurvey.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,eduancm.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,emarbox.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,epsilon.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,exosrv.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,fancyapi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,feitian001.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,feixin2.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,flashtalking.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,fraudmetrix.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,g1.tagtic.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,gentags.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,gepush.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,getui.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,glispa.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,go-mpulse,🛑 广告拦截
+ - DOMAIN-SUFFIX,go-mpulse.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,godloveme.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,gridsum.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,gridsumdissector.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,gridsumdissector.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,growingio.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,guohead.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,guomob.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,haoghost.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,hivecn.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,hypers.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,icast.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,igexin.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,il8r.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,imageter.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,immob.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,inad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,inmobi.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,inmobi.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,inmobicdn.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,inmobicdn.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,innity.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,instabug.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,intely.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,iperceptions.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ipinyou.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,irs01.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,irs01.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,irs09.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,istreamsche.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,jesgoo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,jiaeasy.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,jiguang.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,jimdo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,jisucn.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,jmgehn.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,jpush.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,jusha.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,juzi.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,juzilm.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,kejet.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,kejet.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,keydot.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,keyrun.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,kmd365.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,krux.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,lnk0.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,lnk8.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,localytics.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,lomark.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,lotuseed.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,lrswl.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,lufax.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,madhouse.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,madmini.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,madserving.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,magicwindow.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,mathtag.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,maysunmedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mbai.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,mediaplex.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mediav.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,megajoy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,meiqia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mgogo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,miaozhen.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,microad-cn.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,miidi.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,mijifen.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mixpanel.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mjmobi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mng-ads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,moad.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,moatads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobaders.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobclix.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobgi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobisage.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobvista.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mopub.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,moquanad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mpush.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,mxpnl.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,myhug.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,mzy2014.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,networkbench.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ninebox.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,ntalker.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,nylalobghyhirgh.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,o2omobi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,oadz.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,oneapm.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,onetad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,optaim.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,optimix.asia,🛑 广告拦截
+ - DOMAIN-SUFFIX,optimix.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,optimizelyapis.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,overture.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,p0y.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,pagechoice.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,pingdom.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,plugrush.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,popin.cc,🛑 广告拦截
+ - DOMAIN-SUFFIX,pro.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,publicidad.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,publicidad.tv,🛑 广告拦截
+ - DOMAIN-SUFFIX,pubmatic.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,pubnub.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,qcl777.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,qiyou.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,qtmojo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,quantcount.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,qucaigg.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,qumi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,qxxys.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,reachmax.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,responsys.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,revsci.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,rlcdn.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,rtbasia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sanya1.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,scupio.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,serving-sys.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,shuiguo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,shuzilm.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,similarweb.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sitemeter.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sitescout.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sitetag.us,🛑 广告拦截
+ - DOMAIN-SUFFIX,smartmad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,social-touch.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,somecoding.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sponsorpay.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,stargame.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,stg8.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,switchadhub.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sycbbs.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,synacast.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sysdig.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,talkingdata.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,talkingdata.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,tansuotv.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tanv.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tanx.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tapjoy.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,th7.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,thoughtleadr.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tianmidian.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tiqcdn.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,touclick.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,trafficjam.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,trafficmp.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tuia.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,ueadlian.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,uerzyr.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,ugdtimg.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ugvip.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ujian.cc,🛑 广告拦截
+ - DOMAIN-SUFFIX,ukeiae.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,umeng.co,🛑 广告拦截
+ - DOMAIN-SUFFIX,umeng.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,umtrack.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,unimhk.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,union-wifi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,union001.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,unionsy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,unlitui.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,uri6.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ushaqi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,usingde.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,uuzu.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,uyunad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,vamaker.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,voiceads.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,voiceads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,vpon.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,vungle.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,vungle.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,waps.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,wapx.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,webterren.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,whpxy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,winads.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,winasdaq.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,wiyun.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,wooboo.com.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,wqmobile.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,wrating.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,wumii.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,xcy8.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,xdrig.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,xiaozhen.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,xibao100.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,xtgreat.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,xy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yandui.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yigao.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yijifen.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yinooo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yiqifa.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yiwk.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ylunion.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ymapp.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ymcdn.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,yongyuelm.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yooli.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,youmi.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,youxiaoad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yoyi.com.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,yoyi.tv,🛑 广告拦截
+ - DOMAIN-SUFFIX,yrxmr.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ysjwj.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yunjiasu.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yunpifu.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,zampdsp.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zamplus.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zcdsp.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zhidian3g.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,zhiziyun.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zhjfad.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zqzxz.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zzsx8.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,acuityplatform.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad-stir.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad-survey.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ad4game.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adcloud.jp,🛑 广告拦截
+ - DOMAIN-SUFFIX,adcolony.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,addthis.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adfurikun.jp,🛑 广告拦截
+ - DOMAIN-SUFFIX,adhigh.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,adhood.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adinall.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adition.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adk2x.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,admarket.mobi,🛑 广告拦截
+ - DOMAIN-SUFFIX,admarvel.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,admedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adnxs.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adotmob.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adperium.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adriver.ru,🛑 广告拦截
+ - DOMAIN-SUFFIX,adroll.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsco.re,🛑 广告拦截
+ - DOMAIN-SUFFIX,adservice.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsrvr.org,🛑 广告拦截
+ - DOMAIN-SUFFIX,adsymptotic.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adtaily.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adtech.de,🛑 广告拦截
+ - DOMAIN-SUFFIX,adtechjp.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,adtechus.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,airpush.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,am15.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,amobee.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,appier.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,applift.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,apsalar.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,atas.io,🛑 广告拦截
+ - DOMAIN-SUFFIX,awempire.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,axonix.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,beintoo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,bepolite.eu,🛑 广告拦截
+ - DOMAIN-SUFFIX,bidtheatre.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,bidvertiser.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,blismedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,brucelead.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,bttrack.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,casalemedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,celtra.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,channeladvisor.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,connexity.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,criteo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,criteo.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,csbew.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,demdex.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,directrev.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,dumedia.ru,🛑 广告拦截
+ - DOMAIN-SUFFIX,effectivemeasure.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,effectivemeasure.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,eqads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,everesttech.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,exoclick.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,extend.tv,🛑 广告拦截
+ - DOMAIN-SUFFIX,eyereturn.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,fastapi.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,fastclick.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,fastclick.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,flurry.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,gosquared.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,gtags.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,heyzap.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,histats.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,hitslink.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,hot-mob.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,hyperpromote.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,i-mobile.co.jp,🛑 广告拦截
+ - DOMAIN-SUFFIX,imrworldwide.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,inmobi.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,inner-active.mobi,🛑 广告拦截
+ - DOMAIN-SUFFIX,intentiq.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,inter1ads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ipredictive.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,ironsrc.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,iskyworker.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,jizzads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,juicyads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,kochava.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,leadbolt.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,leadbolt.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,leadboltads.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,leadboltapps.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,leadboltmobile.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,lenzmx.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,liveadvert.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,marketgid.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,marketo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mdotm.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,medialytics.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,medialytics.io,🛑 广告拦截
+ - DOMAIN-SUFFIX,meetrics.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,meetrics.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,mgid.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,millennialmedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobadme.jp,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobfox.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobileadtrading.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mobilityware.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mojiva.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,mookie1.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,msads.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,mydas.mobi,🛑 广告拦截
+ - DOMAIN-SUFFIX,nend.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,netshelter.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,nexage.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,owneriq.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,pixels.asia,🛑 广告拦截
+ - DOMAIN-SUFFIX,plista.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,popads.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,powerlinks.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,propellerads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,quantserve.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,rayjump.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,revdepo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,rubiconproject.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sape.ru,🛑 广告拦截
+ - DOMAIN-SUFFIX,scorecardresearch.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,segment.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,serving-sys.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,sharethis.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,smaato.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,smaato.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,smartadserver.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,smartnews-ads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,startapp.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,startappexchange.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,statcounter.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,steelhousemedia.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,stickyadstv.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,supersonic.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,taboola.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tapjoy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,tapjoyads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,trafficjunky.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,trafficjunky.net,🛑 广告拦截
+ - DOMAIN-SUFFIX,tribalfusion.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,turn.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,uberads.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,vidoomy.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,viglink.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,voicefive.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,wedolook.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,yadro.ru,🛑 广告拦截
+ - DOMAIN-SUFFIX,yengo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zedo.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,zemanta.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,11h5.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,1kxun.mobi,🛑 广告拦截
+ - DOMAIN-SUFFIX,26zsd.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,519397.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,626uc.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,915.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,appget.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,appuu.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,coinhive.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,huodonghezi.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,vcbn65.xyz,🛑 广告拦截
+ - DOMAIN-SUFFIX,wanfeng1.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,wep016.top,🛑 广告拦截
+ - DOMAIN-SUFFIX,win-stock.com.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,zantainet.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,dh54wf.xyz,🛑 广告拦截
+ - DOMAIN-SUFFIX,g2q3e.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,114so.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,go.10086.cn,🛑 广告拦截
+ - DOMAIN-SUFFIX,hivedata.cc,🛑 广告拦截
+ - DOMAIN-SUFFIX,navi.gd.chinamobile.com,🛑 广告拦截
+ - DOMAIN-SUFFIX,a.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adgeo.corp.163.com,🍃 应用净化
+ - DOMAIN-SUFFIX,analytics.126.net,🍃 应用净化
+ - DOMAIN-SUFFIX,bobo.corp.163.com,🍃 应用净化
+ - DOMAIN-SUFFIX,c.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,clkservice.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,conv.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dsp-impr2.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dsp.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fa.corp.163.com,🍃 应用净化
+ - DOMAIN-SUFFIX,g.corp.163.com,🍃 应用净化
+ - DOMAIN-SUFFIX,g1.corp.163.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gb.corp.163.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gorgon.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,haitaoad.nosdn.127.net,🍃 应用净化
+ - DOMAIN-SUFFIX,iadmatvideo.nosdn.127.net,🍃 应用净化
+ - DOMAIN-SUFFIX,img1.126.net,🍃 应用净化
+ - DOMAIN-SUFFIX,img2.126.net,🍃 应用净化
+ - DOMAIN-SUFFIX,ir.mail.126.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ir.mail.yeah.net,🍃 应用净化
+ - DOMAIN-SUFFIX,mimg.126.net,🍃 应用净化
+ - DOMAIN-SUFFIX,nc004x.corp.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,nc045x.corp.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,nex.corp.163.com,🍃 应用净化
+ - DOMAIN-SUFFIX,oimagea2.ydstatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pagechoice.net,🍃 应用净化
+ - DOMAIN-SUFFIX,prom.gome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,qchannel0d.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,qt002x.corp.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rlogs.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,static.flv.uuzuonline.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tb060x.corp.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tb104x.corp.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,union.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wanproxy.127.net,🍃 应用净化
+ - DOMAIN-SUFFIX,ydpushserver.youdao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cvda.17173.com,🍃 应用净化
+ - DOMAIN-SUFFIX,imgapp.yeyou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log1.17173.com,🍃 应用净化
+ - DOMAIN-SUFFIX,s.17173cdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ue.yeyoucdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,vda.17173.com,🍃 应用净化
+ - DOMAIN-SUFFIX,analytics.wanmei.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gg.stargame.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dl.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,download.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,houtai.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,jifen.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,jifendownload.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,minipage.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wan.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,zhushou.2345.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,3600.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gamebox.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,jiagu.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,kuaikan.netmon.360safe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,leak.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,lianmeng.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pub.se.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,s.so.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,shouji.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,soft.data.weather.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.360safe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.m.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,update.360safe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wan.360.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,58.xgo.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,brandshow.58.com,🍃 应用净化
+ - DOMAIN-SUFFIX,imp.xgo.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,jing.58.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.xgo.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,track.58.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tracklog.58.com,🍃 应用净化
+ - DOMAIN-SUFFIX,acjs.aliyun.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adash-c.m.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adash-c.ut.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adashx4yt.m.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adashxgc.ut.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,afp.alicdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ai.m.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,alipaylog.com,🍃 应用净化
+ - DOMAIN-SUFFIX,atanx.alicdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,atanx2.alicdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fav.simba.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,g.click.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,g.tbcdn.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,gma.alicdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gtmsdd.alicdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hydra.alibaba.com,🍃 应用净化
+ - DOMAIN-SUFFIX,m.simba.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pindao.huoban.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,re.m.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,redirect.simba.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rj.m.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sdkinit.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,show.re.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,simaba.m.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,simaba.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,srd.simba.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,strip.taobaocdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tns.simba.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tyh.taobao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,userimg.qunar.com,🍃 应用净化
+ - DOMAIN-SUFFIX,yiliao.hupan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,3dns-2.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,3dns-3.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,activate-sea.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,activate-sjc0.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,activate.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,activate.wip3.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adobe-dns-2.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adobe-dns-3.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adobe-dns.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ereg.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ereg.wip3.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,geo2.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hl2rcv.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hlrcv.stage.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lm.licenses.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lmlicenses.wip4.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,na1r.services.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,na2m-pr.licenses.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,practivate.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wip3.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wwis-dubc1-vip60.adobe.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adserver.unityads.unity3d.com,🍃 应用净化
+ - DOMAIN-SUFFIX,33.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,adproxy.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,al.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,alert.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,applogapi.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,c.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cmx.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,dspmnt.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pcd.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,push.app.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pvx.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,rd.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,rdx.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,stats.autohome.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,a.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,a.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.duapps.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.player.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adm.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,adm.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adscdn.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,adscdn.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adx.xiaodutv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ae.bdstatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,afd.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,afd.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,als.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,als.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,anquan.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,anquan.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,antivirus.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api.mobula.sdk.duapps.com,🍃 应用净化
+ - DOMAIN-SUFFIX,appc.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,appc.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,as.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,as.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,baichuan.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,baidu9635.com,🍃 应用净化
+ - DOMAIN-SUFFIX,baidustatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,baidutv.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,baikebcs.bdimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,banlv.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bar.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bdimg.share.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bdplus.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,btlaunch.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,c.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,c.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cb.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cb.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cbjs.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cbjs.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cbjslog.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cbjslog.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cjhq.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cjhq.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cleaner.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.bes.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.hm.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.qianqian.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cm.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cm.pos.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cpro.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cpro.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cpro.baidustatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cpro.tieba.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cpro.zhidao.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cpro2.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cpro2.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cpu-admin.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,crs.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,crs.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,datax.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dl-vip.bav.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dl-vip.pcfaster.baidu.co.th,🍃 应用净化
+ - DOMAIN-SUFFIX,dl.client.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dl.ops.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dl1sw.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dl2.bav.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dlsw.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dlsw.br.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,download.bav.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,download.sd.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,drmcmm.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,drmcmm.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dup.baidustatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dxp.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dzl.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,e.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,e.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,eclick.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,eclick.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ecma.bdimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ecmb.bdimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ecmc.bdimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,eiv.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,eiv.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,em.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ers.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,f10.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fc-.cdn.bcebos.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fc-feed.cdn.bcebos.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fclick.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fexclick.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,g.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gimg.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,guanjia.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hc.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,hc.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hm.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,hm.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hmma.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,hmma.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hpd.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,hpd.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,idm-su.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,iebar.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ikcode.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,imageplus.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,imageplus.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,img.taotaosou.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,img01.taotaosou.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,itsdata.map.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,j.br.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,kstj.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.music.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.nuomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,m1.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ma.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ma.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mg09.zhaopin.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mipcache.bdstatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mobads-logs.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,mobads-logs.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mobads.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,mobads.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mpro.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mtj.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,mtj.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,neirong.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,nsclick.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,nsclick.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,nsclickvideo.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,openrcv.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pc.videoclick.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pos.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pups.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pups.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pups.bdimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.music.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.zhanzhang.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,qchannel0d.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,qianclick.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,release.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,res.limei.com,🍃 应用净化
+ - DOMAIN-SUFFIX,res.mi.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rigel.baidustatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,river.zhidao.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rj.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,rj.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rp.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,rp.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rplog.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,s.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,s.cpro.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sa.tuisong.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sclick.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sestat.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,shadu.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,share.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,snippet.pos.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sobar.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sobartop.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,spcode.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,spcode.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.v.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,su.bdimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,su.bdstatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tk.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,tk.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tkweb.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tob-cms.bj.bcebos.com,🍃 应用净化
+ - DOMAIN-SUFFIX,toolbar.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tracker.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tuijian.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tuisong.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,tuisong.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,uat1.bfsspadserver.8le8le.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ubmcmm.baidustatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ucstat.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ucstat.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ulic.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ulog.imap.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,union.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,union.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,unionimage.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,utility.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,utility.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,utk.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,utk.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,videopush.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,videopush.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,vv84.bj.bcebos.com,🍃 应用净化
+ - DOMAIN-SUFFIX,w.gdown.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,w.x.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wangmeng.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wangmeng.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,weishi.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wenku-cms.bj.bcebos.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wisepush.video.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wm.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wm.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wn.pos.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,znsv.baidu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,znsv.baidu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,zz.bdstatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,zzy1.quyaoya.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.zhangyue.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adm.ps.easou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,aishowbger.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api.itaoxiaoshuo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,assets.ps.easou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bbcoe.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cj.qidian.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dkeyn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,drdwy.com,🍃 应用净化
+ - DOMAIN-SUFFIX,e.aa985.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,e.v02u9.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,e701.net,🍃 应用净化
+ - DOMAIN-SUFFIX,ehxyz.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ethod.gzgmjcx.com,🍃 应用净化
+ - DOMAIN-SUFFIX,focuscat.com,🍃 应用净化
+ - DOMAIN-SUFFIX,game.qidian.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hdswgc.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jyd.fjzdmy.com,🍃 应用净化
+ - DOMAIN-SUFFIX,m.ourlj.com,🍃 应用净化
+ - DOMAIN-SUFFIX,m.txtxr.com,🍃 应用净化
+ - DOMAIN-SUFFIX,m.vsxet.com,🍃 应用净化
+ - DOMAIN-SUFFIX,miam4.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,o.if.qidian.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p.vq6nsu.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,picture.duokan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.zhangyue.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pyerc.com,🍃 应用净化
+ - DOMAIN-SUFFIX,s1.cmfu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sc.shayugg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sdk.cferw.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sezvc.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sys.zhangyue.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tjlog.ps.easou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tongji.qidian.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ut2.shuqistat.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xgcsr.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xjq.jxmqkj.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xpe.cxaerp.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xtzxmy.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xyrkl.com,🍃 应用净化
+ - DOMAIN-SUFFIX,zhuanfakong.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.toutiao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dsp.toutiao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ic.snssdk.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.snssdk.com,🍃 应用净化
+ - DOMAIN-SUFFIX,nativeapp.toutiao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,partner.toutiao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sm.toutiao.com,🍃 应用净化
+ - DOMAIN-SUFFIX,a.dangdang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.dangdang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,schprompt.dangdang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,t.dangdang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.duomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,boxshows.com,🍃 应用净化
+ - DOMAIN-SUFFIX,staticxx.facebook.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click1n.soufun.com,🍃 应用净化
+ - DOMAIN-SUFFIX,clickm.fang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,clickn.fang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,countpvn.light.fang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,countubn.light.soufun.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mshow.fang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tongji.home.soufun.com,🍃 应用净化
+ - DOMAIN-SUFFIX,admob.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.gmodules.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.google.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adservice.google.com,🍃 应用净化
+ - DOMAIN-SUFFIX,afd.l.google.com,🍃 应用净化
+ - DOMAIN-SUFFIX,badad.googleplex.com,🍃 应用净化
+ - DOMAIN-SUFFIX,csi.gstatic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,doubleclick.com,🍃 应用净化
+ - DOMAIN-SUFFIX,doubleclick.net,🍃 应用净化
+ - DOMAIN-SUFFIX,google-analytics.com,🍃 应用净化
+ - DOMAIN-SUFFIX,googleadservices.com,🍃 应用净化
+ - DOMAIN-SUFFIX,googleadsserving.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,googlecommerce.com,🍃 应用净化
+ - DOMAIN-SUFFIX,googlesyndication.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mobileads.google.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pagead-tpc.l.google.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pagead.google.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pagead.l.google.com,🍃 应用净化
+ - DOMAIN-SUFFIX,service.urchin.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.union.jd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,c-nfa.jd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cps.360buy.com,🍃 应用净化
+ - DOMAIN-SUFFIX,img-x.jd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jrclick.jd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jzt.jd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,policy.jd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.m.jd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.service.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adsfile.bssdlbig.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,d.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,downmobile.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gad.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,game.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gamebox.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gcapi.sy.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gg.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,install.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,install2.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,kgmobilestat.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,kuaikaiapp.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.stat.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.web.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,minidcsc.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mo.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mobilelog.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,msg.mobile.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mvads.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.mobile.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rtmonitor.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sdn.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tj.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,update.mobile.kugou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,apk.shouji.koowo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,deliver.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,g.koowo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,g.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,kwmsg.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,log.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,mobilead.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,msclick2.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,msphoneclick.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,updatepage.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wa.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,webstat.kuwo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,aider-res.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api-flow.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api-game.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api-push.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,aries.mzres.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bro.flyme.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cal.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ebook.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ebook.res.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,game-res.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,game.res.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,infocenter.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,openapi-news.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.res.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,reader.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,reader.res.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,t-e.flyme.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,t-flow.flyme.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,tongji-res1.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tongji.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,umid.orion.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,upush.res.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,uxip.meizu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,a.koudai.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adui.tg.meitu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,corp.meitu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dc.meitustat.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gg.meitu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mdc.meitustat.com,🍃 应用净化
+ - DOMAIN-SUFFIX,meitubeauty.meitudata.com,🍃 应用净化
+ - DOMAIN-SUFFIX,message.meitu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rabbit.meitustat.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rabbit.tg.meitu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tuiguang.meitu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xiuxiu.android.dl.meitu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xiuxiu.mobile.meitudata.com,🍃 应用净化
+ - DOMAIN-SUFFIX,a.market.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad1.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adv.sec.intl.miui.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adv.sec.miui.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bss.pandora.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,d.g.mi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,data.mistat.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,de.pandora.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dvb.pandora.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jellyfish.pandora.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,migc.g.mi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,migcreport.g.mi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mis.g.mi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,notice.game.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ppurifier.game.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,r.browser.miui.com,🍃 应用净化
+ - DOMAIN-SUFFIX,security.browser.miui.com,🍃 应用净化
+ - DOMAIN-SUFFIX,shenghuo.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.pandora.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,union.mi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wtradv.market.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xmpush.xiaomi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.api.moji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,app.moji001.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cdn.moji002.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cdn2.moji002.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fds.api.moji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.moji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.moji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ugc.moji001.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.qingting.fm,🍃 应用净化
+ - DOMAIN-SUFFIX,admgr.qingting.fm,🍃 应用净化
+ - DOMAIN-SUFFIX,dload.qd.qingting.fm,🍃 应用净化
+ - DOMAIN-SUFFIX,logger.qingting.fm,🍃 应用净化
+ - DOMAIN-SUFFIX,s.qd.qingting.fm,🍃 应用净化
+ - DOMAIN-SUFFIX,s.qd.qingtingfm.com,🍃 应用净化
+ - DOMAIN-KEYWORD,omgmtaw,🍃 应用净化
+ - DOMAIN,adsmind.apdcdn.tc.qq.com,🍃 应用净化
+ - DOMAIN,adsmind.gdtimg.com,🍃 应用净化
+ - DOMAIN,adsmind.tc.qq.com,🍃 应用净化
+ - DOMAIN,pgdt.gtimg.cn,🍃 应用净化
+ - DOMAIN,pgdt.gtimg.com,🍃 应用净化
+ - DOMAIN,pgdt.ugdtimg.com,🍃 应用净化
+ - DOMAIN,splashqqlive.gtimg.com,🍃 应用净化
+ - DOMAIN,wa.gtimg.com,🍃 应用净化
+ - DOMAIN,wxsnsdy.wxs.qq.com,🍃 应用净化
+ - DOMAIN,wxsnsdythumb.wxs.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,act.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.qun.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adsfile.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bugly.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,buluo.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,e.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gdt.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,monitor.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pingma.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pingtcss.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,report.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tajs.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tcss.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,uu.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ebp.renren.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jebe.renren.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jebe.xnimg.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,adbox.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,add.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,adimg.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,adm.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,alitui.weibo.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,biz.weibo.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,cre.dp.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,dcads.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,dd.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,dmp.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,game.weibo.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,gw5.push.mcp.weibo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,leju.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,log.mix.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,mobileads.dx.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,newspush.sinajs.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pay.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,sax.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,sax.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,saxd.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,sdkapp.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,sdkapp.uve.weibo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sdkclick.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,slog.sina.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,trends.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,tui.weibo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,u1.img.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wax.weibo.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wbapp.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wbapp.uve.weibo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wbclick.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,wbpctips.mobile.sina.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,zymo.mps.weibo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,123.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,123.sogoucdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adsence.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,amfi.gou.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,brand.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cpc.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,epro.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fair.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,files2.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,galaxy.sogoucdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,golden1.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,goto.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,inte.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,iwan.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lu.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lu.sogoucdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pb.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pd.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,theta.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wan.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wangmeng.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,applovin.com,🍃 应用净化
+ - DOMAIN-SUFFIX,guangzhuiyuan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads-twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,analytics.twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p.twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,scribe.twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,syndication-o.twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,syndication.twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tellapart.com,🍃 应用净化
+ - DOMAIN-SUFFIX,urls.api.twitter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adslot.uc.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,api.mp.uc.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,applog.uc.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,client.video.ucweb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cms.ucweb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dispatcher.upmc.uc.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,huichuan.sm.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,log.cs.pp.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,m.uczzd.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,patriot.cs.pp.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,puds.ucweb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,server.m.pp.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,track.uc.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,u.uc123.com,🍃 应用净化
+ - DOMAIN-SUFFIX,u.ucfly.com,🍃 应用净化
+ - DOMAIN-SUFFIX,uc.ucweb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ucsec.ucweb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ucsec1.ucweb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,aoodoo.feng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fengbuy.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.feng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,we.tm,🍃 应用净化
+ - DOMAIN-SUFFIX,yes1.feng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.docer.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,adm.zookingsoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bannera.kingsoft-office-service.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bole.shangshufang.ksosoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,counter.kingsoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,docerad.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,gou.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,hoplink.ksosoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ic.ksosoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,img.gou.wpscdn.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,info.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ios-informationplatform.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,minfo.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,mo.res.wpscdn.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,news.docer.com,🍃 应用净化
+ - DOMAIN-SUFFIX,notify.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pc.uf.ksosoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pcfg.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pixiu.shangshufang.ksosoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,rating6.kingsoft-office-service.com,🍃 应用净化
+ - DOMAIN-SUFFIX,up.wps.kingsoft.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wpsweb-dc.wps.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,c.51y5.net,🍃 应用净化
+ - DOMAIN-SUFFIX,cdsget.51y5.net,🍃 应用净化
+ - DOMAIN-SUFFIX,news-imgpb.51y5.net,🍃 应用净化
+ - DOMAIN-SUFFIX,wifiapidd.51y5.net,🍃 应用净化
+ - DOMAIN-SUFFIX,wkanc.51y5.net,🍃 应用净化
+ - DOMAIN-SUFFIX,adse.ximalaya.com,🍃 应用净化
+ - DOMAIN-SUFFIX,linkeye.ximalaya.com,🍃 应用净化
+ - DOMAIN-SUFFIX,location.ximalaya.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xdcs-collector.ximalaya.com,🍃 应用净化
+ - DOMAIN-SUFFIX,biz5.kankan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,float.kankan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hub5btmain.sandai.net,🍃 应用净化
+ - DOMAIN-SUFFIX,hub5emu.sandai.net,🍃 应用净化
+ - DOMAIN-SUFFIX,logic.cpm.cm.kankan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,upgrade.xl9.xunlei.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.wretch.cc,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adserver.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adss.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,analytics.query.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,analytics.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ane.yahoo.co.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,ard.yahoo.co.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,beap-bc.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,clicks.beap.bc.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,comet.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,doubleplay-conf-yql.media.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,flurry.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gemini.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,geo.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,js-apac-ss.ysm.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,locdrop.query.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,onepush.query.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p3p.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,partnerads.ysm.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ws.progrss.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,yads.yahoo.co.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,ybp.yahoo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sugar.zhihu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,zhihu-web-analytics.zhihu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,shrek.6.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,simba.6.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,union.6.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,logger.baofeng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,xs.houyi.baofeng.net,🍃 应用净化
+ - DOMAIN-SUFFIX,dotcounter.douyutv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api.newad.ifeng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,exp.3g.ifeng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,game.ifeng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,iis3g.deliver.ifeng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mfp.deliver.ifeng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stadig.ifeng.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adm.funshion.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jobsfe.funshion.com,🍃 应用净化
+ - DOMAIN-SUFFIX,po.funshion.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pub.funshion.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.funshion.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.funshion.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.m.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,afp.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,c.uaa.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cloudpush.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cm.passport.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cupid.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,emoticon.sns.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gamecenter.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ifacelog.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mbdlog.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,meta.video.qiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,msg.71.am,🍃 应用净化
+ - DOMAIN-SUFFIX,msg1.video.qiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,msg2.video.qiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,paopao.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,paopaod.qiyipic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,policy.video.iqiyi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,yuedu.iqiyi.com,🍃 应用净化
+ - IP-CIDR,101.227.200.0/24,🍃 应用净化,no-resolve
+ - IP-CIDR,101.227.200.11/32,🍃 应用净化,no-resolve
+ - IP-CIDR,101.227.200.28/32,🍃 应用净化,no-resolve
+ - IP-CIDR,101.227.97.240/32,🍃 应用净化,no-resolve
+ - IP-CIDR,124.192.153.42/32,🍃 应用净化,no-resolve
+ - DOMAIN-SUFFIX,gug.ku6cdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pq.stat.ku6.com,🍃 应用净化
+ - DOMAIN-SUFFIX,st.vq.ku6.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,static.ku6.com,🍃 应用净化
+ - DOMAIN-SUFFIX,1.letvlive.com,🍃 应用净化
+ - DOMAIN-SUFFIX,2.letvlive.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ark.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dc.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,fz.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,g3.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,game.letvstore.com,🍃 应用净化
+ - DOMAIN-SUFFIX,i0.letvimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,i3.letvimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,minisite.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,n.mark.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pro.hoye.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pro.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,static.app.m.letv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.hunantv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,da.hunantv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,da.mgtv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.hunantv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.v2.hunantv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p2.hunantv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,res.hunantv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,888.tv.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adnet.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,aty.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,aty.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bd.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click2.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ctr.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,epro.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,epro.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,go.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,golden1.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,golden1.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hui.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,inte.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,inte.sogoucdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,inte.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lm.tv.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lu.sogoucdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pb.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.tv.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,theta.sogoucdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,um.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,uranus.sogou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,uranus.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wan.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wl.hd.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,yule.sohu.com,🍃 应用净化
+ - DOMAIN-SUFFIX,afp.pplive.com,🍃 应用净化
+ - DOMAIN-SUFFIX,app.aplus.pptv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,as.aplus.pptv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,asimgs.pplive.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,de.as.pptv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,jp.as.pptv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pp2.pptv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.pptv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,btrace.video.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,c.l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dp3.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,livep.l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lives.l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,livew.l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mcgi.v.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mdevstat.qqlive.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,omgmta1.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p.l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,rcgi.video.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,t.l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,u.l.qq.com,🍃 应用净化
+ - DOMAIN-SUFFIX,a-dxk.play.api.3g.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,actives.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.api.3g.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.api.3g.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.api.mobile.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.mobile.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adcontrol.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adplay.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,b.smartvideo.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,c.yes.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dev-push.m.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dl.g.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dmapp.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,e.stat.ykimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gamex.mobile.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,goods.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hudong.pl.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,hz.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,iwstat.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,iyes.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,l.ykimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,l.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lstat.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,lvip.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mobilemsg.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,msg.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,myes.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,nstat.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p-log.ykimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p.l.ykimg.com,🍃 应用净化
+ - DOMAIN-SUFFIX,p.l.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,passport-log.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.m.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,r.l.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,s.p.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sdk.m.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stats.tudou.com,🍃 应用净化
+ - DOMAIN-SUFFIX,store.tv.api.3g.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,store.xl.api.3g.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tdrec.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,test.ott.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,v.l.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,val.api.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,wan.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ykatr.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ykrec.youku.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ykrectab.youku.com,🍃 应用净化
+ - IP-CIDR,117.177.248.17/32,🍃 应用净化,no-resolve
+ - IP-CIDR,117.177.248.41/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.176.139/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.176.176/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.177.180/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.177.182/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.177.184/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.177.43/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.177.47/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.177.80/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.182.101/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.182.102/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.182.11/32,🍃 应用净化,no-resolve
+ - IP-CIDR,223.87.182.52/32,🍃 应用净化,no-resolve
+ - DOMAIN-SUFFIX,azabu-u.ac.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,couchcoaster.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,delivery.dmkt-sp.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,ehg-youtube.hitbox.com,🍃 应用净化
+ - DOMAIN-SUFFIX,m-78.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,nichibenren.or.jp,🍃 应用净化
+ - DOMAIN-SUFFIX,nicorette.co.kr,🍃 应用净化
+ - DOMAIN-SUFFIX,ssl-youtube.2cnt.net,🍃 应用净化
+ - DOMAIN-SUFFIX,youtube.112.2o7.net,🍃 应用净化
+ - DOMAIN-SUFFIX,youtube.2cnt.net,🍃 应用净化
+ - DOMAIN-SUFFIX,acsystem.wasu.tv,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.cdn.tvb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.wasu.tv,🍃 应用净化
+ - DOMAIN-SUFFIX,afp.wasu.tv,🍃 应用净化
+ - DOMAIN-SUFFIX,c.algovid.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cc.xtgreat.com,🍃 应用净化
+ - DOMAIN-SUFFIX,d.dsp.imageter.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gg.jtertp.com,🍃 应用净化
+ - DOMAIN-SUFFIX,gridsum-vd.cntv.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,kwflvcdn.000dn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,logstat.t.sfht.com,🍃 应用净化
+ - DOMAIN-SUFFIX,match.rtbidder.net,🍃 应用净化
+ - DOMAIN-SUFFIX,n-st.vip.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pop.uusee.com,🍃 应用净化
+ - DOMAIN-SUFFIX,static.duoshuo.com,🍃 应用净化
+ - DOMAIN-SUFFIX,t.cr-nielsen.com,🍃 应用净化
+ - DOMAIN-SUFFIX,terren.cntv.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,1.win7china.com,🍃 应用净化
+ - DOMAIN-SUFFIX,168.it168.com,🍃 应用净化
+ - DOMAIN-SUFFIX,2.win7china.com,🍃 应用净化
+ - DOMAIN-SUFFIX,801.tianya.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,801.tianyaui.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,803.tianya.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,803.tianyaui.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,806.tianya.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,806.tianyaui.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,808.tianya.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,808.tianyaui.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,92x.tumblr.com,🍃 应用净化
+ - DOMAIN-SUFFIX,a1.itc.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ad-channel.wikawika.xyz,🍃 应用净化
+ - DOMAIN-SUFFIX,ad-display.wikawika.xyz,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.12306.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.3.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.95306.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.caiyunapp.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.cctv.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.cmvideo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.csdn.net,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.ganji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.house365.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.thepaper.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ad.unimhk.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adadmin.house365.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adhome.1fangchan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adm.10jqka.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.csdn.net,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.feedly.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.genieessp.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.house365.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ads.linkedin.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adshownew.it168.com,🍃 应用净化
+ - DOMAIN-SUFFIX,adv.ccb.com,🍃 应用净化
+ - DOMAIN-SUFFIX,advert.api.thejoyrun.com,🍃 应用净化
+ - DOMAIN-SUFFIX,analytics.ganji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api-deal.kechenggezi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,api-z.weidian.com,🍃 应用净化
+ - DOMAIN-SUFFIX,app-monitor.ele.me,🍃 应用净化
+ - DOMAIN-SUFFIX,bat.bing.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bd1.52che.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bd2.52che.com,🍃 应用净化
+ - DOMAIN-SUFFIX,bdj.tianya.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,bdj.tianyaui.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,beacon.tingyun.com,🍃 应用净化
+ - DOMAIN-SUFFIX,cdn.jiuzhilan.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.cheshi-img.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.cheshi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.ganji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,click.tianya.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,click.tianyaui.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,client-api.ele.me,🍃 应用净化
+ - DOMAIN-SUFFIX,collector.githubapp.com,🍃 应用净化
+ - DOMAIN-SUFFIX,counter.csdn.net,🍃 应用净化
+ - DOMAIN-SUFFIX,d0.xcar.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,de.soquair.com,🍃 应用净化
+ - DOMAIN-SUFFIX,dol.tianya.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,dol.tianyaui.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,dw.xcar.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,e.nexac.com,🍃 应用净化
+ - DOMAIN-SUFFIX,eq.10jqka.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,exp.17wo.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,game.51yund.com,🍃 应用净化
+ - DOMAIN-SUFFIX,ganjituiguang.ganji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,grand.ele.me,🍃 应用净化
+ - DOMAIN-SUFFIX,hosting.miarroba.info,🍃 应用净化
+ - DOMAIN-SUFFIX,iadsdk.apple.com,🍃 应用净化
+ - DOMAIN-SUFFIX,image.gentags.com,🍃 应用净化
+ - DOMAIN-SUFFIX,its-dori.tumblr.com,🍃 应用净化
+ - DOMAIN-SUFFIX,log.outbrain.com,🍃 应用净化
+ - DOMAIN-SUFFIX,m.12306media.com,🍃 应用净化
+ - DOMAIN-SUFFIX,media.cheshi-img.com,🍃 应用净化
+ - DOMAIN-SUFFIX,media.cheshi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,mobile-pubt.ele.me,🍃 应用净化
+ - DOMAIN-SUFFIX,mobileads.msn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,n.cosbot.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,newton-api.ele.me,🍃 应用净化
+ - DOMAIN-SUFFIX,ozone.10jqka.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,pdl.gionee.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pica-juicy.picacomic.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pixel.wp.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pub.mop.com,🍃 应用净化
+ - DOMAIN-SUFFIX,push.wandoujia.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.cheshi-img.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.cheshi.com,🍃 应用净化
+ - DOMAIN-SUFFIX,pv.xcar.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,qdp.qidian.com,🍃 应用净化
+ - DOMAIN-SUFFIX,res.gwifi.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,ssp.kssws.ks-cdn.com,🍃 应用净化
+ - DOMAIN-SUFFIX,sta.ganji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.10jqka.com.cn,🍃 应用净化
+ - DOMAIN-SUFFIX,stat.it168.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stats.chinaz.com,🍃 应用净化
+ - DOMAIN-SUFFIX,stats.developingperspective.com,🍃 应用净化
+ - DOMAIN-SUFFIX,track.hujiang.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tracker.yhd.com,🍃 应用净化
+ - DOMAIN-SUFFIX,tralog.ganji.com,🍃 应用净化
+ - DOMAIN-SUFFIX,up.qingdaonews.com,🍃 应用净化
+ - DOMAIN-SUFFIX,vaserviece.10jqka.com.cn,🍃 应用净化
+ - DOMAIN,alt1-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,alt2-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,alt3-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,alt4-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,alt5-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,alt6-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,alt7-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,alt8-mtalk.google.com,📢 谷歌 FCM
+ - DOMAIN,mtalk.google.com,📢 谷歌 FCM
+ - IP-CIDR,64.233.177.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,64.233.186.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,64.233.187.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,64.233.188.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,64.233.189.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.23.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.24.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.28.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.127.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.137.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.203.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.204.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,74.125.206.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,108.177.125.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,142.250.4.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,142.250.10.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,142.250.31.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,142.250.96.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,172.217.194.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,172.217.218.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,172.217.219.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,172.253.63.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,172.253.122.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,173.194.175.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,173.194.218.188/32,📢 谷歌 FCM,no-resolve
+ - IP-CIDR,209.85.233.188/32,📢 谷歌 FCM,no-resolve
+ - DOMAIN-KEYWORD,github,😺 GitHub
+ - DOMAIN-SUFFIX,github.com,😺 GitHub
+ - DOMAIN-SUFFIX,github.io,😺 GitHub
+ - DOMAIN-SUFFIX,githubapp.com,😺 GitHub
+ - DOMAIN-SUFFIX,githubassets.com,😺 GitHub
+ - DOMAIN-SUFFIX,githubusercontent.com,😺 GitHub
+ - DOMAIN-SUFFIX,265.com,🎯 全球直连
+ - DOMAIN-SUFFIX,netfly.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,2mdn.net,🎯 全球直连
+ - DOMAIN-SUFFIX,api.prprcloud.life,🎯 全球直连
+ - PROCESS-NAME,OneDrive,Ⓜ️ 微软云盘
+ - PROCESS-NAME,OneDriveUpdater,Ⓜ️ 微软云盘
+ - DOMAIN-KEYWORD,1drv,Ⓜ️ 微软云盘
+ - DOMAIN-KEYWORD,onedrive,Ⓜ️ 微软云盘
+ - DOMAIN-KEYWORD,skydrive,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,livefilestore.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,oneclient.sfx.ms,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,onedrive.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,onedrive.live.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,photos.live.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,sharepoint.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,sharepointonline.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,skydrive.wns.windows.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,spoprod-a.akamaihd.net,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,storage.live.com,Ⓜ️ 微软云盘
+ - DOMAIN-SUFFIX,storage.msn.com,Ⓜ️ 微软云盘
+ - DOMAIN-KEYWORD,1drv,Ⓜ️ 微软服务
+ - DOMAIN-KEYWORD,microsoft,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,aadrm.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,acompli.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,acompli.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,aka.ms,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,akadns.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,aspnetcdn.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,assets-yammer.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,azure.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,azure.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,azureedge.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,azurerms.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,bing.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,cloudapp.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,cloudappsecurity.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,edgesuite.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,gfx.ms,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,hotmail.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,live.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,live.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,lync.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msappproxy.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msauth.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msauthimages.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msecnd.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msedge.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msft.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msftauth.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msftauthimages.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msftidentity.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msidentity.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msn.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msocdn.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,msocsp.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,mstea.ms,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,o365weve.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,oaspapps.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,office.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,office.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,office365.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,officeppe.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,omniroot.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,onedrive.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,onenote.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,onenote.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,onestore.ms,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,outlook.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,outlookmobile.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,phonefactor.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,public-trust.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,sfbassets.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,sfx.ms,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,sharepoint.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,sharepointonline.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,skype.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,skypeassets.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,skypeforbusiness.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,staffhub.ms,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,svc.ms,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,sway-cdn.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,sway-extensions.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,sway.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,trafficmanager.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,uservoice.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,virtualearth.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,visualstudio.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,windows-ppe.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,windows.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,windows.net,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,windowsazure.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,windowsupdate.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,wunderlist.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,yammer.com,Ⓜ️ 微软服务
+ - DOMAIN-SUFFIX,yammerusercontent.com,Ⓜ️ 微软服务
+ - DOMAIN,apple.comscoreresearch.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,aaplimg.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,akadns.net,🍎 苹果服务
+ - DOMAIN-SUFFIX,apple-cloudkit.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,apple.co,🍎 苹果服务
+ - DOMAIN-SUFFIX,apple.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,apple.com.cn,🍎 苹果服务
+ - DOMAIN-SUFFIX,apple.news,🍎 苹果服务
+ - DOMAIN-SUFFIX,appstore.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,cdn-apple.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,crashlytics.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,icloud-content.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,icloud.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,icloud.com.cn,🍎 苹果服务
+ - DOMAIN-SUFFIX,itunes.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,me.com,🍎 苹果服务
+ - DOMAIN-SUFFIX,mzstatic.com,🍎 苹果服务
+ - IP-CIDR,17.0.0.0/8,🍎 苹果服务,no-resolve
+ - IP-CIDR,63.92.224.0/19,🍎 苹果服务,no-resolve
+ - IP-CIDR,65.199.22.0/23,🍎 苹果服务,no-resolve
+ - IP-CIDR,139.178.128.0/18,🍎 苹果服务,no-resolve
+ - IP-CIDR,144.178.0.0/19,🍎 苹果服务,no-resolve
+ - IP-CIDR,144.178.36.0/22,🍎 苹果服务,no-resolve
+ - IP-CIDR,144.178.48.0/20,🍎 苹果服务,no-resolve
+ - IP-CIDR,192.35.50.0/24,🍎 苹果服务,no-resolve
+ - IP-CIDR,198.183.17.0/24,🍎 苹果服务,no-resolve
+ - IP-CIDR,205.180.175.0/24,🍎 苹果服务,no-resolve
+ - DOMAIN-SUFFIX,t.me,📲 Telegram
+ - DOMAIN-SUFFIX,tdesktop.com,📲 Telegram
+ - DOMAIN-SUFFIX,telegra.ph,📲 Telegram
+ - DOMAIN-SUFFIX,telegram.me,📲 Telegram
+ - DOMAIN-SUFFIX,telegram.org,📲 Telegram
+ - DOMAIN-SUFFIX,telesco.pe,📲 Telegram
+ - IP-CIDR,91.108.0.0/16,📲 Telegram,no-resolve
+ - IP-CIDR,109.239.140.0/24,📲 Telegram,no-resolve
+ - IP-CIDR,149.154.160.0/20,📲 Telegram,no-resolve
+ - IP-CIDR6,2001:67c:4e8::/48,📲 Telegram,no-resolve
+ - IP-CIDR6,2001:b28:f23d::/48,📲 Telegram,no-resolve
+ - IP-CIDR6,2001:b28:f23f::/48,📲 Telegram,no-resolve
+ - DOMAIN-SUFFIX,chatgpt.com,🎶 ChatGPT
+ - DOMAIN-SUFFIX,openai.com,🎶 ChatGPT
+ - DOMAIN-SUFFIX,oaiusercontent.com,🎶 ChatGPT
+ - DOMAIN-SUFFIX,oaistatic.com,🎶 ChatGPT
+ - DOMAIN,copilot.microsoft.com,🎶 ChatGPT
+ - DOMAIN-SUFFIX,epicgames.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,helpshift.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,paragon.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,unrealengine.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,playstation.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,playstation.net,🎮 游戏平台
+ - DOMAIN-SUFFIX,playstationnetwork.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,sony.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,sonyentertainmentnetwork.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,fanatical.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,humblebundle.com,🎮 游戏平台
+ - DOMAIN,steambroadcast.akamaized.net,🎮 游戏平台
+ - DOMAIN,steamcdn-a.akamaihd.net,🎮 游戏平台
+ - DOMAIN,steamcommunity-a.akamaihd.net,🎮 游戏平台
+ - DOMAIN,steampipe.akamaized.net,🎮 游戏平台
+ - DOMAIN,steamstore-a.akamaihd.net,🎮 游戏平台
+ - DOMAIN,steamusercontent-a.akamaihd.net,🎮 游戏平台
+ - DOMAIN,steamuserimages-a.akamaihd.net,🎮 游戏平台
+ - DOMAIN-SUFFIX,fanatical.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,humblebundle.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,playartifact.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,steam-chat.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,steamcommunity.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,steamgames.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,steampowered.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,steamstat.us,🎮 游戏平台
+ - DOMAIN-SUFFIX,steamstatic.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,underlords.com,🎮 游戏平台
+ - DOMAIN-SUFFIX,valvesoftware.com,🎮 游戏平台
+ - DOMAIN-KEYWORD,youtube,📹 YouTube
+ - DOMAIN,youtubei.googleapis.com,📹 YouTube
+ - DOMAIN,yt3.ggpht.com,📹 YouTube
+ - DOMAIN-SUFFIX,googlevideo.com,📹 YouTube
+ - DOMAIN-SUFFIX,gvt2.com,📹 YouTube
+ - DOMAIN-SUFFIX,youtu.be,📹 YouTube
+ - DOMAIN-SUFFIX,youtube.com,📹 YouTube
+ - DOMAIN-SUFFIX,ytimg.com,📹 YouTube
+ - DOMAIN-KEYWORD,dualstack.apiproxy-,🎥 Netflix
+ - DOMAIN-KEYWORD,dualstack.ichnaea-web-,🎥 Netflix
+ - DOMAIN,netflix.com.edgesuite.net,🎥 Netflix
+ - DOMAIN-SUFFIX,fast.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflix.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflix.net,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest0.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest1.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest2.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest3.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest4.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest5.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest6.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest7.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest8.com,🎥 Netflix
+ - DOMAIN-SUFFIX,netflixdnstest9.com,🎥 Netflix
+ - DOMAIN-SUFFIX,nflxext.com,🎥 Netflix
+ - DOMAIN-SUFFIX,nflximg.com,🎥 Netflix
+ - DOMAIN-SUFFIX,nflximg.net,🎥 Netflix
+ - DOMAIN-SUFFIX,nflxso.net,🎥 Netflix
+ - DOMAIN-SUFFIX,nflxvideo.net,🎥 Netflix
+ - IP-CIDR,103.87.204.0/22,🎥 Netflix
+ - IP-CIDR,108.175.32.0/20,🎥 Netflix
+ - IP-CIDR,185.2.220.0/22,🎥 Netflix
+ - IP-CIDR,185.9.188.0/22,🎥 Netflix
+ - IP-CIDR,192.173.64.0/18,🎥 Netflix
+ - IP-CIDR,198.38.96.0/19,🎥 Netflix
+ - IP-CIDR,198.45.48.0/20,🎥 Netflix
+ - IP-CIDR,203.116.0.0/16,🎥 Netflix
+ - IP-CIDR,203.198.0.0/20,🎥 Netflix
+ - IP-CIDR,203.198.80.0/21,🎥 Netflix
+ - IP-CIDR,203.75.84.0/24,🎥 Netflix
+ - IP-CIDR,203.83.220.0/22,🎥 Netflix
+ - IP-CIDR,207.45.72.0/22,🎥 Netflix
+ - IP-CIDR,208.75.76.0/22,🎥 Netflix
+ - IP-CIDR,218.102.32.0/19,🎥 Netflix
+ - IP-CIDR,219.76.0.0/17,🎥 Netflix
+ - IP-CIDR,23.246.0.0/18,🎥 Netflix
+ - IP-CIDR,23.78.0.0/16,🎥 Netflix
+ - IP-CIDR,34.192.0.0/16,🎥 Netflix
+ - IP-CIDR,34.208.0.0/12,🎥 Netflix
+ - IP-CIDR,34.210.42.111/32,🎥 Netflix
+ - IP-CIDR,34.248.0.0/13,🎥 Netflix
+ - IP-CIDR,35.160.0.0/13,🎥 Netflix
+ - IP-CIDR,37.77.184.0/21,🎥 Netflix
+ - IP-CIDR,38.72.126.0/24,🎥 Netflix
+ - IP-CIDR,44.224.0.0/16,🎥 Netflix
+ - IP-CIDR,44.230.0.0/16,🎥 Netflix
+ - IP-CIDR,45.57.0.0/17,🎥 Netflix
+ - IP-CIDR,52.0.0.0/15,🎥 Netflix
+ - IP-CIDR,52.10.0.0/15,🎥 Netflix
+ - IP-CIDR,52.12.0.0/15,🎥 Netflix
+ - IP-CIDR,52.22.0.0/16,🎥 Netflix
+ - IP-CIDR,52.24.0.0/14,🎥 Netflix
+ - IP-CIDR,52.32.0.0/14,🎥 Netflix
+ - IP-CIDR,52.40.0.0/14,🎥 Netflix
+ - IP-CIDR,52.48.0.0/14,🎥 Netflix
+ - IP-CIDR,52.5.0.0/16,🎥 Netflix
+ - IP-CIDR,52.54.0.0/16,🎥 Netflix
+ - IP-CIDR,52.7.0.0/16,🎥 Netflix
+ - IP-CIDR,52.71.0.0/16,🎥 Netflix
+ - IP-CIDR,52.72.0.0/16,🎥 Netflix
+ - IP-CIDR,52.88.0.0/15,🎥 Netflix
+ - IP-CIDR,54.0.0.0/16,🎥 Netflix
+ - IP-CIDR,54.148.0.0/15,🎥 Netflix
+ - IP-CIDR,54.175.0.0/16,🎥 Netflix
+ - IP-CIDR,54.186.0.0/15,🎥 Netflix
+ - IP-CIDR,54.188.0.0/15,🎥 Netflix
+ - IP-CIDR,54.213.0.0/16,🎥 Netflix
+ - IP-CIDR,54.214.128.0/17,🎥 Netflix
+ - IP-CIDR,54.68.0.0/15,🎥 Netflix
+ - IP-CIDR,54.74.0.0/15,🎥 Netflix
+ - IP-CIDR,54.76.0.0/15,🎥 Netflix
+ - IP-CIDR,54.85.0.0/16,🎥 Netflix
+ - IP-CIDR,54.86.0.0/16,🎥 Netflix
+ - IP-CIDR,64.120.128.0/17,🎥 Netflix
+ - IP-CIDR,66.197.128.0/17,🎥 Netflix
+ - IP-CIDR,69.53.224.0/19,🎥 Netflix
+ - IP-CIDR,8.41.4.0/24,🎥 Netflix
+ - IP-CIDR6,2607:fb10::/32,🎥 Netflix
+ - IP-CIDR6,2620:10c:7000::/44,🎥 Netflix
+ - IP-CIDR6,2a00:86c0::/32,🎥 Netflix
+ - IP-CIDR6,2a03:5640::/32,🎥 Netflix
+ - DOMAIN,cdn.registerdisney.go.com,🎥 Disney+
+ - DOMAIN-SUFFIX,adobedtm.com,🎥 Disney+
+ - DOMAIN-SUFFIX,bam.nr-data.net,🎥 Disney+
+ - DOMAIN-SUFFIX,bamgrid.com,🎥 Disney+
+ - DOMAIN-SUFFIX,braze.com,🎥 Disney+
+ - DOMAIN-SUFFIX,cdn.optimizely.com,🎥 Disney+
+ - DOMAIN-SUFFIX,cdn.registerdisney.go.com,🎥 Disney+
+ - DOMAIN-SUFFIX,cws.conviva.com,🎥 Disney+
+ - DOMAIN-SUFFIX,d9.flashtalking.com,🎥 Disney+
+ - DOMAIN-SUFFIX,disney-plus.net,🎥 Disney+
+ - DOMAIN-SUFFIX,disney-portal.my.onetrust.com,🎥 Disney+
+ - DOMAIN-SUFFIX,disney.demdex.net,🎥 Disney+
+ - DOMAIN-SUFFIX,disney.my.sentry.io,🎥 Disney+
+ - DOMAIN-SUFFIX,disneyplus.bn5x.net,🎥 Disney+
+ - DOMAIN-SUFFIX,disneyplus.com,🎥 Disney+
+ - DOMAIN-SUFFIX,disneyplus.com.ssl.sc.omtrdc.net,🎥 Disney+
+ - DOMAIN-SUFFIX,disneystreaming.com,🎥 Disney+
+ - DOMAIN-SUFFIX,dssott.com,🎥 Disney+
+ - DOMAIN-SUFFIX,execute-api.us-east-1.amazonaws.com,🎥 Disney+
+ - DOMAIN-SUFFIX,js-agent.newrelic.com,🎥 Disney+
+ - DOMAIN,gamer-cds.cdn.hinet.net,📺 巴哈姆特
+ - DOMAIN,gamer2-cds.cdn.hinet.net,📺 巴哈姆特
+ - DOMAIN-SUFFIX,bahamut.com.tw,📺 巴哈姆特
+ - DOMAIN-SUFFIX,gamer.com.tw,📺 巴哈姆特
+ - DOMAIN-SUFFIX,hinet.net,📺 巴哈姆特
+ - DOMAIN,upos-hz-mirrorakam.akamaized.net,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,acg.tv,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,acgvideo.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,b23.tv,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,bigfun.cn,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,bigfunapp.cn,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,biliapi.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,biliapi.net,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,bilibili.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,bilibili.tv,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,biligame.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,biligame.net,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,bilivideo.cn,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,bilivideo.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,hdslb.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,im9.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,smtcdns.net,📺 哔哩哔哩
+ - DOMAIN,upos-hz-mirrorakam.akamaized.net,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,acgvideo.com,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,bilibili.com,📺 哔哩哔哩
+ - IP-CIDR,45.43.32.234/32,📺 哔哩哔哩
+ - IP-CIDR,119.29.29.29/32,📺 哔哩哔哩
+ - IP-CIDR,128.1.62.200/32,📺 哔哩哔哩
+ - IP-CIDR,128.1.62.201/32,📺 哔哩哔哩
+ - IP-CIDR,150.116.92.250/32,📺 哔哩哔哩
+ - IP-CIDR,164.52.76.18/32,📺 哔哩哔哩
+ - IP-CIDR,203.107.1.33/32,📺 哔哩哔哩
+ - IP-CIDR,203.107.1.34/32,📺 哔哩哔哩
+ - IP-CIDR,203.107.1.65/32,📺 哔哩哔哩
+ - IP-CIDR,203.107.1.66/32,📺 哔哩哔哩
+ - DOMAIN-SUFFIX,misakaf.org,📺 EMBY
+ - DOMAIN-SUFFIX,pilipiliultra.top,📺 EMBY
+ - DOMAIN-SUFFIX,mikuu.com,📺 EMBY
+ - DOMAIN-SUFFIX,mikuu.link,📺 EMBY
+ - DOMAIN-SUFFIX,prpr.kyarucloud.moe,📺 EMBY
+ - DOMAIN-SUFFIX,emby.otakudrive.life,📺 EMBY
+ - DOMAIN-SUFFIX,emby2.otakudrive.life,📺 EMBY
+ - DOMAIN-SUFFIX,agahk1.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,agasg1.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,agajp1.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,aws.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,ntt1.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,hinet.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,cf1.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,pornemby.club,📺 EMBY
+ - DOMAIN-SUFFIX,cf.odysseyplus.site,📺 EMBY
+ - DOMAIN-SUFFIX,agahk.odysseyplus.site,📺 EMBY
+ - DOMAIN-SUFFIX,agasg.odysseyplus.site,📺 EMBY
+ - DOMAIN-SUFFIX,ru.odysseyplus.site,📺 EMBY
+ - DOMAIN-SUFFIX,emby.plusmedia.site,📺 EMBY
+ - DOMAIN-SUFFIX,emby-cf.plusmedia.site,📺 EMBY
+ - DOMAIN-SUFFIX,emby.xeton.dev,📺 EMBY
+ - DOMAIN-SUFFIX,jellyfin.xeton.dev,📺 EMBY
+ - DOMAIN-SUFFIX,movie.xeton.dev,📺 EMBY
+ - DOMAIN-SUFFIX,servers.xeton.dev,📺 EMBY
+ - DOMAIN-SUFFIX,jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,cf.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,hk.jmsooo.com,📺 EMBY
+ - DOMAIN-SUFFIX,sg.jmsooo.com,📺 EMBY
+ - DOMAIN,upos-hz-mirrorakam.akamaized.net,🌏 国内媒体
+ - DOMAIN-SUFFIX,acg.tv,🌏 国内媒体
+ - DOMAIN-SUFFIX,acgvideo.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,b23.tv,🌏 国内媒体
+ - DOMAIN-SUFFIX,bigfun.cn,🌏 国内媒体
+ - DOMAIN-SUFFIX,bigfunapp.cn,🌏 国内媒体
+ - DOMAIN-SUFFIX,biliapi.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,biliapi.net,🌏 国内媒体
+ - DOMAIN-SUFFIX,bilibili.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,bilibili.tv,🌏 国内媒体
+ - DOMAIN-SUFFIX,biligame.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,biligame.net,🌏 国内媒体
+ - DOMAIN-SUFFIX,bilivideo.cn,🌏 国内媒体
+ - DOMAIN-SUFFIX,bilivideo.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,hdslb.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,im9.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,smtcdns.net,🌏 国内媒体
+ - DOMAIN,intel-cache.m.iqiyi.com,🌏 国内媒体
+ - DOMAIN,intel-cache.video.iqiyi.com,🌏 国内媒体
+ - DOMAIN,intl-rcd.iqiyi.com,🌏 国内媒体
+ - DOMAIN,intl-subscription.iqiyi.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,inter.iqiyi.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,inter.ptqy.gitv.tv,🌏 国内媒体
+ - DOMAIN-SUFFIX,intl.iqiyi.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,iq.com,🌏 国内媒体
+ - IP-CIDR,23.40.241.251/32,🌏 国内媒体,no-resolve
+ - IP-CIDR,23.40.242.10/32,🌏 国内媒体,no-resolve
+ - IP-CIDR,103.44.56.0/22,🌏 国内媒体,no-resolve
+ - IP-CIDR,118.26.32.0/23,🌏 国内媒体,no-resolve
+ - IP-CIDR,118.26.120.0/24,🌏 国内媒体,no-resolve
+ - IP-CIDR,223.119.62.225/28,🌏 国内媒体,no-resolve
+ - DOMAIN-SUFFIX,api.mob.app.letv.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,v.smtcdns.com,🌏 国内媒体
+ - DOMAIN-SUFFIX,vv.video.qq.com,🌏 国内媒体
+ - IP-CIDR,106.11.0.0/16,🌏 国内媒体,no-resolve
+ - DOMAIN-SUFFIX,edgedatg.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tiktok.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tiktokv.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,byteoversea.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,ibytedtos.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,ipstatp.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,muscdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,musical.ly,🌍 国外媒体
+ - DOMAIN-SUFFIX,tik-tokapi.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tiktokcdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,go.com,🌍 国外媒体
+ - DOMAIN-KEYWORD,abematv.akamaized.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,abema.io,🌍 国外媒体
+ - DOMAIN-SUFFIX,abema.tv,🌍 国外媒体
+ - DOMAIN-SUFFIX,ameba.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,hayabusa.io,🌍 国外媒体
+ - DOMAIN-SUFFIX,c4assets.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,channel4.com,🌍 国外媒体
+ - DOMAIN, atv-ps.amazon.com,🌍 国外媒体
+ - DOMAIN, fls-na.amazon.com,🌍 国外媒体
+ - DOMAIN-SUFFIX, media-amazon.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,aiv-cdn.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,amazonaws.co.uk,🌍 国外媒体
+ - DOMAIN-SUFFIX,amazonaws.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,amazonvideo.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,llnwd.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,primevideo.com,🌍 国外媒体
+ - DOMAIN,gspe1-ssl.ls.apple.com,🌍 国外媒体
+ - DOMAIN,np-edge.itunes.apple.com,🌍 国外媒体
+ - DOMAIN,play-edge.itunes.apple.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tv.apple.com,🌍 国外媒体
+ - DOMAIN-KEYWORD,bbcfmt,🌍 国外媒体
+ - DOMAIN-KEYWORD,uk-live,🌍 国外媒体
+ - DOMAIN,aod-dash-uk-live.akamaized.net,🌍 国外媒体
+ - DOMAIN,aod-hls-uk-live.akamaized.net,🌍 国外媒体
+ - DOMAIN,vod-dash-uk-live.akamaized.net,🌍 国外媒体
+ - DOMAIN,vod-thumb-uk-live.akamaized.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,bbc.co,🌍 国外媒体
+ - DOMAIN-SUFFIX,bbc.co.uk,🌍 国外媒体
+ - DOMAIN-SUFFIX,bbc.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,bbc.net.uk,🌍 国外媒体
+ - DOMAIN-SUFFIX,bbcfmt.hs.llnwd.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,bbci.co,🌍 国外媒体
+ - DOMAIN-SUFFIX,bbci.co.uk,🌍 国外媒体
+ - DOMAIN-SUFFIX,bidi.net.uk,🌍 国外媒体
+ - DOMAIN,gamer-cds.cdn.hinet.net,🌍 国外媒体
+ - DOMAIN,gamer2-cds.cdn.hinet.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,bahamut.com.tw,🌍 国外媒体
+ - DOMAIN-SUFFIX,gamer.com.tw,🌍 国外媒体
+ - DOMAIN-SUFFIX,hinet.net,🌍 国外媒体
+ - DOMAIN-KEYWORD,livedazn,🌍 国外媒体
+ - DOMAIN-KEYWORD,vod2dazn,🌍 国外媒体
+ - DOMAIN-KEYWORD,voddazn,🌍 国外媒体
+ - DOMAIN,d151l6v8er5bdm.cloudfront.net,🌍 国外媒体
+ - DOMAIN,edge.api.brightcove.com,🌍 国外媒体
+ - DOMAIN,players.brightcove.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,amplify.outbrain.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,bluekai.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,control.kochava.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,cws.conviva.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,d151l6v8er5bdm.cloudfront.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,d1sgwhnao7452x.cloudfront.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dazn-api.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,dazn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,dazndn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,dc1-voddash-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dc1live21715dazn.akamaized.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dc2-live2dash-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dc2-live2hls-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dc2-vodhls-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dca-livedash-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dca-voddash-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dca-vodhls-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dcb-livedash-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dcb-voddash-perform.secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,dcblivedazn.akamaized.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,indazn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,indaznlab.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,intercom.io,🌍 国外媒体
+ - DOMAIN-SUFFIX,perfops.doracdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,s.llnwi.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,s.yimg.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,secure.footprint.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,sentry.io,🌍 国外媒体
+ - DOMAIN-SUFFIX,urbanairship.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,vjs.zencdn.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,widevine.entitlement.us.theplatform.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,yahoo.co.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,deezer.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,dzcdn.net,🌍 国外媒体
+ - DOMAIN,bcbolt446c5271-a.akamaihd.net,🌍 国外媒体
+ - DOMAIN,content.jwplatform.com,🌍 国外媒体
+ - DOMAIN,edge.api.brightcove.com,🌍 国外媒体
+ - DOMAIN,videos-f.jwpsrv.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,encoretvb.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,fox.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,foxdcg.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,uplynk.com,🌍 国外媒体
+ - DOMAIN,44wilhpljf.execute-api.ap-southeast-1.amazonaws.com,🌍 国外媒体
+ - DOMAIN,bcbolthboa-a.akamaihd.net,🌍 国外媒体
+ - DOMAIN,cf-images.ap-southeast-1.prod.boltdns.net,🌍 国外媒体
+ - DOMAIN,dai3fd1oh325y.cloudfront.net,🌍 国外媒体
+ - DOMAIN,hboasia1-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia2-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia3-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia4-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia5-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,players.brightcove.net,🌍 国外媒体
+ - DOMAIN,s3-ap-southeast-1.amazonaws.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbo.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbogo.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbogoasia.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbogoasia.hk,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbomax.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbomaxcdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbonow.com,🌍 国外媒体
+ - DOMAIN-KEYWORD,.hbogoasia.,🌍 国外媒体
+ - DOMAIN,44wilhpljf.execute-api.ap-southeast-1.amazonaws.com,🌍 国外媒体
+ - DOMAIN,bcbolthboa-a.akamaihd.net,🌍 国外媒体
+ - DOMAIN,cf-images.ap-southeast-1.prod.boltdns.net,🌍 国外媒体
+ - DOMAIN,dai3fd1oh325y.cloudfront.net,🌍 国外媒体
+ - DOMAIN,hboasia1-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia2-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia3-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia4-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasia5-i.akamaihd.net,🌍 国外媒体
+ - DOMAIN,hboasialive.akamaized.net,🌍 国外媒体
+ - DOMAIN,hbogoprod-vod.akamaized.net,🌍 国外媒体
+ - DOMAIN,hbolb.onwardsmg.com,🌍 国外媒体
+ - DOMAIN,hbounify-prod.evergent.com,🌍 国外媒体
+ - DOMAIN,players.brightcove.net,🌍 国外媒体
+ - DOMAIN,s3-ap-southeast-1.amazonaws.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbogoasia.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hbogoasia.hk,🌍 国外媒体
+ - DOMAIN-SUFFIX,5itv.tv,🌍 国外媒体
+ - DOMAIN-SUFFIX,ocnttv.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,cws-hulu.conviva.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hulu.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hulu.hb.omtrdc.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,hulu.sc.omtrdc.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,huluad.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,huluim.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,hulustream.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,happyon.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,hjholdings.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,hulu.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,prod.hjholdings.tv,🌍 国外媒体
+ - DOMAIN-SUFFIX,streaks.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,yb.uncn.jp,🌍 国外媒体
+ - DOMAIN,itvpnpmobile-a.akamaihd.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,itv.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,itvstatic.com,🌍 国外媒体
+ - DOMAIN-KEYWORD,jooxweb-api,🌍 国外媒体
+ - DOMAIN-SUFFIX,joox.com,🌍 国外媒体
+ - DOMAIN-KEYWORD,japonx,🌍 国外媒体
+ - DOMAIN-KEYWORD,japronx,🌍 国外媒体
+ - DOMAIN-SUFFIX,japonx.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,japonx.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,japonx.tv,🌍 国外媒体
+ - DOMAIN-SUFFIX,japonx.vip,🌍 国外媒体
+ - DOMAIN-SUFFIX,japronx.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,japronx.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,japronx.tv,🌍 国外媒体
+ - DOMAIN-SUFFIX,japronx.vip,🌍 国外媒体
+ - DOMAIN-SUFFIX,kfs.io,🌍 国外媒体
+ - DOMAIN-SUFFIX,kkbox.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,kkbox.com.tw,🌍 国外媒体
+ - DOMAIN,kktv-theater.kk.stream,🌍 国外媒体
+ - DOMAIN-SUFFIX,kktv.com.tw,🌍 国外媒体
+ - DOMAIN-SUFFIX,kktv.me,🌍 国外媒体
+ - DOMAIN,litvfreemobile-hichannel.cdn.hinet.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,litv.tv,🌍 国外媒体
+ - DOMAIN,d3c7rimkq79yfu.cloudfront.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,d3c7rimkq79yfu.cloudfront.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,linetv.tw,🌍 国外媒体
+ - DOMAIN-SUFFIX,profile.line-scdn.net,🌍 国外媒体
+ - DOMAIN,d349g9zuie06uo.cloudfront.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,channel5.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,my5.tv,🌍 国外媒体
+ - DOMAIN,mytvsuperlimited.hb.omtrdc.net,🌍 国外媒体
+ - DOMAIN,mytvsuperlimited.sc.omtrdc.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,mytvsuper.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tvb.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,dmc.nico,🌍 国外媒体
+ - DOMAIN-SUFFIX,nicovideo.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,nimg.jp,🌍 国外媒体
+ - DOMAIN-SUFFIX,pbs.org,🌍 国外媒体
+ - DOMAIN-SUFFIX,pandora.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,phncdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,phprcdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,pornhub.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,pornhubpremium.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,qobuz.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,p-cdn.us,🌍 国外媒体
+ - DOMAIN-SUFFIX,sndcdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,soundcloud.com,🌍 国外媒体
+ - DOMAIN-KEYWORD,-spotify-com,🌍 国外媒体
+ - DOMAIN-KEYWORD,spotify.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,pscdn.co,🌍 国外媒体
+ - DOMAIN-SUFFIX,scdn.co,🌍 国外媒体
+ - DOMAIN-SUFFIX,spoti.fi,🌍 国外媒体
+ - DOMAIN-SUFFIX,spotify.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,spotifycdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,spotifycdn.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,tidal-cms.s3.amazonaws.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tidal.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tidalhifi.com,🌍 国外媒体
+ - DOMAIN,hamifans.emome.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,skyking.com.tw,🌍 国外媒体
+ - DOMAIN-KEYWORD,-tiktokcdn-com,🌍 国外媒体
+ - DOMAIN-SUFFIX,byteoversea.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,ibytedtos.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,ipstatp.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,muscdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,musical.ly,🌍 国外媒体
+ - DOMAIN-SUFFIX,tik-tokapi.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tiktok.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tiktokcdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,tiktokv.com,🌍 国外媒体
+ - DOMAIN-KEYWORD,ttvnw,🌍 国外媒体
+ - DOMAIN-SUFFIX,jtvnw.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,ttvnw.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,twitch.tv,🌍 国外媒体
+ - DOMAIN-SUFFIX,twitchcdn.net,🌍 国外媒体
+ - DOMAIN,api.viu.now.com,🌍 国外媒体
+ - DOMAIN,d1k2us671qcoau.cloudfront.net,🌍 国外媒体
+ - DOMAIN,d2anahhhmp1ffz.cloudfront.net,🌍 国外媒体
+ - DOMAIN,dfp6rglgjqszk.cloudfront.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,bootstrapcdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,cloudfront.net,🌍 国外媒体
+ - DOMAIN-SUFFIX,cognito-identity.us-east-1.amazonaws.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,firebaseio.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,jwpcdn.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,jwplayer.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,mobileanalytics.us-east-1.amazonaws.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,nowe.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,viu.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,viu.now.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,viu.tv,🌍 国外媒体
+ - DOMAIN-KEYWORD,youtube,🌍 国外媒体
+ - DOMAIN,youtubei.googleapis.com,🌍 国外媒体
+ - DOMAIN,yt3.ggpht.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,googlevideo.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,gvt2.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,youtu.be,🌍 国外媒体
+ - DOMAIN-SUFFIX,youtube.com,🌍 国外媒体
+ - DOMAIN-SUFFIX,ytimg.com,🌍 国外媒体
+ - PROCESS-NAME,com.google.android.apps.youtube.music,🌍 国外媒体
+ - PROCESS-NAME,com.google.android.youtube.tvmusicroot,🌍 国外媒体
+ - PROCESS-NAME,com.vanced.android.apps.youtube.music,🌍 国外媒体
+ - DOMAIN-SUFFIX,1password.com,🚀 节点选择
+ - DOMAIN-SUFFIX,adguard.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bit.no.com,🚀 节点选择
+ - DOMAIN-SUFFIX,btlibrary.me,🚀 节点选择
+ - DOMAIN-SUFFIX,cccat.io,🚀 节点选择
+ - DOMAIN-SUFFIX,cloudcone.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gameloft.com,🚀 节点选择
+ - DOMAIN-SUFFIX,garena.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hoyolab.com,🚀 节点选择
+ - DOMAIN-SUFFIX,inoreader.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ip138.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ping.pe,🚀 节点选择
+ - DOMAIN-SUFFIX,reddit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,teddysun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tumbex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twdvd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,unsplash.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--i2ru8q2qg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yunpanjingling.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eu,🚀 节点选择
+ - DOMAIN-SUFFIX,hk,🚀 节点选择
+ - DOMAIN-SUFFIX,jp,🚀 节点选择
+ - DOMAIN-SUFFIX,kr,🚀 节点选择
+ - DOMAIN-SUFFIX,sg,🚀 节点选择
+ - DOMAIN-SUFFIX,tw,🚀 节点选择
+ - DOMAIN-SUFFIX,uk,🚀 节点选择
+ - DOMAIN-SUFFIX,us,🚀 节点选择
+ - DOMAIN-KEYWORD,1e100,🚀 节点选择
+ - DOMAIN-KEYWORD,abema,🚀 节点选择
+ - DOMAIN-KEYWORD,appledaily,🚀 节点选择
+ - DOMAIN-KEYWORD,avtb,🚀 节点选择
+ - DOMAIN-KEYWORD,beetalk,🚀 节点选择
+ - DOMAIN-KEYWORD,blogspot,🚀 节点选择
+ - DOMAIN-KEYWORD,dropbox,🚀 节点选择
+ - DOMAIN-KEYWORD,facebook,🚀 节点选择
+ - DOMAIN-KEYWORD,fbcdn,🚀 节点选择
+ - DOMAIN-KEYWORD,github,🚀 节点选择
+ - DOMAIN-KEYWORD,gmail,🚀 节点选择
+ - DOMAIN-KEYWORD,google,🚀 节点选择
+ - DOMAIN-KEYWORD,instagram,🚀 节点选择
+ - DOMAIN-KEYWORD,porn,🚀 节点选择
+ - DOMAIN-KEYWORD,sci-hub,🚀 节点选择
+ - DOMAIN-KEYWORD,spotify,🚀 节点选择
+ - DOMAIN-KEYWORD,telegram,🚀 节点选择
+ - DOMAIN-KEYWORD,twitter,🚀 节点选择
+ - DOMAIN-KEYWORD,whatsapp,🚀 节点选择
+ - DOMAIN-KEYWORD,youtube,🚀 节点选择
+ - DOMAIN-SUFFIX,030buy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,0rz.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,1-apple.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,10.tt,🚀 节点选择
+ - DOMAIN-SUFFIX,1000giri.net,🚀 节点选择
+ - DOMAIN-SUFFIX,100ke.org,🚀 节点选择
+ - DOMAIN-SUFFIX,10conditionsoflove.com,🚀 节点选择
+ - DOMAIN-SUFFIX,10musume.com,🚀 节点选择
+ - DOMAIN-SUFFIX,x.com,🚀 节点选择
+ - DOMAIN-SUFFIX,123rf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,12bet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,12vpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,12vpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,138.com,🚀 节点选择
+ - DOMAIN-SUFFIX,141hongkong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,141jj.com,🚀 节点选择
+ - DOMAIN-SUFFIX,141tube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1688.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,173ng.com,🚀 节点选择
+ - DOMAIN-SUFFIX,177pic.info,🚀 节点选择
+ - DOMAIN-SUFFIX,17t17p.com,🚀 节点选择
+ - DOMAIN-SUFFIX,18board.com,🚀 节点选择
+ - DOMAIN-SUFFIX,18board.info,🚀 节点选择
+ - DOMAIN-SUFFIX,18onlygirls.com,🚀 节点选择
+ - DOMAIN-SUFFIX,18p2p.com,🚀 节点选择
+ - DOMAIN-SUFFIX,18virginsex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1949er.org,🚀 节点选择
+ - DOMAIN-SUFFIX,1984.city,🚀 节点选择
+ - DOMAIN-SUFFIX,1984bbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1984bbs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,1991way.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1998cdp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,1bao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,1dumb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1e100.net,🚀 节点选择
+ - DOMAIN-SUFFIX,1eew.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1mobile.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1mobile.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,1pondo.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,2-hand.info,🚀 节点选择
+ - DOMAIN-SUFFIX,2000fun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,2008xianzhang.info,🚀 节点选择
+ - DOMAIN-SUFFIX,2017.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,21andy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,21join.com,🚀 节点选择
+ - DOMAIN-SUFFIX,21pron.com,🚀 节点选择
+ - DOMAIN-SUFFIX,21sextury.com,🚀 节点选择
+ - DOMAIN-SUFFIX,228.net.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,233abc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,24hrs.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,24smile.org,🚀 节点选择
+ - DOMAIN-SUFFIX,25u.com,🚀 节点选择
+ - DOMAIN-SUFFIX,2lipstube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,2shared.com,🚀 节点选择
+ - DOMAIN-SUFFIX,2waky.com,🚀 节点选择
+ - DOMAIN-SUFFIX,3-a.net,🚀 节点选择
+ - DOMAIN-SUFFIX,30boxes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,315lz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,32red.com,🚀 节点选择
+ - DOMAIN-SUFFIX,36rain.com,🚀 节点选择
+ - DOMAIN-SUFFIX,3a5a.com,🚀 节点选择
+ - DOMAIN-SUFFIX,3arabtv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,3boys2girls.com,🚀 节点选择
+ - DOMAIN-SUFFIX,3d-game.com,🚀 节点选择
+ - DOMAIN-SUFFIX,3proxy.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,3ren.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,3tui.net,🚀 节点选择
+ - DOMAIN-SUFFIX,43110.cf,🚀 节点选择
+ - DOMAIN-SUFFIX,466453.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4bluestones.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,4chan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4dq.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4everproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4irc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4mydomain.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4pu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4rbtv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4shared.com,🚀 节点选择
+ - DOMAIN-SUFFIX,4sqi.net,🚀 节点选择
+ - DOMAIN-SUFFIX,50webs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,51.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,51jav.org,🚀 节点选择
+ - DOMAIN-SUFFIX,51luoben.com,🚀 节点选择
+ - DOMAIN-SUFFIX,5278.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,5299.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,5aimiku.com,🚀 节点选择
+ - DOMAIN-SUFFIX,5i01.com,🚀 节点选择
+ - DOMAIN-SUFFIX,5isotoi5.org,🚀 节点选择
+ - DOMAIN-SUFFIX,5maodang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,63i.com,🚀 节点选择
+ - DOMAIN-SUFFIX,64museum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,64tianwang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,64wiki.com,🚀 节点选择
+ - DOMAIN-SUFFIX,66.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,666kb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,6park.com,🚀 节点选择
+ - DOMAIN-SUFFIX,6parker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,6parknews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,7capture.com,🚀 节点选择
+ - DOMAIN-SUFFIX,7cow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,8-d.com,🚀 节点选择
+ - DOMAIN-SUFFIX,85cc.net,🚀 节点选择
+ - DOMAIN-SUFFIX,85cc.us,🚀 节点选择
+ - DOMAIN-SUFFIX,85st.com,🚀 节点选择
+ - DOMAIN-SUFFIX,881903.com,🚀 节点选择
+ - DOMAIN-SUFFIX,888.com,🚀 节点选择
+ - DOMAIN-SUFFIX,888poker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,89-64.org,🚀 节点选择
+ - DOMAIN-SUFFIX,8news.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,8z1.net,🚀 节点选择
+ - DOMAIN-SUFFIX,9001700.com,🚀 节点选择
+ - DOMAIN-SUFFIX,908taiwan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,91porn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,91vps.club,🚀 节点选择
+ - DOMAIN-SUFFIX,92ccav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,991.com,🚀 节点选择
+ - DOMAIN-SUFFIX,99btgc01.com,🚀 节点选择
+ - DOMAIN-SUFFIX,99cn.info,🚀 节点选择
+ - DOMAIN-SUFFIX,9bis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,9bis.net,🚀 节点选择
+ - DOMAIN-SUFFIX,9gag.com,🚀 节点选择
+ - DOMAIN-SUFFIX,a-normal-day.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aamacau.com,🚀 节点选择
+ - DOMAIN-SUFFIX,abc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,abc.net.au,🚀 节点选择
+ - DOMAIN-SUFFIX,abc.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,abchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,abclite.net,🚀 节点选择
+ - DOMAIN-SUFFIX,abebooks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ablwang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aboluowang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,about.google,🚀 节点选择
+ - DOMAIN-SUFFIX,aboutgfw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,abs.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,accim.org,🚀 节点选择
+ - DOMAIN-SUFFIX,aceros-de-hispania.com,🚀 节点选择
+ - DOMAIN-SUFFIX,acevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,acg18.me,🚀 节点选择
+ - DOMAIN-SUFFIX,acgkj.com,🚀 节点选择
+ - DOMAIN-SUFFIX,acmedia365.com,🚀 节点选择
+ - DOMAIN-SUFFIX,acmetoy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,acnw.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,actfortibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,actimes.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,activpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aculo.us,🚀 节点选择
+ - DOMAIN-SUFFIX,adcex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,addictedtocoffee.de,🚀 节点选择
+ - DOMAIN-SUFFIX,adelaidebbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,admob.com,🚀 节点选择
+ - DOMAIN-SUFFIX,adpl.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,ads-twitter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,adsense.com,🚀 节点选择
+ - DOMAIN-SUFFIX,adult-sex-games.com,🚀 节点选择
+ - DOMAIN-SUFFIX,adultfriendfinder.com,🚀 节点选择
+ - DOMAIN-SUFFIX,adultkeep.net,🚀 节点选择
+ - DOMAIN-SUFFIX,advanscene.com,🚀 节点选择
+ - DOMAIN-SUFFIX,advertfan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ae.org,🚀 节点选择
+ - DOMAIN-SUFFIX,aenhancers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,af.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,afantibbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,agnesb.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,agoogleaday.com,🚀 节点选择
+ - DOMAIN-SUFFIX,agro.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,ai-kan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ai-wen.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ai.google,🚀 节点选择
+ - DOMAIN-SUFFIX,aiph.net,🚀 节点选择
+ - DOMAIN-SUFFIX,airasia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,airconsole.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aircrack-ng.org,🚀 节点选择
+ - DOMAIN-SUFFIX,airvpn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,aisex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ait.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,aiweiwei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aiweiweiblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ajsands.com,🚀 节点选择
+ - DOMAIN-SUFFIX,akademiye.org,🚀 节点选择
+ - DOMAIN-SUFFIX,akamai.net,🚀 节点选择
+ - DOMAIN-SUFFIX,akamaihd.net,🚀 节点选择
+ - DOMAIN-SUFFIX,akamaistream.net,🚀 节点选择
+ - DOMAIN-SUFFIX,akamaized.net,🚀 节点选择
+ - DOMAIN-SUFFIX,akiba-online.com,🚀 节点选择
+ - DOMAIN-SUFFIX,akiba-web.com,🚀 节点选择
+ - DOMAIN-SUFFIX,akow.org,🚀 节点选择
+ - DOMAIN-SUFFIX,al-islam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,al-qimmah.net,🚀 节点选择
+ - DOMAIN-SUFFIX,alabout.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alanhou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alarab.qa,🚀 节点选择
+ - DOMAIN-SUFFIX,alasbarricadas.org,🚀 节点选择
+ - DOMAIN-SUFFIX,alexlur.org,🚀 节点选择
+ - DOMAIN-SUFFIX,alforattv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,alhayat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alicejapan.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,aliengu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alkasir.com,🚀 节点选择
+ - DOMAIN-SUFFIX,all4mom.org,🚀 节点选择
+ - DOMAIN-SUFFIX,allcoin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,allconnected.co,🚀 节点选择
+ - DOMAIN-SUFFIX,alldrawnsex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,allervpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,allfinegirls.com,🚀 节点选择
+ - DOMAIN-SUFFIX,allgirlmassage.com,🚀 节点选择
+ - DOMAIN-SUFFIX,allgirlsallowed.org,🚀 节点选择
+ - DOMAIN-SUFFIX,allgravure.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alliance.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,allinfa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alljackpotscasino.com,🚀 节点选择
+ - DOMAIN-SUFFIX,allmovie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,allowed.org,🚀 节点选择
+ - DOMAIN-SUFFIX,almasdarnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,almostmy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alphaporno.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alternate-tools.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alternativeto.net,🚀 节点选择
+ - DOMAIN-SUFFIX,altrec.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alvinalexander.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alwaysdata.com,🚀 节点选择
+ - DOMAIN-SUFFIX,alwaysdata.net,🚀 节点选择
+ - DOMAIN-SUFFIX,alwaysvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,am730.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,amazon.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,amazon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,amazonaws.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ameblo.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,america.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,american.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,americangreencard.com,🚀 节点选择
+ - DOMAIN-SUFFIX,americanunfinished.com,🚀 节点选择
+ - DOMAIN-SUFFIX,americorps.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,amiblockedornot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,amigobbs.net,🚀 节点选择
+ - DOMAIN-SUFFIX,amitabhafoundation.us,🚀 节点选择
+ - DOMAIN-SUFFIX,amnesty.org,🚀 节点选择
+ - DOMAIN-SUFFIX,amnesty.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,amnesty.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,amnestyusa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,amnyemachen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,amoiist.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ampproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,amtb-taipei.org,🚀 节点选择
+ - DOMAIN-SUFFIX,anchorfree.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ancsconf.org,🚀 节点选择
+ - DOMAIN-SUFFIX,andfaraway.net,🚀 节点选择
+ - DOMAIN-SUFFIX,android-x86.org,🚀 节点选择
+ - DOMAIN-SUFFIX,android.com,🚀 节点选择
+ - DOMAIN-SUFFIX,androidify.com,🚀 节点选择
+ - DOMAIN-SUFFIX,androidplus.co,🚀 节点选择
+ - DOMAIN-SUFFIX,androidtv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,andygod.com,🚀 节点选择
+ - DOMAIN-SUFFIX,angela-merkel.de,🚀 节点选择
+ - DOMAIN-SUFFIX,angelfire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,angola.org,🚀 节点选择
+ - DOMAIN-SUFFIX,angularjs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,animecrazy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,animeshippuuden.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aniscartujo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,annatam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,anobii.com,🚀 节点选择
+ - DOMAIN-SUFFIX,anontext.com,🚀 节点选择
+ - DOMAIN-SUFFIX,anonymise.us,🚀 节点选择
+ - DOMAIN-SUFFIX,anonymitynetwork.com,🚀 节点选择
+ - DOMAIN-SUFFIX,anonymizer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,anonymouse.org,🚀 节点选择
+ - DOMAIN-SUFFIX,anpopo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,answering-islam.org,🚀 节点选择
+ - DOMAIN-SUFFIX,antd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,anthonycalzadilla.com,🚀 节点选择
+ - DOMAIN-SUFFIX,anti1984.com,🚀 节点选择
+ - DOMAIN-SUFFIX,antichristendom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,antiwave.net,🚀 节点选择
+ - DOMAIN-SUFFIX,anws.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,anyporn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,anysex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ao3.org,🚀 节点选择
+ - DOMAIN-SUFFIX,aobo.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,aofriend.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aofriend.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,aojiao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,aol.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,aol.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,aol.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aolnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aomiwang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ap.org,🚀 节点选择
+ - DOMAIN-SUFFIX,apartmentratings.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apartments.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apetube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,api.ai,🚀 节点选择
+ - DOMAIN-SUFFIX,apiary.io,🚀 节点选择
+ - DOMAIN-SUFFIX,apigee.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apk-dl.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apkcombo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apkmirror.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apkmonk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apkplz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apkpure.com,🚀 节点选择
+ - DOMAIN-SUFFIX,aplusvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,appdownloader.net,🚀 节点选择
+ - DOMAIN-SUFFIX,appledaily.com,🚀 节点选择
+ - DOMAIN-SUFFIX,appledaily.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,appledaily.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,appshopper.com,🚀 节点选择
+ - DOMAIN-SUFFIX,appsocks.net,🚀 节点选择
+ - DOMAIN-SUFFIX,appspot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,appsto.re,🚀 节点选择
+ - DOMAIN-SUFFIX,aptoide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,archive.fo,🚀 节点选择
+ - DOMAIN-SUFFIX,archive.is,🚀 节点选择
+ - DOMAIN-SUFFIX,archive.li,🚀 节点选择
+ - DOMAIN-SUFFIX,archive.org,🚀 节点选择
+ - DOMAIN-SUFFIX,archive.ph,🚀 节点选择
+ - DOMAIN-SUFFIX,archive.today,🚀 节点选择
+ - DOMAIN-SUFFIX,archiveofourown.com,🚀 节点选择
+ - DOMAIN-SUFFIX,archiveofourown.org,🚀 节点选择
+ - DOMAIN-SUFFIX,archives.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,archives.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,arctosia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,areca-backup.org,🚀 节点选择
+ - DOMAIN-SUFFIX,arena.taipei,🚀 节点选择
+ - DOMAIN-SUFFIX,arethusa.su,🚀 节点选择
+ - DOMAIN-SUFFIX,arlingtoncemetery.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,army.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,art4tibet1998.org,🚀 节点选择
+ - DOMAIN-SUFFIX,arte.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,artofpeacefoundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,artstation.com,🚀 节点选择
+ - DOMAIN-SUFFIX,artsy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,asacp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,asdfg.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,asg.to,🚀 节点选择
+ - DOMAIN-SUFFIX,asia-gaming.com,🚀 节点选择
+ - DOMAIN-SUFFIX,asiaharvest.org,🚀 节点选择
+ - DOMAIN-SUFFIX,asianews.it,🚀 节点选择
+ - DOMAIN-SUFFIX,asianfreeforum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,asiansexdiary.com,🚀 节点选择
+ - DOMAIN-SUFFIX,asianspiss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,asianwomensfilm.de,🚀 节点选择
+ - DOMAIN-SUFFIX,asiatgp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,asiatoday.us,🚀 节点选择
+ - DOMAIN-SUFFIX,askstudent.com,🚀 节点选择
+ - DOMAIN-SUFFIX,askynz.net,🚀 节点选择
+ - DOMAIN-SUFFIX,assembla.com,🚀 节点选择
+ - DOMAIN-SUFFIX,assimp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,astrill.com,🚀 节点选择
+ - DOMAIN-SUFFIX,atc.org.au,🚀 节点选择
+ - DOMAIN-SUFFIX,atchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,atdmt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,atgfw.org,🚀 节点选择
+ - DOMAIN-SUFFIX,athenaeizou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,atlanta168.com,🚀 节点选择
+ - DOMAIN-SUFFIX,atlaspost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,atnext.com,🚀 节点选择
+ - DOMAIN-SUFFIX,audionow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,authorizeddns.net,🚀 节点选择
+ - DOMAIN-SUFFIX,authorizeddns.org,🚀 节点选择
+ - DOMAIN-SUFFIX,authorizeddns.us,🚀 节点选择
+ - DOMAIN-SUFFIX,autodraw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,av-e-body.com,🚀 节点选择
+ - DOMAIN-SUFFIX,av.com,🚀 节点选择
+ - DOMAIN-SUFFIX,av.movie,🚀 节点选择
+ - DOMAIN-SUFFIX,avaaz.org,🚀 节点选择
+ - DOMAIN-SUFFIX,avbody.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,avcity.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,avcool.com,🚀 节点选择
+ - DOMAIN-SUFFIX,avdb.in,🚀 节点选择
+ - DOMAIN-SUFFIX,avdb.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,avfantasy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,avg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,avgle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,avidemux.org,🚀 节点选择
+ - DOMAIN-SUFFIX,avmo.pw,🚀 节点选择
+ - DOMAIN-SUFFIX,avmoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,avmoo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,avmoo.pw,🚀 节点选择
+ - DOMAIN-SUFFIX,avoision.com,🚀 节点选择
+ - DOMAIN-SUFFIX,avyahoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,axureformac.com,🚀 节点选择
+ - DOMAIN-SUFFIX,azerbaycan.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,azerimix.com,🚀 节点选择
+ - DOMAIN-SUFFIX,azubu.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,azurewebsites.net,🚀 节点选择
+ - DOMAIN-SUFFIX,b0ne.com,🚀 节点选择
+ - DOMAIN-SUFFIX,baby-kingdom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,babynet.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,backchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,backpackers.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,backtotiananmen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,badiucao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,badjojo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,badoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,baidu.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,baijie.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bailandaily.com,🚀 节点选择
+ - DOMAIN-SUFFIX,baixing.me,🚀 节点选择
+ - DOMAIN-SUFFIX,bakgeekhome.tk,🚀 节点选择
+ - DOMAIN-SUFFIX,banana-vpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,band.us,🚀 节点选择
+ - DOMAIN-SUFFIX,bandwagonhost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bangbrosnetwork.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bangchen.net,🚀 节点选择
+ - DOMAIN-SUFFIX,bangdream.space,🚀 节点选择
+ - DOMAIN-SUFFIX,bangyoulater.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bankmobilevibe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bannedbook.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bannednews.org,🚀 节点选择
+ - DOMAIN-SUFFIX,banorte.com,🚀 节点选择
+ - DOMAIN-SUFFIX,baramangaonline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,barenakedislam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,barnabu.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,barton.de,🚀 节点选择
+ - DOMAIN-SUFFIX,bartvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bash-hackers.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bastillepost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bayvoice.net,🚀 节点选择
+ - DOMAIN-SUFFIX,baywords.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bb-chat.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,bbc.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,bbc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbc.in,🚀 节点选择
+ - DOMAIN-SUFFIX,bbcchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbchat.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,bbci.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,bbg.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,bbkz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbnradio.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bbs-tw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbsdigest.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbsfeed.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbsland.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbsmo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbsone.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bbtoystore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bcast.co.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,bcc.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,bcchinese.net,🚀 节点选择
+ - DOMAIN-SUFFIX,bcex.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,bcmorning.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bdsmvideos.net,🚀 节点选择
+ - DOMAIN-SUFFIX,beaconevents.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bebo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,beeg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,beevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,behance.net,🚀 节点选择
+ - DOMAIN-SUFFIX,behindkink.com,🚀 节点选择
+ - DOMAIN-SUFFIX,beijing1989.com,🚀 节点选择
+ - DOMAIN-SUFFIX,beijingspring.com,🚀 节点选择
+ - DOMAIN-SUFFIX,beijingzx.org,🚀 节点选择
+ - DOMAIN-SUFFIX,belamionline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bell.wiki,🚀 节点选择
+ - DOMAIN-SUFFIX,bemywife.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,beric.me,🚀 节点选择
+ - DOMAIN-SUFFIX,berlintwitterwall.com,🚀 节点选择
+ - DOMAIN-SUFFIX,berm.co.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,bestforchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bestgore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bestpornstardb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bestvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bestvpnanalysis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bestvpnserver.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bestvpnservice.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bestvpnusa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bet365.com,🚀 节点选择
+ - DOMAIN-SUFFIX,betfair.com,🚀 节点选择
+ - DOMAIN-SUFFIX,betternet.co,🚀 节点选择
+ - DOMAIN-SUFFIX,bettervpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bettween.com,🚀 节点选择
+ - DOMAIN-SUFFIX,betvictor.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bewww.net,🚀 节点选择
+ - DOMAIN-SUFFIX,beyondfirewall.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bfnn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bfsh.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,bgvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bianlei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,biantailajiao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,biantailajiao.in,🚀 节点选择
+ - DOMAIN-SUFFIX,biblesforamerica.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bibox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bic2011.org,🚀 节点选择
+ - DOMAIN-SUFFIX,big.one,🚀 节点选择
+ - DOMAIN-SUFFIX,bigfools.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bigjapanesesex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bigmoney.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,bignews.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bigsound.org,🚀 节点选择
+ - DOMAIN-SUFFIX,biliworld.com,🚀 节点选择
+ - DOMAIN-SUFFIX,billypan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,binance.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,binux.me,🚀 节点选择
+ - DOMAIN-SUFFIX,binwang.me,🚀 节点选择
+ - DOMAIN-SUFFIX,bipic.net,🚀 节点选择
+ - DOMAIN-SUFFIX,bird.so,🚀 节点选择
+ - DOMAIN-SUFFIX,bit-z.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bit.do,🚀 节点选择
+ - DOMAIN-SUFFIX,bit.ly,🚀 节点选择
+ - DOMAIN-SUFFIX,bitcointalk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bitcoinworld.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bitfinex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bithumb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bitinka.com.ar,🚀 节点选择
+ - DOMAIN-SUFFIX,bitmex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bitshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bitsnoop.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bitterwinter.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bitvise.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bizhat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bjnewlife.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bjs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bjzc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bl-doujinsouko.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blacklogic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blackvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blewpass.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blingblingsquad.net,🚀 节点选择
+ - DOMAIN-SUFFIX,blinkx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blinw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blip.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,blockcn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blockless.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blog.de,🚀 节点选择
+ - DOMAIN-SUFFIX,blog.google,🚀 节点选择
+ - DOMAIN-SUFFIX,blog.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,blogblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blogcatalog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blogcity.me,🚀 节点选择
+ - DOMAIN-SUFFIX,blogdns.org,🚀 节点选择
+ - DOMAIN-SUFFIX,blogger.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blogimg.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,bloglines.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bloglovin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blogs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blogspot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blogspot.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,blogspot.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,blogspot.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,blogtd.net,🚀 节点选择
+ - DOMAIN-SUFFIX,blogtd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bloodshed.net,🚀 节点选择
+ - DOMAIN-SUFFIX,bloomberg.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,bloomberg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bloomberg.de,🚀 节点选择
+ - DOMAIN-SUFFIX,bloombergview.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bloomfortune.com,🚀 节点选择
+ - DOMAIN-SUFFIX,blueangellive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bmfinn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bnews.co,🚀 节点选择
+ - DOMAIN-SUFFIX,bnn.co,🚀 节点选择
+ - DOMAIN-SUFFIX,bnrmetal.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boardreader.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bod.asia,🚀 节点选择
+ - DOMAIN-SUFFIX,bodog88.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bolehvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,bonbonme.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bonbonsex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bonfoundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bongacams.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boobstagram.com,🚀 节点选择
+ - DOMAIN-SUFFIX,book.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,bookepub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,books.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,booktopia.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,boomssr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bot.nu,🚀 节点选择
+ - DOMAIN-SUFFIX,botanwang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bowenpress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,box.com,🚀 节点选择
+ - DOMAIN-SUFFIX,box.net,🚀 节点选择
+ - DOMAIN-SUFFIX,boxpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boxun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boxun.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,boxunblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boxunclub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boyangu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boyfriendtv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boysfood.com,🚀 节点选择
+ - DOMAIN-SUFFIX,boysmaster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,br.st,🚀 节点选择
+ - DOMAIN-SUFFIX,brainyquote.com,🚀 节点选择
+ - DOMAIN-SUFFIX,brandonhutchinson.com,🚀 节点选择
+ - DOMAIN-SUFFIX,braumeister.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bravotube.net,🚀 节点选择
+ - DOMAIN-SUFFIX,brazzers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,break.com,🚀 节点选择
+ - DOMAIN-SUFFIX,breakgfw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,breaking911.com,🚀 节点选择
+ - DOMAIN-SUFFIX,breakingtweets.com,🚀 节点选择
+ - DOMAIN-SUFFIX,breakwall.net,🚀 节点选择
+ - DOMAIN-SUFFIX,briefdream.com,🚀 节点选择
+ - DOMAIN-SUFFIX,briian.com,🚀 节点选择
+ - DOMAIN-SUFFIX,brizzly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,brkmd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,broadbook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,broadpressinc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,brockbbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,brucewang.net,🚀 节点选择
+ - DOMAIN-SUFFIX,brutaltgp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bt2mag.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bt95.com,🚀 节点选择
+ - DOMAIN-SUFFIX,btaia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,btbtav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,btc98.com,🚀 节点选择
+ - DOMAIN-SUFFIX,btcbank.bank,🚀 节点选择
+ - DOMAIN-SUFFIX,btctrade.im,🚀 节点选择
+ - DOMAIN-SUFFIX,btdigg.org,🚀 节点选择
+ - DOMAIN-SUFFIX,btku.me,🚀 节点选择
+ - DOMAIN-SUFFIX,btku.org,🚀 节点选择
+ - DOMAIN-SUFFIX,btspread.com,🚀 节点选择
+ - DOMAIN-SUFFIX,btsynckeys.com,🚀 节点选择
+ - DOMAIN-SUFFIX,budaedu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,buddhanet.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,buddhistchannel.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,buffered.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bullog.org,🚀 节点选择
+ - DOMAIN-SUFFIX,bullogger.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bunbunhk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,busayari.com,🚀 节点选择
+ - DOMAIN-SUFFIX,businessinsider.com,🚀 节点选择
+ - DOMAIN-SUFFIX,businessinsider.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,businesstoday.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,businessweek.com,🚀 节点选择
+ - DOMAIN-SUFFIX,busu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,busytrade.com,🚀 节点选择
+ - DOMAIN-SUFFIX,buugaa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,buzzhand.com,🚀 节点选择
+ - DOMAIN-SUFFIX,buzzhand.net,🚀 节点选择
+ - DOMAIN-SUFFIX,buzzorange.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bwbx.io,🚀 节点选择
+ - DOMAIN-SUFFIX,bwgyhw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bwh1.net,🚀 节点选择
+ - DOMAIN-SUFFIX,bwsj.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,bx.in.th,🚀 节点选择
+ - DOMAIN-SUFFIX,bx.tl,🚀 节点选择
+ - DOMAIN-SUFFIX,bynet.co.il,🚀 节点选择
+ - DOMAIN-SUFFIX,c-est-simple.com,🚀 节点选择
+ - DOMAIN-SUFFIX,c-spanvideo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,c100tibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,c2cx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cablegatesearch.net,🚀 节点选择
+ - DOMAIN-SUFFIX,cachinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cacnw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cactusvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cafepress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cahr.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,caijinglengyan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,calameo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,calebelston.com,🚀 节点选择
+ - DOMAIN-SUFFIX,calgarychinese.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,calgarychinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,calgarychinese.net,🚀 节点选择
+ - DOMAIN-SUFFIX,calibre-ebook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,calstate.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,caltech.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,cam4.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cam4.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,cam4.sg,🚀 节点选择
+ - DOMAIN-SUFFIX,camfrog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,campaignforuyghurs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cams.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cams.org.sg,🚀 节点选择
+ - DOMAIN-SUFFIX,canadameet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,canalporno.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cantonese.asia,🚀 节点选择
+ - DOMAIN-SUFFIX,canyu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cao.im,🚀 节点选择
+ - DOMAIN-SUFFIX,caobian.info,🚀 节点选择
+ - DOMAIN-SUFFIX,caochangqing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cap.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,carabinasypistolas.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cardinalkungfoundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,carfax.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cari.com.my,🚀 节点选择
+ - DOMAIN-SUFFIX,caribbeancom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,carmotorshow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,carryzhou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cartoonmovement.com,🚀 节点选择
+ - DOMAIN-SUFFIX,casadeltibetbcn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,casatibet.org.mx,🚀 节点选择
+ - DOMAIN-SUFFIX,casinobellini.com,🚀 节点选择
+ - DOMAIN-SUFFIX,casinoking.com,🚀 节点选择
+ - DOMAIN-SUFFIX,casinoriva.com,🚀 节点选择
+ - DOMAIN-SUFFIX,castbox.fm,🚀 节点选择
+ - DOMAIN-SUFFIX,catch22.net,🚀 节点选择
+ - DOMAIN-SUFFIX,catchgod.com,🚀 节点选择
+ - DOMAIN-SUFFIX,catfightpayperview.xxx,🚀 节点选择
+ - DOMAIN-SUFFIX,catholic.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,catholic.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cathvoice.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cattt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cbc.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,cbsnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cbtc.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,cccat.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,cccat.co,🚀 节点选择
+ - DOMAIN-SUFFIX,ccdtr.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cchere.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ccim.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cclife.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,cclife.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cclifefl.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ccthere.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ccthere.net,🚀 节点选择
+ - DOMAIN-SUFFIX,cctmweb.net,🚀 节点选择
+ - DOMAIN-SUFFIX,cctongbao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ccue.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,ccue.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ccvoice.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,ccw.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cdbook.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdcparty.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cdef.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdig.info,🚀 节点选择
+ - DOMAIN-SUFFIX,cdjp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdn-apple.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cdnews.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cdninstagram.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cdp1989.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdp1998.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdp2006.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdpeu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdpusa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdpweb.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdpwu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cdw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cecc.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,cellulo.info,🚀 节点选择
+ - DOMAIN-SUFFIX,cenews.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,centauro.com.br,🚀 节点选择
+ - DOMAIN-SUFFIX,centerforhumanreprod.com,🚀 节点选择
+ - DOMAIN-SUFFIX,centralnation.com,🚀 节点选择
+ - DOMAIN-SUFFIX,centurys.net,🚀 节点选择
+ - DOMAIN-SUFFIX,certificate-transparency.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cfhks.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,cfos.de,🚀 节点选择
+ - DOMAIN-SUFFIX,cftfc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cgdepot.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cgst.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,change.org,🚀 节点选择
+ - DOMAIN-SUFFIX,changeip.name,🚀 节点选择
+ - DOMAIN-SUFFIX,changeip.net,🚀 节点选择
+ - DOMAIN-SUFFIX,changeip.org,🚀 节点选择
+ - DOMAIN-SUFFIX,changp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,changsa.net,🚀 节点选择
+ - DOMAIN-SUFFIX,channel8news.sg,🚀 节点选择
+ - DOMAIN-SUFFIX,chaoex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chapm25.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chatnook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chaturbate.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chengmingmag.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chenguangcheng.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chenpokong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chenpokong.net,🚀 节点选择
+ - DOMAIN-SUFFIX,cherrysave.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chhongbi.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chicagoncmtv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,china-mmm.net,🚀 节点选择
+ - DOMAIN-SUFFIX,china-review.com.ua,🚀 节点选择
+ - DOMAIN-SUFFIX,china-week.com,🚀 节点选择
+ - DOMAIN-SUFFIX,china101.com,🚀 节点选择
+ - DOMAIN-SUFFIX,china18.org,🚀 节点选择
+ - DOMAIN-SUFFIX,china21.com,🚀 节点选择
+ - DOMAIN-SUFFIX,china21.org,🚀 节点选择
+ - DOMAIN-SUFFIX,china5000.us,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaaffairs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaaid.me,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaaid.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaaid.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaaid.us,🚀 节点选择
+ - DOMAIN-SUFFIX,chinachange.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinachannel.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,chinacitynews.be,🚀 节点选择
+ - DOMAIN-SUFFIX,chinacomments.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinadialogue.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chinadigitaltimes.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaelections.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaeweekly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinafreepress.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinagate.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinageeks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinagfw.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinagonet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinagreenparty.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinahorizon.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinahush.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinainperspective.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinainterimgov.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinalaborwatch.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinalawandpolicy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinalawtranslate.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinamule.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinamz.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinanewscenter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinapost.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,chinapress.com.my,🚀 节点选择
+ - DOMAIN-SUFFIX,chinarightsia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinasmile.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chinasocialdemocraticparty.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinasoul.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinasucks.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chinatimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinatopsex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinatown.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,chinatweeps.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaway.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaworker.info,🚀 节点选择
+ - DOMAIN-SUFFIX,chinaxchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinayouth.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,chinayuanmin.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinese-hermit.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chinese-leaders.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinese-memorial.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesedaily.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesedailynews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesedemocracy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesegay.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesen.de,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesenews.net.au,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesepen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chinesetalks.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chineseupress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chingcheong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chinman.net,🚀 节点选择
+ - DOMAIN-SUFFIX,chithu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chobit.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,chosun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chrdnet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,christianfreedom.org,🚀 节点选择
+ - DOMAIN-SUFFIX,christianstudy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,christiantimes.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,christusrex.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chrlawyers.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,chrome.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chromecast.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chromeexperiments.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chromercise.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chromestatus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chromium.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chuang-yen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chubold.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chubun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chuizi.net,🚀 节点选择
+ - DOMAIN-SUFFIX,churchinhongkong.org,🚀 节点选择
+ - DOMAIN-SUFFIX,chushigangdrug.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,cienen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cineastentreff.de,🚀 节点选择
+ - DOMAIN-SUFFIX,cipfg.org,🚀 节点选择
+ - DOMAIN-SUFFIX,circlethebayfortibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cirosantilli.com,🚀 节点选择
+ - DOMAIN-SUFFIX,citizencn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,citizenlab.org,🚀 节点选择
+ - DOMAIN-SUFFIX,citizenscommission.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,citizensradio.org,🚀 节点选择
+ - DOMAIN-SUFFIX,city365.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,city9x.com,🚀 节点选择
+ - DOMAIN-SUFFIX,citypopulation.de,🚀 节点选择
+ - DOMAIN-SUFFIX,citytalk.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,civicparty.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,civildisobediencemovement.org,🚀 节点选择
+ - DOMAIN-SUFFIX,civilhrfront.org,🚀 节点选择
+ - DOMAIN-SUFFIX,civiliangunner.com,🚀 节点选择
+ - DOMAIN-SUFFIX,civilmedia.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,civisec.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cjb.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ck101.com,🚀 节点选择
+ - DOMAIN-SUFFIX,clarionproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,classicalguitarblog.net,🚀 节点选择
+ - DOMAIN-SUFFIX,clb.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,cleansite.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,cleansite.info,🚀 节点选择
+ - DOMAIN-SUFFIX,cleansite.us,🚀 节点选择
+ - DOMAIN-SUFFIX,clearharmony.net,🚀 节点选择
+ - DOMAIN-SUFFIX,clearsurance.com,🚀 节点选择
+ - DOMAIN-SUFFIX,clearwisdom.net,🚀 节点选择
+ - DOMAIN-SUFFIX,clementine-player.org,🚀 节点选择
+ - DOMAIN-SUFFIX,clinica-tibet.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,clipfish.de,🚀 节点选择
+ - DOMAIN-SUFFIX,cloakpoint.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cloudfront.net,🚀 节点选择
+ - DOMAIN-SUFFIX,club1069.com,🚀 节点选择
+ - DOMAIN-SUFFIX,clyp.it,🚀 节点选择
+ - DOMAIN-SUFFIX,cmcn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cmi.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cmoinc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cms.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,cmu.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,cmule.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cmule.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cmx.im,🚀 节点选择
+ - DOMAIN-SUFFIX,cn-proxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cn6.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,cna.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cnabc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cnd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cnet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cnex.org.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,cnineu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cnitter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cnn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cnpolitics.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cnproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cnyes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,co.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,coat.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,cobinhood.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cochina.co,🚀 节点选择
+ - DOMAIN-SUFFIX,cochina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,code1984.com,🚀 节点选择
+ - DOMAIN-SUFFIX,codeplex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,codeshare.io,🚀 节点选择
+ - DOMAIN-SUFFIX,codeskulptor.org,🚀 节点选择
+ - DOMAIN-SUFFIX,coin2co.in,🚀 节点选择
+ - DOMAIN-SUFFIX,coinbene.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coinegg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coinex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coingi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coinrail.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,cointiger.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cointobe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coinut.com,🚀 节点选择
+ - DOMAIN-SUFFIX,collateralmurder.com,🚀 节点选择
+ - DOMAIN-SUFFIX,collateralmurder.org,🚀 节点选择
+ - DOMAIN-SUFFIX,com.google,🚀 节点选择
+ - DOMAIN-SUFFIX,com.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,com.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,comedycentral.com,🚀 节点选择
+ - DOMAIN-SUFFIX,comefromchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,comic-mega.me,🚀 节点选择
+ - DOMAIN-SUFFIX,comico.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,commandarms.com,🚀 节点选择
+ - DOMAIN-SUFFIX,commentshk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,communistcrimes.org,🚀 节点选择
+ - DOMAIN-SUFFIX,communitychoicecu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,compileheart.com,🚀 节点选择
+ - DOMAIN-SUFFIX,compress.to,🚀 节点选择
+ - DOMAIN-SUFFIX,compython.net,🚀 节点选择
+ - DOMAIN-SUFFIX,conoha.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,constitutionalism.solutions,🚀 节点选择
+ - DOMAIN-SUFFIX,contactmagazine.net,🚀 节点选择
+ - DOMAIN-SUFFIX,convio.net,🚀 节点选择
+ - DOMAIN-SUFFIX,coobay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cool18.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coolaler.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coolder.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coolloud.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,coolncute.com,🚀 节点选择
+ - DOMAIN-SUFFIX,coolstuffinc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,corumcollege.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cos-moe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cosplayjav.pl,🚀 节点选择
+ - DOMAIN-SUFFIX,costco.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cotweet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,counter.social,🚀 节点选择
+ - DOMAIN-SUFFIX,coursehero.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cpj.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cq99.us,🚀 节点选择
+ - DOMAIN-SUFFIX,crackle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,crazys.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,crazyshit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,crbug.com,🚀 节点选择
+ - DOMAIN-SUFFIX,crchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,crd-net.org,🚀 节点选择
+ - DOMAIN-SUFFIX,creaders.net,🚀 节点选择
+ - DOMAIN-SUFFIX,creadersnet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,creativelab5.com,🚀 节点选择
+ - DOMAIN-SUFFIX,crisisresponse.google,🚀 节点选择
+ - DOMAIN-SUFFIX,cristyli.com,🚀 节点选择
+ - DOMAIN-SUFFIX,crocotube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,crossfire.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,crossthewall.net,🚀 节点选择
+ - DOMAIN-SUFFIX,crossvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,crrev.com,🚀 节点选择
+ - DOMAIN-SUFFIX,crucial.com,🚀 节点选择
+ - DOMAIN-SUFFIX,csdparty.com,🚀 节点选择
+ - DOMAIN-SUFFIX,csuchen.de,🚀 节点选择
+ - DOMAIN-SUFFIX,csw.org.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,ct.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ctao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ctfriend.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ctitv.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cts.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cuhk.edu.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,cuhkacs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cuihua.org,🚀 节点选择
+ - DOMAIN-SUFFIX,cuiweiping.net,🚀 节点选择
+ - DOMAIN-SUFFIX,culture.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cumlouder.com,🚀 节点选择
+ - DOMAIN-SUFFIX,curvefish.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cusu.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,cutscenes.net,🚀 节点选择
+ - DOMAIN-SUFFIX,cw.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cwb.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,cyberctm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cyberghostvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cynscribe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,cytode.us,🚀 节点选择
+ - DOMAIN-SUFFIX,cz.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,d-fukyu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,d0z.net,🚀 节点选择
+ - DOMAIN-SUFFIX,d100.net,🚀 节点选择
+ - DOMAIN-SUFFIX,d2bay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,d2pass.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dabr.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,dabr.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,dabr.me,🚀 节点选择
+ - DOMAIN-SUFFIX,dabr.mobi,🚀 节点选择
+ - DOMAIN-SUFFIX,dadazim.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dadi360.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dafabet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dafagood.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dafahao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dafoh.org,🚀 节点选择
+ - DOMAIN-SUFFIX,daftporn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dagelijksestandaard.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,daidostup.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,dailidaili.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dailymotion.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dailyview.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,daiphapinfo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dajiyuan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dajiyuan.de,🚀 节点选择
+ - DOMAIN-SUFFIX,dajiyuan.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailama-archives.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailama.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailama.mn,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailama.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailama80.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamacenter.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamafellows.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamafilm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamafoundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamahindi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamainaustralia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamajapanese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamaprotesters.info,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamaquotes.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamatrust.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamavisit.org.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,dalailamaworld.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dalianmeng.org,🚀 节点选择
+ - DOMAIN-SUFFIX,daliulian.org,🚀 节点选择
+ - DOMAIN-SUFFIX,danke4china.net,🚀 节点选择
+ - DOMAIN-SUFFIX,danwei.org,🚀 节点选择
+ - DOMAIN-SUFFIX,daolan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,daozhongxing.org,🚀 节点选择
+ - DOMAIN-SUFFIX,darktech.org,🚀 节点选择
+ - DOMAIN-SUFFIX,darktoy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,darpa.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,dastrassi.org,🚀 节点选择
+ - DOMAIN-SUFFIX,data-vocabulary.org,🚀 节点选择
+ - DOMAIN-SUFFIX,data.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,daum.net,🚀 节点选择
+ - DOMAIN-SUFFIX,david-kilgour.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dawangidc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,daxa.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,dayabook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,daylife.com,🚀 节点选择
+ - DOMAIN-SUFFIX,db.tt,🚀 节点选择
+ - DOMAIN-SUFFIX,dbc.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,dcard.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,dcmilitary.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ddc.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ddhw.info,🚀 节点选择
+ - DOMAIN-SUFFIX,ddns.info,🚀 节点选择
+ - DOMAIN-SUFFIX,ddns.me.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,ddns.mobi,🚀 节点选择
+ - DOMAIN-SUFFIX,ddns.ms,🚀 节点选择
+ - DOMAIN-SUFFIX,ddns.name,🚀 节点选择
+ - DOMAIN-SUFFIX,ddns.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ddns.us,🚀 节点选择
+ - DOMAIN-SUFFIX,de-sci.org,🚀 节点选择
+ - DOMAIN-SUFFIX,deaftone.com,🚀 节点选择
+ - DOMAIN-SUFFIX,debian.org,🚀 节点选择
+ - DOMAIN-SUFFIX,debug.com,🚀 节点选择
+ - DOMAIN-SUFFIX,deck.ly,🚀 节点选择
+ - DOMAIN-SUFFIX,decodet.co,🚀 节点选择
+ - DOMAIN-SUFFIX,deepmind.com,🚀 节点选择
+ - DOMAIN-SUFFIX,deezer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,definebabe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,deja.com,🚀 节点选择
+ - DOMAIN-SUFFIX,delcamp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,delicious.com,🚀 节点选择
+ - DOMAIN-SUFFIX,democrats.org,🚀 节点选择
+ - DOMAIN-SUFFIX,demosisto.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,depositphotos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,desc.se,🚀 节点选择
+ - DOMAIN-SUFFIX,design.google,🚀 节点选择
+ - DOMAIN-SUFFIX,desipro.de,🚀 节点选择
+ - DOMAIN-SUFFIX,dessci.com,🚀 节点选择
+ - DOMAIN-SUFFIX,destroy-china.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,deutsche-welle.de,🚀 节点选择
+ - DOMAIN-SUFFIX,devio.us,🚀 节点选择
+ - DOMAIN-SUFFIX,devpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dfas.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,dfn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dharamsalanet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dharmakara.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dhcp.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,diaoyuislands.org,🚀 节点选择
+ - DOMAIN-SUFFIX,difangwenge.org,🚀 节点选择
+ - DOMAIN-SUFFIX,digiland.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,digisfera.com,🚀 节点选择
+ - DOMAIN-SUFFIX,digitalnomadsproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,diigo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dilber.se,🚀 节点选择
+ - DOMAIN-SUFFIX,dingchin.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,dipity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,directcreative.com,🚀 节点选择
+ - DOMAIN-SUFFIX,discoins.com,🚀 节点选择
+ - DOMAIN-SUFFIX,disconnect.me,🚀 节点选择
+ - DOMAIN-SUFFIX,discord.com,🚀 节点选择
+ - DOMAIN-SUFFIX,discord.gg,🚀 节点选择
+ - DOMAIN-SUFFIX,discordapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,discordapp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,discuss.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,discuss4u.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dish.com,🚀 节点选择
+ - DOMAIN-SUFFIX,disp.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,disqus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dit-inc.us,🚀 节点选择
+ - DOMAIN-SUFFIX,dizhidizhi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dizhuzhishang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,djangosnippets.org,🚀 节点选择
+ - DOMAIN-SUFFIX,djorz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dl-laby.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,dlsite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dlsite.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,dlyoutube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dm530.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dmcdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dmhy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dmm.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,dmm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dns-dns.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dns-stuff.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dns.google,🚀 节点选择
+ - DOMAIN-SUFFIX,dns04.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dns05.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dns1.us,🚀 节点选择
+ - DOMAIN-SUFFIX,dns2.us,🚀 节点选择
+ - DOMAIN-SUFFIX,dns2go.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dnscrypt.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dnset.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dnsrd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dnssec.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dnvod.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,doctorvoice.org,🚀 节点选择
+ - DOMAIN-SUFFIX,documentingreality.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dogfartnetwork.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dojin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dok-forum.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dolc.de,🚀 节点选择
+ - DOMAIN-SUFFIX,dolf.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,dollf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,domain.club.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,domains.google,🚀 节点选择
+ - DOMAIN-SUFFIX,domaintoday.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,donga.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dongtaiwang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dongtaiwang.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dongyangjing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,donmai.us,🚀 节点选择
+ - DOMAIN-SUFFIX,dontfilter.us,🚀 节点选择
+ - DOMAIN-SUFFIX,dontmovetochina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dorjeshugden.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dotplane.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dotsub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dotvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,doub.io,🚀 节点选择
+ - DOMAIN-SUFFIX,doubibackup.com,🚀 节点选择
+ - DOMAIN-SUFFIX,doubmirror.cf,🚀 节点选择
+ - DOMAIN-SUFFIX,dougscripts.com,🚀 节点选择
+ - DOMAIN-SUFFIX,douhokanko.net,🚀 节点选择
+ - DOMAIN-SUFFIX,doujincafe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dowei.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dphk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dpp.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,dpr.info,🚀 节点选择
+ - DOMAIN-SUFFIX,dragonex.io,🚀 节点选择
+ - DOMAIN-SUFFIX,dragonsprings.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dreamamateurs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,drepung.org,🚀 节点选择
+ - DOMAIN-SUFFIX,drgan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,drmingxia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dropbooks.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,dropbox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dropboxapi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dropboxusercontent.com,🚀 节点选择
+ - DOMAIN-SUFFIX,drsunacademy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,drtuber.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dscn.info,🚀 节点选择
+ - DOMAIN-SUFFIX,dsmtp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dstk.dk,🚀 节点选择
+ - DOMAIN-SUFFIX,dtdns.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dtiblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dtic.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,dtwang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,duanzhihu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dubox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,duck.com,🚀 节点选择
+ - DOMAIN-SUFFIX,duckdns.org,🚀 节点选择
+ - DOMAIN-SUFFIX,duckduckgo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,duckload.com,🚀 节点选择
+ - DOMAIN-SUFFIX,duckmylife.com,🚀 节点选择
+ - DOMAIN-SUFFIX,duga.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,duihua.org,🚀 节点选择
+ - DOMAIN-SUFFIX,duihuahrjournal.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dumb1.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dunyabulteni.net,🚀 节点选择
+ - DOMAIN-SUFFIX,duoweitimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,duping.net,🚀 节点选择
+ - DOMAIN-SUFFIX,duplicati.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dupola.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dupola.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dushi.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,dvdpac.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dvorak.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dw-world.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dw-world.de,🚀 节点选择
+ - DOMAIN-SUFFIX,dw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dw.de,🚀 节点选择
+ - DOMAIN-SUFFIX,dwheeler.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dwnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dwnews.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dxiong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dynamic-dns.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dynamicdns.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,dynamicdns.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,dynamicdns.me.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,dynamicdns.org.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,dynawebinc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dyndns-ip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dyndns-pics.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dyndns.org,🚀 节点选择
+ - DOMAIN-SUFFIX,dyndns.pro,🚀 节点选择
+ - DOMAIN-SUFFIX,dynssl.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dynu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dynu.net,🚀 节点选择
+ - DOMAIN-SUFFIX,dysfz.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,dzze.com,🚀 节点选择
+ - DOMAIN-SUFFIX,e-classical.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,e-gold.com,🚀 节点选择
+ - DOMAIN-SUFFIX,e-hentai.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ehgt.org,🚀 节点选择
+ - DOMAIN-SUFFIX,exhentai.org,🚀 节点选择
+ - DOMAIN-SUFFIX,e-hentaidb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,e-info.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,e-traderland.net,🚀 节点选择
+ - DOMAIN-SUFFIX,e-zone.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,e123.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,earlytibet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,earthcam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,earthvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eastern-ark.com,🚀 节点选择
+ - DOMAIN-SUFFIX,easternlightning.org,🚀 节点选择
+ - DOMAIN-SUFFIX,eastturkestan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eastturkistan-gov.org,🚀 节点选择
+ - DOMAIN-SUFFIX,eastturkistan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,eastturkistancc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,eastturkistangovernmentinexile.us,🚀 节点选择
+ - DOMAIN-SUFFIX,easyca.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,easypic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ebony-beauty.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ebookbrowse.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ebookee.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ebtcbank.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ecfa.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,echainhost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,echofon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ecimg.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ecministry.net,🚀 节点选择
+ - DOMAIN-SUFFIX,economist.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ecstart.com,🚀 节点选择
+ - DOMAIN-SUFFIX,edgecastcdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,edgesuite.net,🚀 节点选择
+ - DOMAIN-SUFFIX,edicypages.com,🚀 节点选择
+ - DOMAIN-SUFFIX,edmontonchina.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,edmontonservice.com,🚀 节点选择
+ - DOMAIN-SUFFIX,edns.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,edoors.com,🚀 节点选择
+ - DOMAIN-SUFFIX,edubridge.com,🚀 节点选择
+ - DOMAIN-SUFFIX,edupro.org,🚀 节点选择
+ - DOMAIN-SUFFIX,eesti.ee,🚀 节点选择
+ - DOMAIN-SUFFIX,eevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,efcc.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,effers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,efksoft.com,🚀 节点选择
+ - DOMAIN-SUFFIX,efukt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eic-av.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eireinikotaerukai.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eisbb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eksisozluk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,electionsmeter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,elgoog.im,🚀 节点选择
+ - DOMAIN-SUFFIX,ellawine.org,🚀 节点选择
+ - DOMAIN-SUFFIX,elpais.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eltondisney.com,🚀 节点选择
+ - DOMAIN-SUFFIX,emaga.com,🚀 节点选择
+ - DOMAIN-SUFFIX,emanna.com,🚀 节点选择
+ - DOMAIN-SUFFIX,embr.in,🚀 节点选择
+ - DOMAIN-SUFFIX,emilylau.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,emory.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,empfil.com,🚀 节点选择
+ - DOMAIN-SUFFIX,emule-ed2k.com,🚀 节点选择
+ - DOMAIN-SUFFIX,emulefans.com,🚀 节点选择
+ - DOMAIN-SUFFIX,emuparadise.me,🚀 节点选择
+ - DOMAIN-SUFFIX,enanyang.my,🚀 节点选择
+ - DOMAIN-SUFFIX,encyclopedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,enewstree.com,🚀 节点选择
+ - DOMAIN-SUFFIX,enfal.de,🚀 节点选择
+ - DOMAIN-SUFFIX,engadget.com,🚀 节点选择
+ - DOMAIN-SUFFIX,engagedaily.org,🚀 节点选择
+ - DOMAIN-SUFFIX,englishforeveryone.org,🚀 节点选择
+ - DOMAIN-SUFFIX,englishfromengland.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,englishpen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,enlighten.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,entermap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,entnt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,environment.google,🚀 节点选择
+ - DOMAIN-SUFFIX,epa.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,epac.to,🚀 节点选择
+ - DOMAIN-SUFFIX,episcopalchurch.org,🚀 节点选择
+ - DOMAIN-SUFFIX,epochhk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes-bg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes-romania.com,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.co.il,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.cz,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.de,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.ie,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.it,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimes.se,🚀 节点选择
+ - DOMAIN-SUFFIX,epochtimestr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,epochweek.com,🚀 节点选择
+ - DOMAIN-SUFFIX,epochweekly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eporner.com,🚀 节点选择
+ - DOMAIN-SUFFIX,equinenow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,erabaru.net,🚀 节点选择
+ - DOMAIN-SUFFIX,eracom.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,eraysoft.com.tr,🚀 节点选择
+ - DOMAIN-SUFFIX,erepublik.com,🚀 节点选择
+ - DOMAIN-SUFFIX,erights.net,🚀 节点选择
+ - DOMAIN-SUFFIX,eriversoft.com,🚀 节点选择
+ - DOMAIN-SUFFIX,erktv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ernestmandel.org,🚀 节点选择
+ - DOMAIN-SUFFIX,erodaizensyu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,erodoujinlog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,erodoujinworld.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eromanga-kingdom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eromangadouzin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eromon.net,🚀 节点选择
+ - DOMAIN-SUFFIX,eroprofile.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eroticsaloon.net,🚀 节点选择
+ - DOMAIN-SUFFIX,eslite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,esmtp.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,esu.im,🚀 节点选择
+ - DOMAIN-SUFFIX,esurance.com,🚀 节点选择
+ - DOMAIN-SUFFIX,etaa.org.au,🚀 节点选择
+ - DOMAIN-SUFFIX,etadult.com,🚀 节点选择
+ - DOMAIN-SUFFIX,etaiwannews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,etherdelta.com,🚀 节点选择
+ - DOMAIN-SUFFIX,etizer.org,🚀 节点选择
+ - DOMAIN-SUFFIX,etokki.com,🚀 节点选择
+ - DOMAIN-SUFFIX,etowns.net,🚀 节点选择
+ - DOMAIN-SUFFIX,etowns.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ettoday.net,🚀 节点选择
+ - DOMAIN-SUFFIX,etvonline.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,eu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,eucasino.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eulam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eurekavpt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,euronews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,europa.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,evschool.net,🚀 节点选择
+ - DOMAIN-SUFFIX,exblog.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,exblog.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,exchristian.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,excite.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,exmo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,exmormon.org,🚀 节点选择
+ - DOMAIN-SUFFIX,expatshield.com,🚀 节点选择
+ - DOMAIN-SUFFIX,expecthim.com,🚀 节点选择
+ - DOMAIN-SUFFIX,expekt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,experts-univers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,exploader.net,🚀 节点选择
+ - DOMAIN-SUFFIX,expofutures.com,🚀 节点选择
+ - DOMAIN-SUFFIX,expressvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,exrates.me,🚀 节点选择
+ - DOMAIN-SUFFIX,extmatrix.com,🚀 节点选择
+ - DOMAIN-SUFFIX,extremetube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,exx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,eyevio.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,eyny.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ezpc.tk,🚀 节点选择
+ - DOMAIN-SUFFIX,ezpeer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ezua.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fa.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.br,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.design,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.hu,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.in,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.net,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.se,🚀 节点选择
+ - DOMAIN-SUFFIX,facebookmail.com,🚀 节点选择
+ - DOMAIN-SUFFIX,facebookquotes4u.com,🚀 节点选择
+ - DOMAIN-SUFFIX,faceless.me,🚀 节点选择
+ - DOMAIN-SUFFIX,facesofnyfw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,facesoftibetanselfimmolators.info,🚀 节点选择
+ - DOMAIN-SUFFIX,fail.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,faith100.org,🚀 节点选择
+ - DOMAIN-SUFFIX,faithfuleye.com,🚀 节点选择
+ - DOMAIN-SUFFIX,faiththedog.info,🚀 节点选择
+ - DOMAIN-SUFFIX,fakku.net,🚀 节点选择
+ - DOMAIN-SUFFIX,falsefire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,falun-co.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falun-ny.net,🚀 节点选择
+ - DOMAIN-SUFFIX,falunart.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falunasia.info,🚀 节点选择
+ - DOMAIN-SUFFIX,falunau.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falunaz.net,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafa-dc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafa-florida.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafa-nc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafa-pa.net,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafa-sacramento.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafaindia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falundafamuseum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,falungong.club,🚀 节点选择
+ - DOMAIN-SUFFIX,falungong.de,🚀 节点选择
+ - DOMAIN-SUFFIX,falungong.org.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,falunhr.org,🚀 节点选择
+ - DOMAIN-SUFFIX,faluninfo.de,🚀 节点选择
+ - DOMAIN-SUFFIX,faluninfo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,falunpilipinas.net,🚀 节点选择
+ - DOMAIN-SUFFIX,falunworld.net,🚀 节点选择
+ - DOMAIN-SUFFIX,familyfed.org,🚀 节点选择
+ - DOMAIN-SUFFIX,famunion.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fan-qiang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fangbinxing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fangeming.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fangeqiang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanglizhi.info,🚀 节点选择
+ - DOMAIN-SUFFIX,fangmincn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fangong.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fangongheike.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanhaodang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanqiang.tk,🚀 节点选择
+ - DOMAIN-SUFFIX,fanqiangdang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanqianghou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanqiangyakexi.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fanqiangzhe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanswong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanyue.info,🚀 节点选择
+ - DOMAIN-SUFFIX,fapdu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,faproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,faqserv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fartit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,farwestchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fastly.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fastpic.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,fastssh.com,🚀 节点选择
+ - DOMAIN-SUFFIX,faststone.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fatbtc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,favotter.net,🚀 节点选择
+ - DOMAIN-SUFFIX,favstar.fm,🚀 节点选择
+ - DOMAIN-SUFFIX,fawanghuihui.org,🚀 节点选择
+ - DOMAIN-SUFFIX,faydao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fb.me,🚀 节点选择
+ - DOMAIN-SUFFIX,fbaddins.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fbcdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fbsbx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fbworkmail.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fc2.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fc2blog.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fc2china.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fc2cn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fc2web.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fda.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,fdbox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fdc64.de,🚀 节点选择
+ - DOMAIN-SUFFIX,fdc64.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fdc89.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,feedburner.com,🚀 节点选择
+ - DOMAIN-SUFFIX,feedly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,feedx.net,🚀 节点选择
+ - DOMAIN-SUFFIX,feelssh.com,🚀 节点选择
+ - DOMAIN-SUFFIX,feer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,feifeiss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,feitian-california.org,🚀 节点选择
+ - DOMAIN-SUFFIX,feitianacademy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,feministteacher.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fengzhenghu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fengzhenghu.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fevernet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ff.im,🚀 节点选择
+ - DOMAIN-SUFFIX,fffff.at,🚀 节点选择
+ - DOMAIN-SUFFIX,fflick.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ffvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fgmtv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fgmtv.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fhreports.net,🚀 节点选择
+ - DOMAIN-SUFFIX,figprayer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fileflyer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fileforum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,files2me.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fileserve.com,🚀 节点选择
+ - DOMAIN-SUFFIX,filesor.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fillthesquare.org,🚀 节点选择
+ - DOMAIN-SUFFIX,filmingfortibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,filthdump.com,🚀 节点选择
+ - DOMAIN-SUFFIX,financetwitter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,finchvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,findmespot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,findyoutube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,findyoutube.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fingerdaily.com,🚀 节点选择
+ - DOMAIN-SUFFIX,finler.net,🚀 节点选择
+ - DOMAIN-SUFFIX,firearmsworld.net,🚀 节点选择
+ - DOMAIN-SUFFIX,firebaseio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fireofliberty.org,🚀 节点选择
+ - DOMAIN-SUFFIX,firetweet.io,🚀 节点选择
+ - DOMAIN-SUFFIX,firstfivefollowers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fizzik.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flagsonline.it,🚀 节点选择
+ - DOMAIN-SUFFIX,flecheinthepeche.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,fleshbot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fleursdeslettres.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flgg.us,🚀 节点选择
+ - DOMAIN-SUFFIX,flgjustice.org,🚀 节点选择
+ - DOMAIN-SUFFIX,flickr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flickrhivemind.net,🚀 节点选择
+ - DOMAIN-SUFFIX,flickriver.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fling.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flipboard.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flipkart.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flitto.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flnet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,flog.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,flurry.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flyvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,flyzy2005.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fmnnow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fnac.be,🚀 节点选择
+ - DOMAIN-SUFFIX,fnac.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fochk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,focustaiwan.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,focusvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fofg-europe.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fofg.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fofldfradio.org,🚀 节点选择
+ - DOMAIN-SUFFIX,foolsmountain.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fooooo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,footwiball.com,🚀 节点选择
+ - DOMAIN-SUFFIX,foreignpolicy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,forum4hk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,forums-free.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fotile.me,🚀 节点选择
+ - DOMAIN-SUFFIX,fourthinternational.org,🚀 节点选择
+ - DOMAIN-SUFFIX,foxbusiness.com,🚀 节点选择
+ - DOMAIN-SUFFIX,foxdie.us,🚀 节点选择
+ - DOMAIN-SUFFIX,foxgay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,foxsub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,foxtang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fpmt-osel.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fpmt.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fpmt.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,fpmtmexico.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fqok.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fqrouter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,franklc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freakshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,free-gate.org,🚀 节点选择
+ - DOMAIN-SUFFIX,free-hada-now.org,🚀 节点选择
+ - DOMAIN-SUFFIX,free-proxy.cz,🚀 节点选择
+ - DOMAIN-SUFFIX,free-ss.site,🚀 节点选择
+ - DOMAIN-SUFFIX,free-ssh.com,🚀 节点选择
+ - DOMAIN-SUFFIX,free.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,free4u.com.ar,🚀 节点选择
+ - DOMAIN-SUFFIX,freealim.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freebearblog.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freebrowser.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freechal.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freechina.net,🚀 节点选择
+ - DOMAIN-SUFFIX,freechina.news,🚀 节点选择
+ - DOMAIN-SUFFIX,freechinaforum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freechinaweibo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeddns.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeddns.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freedomchina.info,🚀 节点选择
+ - DOMAIN-SUFFIX,freedomcollection.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freedomhouse.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freedomsherald.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freeforums.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freefq.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freefuckvids.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freegao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freehongkong.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freeilhamtohti.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freekazakhs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freekwonpyong.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freelotto.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeman2.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freemoren.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freemorenews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freemuse.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freenet-china.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freenetproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freenewscn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeones.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeopenvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeoz.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freerk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freessh.us,🚀 节点选择
+ - DOMAIN-SUFFIX,freetcp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freetibet.net,🚀 节点选择
+ - DOMAIN-SUFFIX,freetibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freetibetanheroes.org,🚀 节点选择
+ - DOMAIN-SUFFIX,freeviewmovies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freevpn.me,🚀 节点选择
+ - DOMAIN-SUFFIX,freevpn.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,freewallpaper4.me,🚀 节点选择
+ - DOMAIN-SUFFIX,freewebs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freewechat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeweibo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freewww.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,freewww.info,🚀 节点选择
+ - DOMAIN-SUFFIX,freexinwen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeyellow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,freeyoutubeproxy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,frienddy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,friendfeed-media.com,🚀 节点选择
+ - DOMAIN-SUFFIX,friendfeed.com,🚀 节点选择
+ - DOMAIN-SUFFIX,friendfinder.com,🚀 节点选择
+ - DOMAIN-SUFFIX,friends-of-tibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,friendsoftibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fring.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fringenetwork.com,🚀 节点选择
+ - DOMAIN-SUFFIX,from-pr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,from-sd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fromchinatousa.net,🚀 节点选择
+ - DOMAIN-SUFFIX,frommel.net,🚀 节点选择
+ - DOMAIN-SUFFIX,frontlinedefenders.org,🚀 节点选择
+ - DOMAIN-SUFFIX,frootvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fscked.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fsurf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ftchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ftp1.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,ftpserver.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,ftv.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,fucd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fuckcnnic.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fuckgfw.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fuckgfw233.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fulione.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fullerconsideration.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fulue.com,🚀 节点选择
+ - DOMAIN-SUFFIX,funf.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,funkyimg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,funp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fuq.com,🚀 节点选择
+ - DOMAIN-SUFFIX,furbo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,furhhdl.org,🚀 节点选择
+ - DOMAIN-SUFFIX,furinkan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,furl.net,🚀 节点选择
+ - DOMAIN-SUFFIX,futurechinaforum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,futuremessage.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fux.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fuyin.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fuyindiantai.org,🚀 节点选择
+ - DOMAIN-SUFFIX,fuyu.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,fw.cm,🚀 节点选择
+ - DOMAIN-SUFFIX,fxcm-chinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fxnetworks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fzh999.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fzh999.net,🚀 节点选择
+ - DOMAIN-SUFFIX,fzlm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,g-area.org,🚀 节点选择
+ - DOMAIN-SUFFIX,g-queen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,g.co,🚀 节点选择
+ - DOMAIN-SUFFIX,g0v.social,🚀 节点选择
+ - DOMAIN-SUFFIX,g6hentai.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gabocorp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gaeproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gaforum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gagaoolala.com,🚀 节点选择
+ - DOMAIN-SUFFIX,galaxymacau.com,🚀 节点选择
+ - DOMAIN-SUFFIX,galenwu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,galstars.net,🚀 节点选择
+ - DOMAIN-SUFFIX,game735.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gamebase.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,gamejolt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gamer.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,gamerp.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,gamez.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,gamousa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ganges.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gaoming.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gaopi.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gaozhisheng.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gaozhisheng.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gardennetworks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gardennetworks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gartlive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gate-project.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gate.io,🚀 节点选择
+ - DOMAIN-SUFFIX,gatecoin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gather.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gatherproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gati.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,gaybubble.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gaycn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gayhub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gaymap.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,gaymenring.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gaytube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gaywatch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gazotube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gcc.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,gclooney.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gcmasia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gcpnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gcr.io,🚀 节点选择
+ - DOMAIN-SUFFIX,gdbt.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gdzf.org,🚀 节点选择
+ - DOMAIN-SUFFIX,geek-art.net,🚀 节点选择
+ - DOMAIN-SUFFIX,geekerhome.com,🚀 节点选择
+ - DOMAIN-SUFFIX,geekheart.info,🚀 节点选择
+ - DOMAIN-SUFFIX,gekikame.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gelbooru.com,🚀 节点选择
+ - DOMAIN-SUFFIX,geocities.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,geocities.com,🚀 节点选择
+ - DOMAIN-SUFFIX,geocities.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,gerefoundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,get.app,🚀 节点选择
+ - DOMAIN-SUFFIX,get.dev,🚀 节点选择
+ - DOMAIN-SUFFIX,get.how,🚀 节点选择
+ - DOMAIN-SUFFIX,get.page,🚀 节点选择
+ - DOMAIN-SUFFIX,getastrill.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getchu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getcloak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getfoxyproxy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,getfreedur.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getgom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,geti2p.net,🚀 节点选择
+ - DOMAIN-SUFFIX,getiton.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getjetso.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getlantern.org,🚀 节点选择
+ - DOMAIN-SUFFIX,getmdl.io,🚀 节点选择
+ - DOMAIN-SUFFIX,getoutline.org,🚀 节点选择
+ - DOMAIN-SUFFIX,getsocialscope.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getsync.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gettrials.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gettyimages.com,🚀 节点选择
+ - DOMAIN-SUFFIX,getuploader.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gfbv.de,🚀 节点选择
+ - DOMAIN-SUFFIX,gfgold.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,gfsale.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gfw.org.ua,🚀 节点选择
+ - DOMAIN-SUFFIX,gfw.press,🚀 节点选择
+ - DOMAIN-SUFFIX,ggpht.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ggssl.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ghostpath.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ghut.org,🚀 节点选择
+ - DOMAIN-SUFFIX,giantessnight.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gifree.com,🚀 节点选择
+ - DOMAIN-SUFFIX,giga-web.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,gigacircle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,giganews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gigporno.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,girlbanker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,git.io,🚀 节点选择
+ - DOMAIN-SUFFIX,gitbooks.io,🚀 节点选择
+ - DOMAIN-SUFFIX,github.com,🚀 节点选择
+ - DOMAIN-SUFFIX,github.io,🚀 节点选择
+ - DOMAIN-SUFFIX,githubassets.com,🚀 节点选择
+ - DOMAIN-SUFFIX,githubusercontent.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gizlen.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gjczz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,glass8.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,globaljihad.net,🚀 节点选择
+ - DOMAIN-SUFFIX,globalmediaoutreach.com,🚀 节点选择
+ - DOMAIN-SUFFIX,globalmuseumoncommunism.org,🚀 节点选择
+ - DOMAIN-SUFFIX,globalrescue.net,🚀 节点选择
+ - DOMAIN-SUFFIX,globaltm.org,🚀 节点选择
+ - DOMAIN-SUFFIX,globalvoices.org,🚀 节点选择
+ - DOMAIN-SUFFIX,globalvoicesonline.org,🚀 节点选择
+ - DOMAIN-SUFFIX,globalvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,glock.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gloryhole.com,🚀 节点选择
+ - DOMAIN-SUFFIX,glorystar.me,🚀 节点选择
+ - DOMAIN-SUFFIX,gluckman.com,🚀 节点选择
+ - DOMAIN-SUFFIX,glype.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gmail.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gmbd.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,gmhz.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gmiddle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gmiddle.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gmll.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gmodules.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gnci.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,gnews.org,🚀 节点选择
+ - DOMAIN-SUFFIX,go-pki.com,🚀 节点选择
+ - DOMAIN-SUFFIX,go141.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goagent.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,goagentplus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gobet.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,godfootsteps.org,🚀 节点选择
+ - DOMAIN-SUFFIX,godns.work,🚀 节点选择
+ - DOMAIN-SUFFIX,godoc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,godsdirectcontact.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,godsdirectcontact.org,🚀 节点选择
+ - DOMAIN-SUFFIX,godsdirectcontact.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,godsimmediatecontact.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gogotunnel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gohappy.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,gokbayrak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,golang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,goldbet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goldbetsports.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goldeneyevault.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goldenfrog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goldjizz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goldstep.net,🚀 节点选择
+ - DOMAIN-SUFFIX,goldwave.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gongm.in,🚀 节点选择
+ - DOMAIN-SUFFIX,gongmeng.info,🚀 节点选择
+ - DOMAIN-SUFFIX,gongminliliang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gongwt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goo.gl,🚀 节点选择
+ - DOMAIN-SUFFIX,goo.ne.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,gooday.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,gooddns.info,🚀 节点选择
+ - DOMAIN-SUFFIX,goodreaders.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goodreads.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goodtv.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,goodtv.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,goofind.com,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ac,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ad,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ae,🚀 节点选择
+ - DOMAIN-SUFFIX,google.af,🚀 节点选择
+ - DOMAIN-SUFFIX,google.al,🚀 节点选择
+ - DOMAIN-SUFFIX,google.am,🚀 节点选择
+ - DOMAIN-SUFFIX,google.as,🚀 节点选择
+ - DOMAIN-SUFFIX,google.at,🚀 节点选择
+ - DOMAIN-SUFFIX,google.az,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ba,🚀 节点选择
+ - DOMAIN-SUFFIX,google.be,🚀 节点选择
+ - DOMAIN-SUFFIX,google.bf,🚀 节点选择
+ - DOMAIN-SUFFIX,google.bg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.bi,🚀 节点选择
+ - DOMAIN-SUFFIX,google.bj,🚀 节点选择
+ - DOMAIN-SUFFIX,google.bs,🚀 节点选择
+ - DOMAIN-SUFFIX,google.bt,🚀 节点选择
+ - DOMAIN-SUFFIX,google.by,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cat,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cd,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cf,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ci,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cl,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.ao,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.bw,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.ck,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.cr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.id,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.il,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.in,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.ke,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.ls,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.ma,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.mz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.th,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.tz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.ug,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.uz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.ve,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.vi,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.za,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.zm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.co.zw,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.af,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ag,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ai,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ar,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.bd,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.bh,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.bn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.bo,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.br,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.bz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.co,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.cu,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.cy,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.do,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ec,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.eg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.et,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.fj,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.gh,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.gi,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.gt,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.jm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.kh,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.kw,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.lb,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ly,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.mm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.mt,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.mx,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.my,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.na,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.nf,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ng,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ni,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.np,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.om,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.pa,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.pe,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.pg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ph,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.pk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.pr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.py,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.qa,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.sa,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.sb,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.sg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.sl,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.sv,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.tj,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.tr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.ua,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.uy,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.vc,🚀 节点选择
+ - DOMAIN-SUFFIX,google.com.vn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cv,🚀 节点选择
+ - DOMAIN-SUFFIX,google.cz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.de,🚀 节点选择
+ - DOMAIN-SUFFIX,google.dev,🚀 节点选择
+ - DOMAIN-SUFFIX,google.dj,🚀 节点选择
+ - DOMAIN-SUFFIX,google.dk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.dm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.dz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ee,🚀 节点选择
+ - DOMAIN-SUFFIX,google.es,🚀 节点选择
+ - DOMAIN-SUFFIX,google.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,google.fi,🚀 节点选择
+ - DOMAIN-SUFFIX,google.fm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ga,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ge,🚀 节点选择
+ - DOMAIN-SUFFIX,google.gg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.gl,🚀 节点选择
+ - DOMAIN-SUFFIX,google.gm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.gp,🚀 节点选择
+ - DOMAIN-SUFFIX,google.gr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.gy,🚀 节点选择
+ - DOMAIN-SUFFIX,google.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.hn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.hr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ht,🚀 节点选择
+ - DOMAIN-SUFFIX,google.hu,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ie,🚀 节点选择
+ - DOMAIN-SUFFIX,google.im,🚀 节点选择
+ - DOMAIN-SUFFIX,google.iq,🚀 节点选择
+ - DOMAIN-SUFFIX,google.is,🚀 节点选择
+ - DOMAIN-SUFFIX,google.it,🚀 节点选择
+ - DOMAIN-SUFFIX,google.it.ao,🚀 节点选择
+ - DOMAIN-SUFFIX,google.je,🚀 节点选择
+ - DOMAIN-SUFFIX,google.jo,🚀 节点选择
+ - DOMAIN-SUFFIX,google.kg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ki,🚀 节点选择
+ - DOMAIN-SUFFIX,google.kz,🚀 节点选择
+ - DOMAIN-SUFFIX,google.la,🚀 节点选择
+ - DOMAIN-SUFFIX,google.li,🚀 节点选择
+ - DOMAIN-SUFFIX,google.lk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.lt,🚀 节点选择
+ - DOMAIN-SUFFIX,google.lu,🚀 节点选择
+ - DOMAIN-SUFFIX,google.lv,🚀 节点选择
+ - DOMAIN-SUFFIX,google.md,🚀 节点选择
+ - DOMAIN-SUFFIX,google.me,🚀 节点选择
+ - DOMAIN-SUFFIX,google.mg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.mk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ml,🚀 节点选择
+ - DOMAIN-SUFFIX,google.mn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ms,🚀 节点选择
+ - DOMAIN-SUFFIX,google.mu,🚀 节点选择
+ - DOMAIN-SUFFIX,google.mv,🚀 节点选择
+ - DOMAIN-SUFFIX,google.mw,🚀 节点选择
+ - DOMAIN-SUFFIX,google.mx,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ne,🚀 节点选择
+ - DOMAIN-SUFFIX,google.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,google.no,🚀 节点选择
+ - DOMAIN-SUFFIX,google.nr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.nu,🚀 节点选择
+ - DOMAIN-SUFFIX,google.org,🚀 节点选择
+ - DOMAIN-SUFFIX,google.pl,🚀 节点选择
+ - DOMAIN-SUFFIX,google.pn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ps,🚀 节点选择
+ - DOMAIN-SUFFIX,google.pt,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ro,🚀 节点选择
+ - DOMAIN-SUFFIX,google.rs,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,google.rw,🚀 节点选择
+ - DOMAIN-SUFFIX,google.sc,🚀 节点选择
+ - DOMAIN-SUFFIX,google.se,🚀 节点选择
+ - DOMAIN-SUFFIX,google.sh,🚀 节点选择
+ - DOMAIN-SUFFIX,google.si,🚀 节点选择
+ - DOMAIN-SUFFIX,google.sk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.sm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.sn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.so,🚀 节点选择
+ - DOMAIN-SUFFIX,google.sr,🚀 节点选择
+ - DOMAIN-SUFFIX,google.st,🚀 节点选择
+ - DOMAIN-SUFFIX,google.td,🚀 节点选择
+ - DOMAIN-SUFFIX,google.tg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.tk,🚀 节点选择
+ - DOMAIN-SUFFIX,google.tl,🚀 节点选择
+ - DOMAIN-SUFFIX,google.tm,🚀 节点选择
+ - DOMAIN-SUFFIX,google.tn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.to,🚀 节点选择
+ - DOMAIN-SUFFIX,google.tt,🚀 节点选择
+ - DOMAIN-SUFFIX,google.us,🚀 节点选择
+ - DOMAIN-SUFFIX,google.vg,🚀 节点选择
+ - DOMAIN-SUFFIX,google.vn,🚀 节点选择
+ - DOMAIN-SUFFIX,google.vu,🚀 节点选择
+ - DOMAIN-SUFFIX,google.ws,🚀 节点选择
+ - DOMAIN-SUFFIX,googleapis.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,googleapis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleapps.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlearth.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleartproject.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlebot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlechinawebmaster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlecode.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlecommerce.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googledomains.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googledrive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleearth.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlegroups.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlehosted.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleideas.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleinsidesearch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlelabs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlemail.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlemashups.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlepagecreator.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleplay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleplus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlescholar.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlesile.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlesource.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleusercontent.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlevideo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleweblight.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googlezip.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gopetition.com,🚀 节点选择
+ - DOMAIN-SUFFIX,goproxing.net,🚀 节点选择
+ - DOMAIN-SUFFIX,goregrish.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gospelherald.com,🚀 节点选择
+ - DOMAIN-SUFFIX,got-game.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gotdns.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,gotgeeks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gotrusted.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gotw.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,gov.taipei,🚀 节点选择
+ - DOMAIN-SUFFIX,gr8domain.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,gr8name.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,gradconnection.com,🚀 节点选择
+ - DOMAIN-SUFFIX,grammaly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,grandtrial.org,🚀 节点选择
+ - DOMAIN-SUFFIX,grangorz.org,🚀 节点选择
+ - DOMAIN-SUFFIX,graphis.ne.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,graphql.org,🚀 节点选择
+ - DOMAIN-SUFFIX,greasespot.net,🚀 节点选择
+ - DOMAIN-SUFFIX,great-firewall.com,🚀 节点选择
+ - DOMAIN-SUFFIX,great-roc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,greatfire.org,🚀 节点选择
+ - DOMAIN-SUFFIX,greatfirewall.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,greatfirewallofchina.net,🚀 节点选择
+ - DOMAIN-SUFFIX,greatfirewallofchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,greatroc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,greatroc.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,greatzhonghua.org,🚀 节点选择
+ - DOMAIN-SUFFIX,greenfieldbookstore.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,greenparty.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,greenpeace.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,greenpeace.org,🚀 节点选择
+ - DOMAIN-SUFFIX,greenreadings.com,🚀 节点选择
+ - DOMAIN-SUFFIX,greenvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,greenvpn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,grotty-monday.com,🚀 节点选择
+ - DOMAIN-SUFFIX,grow.google,🚀 节点选择
+ - DOMAIN-SUFFIX,gs-discuss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gstatic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gtricks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gts-vpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gtv.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gu-chu-sum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,guaguass.com,🚀 节点选择
+ - DOMAIN-SUFFIX,guaguass.org,🚀 节点选择
+ - DOMAIN-SUFFIX,guancha.org,🚀 节点选择
+ - DOMAIN-SUFFIX,guaneryu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,guangming.com.my,🚀 节点选择
+ - DOMAIN-SUFFIX,guangnianvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,guardster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,guishan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gumroad.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gun-world.net,🚀 节点选择
+ - DOMAIN-SUFFIX,gunsamerica.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gunsandammo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,guo.media,🚀 节点选择
+ - DOMAIN-SUFFIX,guruonline.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,gutteruncensored.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gvlib.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gvm.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,gvt0.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gvt1.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gvt3.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gwtproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,gyalwarinpoche.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gyatsostudio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gzm.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,gzone-anime.info,🚀 节点选择
+ - DOMAIN-SUFFIX,h-china.org,🚀 节点选择
+ - DOMAIN-SUFFIX,h-moe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,h1n1china.org,🚀 节点选择
+ - DOMAIN-SUFFIX,h528.com,🚀 节点选择
+ - DOMAIN-SUFFIX,h5dm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,h5galgame.me,🚀 节点选择
+ - DOMAIN-SUFFIX,hacg.club,🚀 节点选择
+ - DOMAIN-SUFFIX,hacg.in,🚀 节点选择
+ - DOMAIN-SUFFIX,hacg.li,🚀 节点选择
+ - DOMAIN-SUFFIX,hacg.me,🚀 节点选择
+ - DOMAIN-SUFFIX,hacg.red,🚀 节点选择
+ - DOMAIN-SUFFIX,hacken.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,hacker.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hackthatphone.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hahlo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hakkatv.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,handcraftedsoftware.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hanime.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,hanminzu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hanunyi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hao.news,🚀 节点选择
+ - DOMAIN-SUFFIX,hao123.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hao123img.com,🚀 节点选择
+ - DOMAIN-SUFFIX,happy-vpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,haproxy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hardsextube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,harunyahya.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hasi.wang,🚀 节点选择
+ - DOMAIN-SUFFIX,hautelook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hautelookcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,have8.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hbg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hbo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hclips.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hdlt.me,🚀 节点选择
+ - DOMAIN-SUFFIX,hdtvb.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hdzog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,heartyit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,heavy-r.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hec.su,🚀 节点选择
+ - DOMAIN-SUFFIX,hecaitou.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hechaji.com,🚀 节点选择
+ - DOMAIN-SUFFIX,heeact.edu.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,hegre-art.com,🚀 节点选择
+ - DOMAIN-SUFFIX,helixstudios.net,🚀 节点选择
+ - DOMAIN-SUFFIX,helloandroid.com,🚀 节点选择
+ - DOMAIN-SUFFIX,helloqueer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,helloss.pw,🚀 节点选择
+ - DOMAIN-SUFFIX,hellotxt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hellouk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,helpeachpeople.com,🚀 节点选择
+ - DOMAIN-SUFFIX,helplinfen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,helpster.de,🚀 节点选择
+ - DOMAIN-SUFFIX,helpuyghursnow.org,🚀 节点选择
+ - DOMAIN-SUFFIX,helpzhuling.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hentai.to,🚀 节点选择
+ - DOMAIN-SUFFIX,hentaitube.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,hentaivideoworld.com,🚀 节点选择
+ - DOMAIN-SUFFIX,heqinglian.net,🚀 节点选择
+ - DOMAIN-SUFFIX,here.com,🚀 节点选择
+ - DOMAIN-SUFFIX,heroku.com,🚀 节点选择
+ - DOMAIN-SUFFIX,heungkongdiscuss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hexieshe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hexieshe.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,hexxeh.net,🚀 节点选择
+ - DOMAIN-SUFFIX,heywire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,heyzo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hgseav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hhdcb3office.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hhthesakyatrizin.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hi-on.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,hidden-advent.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hide.me,🚀 节点选择
+ - DOMAIN-SUFFIX,hidecloud.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hidein.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hideipvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hideman.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hideme.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,hidemy.name,🚀 节点选择
+ - DOMAIN-SUFFIX,hidemyass.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hidemycomp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,higfw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,highpeakspureearth.com,🚀 节点选择
+ - DOMAIN-SUFFIX,highrockmedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hightail.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hihiforum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hihistory.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hiitch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hikinggfw.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hilive.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,himalayan-foundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,himalayanglacier.com,🚀 节点选择
+ - DOMAIN-SUFFIX,himemix.com,🚀 节点选择
+ - DOMAIN-SUFFIX,himemix.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hinet.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hitbtc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hitomi.la,🚀 节点选择
+ - DOMAIN-SUFFIX,hiwifi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hizb-ut-tahrir.info,🚀 节点选择
+ - DOMAIN-SUFFIX,hizb-ut-tahrir.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hizbuttahrir.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hjclub.info,🚀 节点选择
+ - DOMAIN-SUFFIX,hk-pub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hk01.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hk32168.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkacg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkacg.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hkatvnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkbc.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hkbf.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hkbookcity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkchurch.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hkci.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkcmi.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,hkcnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkcoc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkctu.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkdailynews.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkday.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hkdf.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hkej.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkepc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hket.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkfaa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkfreezone.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkfront.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hkgalden.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkgolden.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkgreenradio.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hkheadline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkhkhk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkhrc.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkhrm.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkip.org.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkja.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkjc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkjp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hklft.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hklts.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkpeanut.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkptu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hkreporter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hku.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkusu.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hkvwet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hkwcc.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hkzone.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hmonghot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hmv.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,hmvdigital.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,hmvdigital.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hnjhj.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hnntube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hola.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hola.org,🚀 节点选择
+ - DOMAIN-SUFFIX,holymountaincn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,holyspiritspeaks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,homedepot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,homeip.net,🚀 节点选择
+ - DOMAIN-SUFFIX,homeperversion.com,🚀 节点选择
+ - DOMAIN-SUFFIX,homeservershow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,honeynet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hongkongfp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hongmeimei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hongzhi.li,🚀 节点选择
+ - DOMAIN-SUFFIX,hootsuite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hoovers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hopedialogue.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hopto.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hornygamer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hornytrip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hotav.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,hotels.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,hotfrog.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,hotgoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hotpornshow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hotpot.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,hotshame.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hotspotshield.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hotvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hougaige.com,🚀 节点选择
+ - DOMAIN-SUFFIX,howtoforge.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hoxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hpa.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,hqcdp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hqjapanesesex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hqmovies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hrcchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hrcir.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hrea.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hrichina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hrtsea.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hrw.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hrweb.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hsjp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hsselite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hst.net.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,hstern.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hstt.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ht.ly,🚀 节点选择
+ - DOMAIN-SUFFIX,htkou.net,🚀 节点选择
+ - DOMAIN-SUFFIX,htl.li,🚀 节点选择
+ - DOMAIN-SUFFIX,html5rocks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,https443.net,🚀 节点选择
+ - DOMAIN-SUFFIX,https443.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hua-yue.net,🚀 节点选择
+ - DOMAIN-SUFFIX,huaglad.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huanghuagang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,huangyiyu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huaren.us,🚀 节点选择
+ - DOMAIN-SUFFIX,huaren4us.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huashangnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huasing.org,🚀 节点选择
+ - DOMAIN-SUFFIX,huaxia-news.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huaxiabao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,huaxin.ph,🚀 节点选择
+ - DOMAIN-SUFFIX,huayuworld.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hudatoriq.web.id,🚀 节点选择
+ - DOMAIN-SUFFIX,hudson.org,🚀 节点选择
+ - DOMAIN-SUFFIX,huffingtonpost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hugoroy.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,huhaitai.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huhamhire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huhangfei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huiyi.in,🚀 节点选择
+ - DOMAIN-SUFFIX,hulkshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hulu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huluim.com,🚀 节点选择
+ - DOMAIN-SUFFIX,humanrightsbriefing.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hung-ya.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hungerstrikeforaids.org,🚀 节点选择
+ - DOMAIN-SUFFIX,huobi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huobi.pro,🚀 节点选择
+ - DOMAIN-SUFFIX,huobipro.com,🚀 节点选择
+ - DOMAIN-SUFFIX,huping.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hurgokbayrak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hurriyet.com.tr,🚀 节点选择
+ - DOMAIN-SUFFIX,hustler.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hustlercash.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hut2.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,hutianyi.net,🚀 节点选择
+ - DOMAIN-SUFFIX,hutong9.net,🚀 节点选择
+ - DOMAIN-SUFFIX,huyandex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hwadzan.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,hwayue.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,hwinfo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hxwk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hxwq.org,🚀 节点选择
+ - DOMAIN-SUFFIX,hybrid-analysis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hyperrate.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hyread.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,i-cable.com,🚀 节点选择
+ - DOMAIN-SUFFIX,i-part.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,i-scmp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,i1.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,i2p2.de,🚀 节点选择
+ - DOMAIN-SUFFIX,i2runner.com,🚀 节点选择
+ - DOMAIN-SUFFIX,i818hk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iam.soy,🚀 节点选择
+ - DOMAIN-SUFFIX,iamtopone.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iask.bz,🚀 节点选择
+ - DOMAIN-SUFFIX,iask.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,iav19.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ibiblio.org,🚀 节点选择
+ - DOMAIN-SUFFIX,iblist.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iblogserv-f.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ibros.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ibtimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ibvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,icams.com,🚀 节点选择
+ - DOMAIN-SUFFIX,icerocket.com,🚀 节点选择
+ - DOMAIN-SUFFIX,icij.org,🚀 节点选择
+ - DOMAIN-SUFFIX,icl-fi.org,🚀 节点选择
+ - DOMAIN-SUFFIX,icoco.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iconfactory.net,🚀 节点选择
+ - DOMAIN-SUFFIX,iconpaper.org,🚀 节点选择
+ - DOMAIN-SUFFIX,icu-project.org,🚀 节点选择
+ - DOMAIN-SUFFIX,idaiwan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iddddg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,idemocracy.asia,🚀 节点选择
+ - DOMAIN-SUFFIX,identi.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,idiomconnection.com,🚀 节点选择
+ - DOMAIN-SUFFIX,idlcoyote.com,🚀 节点选择
+ - DOMAIN-SUFFIX,idouga.com,🚀 节点选择
+ - DOMAIN-SUFFIX,idreamx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,idsam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ieasy5.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ied2k.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ienergy1.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ifanqiang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ifcss.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ifjc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ifreewares.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ift.tt,🚀 节点选择
+ - DOMAIN-SUFFIX,igcd.net,🚀 节点选择
+ - DOMAIN-SUFFIX,igfw.net,🚀 节点选择
+ - DOMAIN-SUFFIX,igfw.tech,🚀 节点选择
+ - DOMAIN-SUFFIX,igmg.de,🚀 节点选择
+ - DOMAIN-SUFFIX,ignitedetroit.net,🚀 节点选择
+ - DOMAIN-SUFFIX,igoogle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,igotmail.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,igvita.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ihakka.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ihao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,iicns.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ikstar.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ikwb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ilhamtohtiinstitute.org,🚀 节点选择
+ - DOMAIN-SUFFIX,illusionfactory.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ilove80.be,🚀 节点选择
+ - DOMAIN-SUFFIX,ilovelongtoes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,im.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,im88.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,imageab.com,🚀 节点选择
+ - DOMAIN-SUFFIX,imagefap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,imageflea.com,🚀 节点选择
+ - DOMAIN-SUFFIX,images-gaytube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,imageshack.us,🚀 节点选择
+ - DOMAIN-SUFFIX,imagevenue.com,🚀 节点选择
+ - DOMAIN-SUFFIX,imagezilla.net,🚀 节点选择
+ - DOMAIN-SUFFIX,imb.org,🚀 节点选择
+ - DOMAIN-SUFFIX,imdb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,img.ly,🚀 节点选择
+ - DOMAIN-SUFFIX,imgchili.net,🚀 节点选择
+ - DOMAIN-SUFFIX,imgmega.com,🚀 节点选择
+ - DOMAIN-SUFFIX,imgur.com,🚀 节点选择
+ - DOMAIN-SUFFIX,imkev.com,🚀 节点选择
+ - DOMAIN-SUFFIX,imlive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,immigration.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,immoral.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,impact.org.au,🚀 节点选择
+ - DOMAIN-SUFFIX,impp.mn,🚀 节点选择
+ - DOMAIN-SUFFIX,in-disguise.com,🚀 节点选择
+ - DOMAIN-SUFFIX,in.com,🚀 节点选择
+ - DOMAIN-SUFFIX,in99.org,🚀 节点选择
+ - DOMAIN-SUFFIX,incapdns.net,🚀 节点选择
+ - DOMAIN-SUFFIX,incloak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,incredibox.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,indiandefensenews.in,🚀 节点选择
+ - DOMAIN-SUFFIX,indiatimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,indiemerch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,info-graf.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,informer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,initiativesforchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,inkui.com,🚀 节点选择
+ - DOMAIN-SUFFIX,inmediahk.net,🚀 节点选择
+ - DOMAIN-SUFFIX,innermongolia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,inoreader.com,🚀 节点选择
+ - DOMAIN-SUFFIX,inote.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,insecam.org,🚀 节点选择
+ - DOMAIN-SUFFIX,insidevoa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,instagram.com,🚀 节点选择
+ - DOMAIN-SUFFIX,instanthq.com,🚀 节点选择
+ - DOMAIN-SUFFIX,institut-tibetain.org,🚀 节点选择
+ - DOMAIN-SUFFIX,internet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,internetdefenseleague.org,🚀 节点选择
+ - DOMAIN-SUFFIX,internetfreedom.org,🚀 节点选择
+ - DOMAIN-SUFFIX,internetpopculture.com,🚀 节点选择
+ - DOMAIN-SUFFIX,inthenameofconfuciusmovie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,inxian.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iownyour.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,iownyour.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ipalter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ipfire.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ipfs.io,🚀 节点选择
+ - DOMAIN-SUFFIX,iphone4hongkong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iphonehacks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iphonetaiwan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,iphonix.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,ipicture.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,ipjetable.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ipobar.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ipoock.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iportal.me,🚀 节点选择
+ - DOMAIN-SUFFIX,ippotv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ipredator.se,🚀 节点选择
+ - DOMAIN-SUFFIX,iptv.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,iptvbin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ipvanish.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iredmail.org,🚀 节点选择
+ - DOMAIN-SUFFIX,irib.ir,🚀 节点选择
+ - DOMAIN-SUFFIX,ironpython.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ironsocket.com,🚀 节点选择
+ - DOMAIN-SUFFIX,is-a-hunter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,is.gd,🚀 节点选择
+ - DOMAIN-SUFFIX,isaacmao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,isasecret.com,🚀 节点选择
+ - DOMAIN-SUFFIX,isgreat.org,🚀 节点选择
+ - DOMAIN-SUFFIX,islahhaber.net,🚀 节点选择
+ - DOMAIN-SUFFIX,islam.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,islamawareness.net,🚀 节点选择
+ - DOMAIN-SUFFIX,islamhouse.com,🚀 节点选择
+ - DOMAIN-SUFFIX,islamicity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,islamicpluralism.org,🚀 节点选择
+ - DOMAIN-SUFFIX,islamtoday.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ismaelan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ismalltits.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ismprofessional.net,🚀 节点选择
+ - DOMAIN-SUFFIX,isohunt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,israbox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,issuu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,istars.co.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,istarshine.com,🚀 节点选择
+ - DOMAIN-SUFFIX,istef.info,🚀 节点选择
+ - DOMAIN-SUFFIX,istiqlalhewer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,istockphoto.com,🚀 节点选择
+ - DOMAIN-SUFFIX,isunaffairs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,isuntv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,itaboo.info,🚀 节点选择
+ - DOMAIN-SUFFIX,itaiwan.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,italiatibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,itasoftware.com,🚀 节点选择
+ - DOMAIN-SUFFIX,itemdb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ithome.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,itsaol.com,🚀 节点选择
+ - DOMAIN-SUFFIX,itshidden.com,🚀 节点选择
+ - DOMAIN-SUFFIX,itsky.it,🚀 节点选择
+ - DOMAIN-SUFFIX,itweet.net,🚀 节点选择
+ - DOMAIN-SUFFIX,iu45.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iuhrdf.org,🚀 节点选择
+ - DOMAIN-SUFFIX,iuksky.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ivacy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iverycd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ivpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ixquick.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ixxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,iyouport.com,🚀 节点选择
+ - DOMAIN-SUFFIX,izaobao.us,🚀 节点选择
+ - DOMAIN-SUFFIX,izihost.org,🚀 节点选择
+ - DOMAIN-SUFFIX,izles.net,🚀 节点选择
+ - DOMAIN-SUFFIX,izlesem.org,🚀 节点选择
+ - DOMAIN-SUFFIX,j.mp,🚀 节点选择
+ - DOMAIN-SUFFIX,jackjia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jamaat.org,🚀 节点选择
+ - DOMAIN-SUFFIX,jamyangnorbu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jandyx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,janwongphoto.com,🚀 节点选择
+ - DOMAIN-SUFFIX,japan-whores.com,🚀 节点选择
+ - DOMAIN-SUFFIX,japantimes.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,jav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jav101.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jav2be.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jav68.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,javakiba.org,🚀 节点选择
+ - DOMAIN-SUFFIX,javbus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javfor.me,🚀 节点选择
+ - DOMAIN-SUFFIX,javhd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javhip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javhub.net,🚀 节点选择
+ - DOMAIN-SUFFIX,javhuge.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javlibrary.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javmobile.net,🚀 节点选择
+ - DOMAIN-SUFFIX,javmoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javmoo.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,javseen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javtag.com,🚀 节点选择
+ - DOMAIN-SUFFIX,javzoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jbtalks.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,jbtalks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jbtalks.my,🚀 节点选择
+ - DOMAIN-SUFFIX,jcpenney.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jdwsy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jeanyim.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jetos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jfqu36.club,🚀 节点选择
+ - DOMAIN-SUFFIX,jfqu37.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,jgoodies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jiangweiping.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jiaoyou8.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jiehua.cz,🚀 节点选择
+ - DOMAIN-SUFFIX,jiepang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jieshibaobao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jigglegifs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jigong1024.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jigsy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jihadology.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jiji.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jims.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jinbushe.org,🚀 节点选择
+ - DOMAIN-SUFFIX,jingpin.org,🚀 节点选择
+ - DOMAIN-SUFFIX,jingsim.org,🚀 节点选择
+ - DOMAIN-SUFFIX,jinhai.de,🚀 节点选择
+ - DOMAIN-SUFFIX,jinpianwang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jinroukong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jintian.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jinx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jiruan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jitouch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jizzthis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jjgirls.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jkb.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,jkforum.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jkub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jma.go.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,jmscult.com,🚀 节点选择
+ - DOMAIN-SUFFIX,joachims.org,🚀 节点选择
+ - DOMAIN-SUFFIX,jobso.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,joinbbs.net,🚀 节点选择
+ - DOMAIN-SUFFIX,joinmastodon.org,🚀 节点选择
+ - DOMAIN-SUFFIX,journalchretien.net,🚀 节点选择
+ - DOMAIN-SUFFIX,journalofdemocracy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,joymiihub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,joyourself.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jpopforum.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jqueryui.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jshell.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jtvnw.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jubushoushen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,juhuaren.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jukujo-club.com,🚀 节点选择
+ - DOMAIN-SUFFIX,juliepost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,juliereyc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,junauza.com,🚀 节点选择
+ - DOMAIN-SUFFIX,june4commemoration.org,🚀 节点选择
+ - DOMAIN-SUFFIX,junefourth-20.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jungleheart.com,🚀 节点选择
+ - DOMAIN-SUFFIX,junglobal.net,🚀 节点选择
+ - DOMAIN-SUFFIX,juoaa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,justdied.com,🚀 节点选择
+ - DOMAIN-SUFFIX,justfreevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,justicefortenzin.org,🚀 节点选择
+ - DOMAIN-SUFFIX,justpaste.it,🚀 节点选择
+ - DOMAIN-SUFFIX,justtristan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,juyuange.org,🚀 节点选择
+ - DOMAIN-SUFFIX,juziyue.com,🚀 节点选择
+ - DOMAIN-SUFFIX,jwmusic.org,🚀 节点选择
+ - DOMAIN-SUFFIX,jyxf.net,🚀 节点选择
+ - DOMAIN-SUFFIX,k-doujin.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ka-wai.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kadokawa.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,kagyu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kagyu.org.za,🚀 节点选择
+ - DOMAIN-SUFFIX,kagyumonlam.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kagyunews.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,kagyuoffice.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kagyuoffice.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,kaiyuan.de,🚀 节点选择
+ - DOMAIN-SUFFIX,kakao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kalachakralugano.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kangye.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kankan.today,🚀 节点选择
+ - DOMAIN-SUFFIX,kannewyork.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kanshifang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kantie.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kanzhongguo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kanzhongguo.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,kaotic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,karayou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,karkhung.com,🚀 节点选择
+ - DOMAIN-SUFFIX,karmapa-teachings.org,🚀 节点选择
+ - DOMAIN-SUFFIX,karmapa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kawaiikawaii.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,kawase.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kba-tx.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kcoolonline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kebrum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kechara.com,🚀 节点选择
+ - DOMAIN-SUFFIX,keepandshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,keezmovies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kendatire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kendincos.net,🚀 节点选择
+ - DOMAIN-SUFFIX,kenengba.com,🚀 节点选择
+ - DOMAIN-SUFFIX,keontech.net,🚀 节点选择
+ - DOMAIN-SUFFIX,kepard.com,🚀 节点选择
+ - DOMAIN-SUFFIX,keso.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,kex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,keycdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,khabdha.org,🚀 节点选择
+ - DOMAIN-SUFFIX,khatrimaza.org,🚀 节点选择
+ - DOMAIN-SUFFIX,khmusic.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,kichiku-doujinko.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kik.com,🚀 节点选择
+ - DOMAIN-SUFFIX,killwall.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kimy.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,kindleren.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kingdomsalvation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,kinghost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kingstone.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,kink.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kinmen.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,kinmen.travel,🚀 节点选择
+ - DOMAIN-SUFFIX,kinokuniya.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kir.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,kissbbao.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,kiwi.kz,🚀 节点选择
+ - DOMAIN-SUFFIX,kk-whys.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,kkbox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kknews.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,klip.me,🚀 节点选择
+ - DOMAIN-SUFFIX,kmuh.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,knowledgerush.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kobo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kobobooks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kodingen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kompozer.net,🚀 节点选择
+ - DOMAIN-SUFFIX,konachan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kone.com,🚀 节点选择
+ - DOMAIN-SUFFIX,koolsolutions.com,🚀 节点选择
+ - DOMAIN-SUFFIX,koornk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,koranmandarin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,korenan2.com,🚀 节点选择
+ - DOMAIN-SUFFIX,krtco.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ksdl.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ksnews.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,kspcoin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ktzhk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kucoin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kui.name,🚀 节点选择
+ - DOMAIN-SUFFIX,kun.im,🚀 节点选择
+ - DOMAIN-SUFFIX,kurashsultan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kurtmunger.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kusocity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kwcg.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,kwongwah.com.my,🚀 节点选择
+ - DOMAIN-SUFFIX,kxsw.life,🚀 节点选择
+ - DOMAIN-SUFFIX,kyofun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kyohk.net,🚀 节点选择
+ - DOMAIN-SUFFIX,kyoyue.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kyzyhello.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kzeng.info,🚀 节点选择
+ - DOMAIN-SUFFIX,la-forum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,labiennale.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ladbrokes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lagranepoca.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lalulalu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lama.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,lamayeshe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lamenhu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lamnia.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,lamrim.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lanterncn.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,lantosfoundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,laod.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,laogai.org,🚀 节点选择
+ - DOMAIN-SUFFIX,laomiu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,laoyang.info,🚀 节点选择
+ - DOMAIN-SUFFIX,laptoplockdown.com,🚀 节点选择
+ - DOMAIN-SUFFIX,laqingdan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,larsgeorge.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lastcombat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lastfm.es,🚀 节点选择
+ - DOMAIN-SUFFIX,latelinenews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,latibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,law.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lbank.info,🚀 节点选择
+ - DOMAIN-SUFFIX,le-vpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,leafyvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,lecloud.net,🚀 节点选择
+ - DOMAIN-SUFFIX,leeao.com.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,lefora.com,🚀 节点选择
+ - DOMAIN-SUFFIX,left21.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,legalporno.com,🚀 节点选择
+ - DOMAIN-SUFFIX,legsjapan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,leirentv.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,leisurecafe.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,leisurepro.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lematin.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,lemonde.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,lenwhite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lerosua.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lers.google,🚀 节点选择
+ - DOMAIN-SUFFIX,lesoir.be,🚀 节点选择
+ - DOMAIN-SUFFIX,lester850.info,🚀 节点选择
+ - DOMAIN-SUFFIX,letou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,letscorp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,levyhsu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lflink.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lflinkup.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lflinkup.net,🚀 节点选择
+ - DOMAIN-SUFFIX,lflinkup.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lfpcontent.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lhakar.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lhasocialwork.org,🚀 节点选择
+ - DOMAIN-SUFFIX,liangyou.net,🚀 节点选择
+ - DOMAIN-SUFFIX,liangzhichuanmei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lianyue.net,🚀 节点选择
+ - DOMAIN-SUFFIX,liaowangxizang.net,🚀 节点选择
+ - DOMAIN-SUFFIX,liberal.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,libertytimes.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,libraryinformationtechnology.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lidecheng.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lifemiles.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lighten.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,lighti.me,🚀 节点选择
+ - DOMAIN-SUFFIX,lightnovel.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,lightyearvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lihkg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,like.com,🚀 节点选择
+ - DOMAIN-SUFFIX,limiao.net,🚀 节点选择
+ - DOMAIN-SUFFIX,line-apps.com,🚀 节点选择
+ - DOMAIN-SUFFIX,line-scdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,line.me,🚀 节点选择
+ - DOMAIN-SUFFIX,linkedin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,linglingfa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lingvodics.com,🚀 节点选择
+ - DOMAIN-SUFFIX,link-o-rama.com,🚀 节点选择
+ - DOMAIN-SUFFIX,linkideo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,linksalpha.com,🚀 节点选择
+ - DOMAIN-SUFFIX,linkuswell.com,🚀 节点选择
+ - DOMAIN-SUFFIX,linpie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,linux.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,linuxtoy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lionsroar.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lipuman.com,🚀 节点选择
+ - DOMAIN-SUFFIX,liquidvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,list-manage.com,🚀 节点选择
+ - DOMAIN-SUFFIX,listentoyoutube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,listorious.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lithium.com,🚀 节点选择
+ - DOMAIN-SUFFIX,liu-xiaobo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,liudejun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,liuhanyu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,liujianshu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,liuxiaobo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,liuxiaotong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,live.com,🚀 节点选择
+ - DOMAIN-SUFFIX,livecoin.net,🚀 节点选择
+ - DOMAIN-SUFFIX,livedoor.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,liveleak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,livestation.com,🚀 节点选择
+ - DOMAIN-SUFFIX,livestream.com,🚀 节点选择
+ - DOMAIN-SUFFIX,livevideo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,livingonline.us,🚀 节点选择
+ - DOMAIN-SUFFIX,livingstream.com,🚀 节点选择
+ - DOMAIN-SUFFIX,liwangyang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lizhizhuangbi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lkcn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,llss.me,🚀 节点选择
+ - DOMAIN-SUFFIX,load.to,🚀 节点选择
+ - DOMAIN-SUFFIX,lobsangwangyal.com,🚀 节点选择
+ - DOMAIN-SUFFIX,localbitcoins.com,🚀 节点选择
+ - DOMAIN-SUFFIX,localdomain.ws,🚀 节点选择
+ - DOMAIN-SUFFIX,localpresshk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lockestek.com,🚀 节点选择
+ - DOMAIN-SUFFIX,logbot.net,🚀 节点选择
+ - DOMAIN-SUFFIX,logiqx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,logmein.com,🚀 节点选择
+ - DOMAIN-SUFFIX,londonchinese.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,longhair.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,longmusic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,longtermly.net,🚀 节点选择
+ - DOMAIN-SUFFIX,longtoes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lookpic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,looktoronto.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lotsawahouse.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lotuslight.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,lotuslight.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,loved.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,lovetvshow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lpsg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lrfz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lrip.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lsd.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,lsforum.net,🚀 节点选择
+ - DOMAIN-SUFFIX,lsm.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lsmchinese.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lsmkorean.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lsmradio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lsmwebcast.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lsxszzg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ltn.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,luke54.com,🚀 节点选择
+ - DOMAIN-SUFFIX,luke54.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lupm.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lushstories.com,🚀 节点选择
+ - DOMAIN-SUFFIX,luxebc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lvhai.org,🚀 节点选择
+ - DOMAIN-SUFFIX,lvv2.com,🚀 节点选择
+ - DOMAIN-SUFFIX,lyfhk.net,🚀 节点选择
+ - DOMAIN-SUFFIX,lzmtnews.org,🚀 节点选择
+ - DOMAIN-SUFFIX,m-sport.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,m-team.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,m.me,🚀 节点选择
+ - DOMAIN-SUFFIX,macgamestore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,macrovpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,macts.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mad-ar.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,madewithcode.com,🚀 节点选择
+ - DOMAIN-SUFFIX,madonna-av.com,🚀 节点选择
+ - DOMAIN-SUFFIX,madrau.com,🚀 节点选择
+ - DOMAIN-SUFFIX,madthumbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,magic-net.info,🚀 节点选择
+ - DOMAIN-SUFFIX,mahabodhi.org,🚀 节点选择
+ - DOMAIN-SUFFIX,maiio.net,🚀 节点选择
+ - DOMAIN-SUFFIX,mail-archive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mail.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,mailchimp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,maildns.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,maiplus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,maizhong.org,🚀 节点选择
+ - DOMAIN-SUFFIX,makemymood.com,🚀 节点选择
+ - DOMAIN-SUFFIX,makkahnewspaper.com,🚀 节点选择
+ - DOMAIN-SUFFIX,malaysiakini.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mamingzhe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,manchukuo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,mangafox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mangafox.me,🚀 节点选择
+ - DOMAIN-SUFFIX,maniash.com,🚀 节点选择
+ - DOMAIN-SUFFIX,manicur4ik.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,mansion.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mansionpoker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,manta.com,🚀 节点选择
+ - DOMAIN-SUFFIX,maplew.com,🚀 节点选择
+ - DOMAIN-SUFFIX,marc.info,🚀 节点选择
+ - DOMAIN-SUFFIX,marguerite.su,🚀 节点选择
+ - DOMAIN-SUFFIX,martau.com,🚀 节点选择
+ - DOMAIN-SUFFIX,martincartoons.com,🚀 节点选择
+ - DOMAIN-SUFFIX,martinoei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,martsangkagyuofficial.org,🚀 节点选择
+ - DOMAIN-SUFFIX,maruta.be,🚀 节点选择
+ - DOMAIN-SUFFIX,marxist.com,🚀 节点选择
+ - DOMAIN-SUFFIX,marxist.net,🚀 节点选择
+ - DOMAIN-SUFFIX,marxists.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mash.to,🚀 节点选择
+ - DOMAIN-SUFFIX,maskedip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mastodon.cloud,🚀 节点选择
+ - DOMAIN-SUFFIX,mastodon.host,🚀 节点选择
+ - DOMAIN-SUFFIX,mastodon.social,🚀 节点选择
+ - DOMAIN-SUFFIX,matainja.com,🚀 节点选择
+ - DOMAIN-SUFFIX,material.io,🚀 节点选择
+ - DOMAIN-SUFFIX,mathable.io,🚀 节点选择
+ - DOMAIN-SUFFIX,mathiew-badimon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,matome-plus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,matome-plus.net,🚀 节点选择
+ - DOMAIN-SUFFIX,matsushimakaede.com,🚀 节点选择
+ - DOMAIN-SUFFIX,matters.news,🚀 节点选择
+ - DOMAIN-SUFFIX,mattwilcox.net,🚀 节点选择
+ - DOMAIN-SUFFIX,maturejp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,maxing.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,mayimayi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mcadforums.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mcaf.ee,🚀 节点选择
+ - DOMAIN-SUFFIX,mcfog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mcreasite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,md-t.org,🚀 节点选择
+ - DOMAIN-SUFFIX,me.me,🚀 节点选择
+ - DOMAIN-SUFFIX,meansys.com,🚀 节点选择
+ - DOMAIN-SUFFIX,media.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,mediachinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mediafire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mediafreakcity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,medium.com,🚀 节点选择
+ - DOMAIN-SUFFIX,meetav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,meetup.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mefeedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,meforum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mefound.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mega.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,megaproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,megarotic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,megavideo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,megurineluka.com,🚀 节点选择
+ - DOMAIN-SUFFIX,meirixiaochao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,meltoday.com,🚀 节点选择
+ - DOMAIN-SUFFIX,memehk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,memorybbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,memri.org,🚀 节点选择
+ - DOMAIN-SUFFIX,memrijttm.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mercatox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mercyprophet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mergersandinquisitions.org,🚀 节点选择
+ - DOMAIN-SUFFIX,meridian-trust.org,🚀 节点选择
+ - DOMAIN-SUFFIX,meripet.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,meripet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,merit-times.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,meshrep.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mesotw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,messenger.com,🚀 节点选择
+ - DOMAIN-SUFFIX,metacafe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,metart.com,🚀 节点选择
+ - DOMAIN-SUFFIX,metarthunter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,meteorshowersonline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,metro.taipei,🚀 节点选择
+ - DOMAIN-SUFFIX,metrohk.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,metrolife.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,metroradio.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,meyou.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,meyul.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mfxmedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mgoon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mgstage.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mh4u.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mhradio.org,🚀 节点选择
+ - DOMAIN-SUFFIX,michaelanti.com,🚀 节点选择
+ - DOMAIN-SUFFIX,michaelmarketl.com,🚀 节点选择
+ - DOMAIN-SUFFIX,microvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,middle-way.net,🚀 节点选择
+ - DOMAIN-SUFFIX,mihk.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,mihr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mihua.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mikesoltys.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mikocon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,milph.net,🚀 节点选择
+ - DOMAIN-SUFFIX,milsurps.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mimiai.net,🚀 节点选择
+ - DOMAIN-SUFFIX,mimivip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mimivv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mindrolling.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mingdemedia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,minghui-a.org,🚀 节点选择
+ - DOMAIN-SUFFIX,minghui-b.org,🚀 节点选择
+ - DOMAIN-SUFFIX,minghui-school.org,🚀 节点选择
+ - DOMAIN-SUFFIX,minghui.or.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,minghui.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mingjinglishi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingjingnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingjingtimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpaocanada.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpaomonthly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpaonews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpaony.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpaosf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpaotor.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingpaovan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mingshengbao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,minhhue.net,🚀 节点选择
+ - DOMAIN-SUFFIX,miniforum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ministrybooks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,minzhuhua.net,🚀 节点选择
+ - DOMAIN-SUFFIX,minzhuzhanxian.com,🚀 节点选择
+ - DOMAIN-SUFFIX,minzhuzhongguo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,miroguide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mirrorbooks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mist.vip,🚀 节点选择
+ - DOMAIN-SUFFIX,mit.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,mitao.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mitbbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mitbbsau.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mixero.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mixpod.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mixx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mizzmona.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mjib.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mk5000.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mlcool.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mlzs.work,🚀 节点选择
+ - DOMAIN-SUFFIX,mm-cg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mmaaxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mmmca.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mnewstv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mobatek.net,🚀 节点选择
+ - DOMAIN-SUFFIX,mobile01.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mobileways.de,🚀 节点选择
+ - DOMAIN-SUFFIX,moby.to,🚀 节点选择
+ - DOMAIN-SUFFIX,mobypicture.com,🚀 节点选择
+ - DOMAIN-SUFFIX,moeaic.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,moeerolibrary.com,🚀 节点选择
+ - DOMAIN-SUFFIX,moegirl.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mofa.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mofaxiehui.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mofos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mohu.club,🚀 节点选择
+ - DOMAIN-SUFFIX,mohu.ml,🚀 节点选择
+ - DOMAIN-SUFFIX,mojim.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mol.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,molihua.org,🚀 节点选择
+ - DOMAIN-SUFFIX,monar.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,mondex.org,🚀 节点选择
+ - DOMAIN-SUFFIX,money-link.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,moneyhome.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,monitorchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,monitorware.com,🚀 节点选择
+ - DOMAIN-SUFFIX,monlamit.org,🚀 节点选择
+ - DOMAIN-SUFFIX,monster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,moodyz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,moonbbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,moonbingo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mooo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,morbell.com,🚀 节点选择
+ - DOMAIN-SUFFIX,morningsun.org,🚀 节点选择
+ - DOMAIN-SUFFIX,moroneta.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mos.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,motherless.com,🚀 节点选择
+ - DOMAIN-SUFFIX,motiyun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,motor4ik.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,mousebreaker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,movements.org,🚀 节点选择
+ - DOMAIN-SUFFIX,moviefap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,moztw.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mp3buscador.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mp3ye.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,mpettis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mpfinance.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mpinews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mponline.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,mqxd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mrbasic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mrbonus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mrface.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mrslove.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mrtweet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,msa-it.org,🚀 节点选择
+ - DOMAIN-SUFFIX,msguancha.com,🚀 节点选择
+ - DOMAIN-SUFFIX,msha.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,msn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,msn.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mswe1.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mthruf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mtw.tl,🚀 节点选择
+ - DOMAIN-SUFFIX,mubi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,muchosucko.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mullvad.net,🚀 节点选择
+ - DOMAIN-SUFFIX,multiply.com,🚀 节点选择
+ - DOMAIN-SUFFIX,multiproxy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,multiupload.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mummysgold.com,🚀 节点选择
+ - DOMAIN-SUFFIX,murmur.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,musicade.net,🚀 节点选择
+ - DOMAIN-SUFFIX,muslimvideo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,muzi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,muzi.net,🚀 节点选择
+ - DOMAIN-SUFFIX,muzu.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,mvdis.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mvg.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,mx981.com,🚀 节点选择
+ - DOMAIN-SUFFIX,my-formosa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,my-private-network.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,my-proxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,my03.com,🚀 节点选择
+ - DOMAIN-SUFFIX,my903.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myactimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myanniu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myaudiocast.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myav.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mybbs.us,🚀 节点选择
+ - DOMAIN-SUFFIX,mybet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myca168.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mycanadanow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mychat.to,🚀 节点选择
+ - DOMAIN-SUFFIX,mychinamyhome.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mychinanet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mychinanews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mychinese.news,🚀 节点选择
+ - DOMAIN-SUFFIX,mycnnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mycould.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mydad.info,🚀 节点选择
+ - DOMAIN-SUFFIX,myddns.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myeasytv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myeclipseide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myforum.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,myfreecams.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myfreepaysite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myfreshnet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myftp.info,🚀 节点选择
+ - DOMAIN-SUFFIX,myftp.name,🚀 节点选择
+ - DOMAIN-SUFFIX,myiphide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mykomica.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mylftv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mymaji.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mymediarom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mymoe.moe,🚀 节点选择
+ - DOMAIN-SUFFIX,mymom.info,🚀 节点选择
+ - DOMAIN-SUFFIX,mymusic.net.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,mynetav.net,🚀 节点选择
+ - DOMAIN-SUFFIX,mynetav.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mynumber.org,🚀 节点选择
+ - DOMAIN-SUFFIX,myparagliding.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mypicture.info,🚀 节点选择
+ - DOMAIN-SUFFIX,mypop3.net,🚀 节点选择
+ - DOMAIN-SUFFIX,mypop3.org,🚀 节点选择
+ - DOMAIN-SUFFIX,mypopescu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myradio.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,myreadingmanga.info,🚀 节点选择
+ - DOMAIN-SUFFIX,mysecondarydns.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mysinablog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myspace.com,🚀 节点选择
+ - DOMAIN-SUFFIX,myspacecdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mytalkbox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mytizi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mywww.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,myz.info,🚀 节点选择
+ - DOMAIN-SUFFIX,naacoalition.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nabble.com,🚀 节点选择
+ - DOMAIN-SUFFIX,naitik.net,🚀 节点选择
+ - DOMAIN-SUFFIX,nakido.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nakuz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nalandabodhi.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nalandawest.org,🚀 节点选择
+ - DOMAIN-SUFFIX,namgyal.org,🚀 节点选择
+ - DOMAIN-SUFFIX,namgyalmonastery.org,🚀 节点选择
+ - DOMAIN-SUFFIX,namsisi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nanyang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nanyangpost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nanzao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,naol.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,naol.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,narod.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,nasa.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,nat.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,nat.moe,🚀 节点选择
+ - DOMAIN-SUFFIX,natado.com,🚀 节点选择
+ - DOMAIN-SUFFIX,national-lottery.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,nationalawakening.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nationalgeographic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nationsonline.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nationwide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,naughtyamerica.com,🚀 节点选择
+ - DOMAIN-SUFFIX,naver.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,navy.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,naweeklytimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nbc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nbtvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nccwatch.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,nch.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ncn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ncol.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nde.de,🚀 节点选择
+ - DOMAIN-SUFFIX,ndr.de,🚀 节点选择
+ - DOMAIN-SUFFIX,ned.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nekoslovakia.net,🚀 节点选择
+ - DOMAIN-SUFFIX,neo-miracle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nepusoku.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nesnode.com,🚀 节点选择
+ - DOMAIN-SUFFIX,net-fits.pro,🚀 节点选择
+ - DOMAIN-SUFFIX,netbig.com,🚀 节点选择
+ - DOMAIN-SUFFIX,netbirds.com,🚀 节点选择
+ - DOMAIN-SUFFIX,netcolony.com,🚀 节点选择
+ - DOMAIN-SUFFIX,netfirms.com,🚀 节点选择
+ - DOMAIN-SUFFIX,netflix.com,🚀 节点选择
+ - DOMAIN-SUFFIX,netme.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,netsneak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,network54.com,🚀 节点选择
+ - DOMAIN-SUFFIX,networkedblogs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,networktunnel.net,🚀 节点选择
+ - DOMAIN-SUFFIX,neverforget8964.org,🚀 节点选择
+ - DOMAIN-SUFFIX,new-3lunch.net,🚀 节点选择
+ - DOMAIN-SUFFIX,new-akiba.com,🚀 节点选择
+ - DOMAIN-SUFFIX,new96.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,newcenturymc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newcenturynews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newchen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newgrounds.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newipnow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newlandmagazine.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,newnews.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,news100.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,newsancai.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newschinacomment.org,🚀 节点选择
+ - DOMAIN-SUFFIX,newscn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,newsdetox.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,newsdh.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newsmagazine.asia,🚀 节点选择
+ - DOMAIN-SUFFIX,newspeak.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,newstamago.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newstapa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,newstarnet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,newtaiwan.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,newtalk.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,newyorktimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nexon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,next11.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,nextmag.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,nextmedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nexton-net.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,nexttv.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,nf.id.au,🚀 节点选择
+ - DOMAIN-SUFFIX,nfjtyd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nflxext.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nflximg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nflximg.net,🚀 节点选择
+ - DOMAIN-SUFFIX,nflxso.net,🚀 节点选择
+ - DOMAIN-SUFFIX,nflxvideo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ng.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,nga.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,ngensis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nhentai.net,🚀 节点选择
+ - DOMAIN-SUFFIX,nhi.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,nhk-ondemand.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,nic.google,🚀 节点选择
+ - DOMAIN-SUFFIX,nic.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,nicovideo.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,nighost.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nightlife141.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nikkei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ninecommentaries.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ning.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ninjacloak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ninjaproxy.ninja,🚀 节点选择
+ - DOMAIN-SUFFIX,nintendium.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ninth.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,nitter.net,🚀 节点选择
+ - DOMAIN-SUFFIX,niu.moe,🚀 节点选择
+ - DOMAIN-SUFFIX,niusnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,njactb.org,🚀 节点选择
+ - DOMAIN-SUFFIX,njuice.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nlfreevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,no-ip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,no-ip.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nobel.se,🚀 节点选择
+ - DOMAIN-SUFFIX,nobelprize.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nobodycanstop.us,🚀 节点选择
+ - DOMAIN-SUFFIX,nodesnoop.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nofile.io,🚀 节点选择
+ - DOMAIN-SUFFIX,nokogiri.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nokola.com,🚀 节点选择
+ - DOMAIN-SUFFIX,noodlevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,norbulingka.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nordstrom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nordstromimage.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nordstromrack.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nordvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nottinghampost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,novelasia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,now.com,🚀 节点选择
+ - DOMAIN-SUFFIX,now.im,🚀 节点选择
+ - DOMAIN-SUFFIX,nownews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nowtorrents.com,🚀 节点选择
+ - DOMAIN-SUFFIX,noypf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,npa.go.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,npa.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,npnt.me,🚀 节点选择
+ - DOMAIN-SUFFIX,nps.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,npsboost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nradio.me,🚀 节点选择
+ - DOMAIN-SUFFIX,nrk.no,🚀 节点选择
+ - DOMAIN-SUFFIX,ns01.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,ns01.info,🚀 节点选择
+ - DOMAIN-SUFFIX,ns01.us,🚀 节点选择
+ - DOMAIN-SUFFIX,ns02.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,ns02.info,🚀 节点选择
+ - DOMAIN-SUFFIX,ns02.us,🚀 节点选择
+ - DOMAIN-SUFFIX,ns1.name,🚀 节点选择
+ - DOMAIN-SUFFIX,ns2.name,🚀 节点选择
+ - DOMAIN-SUFFIX,ns3.name,🚀 节点选择
+ - DOMAIN-SUFFIX,nsc.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ntbk.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ntbna.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ntbt.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ntd.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,ntdtv.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,ntdtv.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,ntdtv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ntdtv.cz,🚀 节点选择
+ - DOMAIN-SUFFIX,ntdtv.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ntdtv.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,ntdtvla.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ntrfun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ntsna.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ntu.edu.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,nu.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,nubiles.net,🚀 节点选择
+ - DOMAIN-SUFFIX,nudezz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nuexpo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nukistream.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nurgo-software.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nusatrip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nutaku.net,🚀 节点选择
+ - DOMAIN-SUFFIX,nuuvem.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nuvid.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nuzcom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nvdst.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nvquan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nvtongzhisheng.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nwtca.org,🚀 节点选择
+ - DOMAIN-SUFFIX,nyaa.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,nyaa.si,🚀 节点选择
+ - DOMAIN-SUFFIX,nydus.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,nylon-angel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nylonstockingsonline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nyt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nytchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nytcn.me,🚀 节点选择
+ - DOMAIN-SUFFIX,nytco.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nyti.ms,🚀 节点选择
+ - DOMAIN-SUFFIX,nytimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nytimg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nytlog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nytstyle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nzchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,nzchinese.net.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,oauth.net,🚀 节点选择
+ - DOMAIN-SUFFIX,observechina.net,🚀 节点选择
+ - DOMAIN-SUFFIX,obutu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ocaspro.com,🚀 节点选择
+ - DOMAIN-SUFFIX,occupytiananmen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oclp.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,ocreampies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ocry.com,🚀 节点选择
+ - DOMAIN-SUFFIX,october-review.org,🚀 节点选择
+ - DOMAIN-SUFFIX,oculus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oculuscdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,offbeatchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,officeoftibet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ofile.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ogaoga.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ogate.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ohchr.org,🚀 节点选择
+ - DOMAIN-SUFFIX,oikos.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,oiktv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oizoblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ok.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,okayfreedom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,okex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,okk.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,olabloga.pl,🚀 节点选择
+ - DOMAIN-SUFFIX,old-cat.net,🚀 节点选择
+ - DOMAIN-SUFFIX,olumpo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,olympicwatch.org,🚀 节点选择
+ - DOMAIN-SUFFIX,omgili.com,🚀 节点选择
+ - DOMAIN-SUFFIX,omni7.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,omnitalk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,omnitalk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,omy.sg,🚀 节点选择
+ - DOMAIN-SUFFIX,on.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,on2.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onedumb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onejav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onion.city,🚀 节点选择
+ - DOMAIN-SUFFIX,onlinecha.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onlineyoutube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onlytweets.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onmoon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onmoon.net,🚀 节点选择
+ - DOMAIN-SUFFIX,onmypc.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,onmypc.info,🚀 节点选择
+ - DOMAIN-SUFFIX,onmypc.net,🚀 节点选择
+ - DOMAIN-SUFFIX,onmypc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,onmypc.us,🚀 节点选择
+ - DOMAIN-SUFFIX,onthehunt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ontrac.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oopsforum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,open.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,openallweb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,opendemocracy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,opendn.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,openervpn.in,🚀 节点选择
+ - DOMAIN-SUFFIX,openid.net,🚀 节点选择
+ - DOMAIN-SUFFIX,openleaks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,opensource.google,🚀 节点选择
+ - DOMAIN-SUFFIX,openvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,openvpn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,openwebster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,openwrt.org.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,opera-mini.net,🚀 节点选择
+ - DOMAIN-SUFFIX,opera.com,🚀 节点选择
+ - DOMAIN-SUFFIX,opus-gaming.com,🚀 节点选择
+ - DOMAIN-SUFFIX,orchidbbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,organcare.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,organharvestinvestigation.net,🚀 节点选择
+ - DOMAIN-SUFFIX,organiccrap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,orgasm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,orgfree.com,🚀 节点选择
+ - DOMAIN-SUFFIX,orient-doll.com,🚀 节点选择
+ - DOMAIN-SUFFIX,orientaldaily.com.my,🚀 节点选择
+ - DOMAIN-SUFFIX,orn.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,orzdream.com,🚀 节点选择
+ - DOMAIN-SUFFIX,orzistic.org,🚀 节点选择
+ - DOMAIN-SUFFIX,osfoora.com,🚀 节点选择
+ - DOMAIN-SUFFIX,otcbtc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,otnd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,otto.de,🚀 节点选择
+ - DOMAIN-SUFFIX,otzo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ourdearamy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ourhobby.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oursogo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oursteps.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,oursweb.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ourtv.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,over-blog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,overplay.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ovi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ow.ly,🚀 节点选择
+ - DOMAIN-SUFFIX,owind.com,🚀 节点选择
+ - DOMAIN-SUFFIX,owl.li,🚀 节点选择
+ - DOMAIN-SUFFIX,oxid.it,🚀 节点选择
+ - DOMAIN-SUFFIX,oyax.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oyghan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ozchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ozvoice.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ozxw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ozyoyo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pachosting.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pacificpoker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,packetix.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pacopacomama.com,🚀 节点选择
+ - DOMAIN-SUFFIX,padmanet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,page.tl,🚀 节点选择
+ - DOMAIN-SUFFIX,page2rss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pagodabox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,palacemoon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,paldengyal.com,🚀 节点选择
+ - DOMAIN-SUFFIX,paljorpublications.com,🚀 节点选择
+ - DOMAIN-SUFFIX,palmislife.com,🚀 节点选择
+ - DOMAIN-SUFFIX,paltalk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pandapow.co,🚀 节点选择
+ - DOMAIN-SUFFIX,pandapow.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pandavpn-jp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pandora.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pandora.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,panluan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,panoramio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pao-pao.net,🚀 节点选择
+ - DOMAIN-SUFFIX,paper.li,🚀 节点选择
+ - DOMAIN-SUFFIX,paperb.us,🚀 节点选择
+ - DOMAIN-SUFFIX,paradisehill.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,paradisepoker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,parkansky.com,🚀 节点选择
+ - DOMAIN-SUFFIX,parler.com,🚀 节点选择
+ - DOMAIN-SUFFIX,parsevideo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,partycasino.com,🚀 节点选择
+ - DOMAIN-SUFFIX,partypoker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,passion.com,🚀 节点选择
+ - DOMAIN-SUFFIX,passiontimes.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,paste.ee,🚀 节点选择
+ - DOMAIN-SUFFIX,pastebin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pastie.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pathtosharepoint.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pbs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pbwiki.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pbworks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pbxes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pbxes.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pcanywhere.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pcc.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,pcdvd.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,pchome.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,pcij.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pcloud.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pcstore.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,pct.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,pdetails.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pdproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,peace.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,peacefire.org,🚀 节点选择
+ - DOMAIN-SUFFIX,peacehall.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pearlher.org,🚀 节点选择
+ - DOMAIN-SUFFIX,peeasian.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pekingduck.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pemulihan.or.id,🚀 节点选择
+ - DOMAIN-SUFFIX,pen.io,🚀 节点选择
+ - DOMAIN-SUFFIX,penchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,penchinese.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pengyulong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,penisbot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pentalogic.net,🚀 节点选择
+ - DOMAIN-SUFFIX,penthouse.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pentoy.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,peoplebookcafe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,peoplenews.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,peopo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,percy.in,🚀 节点选择
+ - DOMAIN-SUFFIX,perfectgirls.net,🚀 节点选择
+ - DOMAIN-SUFFIX,perfectvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,periscope.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,persecutionblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,persiankitty.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pfd.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,phapluan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,phayul.com,🚀 节点选择
+ - DOMAIN-SUFFIX,philborges.com,🚀 节点选择
+ - DOMAIN-SUFFIX,philly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,phmsociety.org,🚀 节点选择
+ - DOMAIN-SUFFIX,phncdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,phonegap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,photodharma.net,🚀 节点选择
+ - DOMAIN-SUFFIX,photofocus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,phuquocservices.com,🚀 节点选择
+ - DOMAIN-SUFFIX,picacomic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,picacomiccn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,picasaweb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,picidae.net,🚀 节点选择
+ - DOMAIN-SUFFIX,picturedip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,picturesocial.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pimg.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,pin-cong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pin6.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pincong.rocks,🚀 节点选择
+ - DOMAIN-SUFFIX,ping.fm,🚀 节点选择
+ - DOMAIN-SUFFIX,pinimg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pinkrod.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pinoy-n.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.at,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.de,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.dk,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,pinterest.se,🚀 节点选择
+ - DOMAIN-SUFFIX,pipii.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,piposay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,piraattilahti.org,🚀 节点选择
+ - DOMAIN-SUFFIX,piring.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pixelqi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pixiv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pixnet.in,🚀 节点选择
+ - DOMAIN-SUFFIX,pixnet.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pki.goog,🚀 节点选择
+ - DOMAIN-SUFFIX,placemix.com,🚀 节点选择
+ - DOMAIN-SUFFIX,playboy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,playboyplus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,player.fm,🚀 节点选择
+ - DOMAIN-SUFFIX,playno1.com,🚀 节点选择
+ - DOMAIN-SUFFIX,playpcesor.com,🚀 节点选择
+ - DOMAIN-SUFFIX,plays.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,plixi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,plm.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,plunder.com,🚀 节点选择
+ - DOMAIN-SUFFIX,plurk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,plus.codes,🚀 节点选择
+ - DOMAIN-SUFFIX,plus28.com,🚀 节点选择
+ - DOMAIN-SUFFIX,plusbb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pmatehunter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pmates.com,🚀 节点选择
+ - DOMAIN-SUFFIX,po2b.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pobieramy.top,🚀 节点选择
+ - DOMAIN-SUFFIX,podictionary.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pokerstars.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pokerstars.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pokerstrategy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,politicalchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,politicalconsultation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,politiscales.net,🚀 节点选择
+ - DOMAIN-SUFFIX,poloniex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,polymer-project.org,🚀 节点选择
+ - DOMAIN-SUFFIX,polymerhk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,popo.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,popvote.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,popyard.com,🚀 节点选择
+ - DOMAIN-SUFFIX,popyard.org,🚀 节点选择
+ - DOMAIN-SUFFIX,porn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,porn2.com,🚀 节点选择
+ - DOMAIN-SUFFIX,porn5.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornbase.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pornerbros.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornhd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornhost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornhub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornhubdeutsch.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pornmm.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pornoxo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornrapidshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornsharing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornsocket.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornstarclub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,porntube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,porntubenews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,porntvblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornvisit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,port25.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,portablevpn.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,poskotanews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,post01.com,🚀 节点选择
+ - DOMAIN-SUFFIX,post76.com,🚀 节点选择
+ - DOMAIN-SUFFIX,post852.com,🚀 节点选择
+ - DOMAIN-SUFFIX,postadult.com,🚀 节点选择
+ - DOMAIN-SUFFIX,postimg.org,🚀 节点选择
+ - DOMAIN-SUFFIX,potato.im,🚀 节点选择
+ - DOMAIN-SUFFIX,potvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,power.com,🚀 节点选择
+ - DOMAIN-SUFFIX,powerapple.com,🚀 节点选择
+ - DOMAIN-SUFFIX,powercx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,powerphoto.org,🚀 节点选择
+ - DOMAIN-SUFFIX,powerpointninja.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pp.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,prayforchina.net,🚀 节点选择
+ - DOMAIN-SUFFIX,premeforwindows7.com,🚀 节点选择
+ - DOMAIN-SUFFIX,premproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,presentationzen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,presidentlee.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,prestige-av.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pride.google,🚀 节点选择
+ - DOMAIN-SUFFIX,printfriendly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,prism-break.org,🚀 节点选择
+ - DOMAIN-SUFFIX,prisoneralert.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pritunl.com,🚀 节点选择
+ - DOMAIN-SUFFIX,privacybox.de,🚀 节点选择
+ - DOMAIN-SUFFIX,private.com,🚀 节点选择
+ - DOMAIN-SUFFIX,privateinternetaccess.com,🚀 节点选择
+ - DOMAIN-SUFFIX,privatepaste.com,🚀 节点选择
+ - DOMAIN-SUFFIX,privatetunnel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,privatevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,procopytips.com,🚀 节点选择
+ - DOMAIN-SUFFIX,prosiben.de,🚀 节点选择
+ - DOMAIN-SUFFIX,protonvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,provideocoalition.com,🚀 节点选择
+ - DOMAIN-SUFFIX,provpnaccounts.com,🚀 节点选择
+ - DOMAIN-SUFFIX,proxfree.com,🚀 节点选择
+ - DOMAIN-SUFFIX,proxifier.com,🚀 节点选择
+ - DOMAIN-SUFFIX,proxlet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,proxomitron.info,🚀 节点选择
+ - DOMAIN-SUFFIX,proxpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,proxyanonimo.es,🚀 节点选择
+ - DOMAIN-SUFFIX,proxydns.com,🚀 节点选择
+ - DOMAIN-SUFFIX,proxylist.org.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,proxynetwork.org.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,proxypy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,proxyroad.com,🚀 节点选择
+ - DOMAIN-SUFFIX,proxytunnel.net,🚀 节点选择
+ - DOMAIN-SUFFIX,proyectoclubes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,prozz.net,🚀 节点选择
+ - DOMAIN-SUFFIX,psblog.name,🚀 节点选择
+ - DOMAIN-SUFFIX,pscp.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,pshvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,psiphon.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,psiphon3.com,🚀 节点选择
+ - DOMAIN-SUFFIX,psiphontoday.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pts.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ptt.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,pttvan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pubu.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,puffinbrowser.com,🚀 节点选择
+ - DOMAIN-SUFFIX,puffstore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pullfolio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,punyu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pure18.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pureapk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pureconcepts.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pureinsight.org,🚀 节点选择
+ - DOMAIN-SUFFIX,purepdf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,purevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,purplelotus.org,🚀 节点选择
+ - DOMAIN-SUFFIX,pursuestar.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pushchinawall.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pussyspace.com,🚀 节点选择
+ - DOMAIN-SUFFIX,putihome.org,🚀 节点选择
+ - DOMAIN-SUFFIX,putlocker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,putty.org,🚀 节点选择
+ - DOMAIN-SUFFIX,puuko.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pwned.com,🚀 节点选择
+ - DOMAIN-SUFFIX,python.com,🚀 节点选择
+ - DOMAIN-SUFFIX,python.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,pythonhackers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pythonic.life,🚀 节点选择
+ - DOMAIN-SUFFIX,pytorch.org,🚀 节点选择
+ - DOMAIN-SUFFIX,qanote.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qgirl.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,qhigh.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qi-gong.me,🚀 节点选择
+ - DOMAIN-SUFFIX,qiandao.today,🚀 节点选择
+ - DOMAIN-SUFFIX,qiangyou.org,🚀 节点选择
+ - DOMAIN-SUFFIX,qidian.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,qienkuen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,qiwen.lu,🚀 节点选择
+ - DOMAIN-SUFFIX,qixianglu.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,qkshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qmzdd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qoos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qooza.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,qpoe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qq.co.za,🚀 节点选择
+ - DOMAIN-SUFFIX,qstatus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qtrac.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,qtweeter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,quannengshen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,quantumbooter.net,🚀 节点选择
+ - DOMAIN-SUFFIX,questvisual.com,🚀 节点选择
+ - DOMAIN-SUFFIX,quitccp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,quitccp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,quora.com,🚀 节点选择
+ - DOMAIN-SUFFIX,quoracdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,quran.com,🚀 节点选择
+ - DOMAIN-SUFFIX,quranexplorer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,qusi8.net,🚀 节点选择
+ - DOMAIN-SUFFIX,qvodzy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,qx.net,🚀 节点选择
+ - DOMAIN-SUFFIX,qxbbs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,qz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,r18.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ra.gg,🚀 节点选择
+ - DOMAIN-SUFFIX,radicalparty.org,🚀 节点选择
+ - DOMAIN-SUFFIX,radiko.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,radio.garden,🚀 节点选择
+ - DOMAIN-SUFFIX,radioaustralia.net.au,🚀 节点选择
+ - DOMAIN-SUFFIX,radiohilight.net,🚀 节点选择
+ - DOMAIN-SUFFIX,radiotime.com,🚀 节点选择
+ - DOMAIN-SUFFIX,radiovaticana.org,🚀 节点选择
+ - DOMAIN-SUFFIX,radiovncr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rael.org,🚀 节点选择
+ - DOMAIN-SUFFIX,raggedbanner.com,🚀 节点选择
+ - DOMAIN-SUFFIX,raidcall.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,raidtalk.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,rainbowplan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,raindrop.io,🚀 节点选择
+ - DOMAIN-SUFFIX,raizoji.or.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,ramcity.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,rangwang.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,rangzen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rangzen.net,🚀 节点选择
+ - DOMAIN-SUFFIX,rangzen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ranxiang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ranyunfei.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rapbull.net,🚀 节点选择
+ - DOMAIN-SUFFIX,rapidgator.net,🚀 节点选择
+ - DOMAIN-SUFFIX,rapidmoviez.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rapidvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rarbgprx.org,🚀 节点选择
+ - DOMAIN-SUFFIX,raremovie.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,raremovie.net,🚀 节点选择
+ - DOMAIN-SUFFIX,rawgit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rawgithub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,raxcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,razyboard.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rcinet.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,rd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rdio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,read01.com,🚀 节点选择
+ - DOMAIN-SUFFIX,read100.com,🚀 节点选择
+ - DOMAIN-SUFFIX,readingtimes.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,readmoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,readydown.com,🚀 节点选择
+ - DOMAIN-SUFFIX,realcourage.org,🚀 节点选择
+ - DOMAIN-SUFFIX,realitykings.com,🚀 节点选择
+ - DOMAIN-SUFFIX,realraptalk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,realsexpass.com,🚀 节点选择
+ - DOMAIN-SUFFIX,reason.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rebatesrule.net,🚀 节点选择
+ - DOMAIN-SUFFIX,recaptcha.net,🚀 节点选择
+ - DOMAIN-SUFFIX,recordhistory.org,🚀 节点选择
+ - DOMAIN-SUFFIX,recovery.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,recoveryversion.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,recoveryversion.org,🚀 节点选择
+ - DOMAIN-SUFFIX,red-lang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,redballoonsolidarity.org,🚀 节点选择
+ - DOMAIN-SUFFIX,redchinacn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,redchinacn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,redd.it,🚀 节点选择
+ - DOMAIN-SUFFIX,reddit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,redditlist.com,🚀 节点选择
+ - DOMAIN-SUFFIX,redditmedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,redditstatic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,redhotlabs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,redtube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,referer.us,🚀 节点选择
+ - DOMAIN-SUFFIX,reflectivecode.com,🚀 节点选择
+ - DOMAIN-SUFFIX,registry.google,🚀 节点选择
+ - DOMAIN-SUFFIX,relaxbbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,relay.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,releaseinternational.org,🚀 节点选择
+ - DOMAIN-SUFFIX,religioustolerance.org,🚀 节点选择
+ - DOMAIN-SUFFIX,renminbao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,renyurenquan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rerouted.org,🚀 节点选择
+ - DOMAIN-SUFFIX,resilio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,resistchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,retweeteffect.com,🚀 节点选择
+ - DOMAIN-SUFFIX,retweetist.com,🚀 节点选择
+ - DOMAIN-SUFFIX,retweetrank.com,🚀 节点选择
+ - DOMAIN-SUFFIX,reuters.com,🚀 节点选择
+ - DOMAIN-SUFFIX,reutersmedia.net,🚀 节点选择
+ - DOMAIN-SUFFIX,revleft.com,🚀 节点选择
+ - DOMAIN-SUFFIX,revocationcheck.com,🚀 节点选择
+ - DOMAIN-SUFFIX,revver.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rfa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rfachina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rfamobile.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rfaweb.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rferl.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rfi.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,rfi.my,🚀 节点选择
+ - DOMAIN-SUFFIX,rightbtc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rightster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rigpa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,riku.me,🚀 节点选择
+ - DOMAIN-SUFFIX,rileyguide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,riseup.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ritouki.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,ritter.vg,🚀 节点选择
+ - DOMAIN-SUFFIX,rixcloud.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rixcloud.us,🚀 节点选择
+ - DOMAIN-SUFFIX,rlwlw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rmjdw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rmjdw132.info,🚀 节点选择
+ - DOMAIN-SUFFIX,roadshow.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,roboforex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,robustnessiskey.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rocket-inc.net,🚀 节点选择
+ - DOMAIN-SUFFIX,rocketbbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rocksdb.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rojo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rolia.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ronjoneswriter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,roodo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rosechina.net,🚀 节点选择
+ - DOMAIN-SUFFIX,rotten.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rsdlmonitor.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rsf-chinese.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rsf.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rsgamen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rssing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rssmeme.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rtalabel.org,🚀 节点选择
+ - DOMAIN-SUFFIX,rthk.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,rthk.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,rti.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,rtycminnesota.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ruanyifeng.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rukor.org,🚀 节点选择
+ - DOMAIN-SUFFIX,runbtx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rushbee.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ruten.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,rutube.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,ruyiseek.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rxhj.net,🚀 节点选择
+ - DOMAIN-SUFFIX,s-cute.com,🚀 节点选择
+ - DOMAIN-SUFFIX,s-dragon.org,🚀 节点选择
+ - DOMAIN-SUFFIX,s1heng.com,🚀 节点选择
+ - DOMAIN-SUFFIX,s1s1s1.com,🚀 节点选择
+ - DOMAIN-SUFFIX,s4miniarchive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,s8forum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,saboom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sacks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sacom.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,sadistic-v.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sadpanda.us,🚀 节点选择
+ - DOMAIN-SUFFIX,safervpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,safety.google,🚀 节点选择
+ - DOMAIN-SUFFIX,saintyculture.com,🚀 节点选择
+ - DOMAIN-SUFFIX,saiq.me,🚀 节点选择
+ - DOMAIN-SUFFIX,sakuralive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sakya.org,🚀 节点选择
+ - DOMAIN-SUFFIX,salvation.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,samair.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,sambhota.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sandscotaicentral.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sanmin.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sans.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,sapikachu.net,🚀 节点选择
+ - DOMAIN-SUFFIX,saveliuxiaobo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,savemedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,savethedate.foo,🚀 节点选择
+ - DOMAIN-SUFFIX,savethesounds.info,🚀 节点选择
+ - DOMAIN-SUFFIX,savetibet.de,🚀 节点选择
+ - DOMAIN-SUFFIX,savetibet.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,savetibet.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,savetibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,savetibet.ru,🚀 节点选择
+ - DOMAIN-SUFFIX,savetibetstore.org,🚀 节点选择
+ - DOMAIN-SUFFIX,savevid.com,🚀 节点选择
+ - DOMAIN-SUFFIX,say2.info,🚀 节点选择
+ - DOMAIN-SUFFIX,sbme.me,🚀 节点选择
+ - DOMAIN-SUFFIX,sbs.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,scasino.com,🚀 节点选择
+ - DOMAIN-SUFFIX,schema.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sciencemag.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sciencenets.com,🚀 节点选择
+ - DOMAIN-SUFFIX,scieron.com,🚀 节点选择
+ - DOMAIN-SUFFIX,scmp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,scmpchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,scramble.io,🚀 节点选择
+ - DOMAIN-SUFFIX,scribd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,scriptspot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,seapuff.com,🚀 节点选择
+ - DOMAIN-SUFFIX,search.com,🚀 节点选择
+ - DOMAIN-SUFFIX,search.xxx,🚀 节点选择
+ - DOMAIN-SUFFIX,searchtruth.com,🚀 节点选择
+ - DOMAIN-SUFFIX,seatguru.com,🚀 节点选择
+ - DOMAIN-SUFFIX,secretchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,secretgarden.no,🚀 节点选择
+ - DOMAIN-SUFFIX,secretsline.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,securetunnel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,securityinabox.org,🚀 节点选择
+ - DOMAIN-SUFFIX,securitykiss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,seed4.me,🚀 节点选择
+ - DOMAIN-SUFFIX,seehua.com,🚀 节点选择
+ - DOMAIN-SUFFIX,seesmic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,seevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,seezone.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sejie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sellclassics.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sendsmtp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sendspace.com,🚀 节点选择
+ - DOMAIN-SUFFIX,seraph.me,🚀 节点选择
+ - DOMAIN-SUFFIX,servehttp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,serveuser.com,🚀 节点选择
+ - DOMAIN-SUFFIX,serveusers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sesawe.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sesawe.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sethwklein.net,🚀 节点选择
+ - DOMAIN-SUFFIX,setn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,settv.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,setty.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sevenload.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sex-11.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sex3.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sex8.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,sexandsubmission.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sexbot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sexhu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sexhuang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sexidude.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sexinsex.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sextvx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sexxxy.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,sf.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sfileydy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sfshibao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sftindia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sftuk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shadeyouvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shadow.ma,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsky.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsocks-r.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsocks.asia,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsocks.be,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsocks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsocks.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsocks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shadowsocks9.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shafaqna.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shambalapost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shambhalasun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shangfang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shapeservices.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sharebee.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sharecool.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sharpdaily.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,sharpdaily.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,sharpdaily.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,shat-tibet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shattered.io,🚀 节点选择
+ - DOMAIN-SUFFIX,sheikyermami.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shellfire.de,🚀 节点选择
+ - DOMAIN-SUFFIX,shemalez.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shenshou.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shenyun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shenyunperformingarts.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shenzhoufilm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sherabgyaltsen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shiatv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,shicheng.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shiksha.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shinychan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shipcamouflage.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shireyishunjian.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shitaotv.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shixiao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shizhao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shkspr.mobi,🚀 节点选择
+ - DOMAIN-SUFFIX,shodanhq.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shooshtime.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shop2000.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,shopee.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,shopping.com,🚀 节点选择
+ - DOMAIN-SUFFIX,showhaotu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,showtime.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,shutterstock.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shvoong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,shwchurch.org,🚀 节点选择
+ - DOMAIN-SUFFIX,shwchurch3.com,🚀 节点选择
+ - DOMAIN-SUFFIX,siddharthasintent.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sidelinesnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sidelinessportseatery.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sierrafriendsoftibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sijihuisuo.club,🚀 节点选择
+ - DOMAIN-SUFFIX,sijihuisuo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,silkbook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,simbolostwitter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,simplecd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,simpleproductivityblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sina.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,sina.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sinchew.com.my,🚀 节点选择
+ - DOMAIN-SUFFIX,singaporepools.com.sg,🚀 节点选择
+ - DOMAIN-SUFFIX,singfortibet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,singpao.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,singtao.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,singtao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,singtaousa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sino-monthly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sinoants.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sinocast.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sinocism.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sinomontreal.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,sinonet.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,sinopitt.info,🚀 节点选择
+ - DOMAIN-SUFFIX,sinoquebec.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sipml5.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sis.xxx,🚀 节点选择
+ - DOMAIN-SUFFIX,sis001.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sis001.us,🚀 节点选择
+ - DOMAIN-SUFFIX,site2unblock.com,🚀 节点选择
+ - DOMAIN-SUFFIX,site90.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sitebro.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sitekreator.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sitemaps.org,🚀 节点选择
+ - DOMAIN-SUFFIX,six-degrees.io,🚀 节点选择
+ - DOMAIN-SUFFIX,sixth.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,sjrt.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sjum.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,sketchappsources.com,🚀 节点选择
+ - DOMAIN-SUFFIX,skimtube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,skybet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,skyking.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,skykiwi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,skynet.be,🚀 节点选择
+ - DOMAIN-SUFFIX,skype.com,🚀 节点选择
+ - DOMAIN-SUFFIX,skyvegas.com,🚀 节点选择
+ - DOMAIN-SUFFIX,skyxvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slacker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slandr.net,🚀 节点选择
+ - DOMAIN-SUFFIX,slaytizle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sleazydream.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slheng.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slickvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slideshare.net,🚀 节点选择
+ - DOMAIN-SUFFIX,slime.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,slinkset.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slutload.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slutmoonbeam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slyip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,slyip.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sm-miracle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,smartdnsproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,smarthide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,smartmailcloud.com,🚀 节点选择
+ - DOMAIN-SUFFIX,smchbooks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,smh.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,smhric.org,🚀 节点选择
+ - DOMAIN-SUFFIX,smith.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,smyxy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,snapchat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,snaptu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sndcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sneakme.net,🚀 节点选择
+ - DOMAIN-SUFFIX,snowlionpub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,so-net.net.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sobees.com,🚀 节点选择
+ - DOMAIN-SUFFIX,soc.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,socialwhale.com,🚀 节点选择
+ - DOMAIN-SUFFIX,socks-proxy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sockscap64.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sockslist.net,🚀 节点选择
+ - DOMAIN-SUFFIX,socrec.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sod.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,softether-download.com,🚀 节点选择
+ - DOMAIN-SUFFIX,softether.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,softether.org,🚀 节点选择
+ - DOMAIN-SUFFIX,softfamous.com,🚀 节点选择
+ - DOMAIN-SUFFIX,softlayer.net,🚀 节点选择
+ - DOMAIN-SUFFIX,softsmirror.cf,🚀 节点选择
+ - DOMAIN-SUFFIX,softwarebychuck.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sogclub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sogoo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sogrady.me,🚀 节点选择
+ - DOMAIN-SUFFIX,soh.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sohcradio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sohfrance.org,🚀 节点选择
+ - DOMAIN-SUFFIX,soifind.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sokamonline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sokmil.com,🚀 节点选择
+ - DOMAIN-SUFFIX,solidaritetibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,solidfiles.com,🚀 节点选择
+ - DOMAIN-SUFFIX,somee.com,🚀 节点选择
+ - DOMAIN-SUFFIX,songjianjun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sonicbbs.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,sonidodelaesperanza.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sopcast.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sopcast.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sorazone.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sorting-algorithms.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sos.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sosreader.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sostibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sou-tong.org,🚀 节点选择
+ - DOMAIN-SUFFIX,soubory.com,🚀 节点选择
+ - DOMAIN-SUFFIX,soul-plus.net,🚀 节点选择
+ - DOMAIN-SUFFIX,soulcaliburhentai.net,🚀 节点选择
+ - DOMAIN-SUFFIX,soumo.info,🚀 节点选择
+ - DOMAIN-SUFFIX,soundcloud.com,🚀 节点选择
+ - DOMAIN-SUFFIX,soundofhope.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,soundofhope.org,🚀 节点选择
+ - DOMAIN-SUFFIX,soup.io,🚀 节点选择
+ - DOMAIN-SUFFIX,soupofmedia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sourceforge.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sourcewadio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,southnews.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sowers.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,sowiki.net,🚀 节点选择
+ - DOMAIN-SUFFIX,soylent.com,🚀 节点选择
+ - DOMAIN-SUFFIX,soylentnews.org,🚀 节点选择
+ - DOMAIN-SUFFIX,spankbang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spankingtube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spankwire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,speakerdeck.com,🚀 节点选择
+ - DOMAIN-SUFFIX,speedify.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spem.at,🚀 节点选择
+ - DOMAIN-SUFFIX,spencertipping.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spendee.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spicevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spideroak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spike.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spotflux.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spotify.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spreadshirt.es,🚀 节点选择
+ - DOMAIN-SUFFIX,spring4u.info,🚀 节点选择
+ - DOMAIN-SUFFIX,springboardplatform.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sprite.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sproutcore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sproxy.info,🚀 节点选择
+ - DOMAIN-SUFFIX,squirly.info,🚀 节点选择
+ - DOMAIN-SUFFIX,srocket.us,🚀 节点选择
+ - DOMAIN-SUFFIX,ss-link.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ssglobal.co,🚀 节点选择
+ - DOMAIN-SUFFIX,ssglobal.me,🚀 节点选择
+ - DOMAIN-SUFFIX,ssh91.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ssl443.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sspanel.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sspro.ml,🚀 节点选择
+ - DOMAIN-SUFFIX,ssr.tools,🚀 节点选择
+ - DOMAIN-SUFFIX,ssrshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sss.camp,🚀 节点选择
+ - DOMAIN-SUFFIX,sstmlt.moe,🚀 节点选择
+ - DOMAIN-SUFFIX,sstmlt.net,🚀 节点选择
+ - DOMAIN-SUFFIX,stackoverflow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stage64.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,standupfortibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,standwithhk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,stanford.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,starfishfx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,starp2p.com,🚀 节点选择
+ - DOMAIN-SUFFIX,startpage.com,🚀 节点选择
+ - DOMAIN-SUFFIX,startuplivingchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stat.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,state.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,static-economist.com,🚀 节点选择
+ - DOMAIN-SUFFIX,staticflickr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,statueofdemocracy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,stc.com.sa,🚀 节点选择
+ - DOMAIN-SUFFIX,steamcommunity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,steel-storm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,steemit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,steganos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,steganos.net,🚀 节点选择
+ - DOMAIN-SUFFIX,stepchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stephaniered.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stgloballink.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stheadline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sthoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stickam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stickeraction.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stileproject.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sto.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,stoporganharvesting.org,🚀 节点选择
+ - DOMAIN-SUFFIX,stoptibetcrisis.net,🚀 节点选择
+ - DOMAIN-SUFFIX,storagenewsletter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stories.google,🚀 节点选择
+ - DOMAIN-SUFFIX,storify.com,🚀 节点选择
+ - DOMAIN-SUFFIX,storm.mg,🚀 节点选择
+ - DOMAIN-SUFFIX,stormmediagroup.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stoweboyd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stranabg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,straplessdildo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,streamingthe.net,🚀 节点选择
+ - DOMAIN-SUFFIX,streema.com,🚀 节点选择
+ - DOMAIN-SUFFIX,streetvoice.com,🚀 节点选择
+ - DOMAIN-SUFFIX,strikingly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,strongvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,strongwindpress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,student.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,studentsforafreetibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,stumbleupon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,stupidvideos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,successfn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sueddeutsche.de,🚀 节点选择
+ - DOMAIN-SUFFIX,sugarsync.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sugobbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sugumiru18.com,🚀 节点选择
+ - DOMAIN-SUFFIX,suissl.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sulian.me,🚀 节点选择
+ - DOMAIN-SUFFIX,summify.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sumrando.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sun1911.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sunmedia.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,sunporno.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sunskyforum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sunta.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,sunvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,suoluo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,supchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,superfreevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,superokayama.com,🚀 节点选择
+ - DOMAIN-SUFFIX,superpages.com,🚀 节点选择
+ - DOMAIN-SUFFIX,supervpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,superzooi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,suppig.net,🚀 节点选择
+ - DOMAIN-SUFFIX,suprememastertv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,surfeasy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,surfeasy.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,suroot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,surrenderat20.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sustainability.google,🚀 节点选择
+ - DOMAIN-SUFFIX,suyangg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,svsfx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,swagbucks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,swissinfo.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,swissvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,switch1.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,switchvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,sydneytoday.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sylfoundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,syncback.com,🚀 节点选择
+ - DOMAIN-SUFFIX,synergyse.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sysresccd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sytes.net,🚀 节点选择
+ - DOMAIN-SUFFIX,syx86.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,syx86.com,🚀 节点选择
+ - DOMAIN-SUFFIX,szbbs.net,🚀 节点选择
+ - DOMAIN-SUFFIX,szetowah.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,t-g.com,🚀 节点选择
+ - DOMAIN-SUFFIX,t.co,🚀 节点选择
+ - DOMAIN-SUFFIX,t.me,🚀 节点选择
+ - DOMAIN-SUFFIX,t35.com,🚀 节点选择
+ - DOMAIN-SUFFIX,t66y.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taa-usa.org,🚀 节点选择
+ - DOMAIN-SUFFIX,taaze.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tablesgenerator.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tabtter.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,tacem.org,🚀 节点选择
+ - DOMAIN-SUFFIX,taconet.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taedp.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tafm.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tagwa.org.au,🚀 节点选择
+ - DOMAIN-SUFFIX,tagwalk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tahr.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taipei.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taipeisociety.org,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwan-sex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanbible.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwancon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwandaily.net,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwandc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanjobs.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanjustice.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanjustice.net,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwankiss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwannation.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwannation.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanncf.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwannews.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanonline.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwantp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwantt.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanus.net,🚀 节点选择
+ - DOMAIN-SUFFIX,taiwanyes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,talk853.com,🚀 节点选择
+ - DOMAIN-SUFFIX,talkboxapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,talkcc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,talkonly.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tamiaode.tk,🚀 节点选择
+ - DOMAIN-SUFFIX,tampabay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tanc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tangben.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tangren.us,🚀 节点选择
+ - DOMAIN-SUFFIX,taoism.net,🚀 节点选择
+ - DOMAIN-SUFFIX,taolun.info,🚀 节点选择
+ - DOMAIN-SUFFIX,tapanwap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tapatalk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,taragana.com,🚀 节点选择
+ - DOMAIN-SUFFIX,target.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tascn.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,taup.net,🚀 节点选择
+ - DOMAIN-SUFFIX,taup.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,taweet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tbcollege.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbi.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,tbicn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbjyt.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbpic.info,🚀 节点选择
+ - DOMAIN-SUFFIX,tbrc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbs-rainbow.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbsec.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbsmalaysia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbsn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbsseattle.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbssqh.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbswd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tbtemple.org.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,tbthouston.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tccwonline.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tcewf.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tchrd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tcnynj.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tcpspeed.co,🚀 节点选择
+ - DOMAIN-SUFFIX,tcpspeed.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tcsofbc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tcsovi.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tdesktop.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tdm.com.mo,🚀 节点选择
+ - DOMAIN-SUFFIX,teachparentstech.org,🚀 节点选择
+ - DOMAIN-SUFFIX,teamamericany.com,🚀 节点选择
+ - DOMAIN-SUFFIX,techviz.net,🚀 节点选择
+ - DOMAIN-SUFFIX,teck.in,🚀 节点选择
+ - DOMAIN-SUFFIX,teco-hk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,teco-mo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,teddysun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,teeniefuck.net,🚀 节点选择
+ - DOMAIN-SUFFIX,teensinasia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,telecomspace.com,🚀 节点选择
+ - DOMAIN-SUFFIX,telegra.ph,🚀 节点选择
+ - DOMAIN-SUFFIX,telegram.dog,🚀 节点选择
+ - DOMAIN-SUFFIX,telegram.me,🚀 节点选择
+ - DOMAIN-SUFFIX,telegram.org,🚀 节点选择
+ - DOMAIN-SUFFIX,telegramdownload.com,🚀 节点选择
+ - DOMAIN-SUFFIX,telegraph.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,telesco.pe,🚀 节点选择
+ - DOMAIN-SUFFIX,tellme.pw,🚀 节点选择
+ - DOMAIN-SUFFIX,tenacy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tensorflow.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tenzinpalmo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tew.org,🚀 节点选择
+ - DOMAIN-SUFFIX,textnow.me,🚀 节点选择
+ - DOMAIN-SUFFIX,tfhub.dev,🚀 节点选择
+ - DOMAIN-SUFFIX,thaicn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thb.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,theatrum-belli.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thebcomplex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,theblemish.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thebobs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thebodyshop-usa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thechinabeat.org,🚀 节点选择
+ - DOMAIN-SUFFIX,thechinastory.org,🚀 节点选择
+ - DOMAIN-SUFFIX,thedalailamamovie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thedw.us,🚀 节点选择
+ - DOMAIN-SUFFIX,thefacebook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thefrontier.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,thegay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thegioitinhoc.vn,🚀 节点选择
+ - DOMAIN-SUFFIX,thegly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thehots.info,🚀 节点选择
+ - DOMAIN-SUFFIX,thehousenews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thehun.net,🚀 节点选择
+ - DOMAIN-SUFFIX,theinitium.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thenewslens.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thepiratebay.org,🚀 节点选择
+ - DOMAIN-SUFFIX,theporndude.com,🚀 节点选择
+ - DOMAIN-SUFFIX,theportalwiki.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thereallove.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,therock.net.nz,🚀 节点选择
+ - DOMAIN-SUFFIX,thespeeder.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thestandnews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thetibetcenter.org,🚀 节点选择
+ - DOMAIN-SUFFIX,thetibetconnection.org,🚀 节点选择
+ - DOMAIN-SUFFIX,thetibetmuseum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,thetibetpost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thetinhat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thetrotskymovie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thevivekspot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thewgo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,theync.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thinkgeek.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thinkingtaiwan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thinkwithgoogle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thisav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thlib.org,🚀 节点选择
+ - DOMAIN-SUFFIX,thomasbernhard.org,🚀 节点选择
+ - DOMAIN-SUFFIX,thongdreams.com,🚀 节点选择
+ - DOMAIN-SUFFIX,threatchaos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,throughnightsfire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thumbzilla.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thywords.com,🚀 节点选择
+ - DOMAIN-SUFFIX,thywords.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tiananmenduizhi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tiananmenmother.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tiananmenuniv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tiananmenuniv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tiandixing.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tianhuayuan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tianlawoffice.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tianti.io,🚀 节点选择
+ - DOMAIN-SUFFIX,tiantibooks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tianyantong.org.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,tianzhu.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet-envoy.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet-foundation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet-house-trust.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet-initiative.de,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet-munich.de,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.a.se,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.at,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.nu,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.sk,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet.to,🚀 节点选择
+ - DOMAIN-SUFFIX,tibet3rdpole.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetaction.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetaid.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetalk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetan-alliance.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetan.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanaidproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanarts.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanbuddhistinstitute.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetancommunity.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetancommunityuk.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanculture.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanfeministcollective.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanjournal.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanlanguage.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanliberation.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanpaintings.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanphotoproject.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanpoliticalreview.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanreview.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetansports.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanwomen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanyouth.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetanyouthcongress.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetcharity.dk,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetcharity.in,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetchild.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetcity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetcollection.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetcorps.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetexpress.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetfocus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetfund.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetgermany.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetgermany.de,🚀 节点选择
+ - DOMAIN-SUFFIX,tibethaus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetheritagefund.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibethouse.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,tibethouse.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibethouse.us,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetinfonet.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetjustice.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetkomite.dk,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetmuseum.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetnetwork.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetoffice.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetoffice.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetoffice.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetoffice.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetonline.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetonline.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetoralhistory.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetpolicy.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetrelieffund.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetsites.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetsociety.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetsun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetsupportgroup.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetswiss.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,tibettelegraph.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tibettimes.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tibetwrites.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ticket.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tigervpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tiltbrush.com,🚀 节点选择
+ - DOMAIN-SUFFIX,timdir.com,🚀 节点选择
+ - DOMAIN-SUFFIX,time.com,🚀 节点选择
+ - DOMAIN-SUFFIX,timsah.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tinc-vpn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tiney.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tineye.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tintuc101.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tiny.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,tinychat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tinypaste.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tipo.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tistory.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tkcs-collins.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tl.gd,🚀 节点选择
+ - DOMAIN-SUFFIX,tma.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,tmagazine.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tmdfish.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tmi.me,🚀 节点选择
+ - DOMAIN-SUFFIX,tmpp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tnaflix.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tngrnow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tngrnow.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tnp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,to-porno.com,🚀 节点选择
+ - DOMAIN-SUFFIX,togetter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,toh.info,🚀 节点选择
+ - DOMAIN-SUFFIX,tokyo-247.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tokyo-hot.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tokyo-porn-tube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tokyocn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tomonews.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tongil.or.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,tono-oka.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,tonyyan.net,🚀 节点选择
+ - DOMAIN-SUFFIX,toodoc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,toonel.net,🚀 节点选择
+ - DOMAIN-SUFFIX,top.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,top10vpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,top81.ws,🚀 节点选择
+ - DOMAIN-SUFFIX,topbtc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,topnews.in,🚀 节点选择
+ - DOMAIN-SUFFIX,toppornsites.com,🚀 节点选择
+ - DOMAIN-SUFFIX,topshareware.com,🚀 节点选择
+ - DOMAIN-SUFFIX,topsy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,toptip.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,tora.to,🚀 节点选择
+ - DOMAIN-SUFFIX,torcn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,torguard.net,🚀 节点选择
+ - DOMAIN-SUFFIX,torproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,torrentprivacy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,torrentproject.se,🚀 节点选择
+ - DOMAIN-SUFFIX,torrenty.org,🚀 节点选择
+ - DOMAIN-SUFFIX,torrentz.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,torvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,totalvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,toutiaoabc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,towngain.com,🚀 节点选择
+ - DOMAIN-SUFFIX,toypark.in,🚀 节点选择
+ - DOMAIN-SUFFIX,toythieves.com,🚀 节点选择
+ - DOMAIN-SUFFIX,toytractorshow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tparents.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tpi.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tracfone.com,🚀 节点选择
+ - DOMAIN-SUFFIX,traffichaus.com,🚀 节点选择
+ - DOMAIN-SUFFIX,transparency.org,🚀 节点选择
+ - DOMAIN-SUFFIX,treemall.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,trendsmap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,trialofccp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,trickip.net,🚀 节点选择
+ - DOMAIN-SUFFIX,trickip.org,🚀 节点选择
+ - DOMAIN-SUFFIX,trimondi.de,🚀 节点选择
+ - DOMAIN-SUFFIX,trouw.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,trt.net.tr,🚀 节点选择
+ - DOMAIN-SUFFIX,trtc.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,truebuddha-md.org,🚀 节点选择
+ - DOMAIN-SUFFIX,trulyergonomic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,truthontour.org,🚀 节点选择
+ - DOMAIN-SUFFIX,truveo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tryheart.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,tsctv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tsemtulku.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tsquare.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,tsu.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tsunagarumon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tt1069.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tttan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ttv.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ttvnw.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tu8964.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tubaholic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tube8.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tube911.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tubecup.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tubegals.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tubeislam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tubepornclassic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tubestack.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tubewolf.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tuibeitu.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tuidang.net,🚀 节点选择
+ - DOMAIN-SUFFIX,tuidang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tuidang.se,🚀 节点选择
+ - DOMAIN-SUFFIX,tuitui.info,🚀 节点选择
+ - DOMAIN-SUFFIX,tuitwit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tumblr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tumutanzi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tumview.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tunein.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tunnelbear.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tunnelr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.blue,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.club,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.fit,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.in,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.ninja,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.pw,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.red,🚀 节点选择
+ - DOMAIN-SUFFIX,tuo8.space,🚀 节点选择
+ - DOMAIN-SUFFIX,turansam.org,🚀 节点选择
+ - DOMAIN-SUFFIX,turbobit.net,🚀 节点选择
+ - DOMAIN-SUFFIX,turbohide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,turbotwitter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,turkistantimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,turntable.fm,🚀 节点选择
+ - DOMAIN-SUFFIX,tushycash.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tutanota.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tuvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tuzaijidi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tvants.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tvb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tvboxnow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tvbs.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,tvider.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tvmost.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,tvplayvideos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tvunetworks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tw-blog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tw-npo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tw01.org,🚀 节点选择
+ - DOMAIN-SUFFIX,twaitter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twapperkeeper.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twaud.io,🚀 节点选择
+ - DOMAIN-SUFFIX,twavi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twbbs.net.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,twbbs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,twbbs.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,twblogger.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweepguide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweeplike.me,🚀 节点选择
+ - DOMAIN-SUFFIX,tweepmag.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweepml.org,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetbackup.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetboard.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetboner.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetcs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetdeck.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetedtimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetmylast.fm,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetphoto.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetrans.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetree.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweettunnel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetwally.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweetymail.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tweez.net,🚀 节点选择
+ - DOMAIN-SUFFIX,twelve.today,🚀 节点选择
+ - DOMAIN-SUFFIX,twerkingbutt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twftp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,twgreatdaily.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twibase.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twibble.de,🚀 节点选择
+ - DOMAIN-SUFFIX,twibbon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twibs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twicountry.org,🚀 节点选择
+ - DOMAIN-SUFFIX,twicsy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twiends.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twifan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twiffo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twiggit.org,🚀 节点选择
+ - DOMAIN-SUFFIX,twilightsex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twilio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twilog.org,🚀 节点选择
+ - DOMAIN-SUFFIX,twimbow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twimg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twindexx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twip.me,🚀 节点选择
+ - DOMAIN-SUFFIX,twipple.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,twishort.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twistar.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,twister.net.co,🚀 节点选择
+ - DOMAIN-SUFFIX,twisterio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twisternow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twistory.net,🚀 节点选择
+ - DOMAIN-SUFFIX,twit2d.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitbrowser.net,🚀 节点选择
+ - DOMAIN-SUFFIX,twitcause.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitch.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,twitchcdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,twitgether.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitgoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitiq.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitlonger.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitmania.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitoaster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitonmsn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitpic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitstat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twittbot.net,🚀 节点选择
+ - DOMAIN-SUFFIX,twitter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitter.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,twitter4j.org,🚀 节点选择
+ - DOMAIN-SUFFIX,twittercounter.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitterfeed.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twittergadget.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitterkr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twittermail.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitterrific.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twittertim.es,🚀 节点选择
+ - DOMAIN-SUFFIX,twitthat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitturk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitturly.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitvid.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twitzap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twiyia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twnorth.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,twskype.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twstar.net,🚀 节点选择
+ - DOMAIN-SUFFIX,twt.tl,🚀 节点选择
+ - DOMAIN-SUFFIX,twtkr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twtrland.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twttr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twurl.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,twyac.org,🚀 节点选择
+ - DOMAIN-SUFFIX,txxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tycool.com,🚀 节点选择
+ - DOMAIN-SUFFIX,typepad.com,🚀 节点选择
+ - DOMAIN-SUFFIX,u15.info,🚀 节点选择
+ - DOMAIN-SUFFIX,u9un.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ub0.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,ubddns.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uberproxy.net,🚀 节点选择
+ - DOMAIN-SUFFIX,uc-japan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ucam.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ucanews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ucdc1998.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uchicago.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,uderzo.it,🚀 节点选择
+ - DOMAIN-SUFFIX,udn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,udn.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,udnbkk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uforadio.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,ufreevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ugo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uhdwallpapers.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uhrp.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uighur.nl,🚀 节点选择
+ - DOMAIN-SUFFIX,uighurbiz.net,🚀 节点选择
+ - DOMAIN-SUFFIX,uk.to,🚀 节点选择
+ - DOMAIN-SUFFIX,ukcdp.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,ukliferadio.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,uku.im,🚀 节点选择
+ - DOMAIN-SUFFIX,ulike.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ulop.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ultravpn.fr,🚀 节点选择
+ - DOMAIN-SUFFIX,ultraxs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,umich.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,unblock-us.com,🚀 节点选择
+ - DOMAIN-SUFFIX,unblockdmm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,unblocker.yt,🚀 节点选择
+ - DOMAIN-SUFFIX,unblocksit.es,🚀 节点选择
+ - DOMAIN-SUFFIX,uncyclomedia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uncyclopedia.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,uncyclopedia.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,underwoodammo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,unholyknight.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uni.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,unicode.org,🚀 节点选择
+ - DOMAIN-SUFFIX,unification.net,🚀 节点选择
+ - DOMAIN-SUFFIX,unification.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,unirule.cloud,🚀 节点选择
+ - DOMAIN-SUFFIX,unitedsocialpress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,unix100.com,🚀 节点选择
+ - DOMAIN-SUFFIX,unknownspace.org,🚀 节点选择
+ - DOMAIN-SUFFIX,unodedos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,unpo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,unseen.is,🚀 节点选择
+ - DOMAIN-SUFFIX,untraceable.us,🚀 节点选择
+ - DOMAIN-SUFFIX,uocn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,updatestar.com,🚀 节点选择
+ - DOMAIN-SUFFIX,upholdjustice.org,🚀 节点选择
+ - DOMAIN-SUFFIX,upload4u.info,🚀 节点选择
+ - DOMAIN-SUFFIX,uploaded.net,🚀 节点选择
+ - DOMAIN-SUFFIX,uploaded.to,🚀 节点选择
+ - DOMAIN-SUFFIX,uploadstation.com,🚀 节点选择
+ - DOMAIN-SUFFIX,upmedia.mg,🚀 节点选择
+ - DOMAIN-SUFFIX,upornia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uproxy.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uptodown.com,🚀 节点选择
+ - DOMAIN-SUFFIX,upwill.org,🚀 节点选择
+ - DOMAIN-SUFFIX,ur7s.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uraban.me,🚀 节点选择
+ - DOMAIN-SUFFIX,urbansurvival.com,🚀 节点选择
+ - DOMAIN-SUFFIX,urchin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,url.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,url.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,urlborg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,urlparser.com,🚀 节点选择
+ - DOMAIN-SUFFIX,us.to,🚀 节点选择
+ - DOMAIN-SUFFIX,usacn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,usaip.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,usc.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,usembassy.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,usfk.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,usma.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,usmc.mil,🚀 节点选择
+ - DOMAIN-SUFFIX,usocctn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uspto.gov,🚀 节点选择
+ - DOMAIN-SUFFIX,ustream.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,usunitednews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,usus.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,utopianpal.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uu-gg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uukanshu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uvwxyz.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,uwants.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uwants.net,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghur-j.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghur.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghuramerican.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghurcanadiansociety.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghurcongress.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghurensemble.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghurpen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghurpress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,uyghurstudies.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uygur.org,🚀 节点选择
+ - DOMAIN-SUFFIX,uymaarip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,v2ex.com,🚀 节点选择
+ - DOMAIN-SUFFIX,v2ray.com,🚀 节点选择
+ - DOMAIN-SUFFIX,van001.com,🚀 节点选择
+ - DOMAIN-SUFFIX,van698.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vanemu.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,vanilla-jp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vanpeople.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vansky.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vaticannews.va,🚀 节点选择
+ - DOMAIN-SUFFIX,vatn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vcf-online.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vcfbuilder.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vegasred.com,🚀 节点选择
+ - DOMAIN-SUFFIX,velkaepocha.sk,🚀 节点选择
+ - DOMAIN-SUFFIX,venbbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,venchina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,venetianmacao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ventureswell.com,🚀 节点选择
+ - DOMAIN-SUFFIX,veoh.com,🚀 节点选择
+ - DOMAIN-SUFFIX,verizon.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vermonttibet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,versavpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,verybs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vevo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vft.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,viber.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vica.info,🚀 节点选择
+ - DOMAIN-SUFFIX,victimsofcommunism.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vid.me,🚀 节点选择
+ - DOMAIN-SUFFIX,vidble.com,🚀 节点选择
+ - DOMAIN-SUFFIX,videobam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,videodetective.com,🚀 节点选择
+ - DOMAIN-SUFFIX,videomega.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,videomo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,videopediaworld.com,🚀 节点选择
+ - DOMAIN-SUFFIX,videopress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vidinfo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vietdaikynguyen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vijayatemple.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vimeo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vimperator.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vincnd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vine.co,🚀 节点选择
+ - DOMAIN-SUFFIX,vinniev.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vip-enterprise.com,🚀 节点选择
+ - DOMAIN-SUFFIX,virginia.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,virtualrealporn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,visibletweets.com,🚀 节点选择
+ - DOMAIN-SUFFIX,visiontimes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vital247.org,🚀 节点选择
+ - DOMAIN-SUFFIX,viu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,viu.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,vivahentai4u.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vivatube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vivthomas.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vizvaz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vjav.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vjmedia.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,vllcs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vmixcore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vmpsoft.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vnet.link,🚀 节点选择
+ - DOMAIN-SUFFIX,voa.mobi,🚀 节点选择
+ - DOMAIN-SUFFIX,voacantonese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voachinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voachineseblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voagd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voanews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voatibetan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voatibetanenglish.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vocativ.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vocn.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,vot.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vovo2000.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voxer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,voy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpn.ac,🚀 节点选择
+ - DOMAIN-SUFFIX,vpn4all.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnaccount.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnaccounts.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnbook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpncomparison.org,🚀 节点选择
+ - DOMAIN-SUFFIX,vpncoupons.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpncup.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpndada.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnfan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnfire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnfires.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnforgame.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vpngate.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,vpngate.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vpngratis.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnhq.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpninja.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnintouch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnintouch.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnjack.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnmaster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnmentor.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnpick.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnpop.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnpronet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnreactor.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnreviewz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnsecure.me,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnshazam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnshieldapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnsp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpntraffic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpntunnel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnuk.info,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnunlimitedapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnvip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpnworldwide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vporn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vpser.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vraiesagesse.net,🚀 节点选择
+ - DOMAIN-SUFFIX,vrmtr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vrsmash.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vtunnel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vuku.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,vultryhw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,vzw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,w3.org,🚀 节点选择
+ - DOMAIN-SUFFIX,w3schools.com,🚀 节点选择
+ - DOMAIN-SUFFIX,waffle1999.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wahas.com,🚀 节点选择
+ - DOMAIN-SUFFIX,waigaobu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,waikeung.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wailaike.net,🚀 节点选择
+ - DOMAIN-SUFFIX,waiwaier.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wallmama.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wallornot.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wallpapercasa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wallproxy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,waltermartin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,waltermartin.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wan-press.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wanderinghorse.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wangafu.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wangjinbo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wanglixiong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wango.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wangruoshui.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wangruowang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,want-daily.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wanz-factory.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wapedia.mobi,🚀 节点选择
+ - DOMAIN-SUFFIX,warehouse333.com,🚀 节点选择
+ - DOMAIN-SUFFIX,waselpro.com,🚀 节点选择
+ - DOMAIN-SUFFIX,washeng.net,🚀 节点选择
+ - DOMAIN-SUFFIX,washingtonpost.com,🚀 节点选择
+ - DOMAIN-SUFFIX,watch8x.com,🚀 节点选择
+ - DOMAIN-SUFFIX,watchinese.com,🚀 节点选择
+ - DOMAIN-SUFFIX,watchmygf.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wattpad.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wav.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,waveprotocol.org,🚀 节点选择
+ - DOMAIN-SUFFIX,waymo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wda.gov.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,wdf5.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wearehairy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wearn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,weather.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,web.dev,🚀 节点选择
+ - DOMAIN-SUFFIX,web2project.net,🚀 节点选择
+ - DOMAIN-SUFFIX,webbang.net,🚀 节点选择
+ - DOMAIN-SUFFIX,webevader.org,🚀 节点选择
+ - DOMAIN-SUFFIX,webfreer.com,🚀 节点选择
+ - DOMAIN-SUFFIX,webjb.org,🚀 节点选择
+ - DOMAIN-SUFFIX,weblagu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,webmproject.org,🚀 节点选择
+ - DOMAIN-SUFFIX,webpack.de,🚀 节点选择
+ - DOMAIN-SUFFIX,webrtc.org,🚀 节点选择
+ - DOMAIN-SUFFIX,webrush.net,🚀 节点选择
+ - DOMAIN-SUFFIX,webs-tv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,websitepulse.com,🚀 节点选择
+ - DOMAIN-SUFFIX,websnapr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,webwarper.net,🚀 节点选择
+ - DOMAIN-SUFFIX,webworkerdaily.com,🚀 节点选择
+ - DOMAIN-SUFFIX,weekmag.info,🚀 节点选择
+ - DOMAIN-SUFFIX,wefightcensorship.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wefong.com,🚀 节点选择
+ - DOMAIN-SUFFIX,weiboleak.com,🚀 节点选择
+ - DOMAIN-SUFFIX,weihuo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,weijingsheng.org,🚀 节点选择
+ - DOMAIN-SUFFIX,weiming.info,🚀 节点选择
+ - DOMAIN-SUFFIX,weiquanwang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,weisuo.ws,🚀 节点选择
+ - DOMAIN-SUFFIX,welovecock.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wemigrate.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wengewang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wengewang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wenhui.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,wenweipo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wenxuecity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wenyunchao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wenzhao.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,westca.com,🚀 节点选择
+ - DOMAIN-SUFFIX,westernshugdensociety.org,🚀 节点选择
+ - DOMAIN-SUFFIX,westernwolves.com,🚀 节点选择
+ - DOMAIN-SUFFIX,westkit.net,🚀 节点选择
+ - DOMAIN-SUFFIX,westpoint.edu,🚀 节点选择
+ - DOMAIN-SUFFIX,wetplace.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wetpussygames.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wexiaobo.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wezhiyong.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wezone.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wforum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wha.la,🚀 节点选择
+ - DOMAIN-SUFFIX,whatblocked.com,🚀 节点选择
+ - DOMAIN-SUFFIX,whatbrowser.org,🚀 节点选择
+ - DOMAIN-SUFFIX,whatsapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,whatsapp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,whatsonweibo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wheatseeds.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wheelockslatin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,whereiswerner.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wheretowatch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,whippedass.com,🚀 节点选择
+ - DOMAIN-SUFFIX,whodns.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,whoer.net,🚀 节点选择
+ - DOMAIN-SUFFIX,whotalking.com,🚀 节点选择
+ - DOMAIN-SUFFIX,whylover.com,🚀 节点选择
+ - DOMAIN-SUFFIX,whyx.org,🚀 节点选择
+ - DOMAIN-SUFFIX,widevine.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wikaba.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wikia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks-forum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.ch,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.de,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.eu,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.lu,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.pl,🚀 节点选择
+ - DOMAIN-SUFFIX,wikilivres.info,🚀 节点选择
+ - DOMAIN-SUFFIX,wikimapia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikinews.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikipedia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikisource.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikiwiki.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,wildammo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,williamhill.com,🚀 节点选择
+ - DOMAIN-SUFFIX,willw.net,🚀 节点选择
+ - DOMAIN-SUFFIX,windowsphoneme.com,🚀 节点选择
+ - DOMAIN-SUFFIX,windscribe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,windy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wingamestore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wingy.site,🚀 节点选择
+ - DOMAIN-SUFFIX,winning11.com,🚀 节点选择
+ - DOMAIN-SUFFIX,winwhispers.info,🚀 节点选择
+ - DOMAIN-SUFFIX,wionews.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wire.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wiredbytes.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wiredpen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wisdompubs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wisevid.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wistia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,withgoogle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,withyoutube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,witnessleeteaching.com,🚀 节点选择
+ - DOMAIN-SUFFIX,witopia.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wizcrafts.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wjbk.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wnacg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wnacg.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wo.tc,🚀 节点选择
+ - DOMAIN-SUFFIX,woeser.com,🚀 节点选择
+ - DOMAIN-SUFFIX,woesermiddle-way.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wokar.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wolfax.com,🚀 节点选择
+ - DOMAIN-SUFFIX,woolyss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,woopie.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,woopie.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,wordpress.com,🚀 节点选择
+ - DOMAIN-SUFFIX,workatruna.com,🚀 节点选择
+ - DOMAIN-SUFFIX,workerdemo.org.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,workerempowerment.org,🚀 节点选择
+ - DOMAIN-SUFFIX,workersthebig.net,🚀 节点选择
+ - DOMAIN-SUFFIX,workflow.is,🚀 节点选择
+ - DOMAIN-SUFFIX,worldcat.org,🚀 节点选择
+ - DOMAIN-SUFFIX,worldjournal.com,🚀 节点选择
+ - DOMAIN-SUFFIX,worldvpn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wow-life.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wowgirls.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wowlegacy.ml,🚀 节点选择
+ - DOMAIN-SUFFIX,wowporn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wowrk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,woxinghuiguo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,woyaolian.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wozy.in,🚀 节点选择
+ - DOMAIN-SUFFIX,wp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wpoforum.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wqyd.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wrchina.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wretch.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,wsj.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wsj.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wsjhk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wtbn.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wtfpeople.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wuerkaixi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wufafangwen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wufi.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,wuguoguang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wujie.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wujieliulan.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wukangrui.net,🚀 节点选择
+ - DOMAIN-SUFFIX,wuw.red,🚀 节点选择
+ - DOMAIN-SUFFIX,wuyanblog.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wwe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,wwitv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,www1.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,wwwhost.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,wzyboy.im,🚀 节点选择
+ - DOMAIN-SUFFIX,x-art.com,🚀 节点选择
+ - DOMAIN-SUFFIX,x-berry.com,🚀 节点选择
+ - DOMAIN-SUFFIX,x-wall.org,🚀 节点选择
+ - DOMAIN-SUFFIX,x.company,🚀 节点选择
+ - DOMAIN-SUFFIX,x1949x.com,🚀 节点选择
+ - DOMAIN-SUFFIX,x24hr.com,🚀 节点选择
+ - DOMAIN-SUFFIX,x365x.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xanga.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xbabe.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xbookcn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xbtce.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xcafe.in,🚀 节点选择
+ - DOMAIN-SUFFIX,xcity.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,xcritic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xda-developers.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xerotica.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xfiles.to,🚀 节点选择
+ - DOMAIN-SUFFIX,xfinity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xgmyd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xhamster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xianba.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xianchawang.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xianjian.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,xianqiao.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xiaobaiwu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xiaochuncnjp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xiaod.in,🚀 节点选择
+ - DOMAIN-SUFFIX,xiaohexie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xiaolan.me,🚀 节点选择
+ - DOMAIN-SUFFIX,xiaoma.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xiezhua.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xihua.es,🚀 节点选择
+ - DOMAIN-SUFFIX,xinbao.de,🚀 节点选择
+ - DOMAIN-SUFFIX,xing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xinhuanet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xinmiao.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,xinsheng.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xinshijue.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xinyubbs.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xiongpian.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xiuren.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xizang-zhiye.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xjp.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,xjtravelguide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xkiwi.tk,🚀 节点选择
+ - DOMAIN-SUFFIX,xlfmtalk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xlfmwz.info,🚀 节点选择
+ - DOMAIN-SUFFIX,xm.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xml-training-guide.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xmovies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--4gq171p.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--czq75pvv1aj5c.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--i2ru8q2qg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--ngstr-lra8j.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--oiq.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--p8j9a0d9c9a.xn--q9jyb4c,🚀 节点选择
+ - DOMAIN-SUFFIX,xnxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xpdo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xpud.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xrentdvd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xskywalker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xskywalker.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xtube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xuchao.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xuchao.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xuehua.us,🚀 节点选择
+ - DOMAIN-SUFFIX,xuite.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xuzhiyong.net,🚀 节点选择
+ - DOMAIN-SUFFIX,xvideo.cc,🚀 节点选择
+ - DOMAIN-SUFFIX,xvideos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xvideos.es,🚀 节点选择
+ - DOMAIN-SUFFIX,xxbbx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xxlmovies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xxuz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xxx.xxx,🚀 节点选择
+ - DOMAIN-SUFFIX,xxxfuckmom.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xxxx.com.au,🚀 节点选择
+ - DOMAIN-SUFFIX,xxxy.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,xxxy.info,🚀 节点选择
+ - DOMAIN-SUFFIX,xxxymovies.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xys.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xysblogs.org,🚀 节点选择
+ - DOMAIN-SUFFIX,xyy69.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xyy69.info,🚀 节点选择
+ - DOMAIN-SUFFIX,yahoo.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,yahoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yahoo.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,yahoo.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,yahoo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yakbutterblues.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yam.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yam.org.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,yanghengjun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yangjianli.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yasni.co.uk,🚀 节点选择
+ - DOMAIN-SUFFIX,yayabay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ydy.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yeahteentube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yecl.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yeelou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yeeyi.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yegle.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yes-news.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yes.xxx,🚀 节点选择
+ - DOMAIN-SUFFIX,yes123.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,yesasia.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yesasia.com.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,yespornplease.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yeyeclub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ygto.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yhcw.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yibada.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yibaochina.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yidio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yigeni.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yilubbs.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yimg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yingsuoss.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yinlei.org,🚀 节点选择
+ - DOMAIN-SUFFIX,yipub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yizhihongxing.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yobit.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yobt.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yobt.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,yogichen.org,🚀 节点选择
+ - DOMAIN-SUFFIX,yolasite.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yomiuri.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,yong.hu,🚀 节点选择
+ - DOMAIN-SUFFIX,yorkbbs.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,you-get.org,🚀 节点选择
+ - DOMAIN-SUFFIX,youdontcare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youjizz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youmaker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youngpornvideos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youngspiration.hk,🚀 节点选择
+ - DOMAIN-SUFFIX,youpai.org,🚀 节点选择
+ - DOMAIN-SUFFIX,youporn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youporngay.com,🚀 节点选择
+ - DOMAIN-SUFFIX,your-freedom.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yourepeat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yourlisten.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yourlust.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yourprivatevpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yourtrap.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yousendit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youshun12.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youthnetradio.org,🚀 节点选择
+ - DOMAIN-SUFFIX,youthwant.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,youtu.be,🚀 节点选择
+ - DOMAIN-SUFFIX,youtube-nocookie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youtube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youtubecn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youtubeeducation.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youtubegaming.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youversion.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youwin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youxu.info,🚀 节点选择
+ - DOMAIN-SUFFIX,yt.be,🚀 节点选择
+ - DOMAIN-SUFFIX,ytht.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ytimg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ytn.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,yuanming.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yuanzhengtang.org,🚀 节点选择
+ - DOMAIN-SUFFIX,yulghun.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yunchao.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yuntipub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yuvutu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yvesgeleyn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ywpw.com,🚀 节点选择
+ - DOMAIN-SUFFIX,yx51.net,🚀 节点选择
+ - DOMAIN-SUFFIX,yyii.org,🚀 节点选择
+ - DOMAIN-SUFFIX,yzzk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zacebook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zalmos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zannel.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zaobao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zaobao.com.sg,🚀 节点选择
+ - DOMAIN-SUFFIX,zaozon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zapto.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zattoo.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zdnet.com.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,zello.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zengjinyan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zenmate.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zeronet.io,🚀 节点选择
+ - DOMAIN-SUFFIX,zeutch.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zfreet.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zgsddh.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zgzcjj.net,🚀 节点选择
+ - DOMAIN-SUFFIX,zhanbin.net,🚀 节点选择
+ - DOMAIN-SUFFIX,zhangboli.net,🚀 节点选择
+ - DOMAIN-SUFFIX,zhangtianliang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zhanlve.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zhenghui.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zhengjian.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zhengwunet.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zhenlibu.info,🚀 节点选择
+ - DOMAIN-SUFFIX,zhenlibu1984.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zhenxiang.biz,🚀 节点选择
+ - DOMAIN-SUFFIX,zhinengluyou.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zhongguo.ca,🚀 节点选择
+ - DOMAIN-SUFFIX,zhongguorenquan.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zhongguotese.net,🚀 节点选择
+ - DOMAIN-SUFFIX,zhongmeng.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zhoushuguang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zhreader.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zhuangbi.me,🚀 节点选择
+ - DOMAIN-SUFFIX,zhuanxing.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,zhuatieba.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zhuichaguoji.org,🚀 节点选择
+ - DOMAIN-SUFFIX,zi5.me,🚀 节点选择
+ - DOMAIN-SUFFIX,ziddu.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zillionk.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zim.vn,🚀 节点选择
+ - DOMAIN-SUFFIX,zinio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ziporn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zippyshare.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zkaip.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zkiz.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zmw.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,zodgame.us,🚀 节点选择
+ - DOMAIN-SUFFIX,zoho.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zomobo.net,🚀 节点选择
+ - DOMAIN-SUFFIX,zonaeuropa.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zonghexinwen.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zonghexinwen.net,🚀 节点选择
+ - DOMAIN-SUFFIX,zoogvpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zootool.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zoozle.net,🚀 节点选择
+ - DOMAIN-SUFFIX,zorrovpn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zozotown.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zpn.im,🚀 节点选择
+ - DOMAIN-SUFFIX,zspeeder.me,🚀 节点选择
+ - DOMAIN-SUFFIX,zsrhao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zuo.la,🚀 节点选择
+ - DOMAIN-SUFFIX,zuobiao.me,🚀 节点选择
+ - DOMAIN-SUFFIX,zuola.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zvereff.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zynaima.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zynamics.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zyns.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zyzc9.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zzcartoon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,zzcloud.me,🚀 节点选择
+ - DOMAIN-SUFFIX,zzux.com,🚀 节点选择
+ - DOMAIN-SUFFIX,amazon.co.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,amazon.com,🚀 节点选择
+ - DOMAIN-SUFFIX,amazonaws.com,🚀 节点选择
+ - IP-CIDR,13.32.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,13.35.0.0/17,🚀 节点选择,no-resolve
+ - IP-CIDR,18.184.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,18.194.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,18.208.0.0/13,🚀 节点选择,no-resolve
+ - IP-CIDR,18.232.0.0/14,🚀 节点选择,no-resolve
+ - IP-CIDR,52.58.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,52.74.0.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,52.77.0.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,52.84.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,52.200.0.0/13,🚀 节点选择,no-resolve
+ - IP-CIDR,54.93.0.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,54.156.0.0/14,🚀 节点选择,no-resolve
+ - IP-CIDR,54.226.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,54.230.156.0/22,🚀 节点选择,no-resolve
+ - DOMAIN-KEYWORD,uk-live,🚀 节点选择
+ - DOMAIN-SUFFIX,bbc.co,🚀 节点选择
+ - DOMAIN-SUFFIX,bbc.com,🚀 节点选择
+ - DOMAIN-SUFFIX,apache.org,🚀 节点选择
+ - DOMAIN-SUFFIX,docker.com,🚀 节点选择
+ - DOMAIN-SUFFIX,elastic.co,🚀 节点选择
+ - DOMAIN-SUFFIX,elastic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gcr.io,🚀 节点选择
+ - DOMAIN-SUFFIX,gitlab.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gitlab.io,🚀 节点选择
+ - DOMAIN-SUFFIX,jitpack.io,🚀 节点选择
+ - DOMAIN-SUFFIX,maven.org,🚀 节点选择
+ - DOMAIN-SUFFIX,medium.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mvnrepository.com,🚀 节点选择
+ - DOMAIN-SUFFIX,quay.io,🚀 节点选择
+ - DOMAIN-SUFFIX,reddit.com,🚀 节点选择
+ - DOMAIN-SUFFIX,redhat.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sonatype.org,🚀 节点选择
+ - DOMAIN-SUFFIX,sourcegraph.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spring.io,🚀 节点选择
+ - DOMAIN-SUFFIX,spring.net,🚀 节点选择
+ - DOMAIN-SUFFIX,stackoverflow.com,🚀 节点选择
+ - DOMAIN-SUFFIX,discord.co,🚀 节点选择
+ - DOMAIN-SUFFIX,discord.com,🚀 节点选择
+ - DOMAIN-SUFFIX,discord.gg,🚀 节点选择
+ - DOMAIN-SUFFIX,discord.media,🚀 节点选择
+ - DOMAIN-SUFFIX,discordapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,discordapp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,facebook.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fb.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fb.me,🚀 节点选择
+ - DOMAIN-SUFFIX,fbcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fbcdn.net,🚀 节点选择
+ - IP-CIDR,31.13.24.0/21,🚀 节点选择,no-resolve
+ - IP-CIDR,31.13.64.0/18,🚀 节点选择,no-resolve
+ - IP-CIDR,45.64.40.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,66.220.144.0/20,🚀 节点选择,no-resolve
+ - IP-CIDR,69.63.176.0/20,🚀 节点选择,no-resolve
+ - IP-CIDR,69.171.224.0/19,🚀 节点选择,no-resolve
+ - IP-CIDR,74.119.76.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,103.4.96.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,129.134.0.0/17,🚀 节点选择,no-resolve
+ - IP-CIDR,157.240.0.0/17,🚀 节点选择,no-resolve
+ - IP-CIDR,173.252.64.0/18,🚀 节点选择,no-resolve
+ - IP-CIDR,179.60.192.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,185.60.216.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,204.15.20.0/22,🚀 节点选择,no-resolve
+ - DOMAIN-SUFFIX,github.com,🚀 节点选择
+ - DOMAIN-SUFFIX,github.io,🚀 节点选择
+ - DOMAIN-SUFFIX,githubapp.com,🚀 节点选择
+ - DOMAIN-SUFFIX,githubassets.com,🚀 节点选择
+ - DOMAIN-SUFFIX,githubusercontent.com,🚀 节点选择
+ - DOMAIN-SUFFIX,1e100.net,🚀 节点选择
+ - DOMAIN-SUFFIX,2mdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,app-measurement.net,🚀 节点选择
+ - DOMAIN-SUFFIX,ggpht.com,🚀 节点选择
+ - DOMAIN-SUFFIX,googleapis.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,googleapis.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gstatic.cn,🚀 节点选择
+ - DOMAIN-SUFFIX,gstatic.com,🚀 节点选择
+ - DOMAIN-SUFFIX,g.co,🚀 节点选择
+ - DOMAIN-SUFFIX,goo.gl,🚀 节点选择
+ - DOMAIN-SUFFIX,gvt0.com,🚀 节点选择
+ - DOMAIN-SUFFIX,gvt1.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xn--ngstr-lra8j.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youtu.be,🚀 节点选择
+ - DOMAIN-SUFFIX,youtube-nocookie.com,🚀 节点选择
+ - DOMAIN-SUFFIX,youtube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ytimg.com,🚀 节点选择
+ - IP-CIDR,74.125.0.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,173.194.0.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,120.232.181.162/32,🚀 节点选择,no-resolve
+ - IP-CIDR,120.241.147.226/32,🚀 节点选择,no-resolve
+ - IP-CIDR,120.253.253.226/32,🚀 节点选择,no-resolve
+ - IP-CIDR,120.253.255.162/32,🚀 节点选择,no-resolve
+ - IP-CIDR,120.253.255.34/32,🚀 节点选择,no-resolve
+ - IP-CIDR,120.253.255.98/32,🚀 节点选择,no-resolve
+ - IP-CIDR,180.163.150.162/32,🚀 节点选择,no-resolve
+ - IP-CIDR,180.163.150.34/32,🚀 节点选择,no-resolve
+ - IP-CIDR,180.163.151.162/32,🚀 节点选择,no-resolve
+ - IP-CIDR,180.163.151.34/32,🚀 节点选择,no-resolve
+ - IP-CIDR,203.208.39.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,203.208.40.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,203.208.41.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,203.208.43.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,203.208.50.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,220.181.174.162/32,🚀 节点选择,no-resolve
+ - IP-CIDR,220.181.174.226/32,🚀 节点选择,no-resolve
+ - IP-CIDR,220.181.174.34/32,🚀 节点选择,no-resolve
+ - DOMAIN-SUFFIX,cdninstagram.com,🚀 节点选择
+ - DOMAIN-SUFFIX,instagram.com,🚀 节点选择
+ - DOMAIN-SUFFIX,instagr.am,🚀 节点选择
+ - DOMAIN-SUFFIX,akamaihd.net,🚀 节点选择
+ - DOMAIN-SUFFIX,kakao.com,🚀 节点选择
+ - DOMAIN-SUFFIX,kakao.co.kr,🚀 节点选择
+ - DOMAIN-SUFFIX,kakaocdn.net,🚀 节点选择
+ - IP-CIDR,1.201.0.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,27.0.236.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,103.27.148.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,103.246.56.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,110.76.140.0/22,🚀 节点选择,no-resolve
+ - IP-CIDR,113.61.104.0/22,🚀 节点选择,no-resolve
+ - DOMAIN-SUFFIX,lin.ee,🚀 节点选择
+ - DOMAIN-SUFFIX,line-apps.com,🚀 节点选择
+ - DOMAIN-SUFFIX,line-cdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,line-scdn.net,🚀 节点选择
+ - DOMAIN-SUFFIX,line.me,🚀 节点选择
+ - DOMAIN-SUFFIX,line.naver.jp,🚀 节点选择
+ - DOMAIN-SUFFIX,nhncorp.jp,🚀 节点选择
+ - IP-CIDR,103.2.28.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,103.2.30.0/23,🚀 节点选择,no-resolve
+ - IP-CIDR,119.235.224.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,119.235.232.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,119.235.235.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,119.235.236.0/23,🚀 节点选择,no-resolve
+ - IP-CIDR,147.92.128.0/17,🚀 节点选择,no-resolve
+ - IP-CIDR,203.104.128.0/19,🚀 节点选择,no-resolve
+ - DOMAIN-KEYWORD,1drv,🚀 节点选择
+ - DOMAIN-KEYWORD,onedrive,🚀 节点选择
+ - DOMAIN-KEYWORD,skydrive,🚀 节点选择
+ - DOMAIN-SUFFIX,livefilestore.com,🚀 节点选择
+ - DOMAIN-SUFFIX,oneclient.sfx.ms,🚀 节点选择
+ - DOMAIN-SUFFIX,onedrive.com,🚀 节点选择
+ - DOMAIN-SUFFIX,onedrive.live.com,🚀 节点选择
+ - DOMAIN-SUFFIX,photos.live.com,🚀 节点选择
+ - DOMAIN-SUFFIX,skydrive.wns.windows.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spoprod-a.akamaihd.net,🚀 节点选择
+ - DOMAIN-SUFFIX,storage.live.com,🚀 节点选择
+ - DOMAIN-SUFFIX,mypikpak.com,🚀 节点选择
+ - DOMAIN-KEYWORD,porn,🚀 节点选择
+ - DOMAIN-SUFFIX,8teenxxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ahcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bcvcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,bongacams.com,🚀 节点选择
+ - DOMAIN-SUFFIX,chaturbate.com,🚀 节点选择
+ - DOMAIN-SUFFIX,dditscdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,livejasmin.com,🚀 节点选择
+ - DOMAIN-SUFFIX,phncdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,phprcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornhub.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pornhubpremium.com,🚀 节点选择
+ - DOMAIN-SUFFIX,rdtcdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,redtube.com,🚀 节点选择
+ - DOMAIN-SUFFIX,sb-cd.com,🚀 节点选择
+ - DOMAIN-SUFFIX,spankbang.com,🚀 节点选择
+ - DOMAIN-SUFFIX,t66y.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xhamster.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xnxx-cdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xnxx.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xvideos-cdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,xvideos.com,🚀 节点选择
+ - DOMAIN-SUFFIX,ypncdn.com,🚀 节点选择
+ - DOMAIN-SUFFIX,pixiv.net,🚀 节点选择
+ - DOMAIN-SUFFIX,pximg.net,🚀 节点选择
+ - DOMAIN-SUFFIX,amplitude.com,🚀 节点选择
+ - DOMAIN-SUFFIX,firebaseio.com,🚀 节点选择
+ - DOMAIN-SUFFIX,hockeyapp.net,🚀 节点选择
+ - DOMAIN-SUFFIX,readdle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,smartmailcloud.com,🚀 节点选择
+ - DOMAIN-SUFFIX,fanatical.com,🚀 节点选择
+ - DOMAIN-SUFFIX,humblebundle.com,🚀 节点选择
+ - DOMAIN-SUFFIX,steamcommunity.com,🚀 节点选择
+ - DOMAIN-SUFFIX,tap.io,🚀 节点选择
+ - DOMAIN-SUFFIX,taptap.tw,🚀 节点选择
+ - DOMAIN-SUFFIX,twitch.tv,🚀 节点选择
+ - DOMAIN-SUFFIX,ttvnw.net,🚀 节点选择
+ - DOMAIN-SUFFIX,jtvnw.net,🚀 节点选择
+ - DOMAIN-KEYWORD,ttvnw,🚀 节点选择
+ - DOMAIN-SUFFIX,t.co,🚀 节点选择
+ - DOMAIN-SUFFIX,twimg.co,🚀 节点选择
+ - DOMAIN-SUFFIX,twimg.com,🚀 节点选择
+ - DOMAIN-SUFFIX,twimg.org,🚀 节点选择
+ - DOMAIN-SUFFIX,t.me,🚀 节点选择
+ - DOMAIN-SUFFIX,tdesktop.com,🚀 节点选择
+ - DOMAIN-SUFFIX,telegra.ph,🚀 节点选择
+ - DOMAIN-SUFFIX,telegram.me,🚀 节点选择
+ - DOMAIN-SUFFIX,telegram.org,🚀 节点选择
+ - DOMAIN-SUFFIX,telesco.pe,🚀 节点选择
+ - IP-CIDR,91.108.0.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,109.239.140.0/24,🚀 节点选择,no-resolve
+ - IP-CIDR,149.154.160.0/20,🚀 节点选择,no-resolve
+ - IP-CIDR6,2001:67c:4e8::/48,🚀 节点选择,no-resolve
+ - IP-CIDR6,2001:b28:f23d::/48,🚀 节点选择,no-resolve
+ - IP-CIDR6,2001:b28:f23f::/48,🚀 节点选择,no-resolve
+ - DOMAIN-SUFFIX,terabox.com,🚀 节点选择
+ - DOMAIN-SUFFIX,teraboxcdn.com,🚀 节点选择
+ - IP-CIDR,18.194.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,34.224.0.0/12,🚀 节点选择,no-resolve
+ - IP-CIDR,54.242.0.0/15,🚀 节点选择,no-resolve
+ - IP-CIDR,50.22.198.204/30,🚀 节点选择,no-resolve
+ - IP-CIDR,208.43.122.128/27,🚀 节点选择,no-resolve
+ - IP-CIDR,108.168.174.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,173.192.231.32/27,🚀 节点选择,no-resolve
+ - IP-CIDR,158.85.5.192/27,🚀 节点选择,no-resolve
+ - IP-CIDR,174.37.243.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,158.85.46.128/27,🚀 节点选择,no-resolve
+ - IP-CIDR,173.192.222.160/27,🚀 节点选择,no-resolve
+ - IP-CIDR,184.173.128.0/17,🚀 节点选择,no-resolve
+ - IP-CIDR,158.85.224.160/27,🚀 节点选择,no-resolve
+ - IP-CIDR,75.126.150.0/16,🚀 节点选择,no-resolve
+ - IP-CIDR,69.171.235.0/16,🚀 节点选择,no-resolve
+ - DOMAIN-SUFFIX,mediawiki.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikibooks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikidata.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikileaks.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikimedia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikinews.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikipedia.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikiquote.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikisource.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikiversity.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wikivoyage.org,🚀 节点选择
+ - DOMAIN-SUFFIX,wiktionary.org,🚀 节点选择
+ - DOMAIN-SUFFIX,neulion.com,🚀 节点选择
+ - DOMAIN-SUFFIX,icntv.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,flzbcdn.xyz,🚀 节点选择
+ - DOMAIN-SUFFIX,ocnttv.com,🚀 节点选择
+ - DOMAIN-SUFFIX,13th.tech,🎯 全球直连
+ - DOMAIN-SUFFIX,423down.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bokecc.com,🎯 全球直连
+ - DOMAIN-SUFFIX,chaipip.com,🎯 全球直连
+ - DOMAIN-SUFFIX,chinaplay.store,🎯 全球直连
+ - DOMAIN-SUFFIX,hrtsea.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kaikeba.com,🎯 全球直连
+ - DOMAIN-SUFFIX,laomo.me,🎯 全球直连
+ - DOMAIN-SUFFIX,mpyit.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qupu123.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cn,🎯 全球直连
+ - DOMAIN-SUFFIX,中国,🎯 全球直连
+ - DOMAIN-SUFFIX,公司,🎯 全球直连
+ - DOMAIN-SUFFIX,网络,🎯 全球直连
+ - DOMAIN-KEYWORD,-cn,🎯 全球直连
+ - DOMAIN-KEYWORD,360buy,🎯 全球直连
+ - DOMAIN-KEYWORD,alicdn,🎯 全球直连
+ - DOMAIN-KEYWORD,alimama,🎯 全球直连
+ - DOMAIN-KEYWORD,alipay,🎯 全球直连
+ - DOMAIN-KEYWORD,appzapp,🎯 全球直连
+ - DOMAIN-KEYWORD,baidupcs,🎯 全球直连
+ - DOMAIN-KEYWORD,bilibili,🎯 全球直连
+ - DOMAIN-KEYWORD,ccgslb,🎯 全球直连
+ - DOMAIN-KEYWORD,chinacache,🎯 全球直连
+ - DOMAIN-KEYWORD,duobao,🎯 全球直连
+ - DOMAIN-KEYWORD,jdpay,🎯 全球直连
+ - DOMAIN-KEYWORD,moke,🎯 全球直连
+ - DOMAIN-KEYWORD,qhimg,🎯 全球直连
+ - DOMAIN-KEYWORD,vpimg,🎯 全球直连
+ - DOMAIN-KEYWORD,xiami,🎯 全球直连
+ - DOMAIN-KEYWORD,xiaomi,🎯 全球直连
+ - DOMAIN-SUFFIX,360.com,🎯 全球直连
+ - DOMAIN-SUFFIX,360kuai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,360safe.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dhrest.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qhres.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qhstatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qhupdate.com,🎯 全球直连
+ - DOMAIN-SUFFIX,so.com,🎯 全球直连
+ - DOMAIN-SUFFIX,4399.com,🎯 全球直连
+ - DOMAIN-SUFFIX,4399pk.com,🎯 全球直连
+ - DOMAIN-SUFFIX,5054399.com,🎯 全球直连
+ - DOMAIN-SUFFIX,img4399.com,🎯 全球直连
+ - DOMAIN-SUFFIX,58.com,🎯 全球直连
+ - DOMAIN-SUFFIX,1688.com,🎯 全球直连
+ - DOMAIN-SUFFIX,aliapp.org,🎯 全球直连
+ - DOMAIN-SUFFIX,alibaba.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alibabacloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alibabausercontent.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alicdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alicloudccp.com,🎯 全球直连
+ - DOMAIN-SUFFIX,aliexpress.com,🎯 全球直连
+ - DOMAIN-SUFFIX,aliimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alikunlun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alipay.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alipayobjects.com,🎯 全球直连
+ - DOMAIN-SUFFIX,alisoft.com,🎯 全球直连
+ - DOMAIN-SUFFIX,aliyun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,aliyuncdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,aliyuncs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,aliyundrive.com,🎯 全球直连
+ - DOMAIN-SUFFIX,amap.com,🎯 全球直连
+ - DOMAIN-SUFFIX,autonavi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dingtalk.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ele.me,🎯 全球直连
+ - DOMAIN-SUFFIX,hichina.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mmstat.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mxhichina.com,🎯 全球直连
+ - DOMAIN-SUFFIX,soku.com,🎯 全球直连
+ - DOMAIN-SUFFIX,taobao.com,🎯 全球直连
+ - DOMAIN-SUFFIX,taobaocdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tbcache.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tbcdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tmall.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tmall.hk,🎯 全球直连
+ - DOMAIN-SUFFIX,ucweb.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiami.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiami.net,🎯 全球直连
+ - DOMAIN-SUFFIX,ykimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,youku.com,🎯 全球直连
+ - DOMAIN-SUFFIX,baidu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,baidubcr.com,🎯 全球直连
+ - DOMAIN-SUFFIX,baidupcs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,baidustatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bcebos.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bdimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bdstatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bdurl.net,🎯 全球直连
+ - DOMAIN-SUFFIX,hao123.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hao123img.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jomodns.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yunjiasu-cdn.net,🎯 全球直连
+ - DOMAIN-SUFFIX,acg.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,acgvideo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,b23.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,bigfun.cn,🎯 全球直连
+ - DOMAIN-SUFFIX,bigfunapp.cn,🎯 全球直连
+ - DOMAIN-SUFFIX,biliapi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,biliapi.net,🎯 全球直连
+ - DOMAIN-SUFFIX,bilibili.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bilibili.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,biligame.com,🎯 全球直连
+ - DOMAIN-SUFFIX,biligame.net,🎯 全球直连
+ - DOMAIN-SUFFIX,bilivideo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bilivideo.cn,🎯 全球直连
+ - DOMAIN-SUFFIX,hdslb.com,🎯 全球直连
+ - DOMAIN-SUFFIX,im9.com,🎯 全球直连
+ - DOMAIN-SUFFIX,smtcdns.net,🎯 全球直连
+ - DOMAIN-SUFFIX,battle.net,🎯 全球直连
+ - DOMAIN-SUFFIX,battlenet.com,🎯 全球直连
+ - DOMAIN-SUFFIX,blizzard.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bytedance.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bytedance.net,🎯 全球直连
+ - DOMAIN-SUFFIX,bytedns.net,🎯 全球直连
+ - DOMAIN-SUFFIX,byteimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,feiliao.com,🎯 全球直连
+ - DOMAIN-SUFFIX,gifshow.com,🎯 全球直连
+ - DOMAIN-SUFFIX,huoshan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,iesdouyin.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ixigua.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kspkg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,pstatp.com,🎯 全球直连
+ - DOMAIN-SUFFIX,snssdk.com,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiao.com,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiao13.com,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiaocdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiaocdn.net,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiaocloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiaohao.com,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiaohao.net,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiaoimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,toutiaopage.com,🎯 全球直连
+ - DOMAIN-SUFFIX,wukong.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zijieimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zjbyte.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zjcdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cctv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cctvpic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,livechina.com,🎯 全球直连
+ - DOMAIN-SUFFIX,21cn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,didialift.com,🎯 全球直连
+ - DOMAIN-SUFFIX,didiglobal.com,🎯 全球直连
+ - DOMAIN-SUFFIX,udache.com,🎯 全球直连
+ - DOMAIN-SUFFIX,douyu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,douyu.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,douyuscdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,douyutv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,epicgames.com,🎯 全球直连
+ - DOMAIN-SUFFIX,helpshift.com,🎯 全球直连
+ - DOMAIN-SUFFIX,paragon.com,🎯 全球直连
+ - DOMAIN-SUFFIX,unrealengine.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dbankcdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hc-cdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hicloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,huawei.com,🎯 全球直连
+ - DOMAIN-SUFFIX,huaweicloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,huaweishop.net,🎯 全球直连
+ - DOMAIN-SUFFIX,hwccpc.com,🎯 全球直连
+ - DOMAIN-SUFFIX,vmall.com,🎯 全球直连
+ - DOMAIN-SUFFIX,vmallres.com,🎯 全球直连
+ - DOMAIN-SUFFIX,iflyink.com,🎯 全球直连
+ - DOMAIN-SUFFIX,iflyrec.com,🎯 全球直连
+ - DOMAIN-SUFFIX,iflytek.com,🎯 全球直连
+ - DOMAIN-SUFFIX,71.am,🎯 全球直连
+ - DOMAIN-SUFFIX,71edge.com,🎯 全球直连
+ - DOMAIN-SUFFIX,iqiyi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,iqiyipic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ppsimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qiyi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qiyipic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qy.net,🎯 全球直连
+ - DOMAIN-SUFFIX,360buy.com,🎯 全球直连
+ - DOMAIN-SUFFIX,360buyimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jcloudcs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jd.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jd.hk,🎯 全球直连
+ - DOMAIN-SUFFIX,jdcloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jdpay.com,🎯 全球直连
+ - DOMAIN-SUFFIX,paipai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,iciba.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ksosoft.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ksyun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kuaishou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yximgs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,meitu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,meitudata.com,🎯 全球直连
+ - DOMAIN-SUFFIX,meitustat.com,🎯 全球直连
+ - DOMAIN-SUFFIX,meipai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,le.com,🎯 全球直连
+ - DOMAIN-SUFFIX,lecloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,letv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,letvcloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,letvimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,letvlive.com,🎯 全球直连
+ - DOMAIN-SUFFIX,letvstore.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hitv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hunantv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mgtv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,duokan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mi-img.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,miui.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiaomi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiaomi.net,🎯 全球直连
+ - DOMAIN-SUFFIX,xiaomicp.com,🎯 全球直连
+ - DOMAIN-SUFFIX,126.com,🎯 全球直连
+ - DOMAIN-SUFFIX,126.net,🎯 全球直连
+ - DOMAIN-SUFFIX,127.net,🎯 全球直连
+ - DOMAIN-SUFFIX,163.com,🎯 全球直连
+ - DOMAIN-SUFFIX,163yun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,lofter.com,🎯 全球直连
+ - DOMAIN-SUFFIX,netease.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ydstatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,youdao.com,🎯 全球直连
+ - DOMAIN-SUFFIX,pplive.com,🎯 全球直连
+ - DOMAIN-SUFFIX,pptv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,pinduoduo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yangkeduo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,leju.com,🎯 全球直连
+ - DOMAIN-SUFFIX,miaopai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sina.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sinaapp.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sinaimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weibo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weibocdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiaoka.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,go2map.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sogo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sogou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sogoucdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sohu-inc.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sohu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sohucs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sohuno.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sohurdc.com,🎯 全球直连
+ - DOMAIN-SUFFIX,v-56.com,🎯 全球直连
+ - DOMAIN-SUFFIX,playstation.com,🎯 全球直连
+ - DOMAIN-SUFFIX,playstation.net,🎯 全球直连
+ - DOMAIN-SUFFIX,playstationnetwork.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sony.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sonyentertainmentnetwork.com,🎯 全球直连
+ - DOMAIN-SUFFIX,csgo.wmsj.cn,🎯 全球直连
+ - DOMAIN-SUFFIX,dl.steam.ksyna.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dota2.wmsj.cn,🎯 全球直连
+ - DOMAIN-SUFFIX,st.dl.bscstorage.net,🎯 全球直连
+ - DOMAIN-SUFFIX,st.dl.eccdnx.com,🎯 全球直连
+ - DOMAIN-SUFFIX,st.dl.pinyuncloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,steamcommunity-a.akamaihd.net,🎯 全球直连
+ - DOMAIN-SUFFIX,steamcontent.com,🎯 全球直连
+ - DOMAIN-SUFFIX,steamgames.com,🎯 全球直连
+ - DOMAIN-SUFFIX,steampowered.com.8686c.com,🎯 全球直连
+ - DOMAIN-SUFFIX,steamstat.us,🎯 全球直连
+ - DOMAIN-SUFFIX,steamstatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,steamusercontent.com,🎯 全球直连
+ - DOMAIN-SUFFIX,steamuserimages-a.akamaihd.net,🎯 全球直连
+ - DOMAIN-SUFFIX,foxmail.com,🎯 全球直连
+ - DOMAIN-SUFFIX,gtimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,idqqimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,igamecj.com,🎯 全球直连
+ - DOMAIN-SUFFIX,myapp.com,🎯 全球直连
+ - DOMAIN-SUFFIX,myqcloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qq.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qqmail.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qqurl.com,🎯 全球直连
+ - DOMAIN-SUFFIX,smtcdns.com,🎯 全球直连
+ - DOMAIN-SUFFIX,smtcdns.net,🎯 全球直连
+ - DOMAIN-SUFFIX,soso.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tencent-cloud.net,🎯 全球直连
+ - DOMAIN-SUFFIX,tencent.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tencentmind.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tenpay.com,🎯 全球直连
+ - DOMAIN-SUFFIX,wechat.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weixin.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weiyun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,appsimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,appvipshop.com,🎯 全球直连
+ - DOMAIN-SUFFIX,vip.com,🎯 全球直连
+ - DOMAIN-SUFFIX,vipstatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ximalaya.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xmcdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,00cdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,88cdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kanimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kankan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,p2cdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sandai.net,🎯 全球直连
+ - DOMAIN-SUFFIX,thundercdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xunlei.com,🎯 全球直连
+ - DOMAIN-SUFFIX,got001.com,🎯 全球直连
+ - DOMAIN-SUFFIX,p4pfile.com,🎯 全球直连
+ - DOMAIN-SUFFIX,rrys.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,rrys2020.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yyets.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zimuzu.io,🎯 全球直连
+ - DOMAIN-SUFFIX,zimuzu.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,zmz001.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zmz002.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zmz003.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zmz004.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zmz2019.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zmzapi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zmzapi.net,🎯 全球直连
+ - DOMAIN-SUFFIX,zmzfile.com,🎯 全球直连
+ - DOMAIN-KEYWORD,announce,🎯 全球直连
+ - DOMAIN-KEYWORD,torrent,🎯 全球直连
+ - DOMAIN-KEYWORD,tracker,🎯 全球直连
+ - DOMAIN-SUFFIX,animebytes.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,animetorrents.me,🎯 全球直连
+ - DOMAIN-SUFFIX,awesome-hd.me,🎯 全球直连
+ - DOMAIN-SUFFIX,beitai.pt,🎯 全球直连
+ - DOMAIN-SUFFIX,bittorrent.com,🎯 全球直连
+ - DOMAIN-SUFFIX,broadcasthe.net,🎯 全球直连
+ - DOMAIN-SUFFIX,chdbits.co,🎯 全球直连
+ - DOMAIN-SUFFIX,classix-unlimited.co.uk,🎯 全球直连
+ - DOMAIN-SUFFIX,empornium.me,🎯 全球直连
+ - DOMAIN-SUFFIX,gazellegames.net,🎯 全球直连
+ - DOMAIN-SUFFIX,hd4fans.org,🎯 全球直连
+ - DOMAIN-SUFFIX,hdchina.org,🎯 全球直连
+ - DOMAIN-SUFFIX,hdhome.org,🎯 全球直连
+ - DOMAIN-SUFFIX,hdsky.me,🎯 全球直连
+ - DOMAIN-SUFFIX,hdtime.org,🎯 全球直连
+ - DOMAIN-SUFFIX,hdzone.me,🎯 全球直连
+ - DOMAIN-SUFFIX,icetorrent.org,🎯 全球直连
+ - DOMAIN-SUFFIX,jpopsuki.eu,🎯 全球直连
+ - DOMAIN-SUFFIX,keepfrds.com,🎯 全球直连
+ - DOMAIN-SUFFIX,leaguehd.com,🎯 全球直连
+ - DOMAIN-SUFFIX,m-team.cc,🎯 全球直连
+ - DOMAIN-SUFFIX,madsrevolution.net,🎯 全球直连
+ - DOMAIN-SUFFIX,msg.vg,🎯 全球直连
+ - DOMAIN-SUFFIX,nanyangpt.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ncore.cc,🎯 全球直连
+ - DOMAIN-SUFFIX,open.cd,🎯 全球直连
+ - DOMAIN-SUFFIX,ourbits.club,🎯 全球直连
+ - DOMAIN-SUFFIX,passthepopcorn.me,🎯 全球直连
+ - DOMAIN-SUFFIX,privatehd.to,🎯 全球直连
+ - DOMAIN-SUFFIX,pthome.net,🎯 全球直连
+ - DOMAIN-SUFFIX,redacted.ch,🎯 全球直连
+ - DOMAIN-SUFFIX,springsunday.net,🎯 全球直连
+ - DOMAIN-SUFFIX,tjupt.org,🎯 全球直连
+ - DOMAIN-SUFFIX,totheglory.im,🎯 全球直连
+ - DOMAIN-SUFFIX,trontv.com,🎯 全球直连
+ - DOMAIN-SUFFIX,teamviewer.com,🎯 全球直连
+ - IP-CIDR,109.239.140.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,139.220.243.27/32,🎯 全球直连,no-resolve
+ - IP-CIDR,172.16.102.56/32,🎯 全球直连,no-resolve
+ - IP-CIDR,185.188.32.1/28,🎯 全球直连,no-resolve
+ - IP-CIDR,221.226.128.146/32,🎯 全球直连,no-resolve
+ - IP-CIDR6,2a0b:b580::/48,🎯 全球直连,no-resolve
+ - IP-CIDR6,2a0b:b581::/48,🎯 全球直连,no-resolve
+ - IP-CIDR6,2a0b:b582::/48,🎯 全球直连,no-resolve
+ - IP-CIDR6,2a0b:b583::/48,🎯 全球直连,no-resolve
+ - DOMAIN-SUFFIX,baomitu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bootcss.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jiasule.com,🎯 全球直连
+ - DOMAIN-SUFFIX,staticfile.org,🎯 全球直连
+ - DOMAIN-SUFFIX,upaiyun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,10010.com,🎯 全球直连
+ - DOMAIN-SUFFIX,115.com,🎯 全球直连
+ - DOMAIN-SUFFIX,12306.com,🎯 全球直连
+ - DOMAIN-SUFFIX,17173.com,🎯 全球直连
+ - DOMAIN-SUFFIX,178.com,🎯 全球直连
+ - DOMAIN-SUFFIX,17k.com,🎯 全球直连
+ - DOMAIN-SUFFIX,360doc.com,🎯 全球直连
+ - DOMAIN-SUFFIX,36kr.com,🎯 全球直连
+ - DOMAIN-SUFFIX,3dmgame.com,🎯 全球直连
+ - DOMAIN-SUFFIX,51cto.com,🎯 全球直连
+ - DOMAIN-SUFFIX,51job.com,🎯 全球直连
+ - DOMAIN-SUFFIX,51jobcdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,56.com,🎯 全球直连
+ - DOMAIN-SUFFIX,8686c.com,🎯 全球直连
+ - DOMAIN-SUFFIX,abchina.com,🎯 全球直连
+ - DOMAIN-SUFFIX,abercrombie.com,🎯 全球直连
+ - DOMAIN-SUFFIX,acfun.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,air-matters.com,🎯 全球直连
+ - DOMAIN-SUFFIX,air-matters.io,🎯 全球直连
+ - DOMAIN-SUFFIX,aixifan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,algocasts.io,🎯 全球直连
+ - DOMAIN-SUFFIX,babytree.com,🎯 全球直连
+ - DOMAIN-SUFFIX,babytreeimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,baicizhan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,baidupan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,baike.com,🎯 全球直连
+ - DOMAIN-SUFFIX,biqudu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,biquge.com,🎯 全球直连
+ - DOMAIN-SUFFIX,bitauto.com,🎯 全球直连
+ - DOMAIN-SUFFIX,c-ctrip.com,🎯 全球直连
+ - DOMAIN-SUFFIX,camera360.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cdnmama.com,🎯 全球直连
+ - DOMAIN-SUFFIX,chaoxing.com,🎯 全球直连
+ - DOMAIN-SUFFIX,che168.com,🎯 全球直连
+ - DOMAIN-SUFFIX,chinacache.net,🎯 全球直连
+ - DOMAIN-SUFFIX,chinaso.com,🎯 全球直连
+ - DOMAIN-SUFFIX,chinaz.com,🎯 全球直连
+ - DOMAIN-SUFFIX,chinaz.net,🎯 全球直连
+ - DOMAIN-SUFFIX,chuimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cibntv.net,🎯 全球直连
+ - DOMAIN-SUFFIX,clouddn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cloudxns.net,🎯 全球直连
+ - DOMAIN-SUFFIX,cn163.net,🎯 全球直连
+ - DOMAIN-SUFFIX,cnbeta.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cnbetacdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cnblogs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,cnki.net,🎯 全球直连
+ - DOMAIN-SUFFIX,cnmstl.net,🎯 全球直连
+ - DOMAIN-SUFFIX,coolapk.com,🎯 全球直连
+ - DOMAIN-SUFFIX,coolapkmarket.com,🎯 全球直连
+ - DOMAIN-SUFFIX,csdn.net,🎯 全球直连
+ - DOMAIN-SUFFIX,ctrip.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dangdang.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dfcfw.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dianping.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dilidili.wang,🎯 全球直连
+ - DOMAIN-SUFFIX,douban.com,🎯 全球直连
+ - DOMAIN-SUFFIX,doubanio.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dpfile.com,🎯 全球直连
+ - DOMAIN-SUFFIX,duowan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dxycdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,dytt8.net,🎯 全球直连
+ - DOMAIN-SUFFIX,easou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,eastday.com,🎯 全球直连
+ - DOMAIN-SUFFIX,eastmoney.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ecitic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ewqcxz.com,🎯 全球直连
+ - DOMAIN-SUFFIX,fang.com,🎯 全球直连
+ - DOMAIN-SUFFIX,fantasy.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,feng.com,🎯 全球直连
+ - DOMAIN-SUFFIX,fengkongcloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,fir.im,🎯 全球直连
+ - DOMAIN-SUFFIX,frdic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,fresh-ideas.cc,🎯 全球直连
+ - DOMAIN-SUFFIX,ganji.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ganjistatic1.com,🎯 全球直连
+ - DOMAIN-SUFFIX,geetest.com,🎯 全球直连
+ - DOMAIN-SUFFIX,geilicdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ghpym.com,🎯 全球直连
+ - DOMAIN-SUFFIX,godic.net,🎯 全球直连
+ - DOMAIN-SUFFIX,guazi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,gwdang.com,🎯 全球直连
+ - DOMAIN-SUFFIX,gzlzfm.com,🎯 全球直连
+ - DOMAIN-SUFFIX,haibian.com,🎯 全球直连
+ - DOMAIN-SUFFIX,haosou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hollisterco.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hongxiu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,huajiao.com,🎯 全球直连
+ - DOMAIN-SUFFIX,hupu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,huxiucdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,huya.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ifeng.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ifengimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,images-amazon.com,🎯 全球直连
+ - DOMAIN-SUFFIX,infzm.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ipip.net,🎯 全球直连
+ - DOMAIN-SUFFIX,it168.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ithome.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ixdzs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jianguoyun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jianshu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jianshu.io,🎯 全球直连
+ - DOMAIN-SUFFIX,jianshuapi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jiathis.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jmstatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,jumei.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kaola.com,🎯 全球直连
+ - DOMAIN-SUFFIX,knewone.com,🎯 全球直连
+ - DOMAIN-SUFFIX,koowo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ksyungslb.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kuaidi100.com,🎯 全球直连
+ - DOMAIN-SUFFIX,kugou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,lancdns.com,🎯 全球直连
+ - DOMAIN-SUFFIX,landiannews.com,🎯 全球直连
+ - DOMAIN-SUFFIX,lanzou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,lemicp.com,🎯 全球直连
+ - DOMAIN-SUFFIX,letitfly.me,🎯 全球直连
+ - DOMAIN-SUFFIX,lizhi.fm,🎯 全球直连
+ - DOMAIN-SUFFIX,lizhi.io,🎯 全球直连
+ - DOMAIN-SUFFIX,lizhifm.com,🎯 全球直连
+ - DOMAIN-SUFFIX,loli.net,🎯 全球直连
+ - DOMAIN-SUFFIX,luoo.net,🎯 全球直连
+ - DOMAIN-SUFFIX,lvmama.com,🎯 全球直连
+ - DOMAIN-SUFFIX,lxdns.com,🎯 全球直连
+ - DOMAIN-SUFFIX,maoyan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,meilishuo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,meituan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,meituan.net,🎯 全球直连
+ - DOMAIN-SUFFIX,meizu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,migucloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,miguvideo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mobike.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mogu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mogucdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mogujie.com,🎯 全球直连
+ - DOMAIN-SUFFIX,moji.com,🎯 全球直连
+ - DOMAIN-SUFFIX,moke.com,🎯 全球直连
+ - DOMAIN-SUFFIX,msstatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,mubu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,myunlu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,nruan.com,🎯 全球直连
+ - DOMAIN-SUFFIX,nuomi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,onedns.net,🎯 全球直连
+ - DOMAIN-SUFFIX,onlinedown.net,🎯 全球直连
+ - DOMAIN-SUFFIX,oracle.com,🎯 全球直连
+ - DOMAIN-SUFFIX,oschina.net,🎯 全球直连
+ - DOMAIN-SUFFIX,ourdvs.com,🎯 全球直连
+ - DOMAIN-SUFFIX,paypal.com,🎯 全球直连
+ - DOMAIN-SUFFIX,polyv.net,🎯 全球直连
+ - DOMAIN-SUFFIX,qbox.me,🎯 全球直连
+ - DOMAIN-SUFFIX,qcloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qcloudcdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qdaily.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qdmm.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qhimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qianqian.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qidian.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qihucdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qin.io,🎯 全球直连
+ - DOMAIN-SUFFIX,qiniu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qiniucdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qiniudn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qiushibaike.com,🎯 全球直连
+ - DOMAIN-SUFFIX,quanmin.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,qunar.com,🎯 全球直连
+ - DOMAIN-SUFFIX,qunarzz.com,🎯 全球直连
+ - DOMAIN-SUFFIX,rarbg.to,🎯 全球直连
+ - DOMAIN-SUFFIX,repaik.com,🎯 全球直连
+ - DOMAIN-SUFFIX,rrmj.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,ruguoapp.com,🎯 全球直连
+ - DOMAIN-SUFFIX,runoob.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sankuai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,segmentfault.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sf-express.com,🎯 全球直连
+ - DOMAIN-SUFFIX,shumilou.net,🎯 全球直连
+ - DOMAIN-SUFFIX,simplecd.me,🎯 全球直连
+ - DOMAIN-SUFFIX,sm.ms,🎯 全球直连
+ - DOMAIN-SUFFIX,smzdm.com,🎯 全球直连
+ - DOMAIN-SUFFIX,snwx.com,🎯 全球直连
+ - DOMAIN-SUFFIX,soufunimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,sspai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,startssl.com,🎯 全球直连
+ - DOMAIN-SUFFIX,suning.com,🎯 全球直连
+ - DOMAIN-SUFFIX,taihe.com,🎯 全球直连
+ - DOMAIN-SUFFIX,th-sjy.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tianqi.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tianqistatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tianyancha.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tianyaui.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tietuku.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tiexue.net,🎯 全球直连
+ - DOMAIN-SUFFIX,tmiaoo.com,🎯 全球直连
+ - DOMAIN-SUFFIX,trip.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ttmeiju.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tudou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tuniu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,tuniucdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,umengcloud.com,🎯 全球直连
+ - DOMAIN-SUFFIX,upyun.com,🎯 全球直连
+ - DOMAIN-SUFFIX,uxengine.net,🎯 全球直连
+ - DOMAIN-SUFFIX,videocc.net,🎯 全球直连
+ - DOMAIN-SUFFIX,wandoujia.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weather.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weico.cc,🎯 全球直连
+ - DOMAIN-SUFFIX,weidian.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weiphone.com,🎯 全球直连
+ - DOMAIN-SUFFIX,weiphone.net,🎯 全球直连
+ - DOMAIN-SUFFIX,womai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,wscdns.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xdrig.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xhscdn.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiachufang.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiaohongshu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiaojukeji.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xinhuanet.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xip.io,🎯 全球直连
+ - DOMAIN-SUFFIX,xitek.com,🎯 全球直连
+ - DOMAIN-SUFFIX,xiumi.us,🎯 全球直连
+ - DOMAIN-SUFFIX,xslb.net,🎯 全球直连
+ - DOMAIN-SUFFIX,xueqiu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yach.me,🎯 全球直连
+ - DOMAIN-SUFFIX,yeepay.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yhd.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yihaodianimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yinxiang.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yinyuetai.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yixia.com,🎯 全球直连
+ - DOMAIN-SUFFIX,ys168.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yuewen.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yy.com,🎯 全球直连
+ - DOMAIN-SUFFIX,yystatic.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zealer.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zhangzishi.cc,🎯 全球直连
+ - DOMAIN-SUFFIX,zhanqi.tv,🎯 全球直连
+ - DOMAIN-SUFFIX,zhaopin.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zhihu.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zhimg.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zhongsou.com,🎯 全球直连
+ - DOMAIN-SUFFIX,zhuihd.com,🎯 全球直连
+ - IP-CIDR,8.128.0.0/10,🎯 全球直连,no-resolve
+ - IP-CIDR,8.208.0.0/12,🎯 全球直连,no-resolve
+ - IP-CIDR,14.1.112.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,41.222.240.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,41.223.119.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,43.242.168.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,45.112.212.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,47.52.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,47.56.0.0/15,🎯 全球直连,no-resolve
+ - IP-CIDR,47.74.0.0/15,🎯 全球直连,no-resolve
+ - IP-CIDR,47.76.0.0/14,🎯 全球直连,no-resolve
+ - IP-CIDR,47.80.0.0/12,🎯 全球直连,no-resolve
+ - IP-CIDR,47.235.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,47.236.0.0/14,🎯 全球直连,no-resolve
+ - IP-CIDR,47.240.0.0/14,🎯 全球直连,no-resolve
+ - IP-CIDR,47.244.0.0/15,🎯 全球直连,no-resolve
+ - IP-CIDR,47.246.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,47.250.0.0/15,🎯 全球直连,no-resolve
+ - IP-CIDR,47.252.0.0/15,🎯 全球直连,no-resolve
+ - IP-CIDR,47.254.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,59.82.0.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,59.82.240.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,59.82.248.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,72.254.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,103.38.56.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.52.76.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.206.40.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,110.76.21.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,110.76.23.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,112.125.0.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,116.251.64.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,119.38.208.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,119.38.224.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,119.42.224.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,139.95.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,140.205.1.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,140.205.122.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,147.139.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,149.129.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,155.102.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,161.117.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,163.181.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,170.33.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,198.11.128.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,205.204.96.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,19.28.0.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,45.40.192.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,49.51.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,62.234.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,94.191.0.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,103.7.28.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.116.50.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,103.231.60.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,109.244.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,111.30.128.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,111.30.136.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,111.30.139.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,111.30.140.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,115.159.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,119.28.0.0/15,🎯 全球直连,no-resolve
+ - IP-CIDR,120.88.56.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,121.51.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,129.28.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,129.204.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,129.211.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,132.232.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,134.175.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,146.56.192.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,148.70.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,150.109.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,152.136.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,162.14.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,162.62.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,170.106.130.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,182.254.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,188.131.128.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,203.195.128.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,203.205.128.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,210.4.138.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,211.152.128.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,211.152.132.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,211.152.148.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,212.64.0.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,212.129.128.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,45.113.192.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,63.217.23.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,63.243.252.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,103.235.44.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,104.193.88.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,106.12.0.0/15,🎯 全球直连,no-resolve
+ - IP-CIDR,114.28.224.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,119.63.192.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,180.76.0.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,180.76.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,182.61.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,185.10.104.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,202.46.48.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,203.90.238.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,43.254.0.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,45.249.212.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,49.4.0.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,78.101.192.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,78.101.224.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,81.52.161.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,85.97.220.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.31.200.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.69.140.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,103.218.216.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,114.115.128.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,114.116.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,116.63.128.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,116.66.184.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.96.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.128.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.136.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.141.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.142.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.243.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.244.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,116.71.251.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,117.78.0.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,119.3.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,119.8.0.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,119.8.32.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,121.36.0.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,121.36.128.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,121.37.0.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,122.112.128.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.0.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.64.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.100.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.104.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.112.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.128.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.192.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.224.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.240.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,139.9.248.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,139.159.128.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,139.159.160.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,139.159.164.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,139.159.168.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,139.159.176.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,139.159.192.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.0.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.64.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.79.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.80.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.96.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.112.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.125.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.128.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.192.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.223.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,159.138.224.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,168.195.92.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,185.176.76.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,197.199.0.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,197.210.163.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,197.252.1.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,197.252.2.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,197.252.4.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,197.252.8.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,200.32.52.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,200.32.54.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,200.32.57.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.0.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.4.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.8.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.11.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.13.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.20.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.22.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.24.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.26.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.29.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.33.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.38.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.40.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.43.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.48.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,203.135.50.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,42.186.0.0/16,🎯 全球直连,no-resolve
+ - IP-CIDR,45.127.128.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,45.195.24.0/24,🎯 全球直连,no-resolve
+ - IP-CIDR,45.253.132.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,45.253.240.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,45.254.48.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,59.111.0.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,59.111.128.0/17,🎯 全球直连,no-resolve
+ - IP-CIDR,103.71.120.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,103.71.128.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.71.196.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.71.200.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.12.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.18.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.24.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.28.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.38.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.40.0/23,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.44.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.48.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,103.72.128.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,103.74.24.0/21,🎯 全球直连,no-resolve
+ - IP-CIDR,103.74.48.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.126.92.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.129.252.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.131.252.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.135.240.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,103.196.64.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,106.2.32.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,106.2.64.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,114.113.196.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,114.113.200.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,115.236.112.0/20,🎯 全球直连,no-resolve
+ - IP-CIDR,115.238.76.0/22,🎯 全球直连,no-resolve
+ - IP-CIDR,123.58.160.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,223.252.192.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,101.198.128.0/18,🎯 全球直连,no-resolve
+ - IP-CIDR,101.198.192.0/19,🎯 全球直连,no-resolve
+ - IP-CIDR,101.199.196.0/22,🎯 全球直连,no-resolve
+ - PROCESS-NAME,aria2c.exe,🎯 全球直连
+ - PROCESS-NAME,fdm.exe,🎯 全球直连
+ - PROCESS-NAME,Folx.exe,🎯 全球直连
+ - PROCESS-NAME,NetTransport.exe,🎯 全球直连
+ - PROCESS-NAME,Thunder.exe,🎯 全球直连
+ - PROCESS-NAME,Transmission.exe,🎯 全球直连
+ - PROCESS-NAME,uTorrent.exe,🎯 全球直连
+ - PROCESS-NAME,WebTorrent.exe,🎯 全球直连
+ - PROCESS-NAME,WebTorrent Helper.exe,🎯 全球直连
+ - DOMAIN-SUFFIX,smtp,🎯 全球直连
+ - DOMAIN-KEYWORD,aria2,🎯 全球直连
+ - PROCESS-NAME,DownloadService.exe,🎯 全球直连
+ - PROCESS-NAME,Weiyun.exe,🎯 全球直连
+ - PROCESS-NAME,baidunetdisk.exe,🎯 全球直连
+ - GEOIP,CN,🎯 全球直连
+ - MATCH,🐟 漏网之鱼
+"""
+# ========================================================
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ss2clash.py / ss2singbox.py / ss2surge.py (转换逻辑在 ss_clash.py / ss_singbox.py / ss_surge.py 中) 共用的工具。
+需要与这些脚本放在同一目录下。
+"""
+
+import sys
+import os
+import contextlib
+import collections
+import itertools
+import re
+import time
+from urllib.parse import urlparse, unquote
+
+# 并行解析时每块的字节数范围：太小的文件并行得不偿失，太大的块占用过多内存
+PARALLEL_MIN_CHUNK_SIZE = 1 << 20
+PARALLEL_MAX_CHUNK_SIZE = 64 << 20
+# mmap 读取时每次切分的字节数
+MMAP_BLOCK_SIZE = 1 << 20
+
+# 渲染模板片段时代替代理列表和组成员的占位名称
+PROXIES_SENTINEL = "__SS_PROXIES__"
+MEMBERS_SENTINEL = "__SS_MEMBERS__"
+# 增量状态文件格式版本，渲染逻辑变化时递增，使旧状态失效 (同时用于模板片段缓存)
+STATE_VERSION = 1
+# 模板解析结果和模板片段的磁盘缓存目录，可通过环境变量 SS2CLASH_CACHE_DIR 覆盖
+TEMPLATE_CACHE_DIR = os.environ.get("SS2CLASH_CACHE_DIR") or os.path.join(os.path.expanduser("~"), ".cache", "ss2clash")
+FRAGMENTS_CACHE_PREFIX = "fragments_"
+# 设为 python 时不使用 libyaml，强制 PyYAML 的纯 Python 实现 (用于对照或排查 libyaml 的问题)
+YAML_IMPLEMENTATION_ENV = "SS2CLASH_YAML"
+
+# 结构化的警告：reason 为下列原因之一，line_number 为输入中的行号，message 为不含行号前缀的说明文本
+ParseWarning = collections.namedtuple('ParseWarning', 'reason line_number message')
+WARN_BAD_SCHEME = 'bad_scheme'  # 不是 socks:// 或 socks5:// 链接
+WARN_MISSING_ADDRESS = 'missing_address'  # 缺少主机名或端口
+WARN_PARSE_ERROR = 'parse_error'  # 解析时抛出异常 (如端口超出范围)
+WARN_RENAME = 'rename'  # 节点名称重复，已自动重命名
+
+
+# 各原因在汇总中的说明
+WARNING_REASONS = {
+    WARN_BAD_SCHEME: "无效的协议",
+    WARN_MISSING_ADDRESS: "缺少主机名或端口",
+    WARN_PARSE_ERROR: "解析错误",
+    WARN_RENAME: "名称重复已重命名",
+}
+# 每种原因默认显示 (并在汇总中保留) 的警告条数
+WARNING_EXAMPLE_LIMIT = 20
+
+
+def print_warning(warning):
+    """以 "警告: 第 N 行: ..." 的格式把一条警告写到 sys.stderr。"""
+    print(f"警告: 第 {warning.line_number} 行: {warning.message}", file=sys.stderr)
+
+
+class WarningSummary:
+    """
+    按原因汇总的警告，可直接作为 parse_link_file 等函数的 warn 回调。
+    每种原因只有前 limit 条立即打印并保留为示例，之后的只计数，最后由 report() 打印各原因的总数；
+    输入中有数百万条无效链接时，内存占用和格式化输出的开销都不随警告数量增长。
+    as_dict() 返回可 JSON 序列化的汇总，供脚本读取。
+    """
+
+    def __init__(self, limit=WARNING_EXAMPLE_LIMIT, echo=True):
+        self.limit = max(limit, 0)
+        self.echo = echo  # 为 False 时不打印，只计数和保留示例
+        self.counts = collections.Counter()
+        self.examples = collections.defaultdict(list)
+
+    def __call__(self, warning):
+        self.counts[warning.reason] += 1
+        if self.counts[warning.reason] <= self.limit:
+            self.examples[warning.reason].append(warning)
+            if self.echo:
+                print_warning(warning)
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+    def report(self):
+        """有警告未显示时，在标准错误中打印各原因的警告总数。"""
+        hidden = {reason: count - self.limit for reason, count in self.counts.items() if count > self.limit}
+        if not hidden:
+            return
+        parts = [f"{WARNING_REASONS.get(reason, reason)} {count} 条 (另有 {hidden[reason]} 条未显示)" if reason in hidden
+                 else f"{WARNING_REASONS.get(reason, reason)} {count} 条"
+                 for reason, count in self.counts.most_common()]
+        print(f"警告汇总: 共 {self.total} 条，" + "，".join(parts) + "。", file=sys.stderr)
+
+    def as_dict(self):
+        return {
+            'total': self.total,
+            'limit': self.limit,
+            'reasons': {
+                reason: {
+                    'description': WARNING_REASONS.get(reason, reason),
+                    'count': count,
+                    'examples': [{'line': warning.line_number, 'message': warning.message} for warning in self.examples[reason]]
+                }
+                for reason, count in self.counts.most_common()
+            }
+        }
+
+    def write_json(self, path):
+        """把 as_dict() 写为 JSON 文件。"""
+        import json
+        with open(path, 'w', encoding='utf-8') as f_out:
+            json.dump(self.as_dict(), f_out, indent=2, ensure_ascii=False)
+
+
+def _filter_link_lines(lines, first_line_number=1):
+    """跳过空行和注释行，产出 (行号, 去除首尾空白后的链接)。"""
+    for i, line in enumerate(lines, first_line_number):
+        line = line.strip()
+        if not line or line.startswith('#'):  # 跳过空行和注释行
+            continue
+        yield i, line
+
+
+def _count_line_breaks(data):
+    """统计一段字节中的行结束符数量 (与文本模式一致，CRLF、CR、LF 都算作换行)。"""
+    return data.count(b'\n') + data.count(b'\r') - data.count(b'\r\n')
+
+
+def _filter_link_block(block, first_line_number=1):
+    """
+    与 _filter_link_lines 相同，但输入为一段原始字节。
+    bytes.splitlines() 与文本模式一样只把 CRLF、CR、LF 当作换行，行号因此保持一致；
+    空行和注释行在字节层面直接跳过，只有剩下的行才解码为字符串。
+    """
+    for i, raw in enumerate(map(bytes.strip, block.splitlines()), first_line_number):
+        if not raw or raw[0] == 0x23:  # b'#'
+            continue
+        # str.strip() 去除的空白比 bytes.strip() 多 (如全角空格)，解码后需再判断一次
+        line = raw.decode('utf-8').strip()
+        if not line or line[0] == '#':
+            continue
+        yield i, line
+
+
+def iter_link_lines_mmap(input_file, block_size=MMAP_BLOCK_SIZE):
+    """
+    用 mmap 读取链接文件，产出结果与 iter_link_lines 相同。
+    按 block_size 在换行符处切块后整块分行，空行和注释行不解码。
+    注意: CPython 的文本模式读取本身由 C 实现，此方式通常并不更快 (见 ss_bench.py reader)，
+    因此转换脚本默认仍使用 iter_link_lines；并行解析的子进程按字节范围读取，使用同样的分行逻辑。
+    """
+    import mmap  # 转换脚本默认不使用 mmap，不在启动时导入
+
+    with open(input_file, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if not size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = 0
+            line_number = 1
+            while start < size:
+                end = size
+                if start + block_size < size:
+                    newline = mm.find(b'\n', start + block_size)
+                    if newline != -1:
+                        end = newline + 1
+                block = mm[start:end]
+                yield from _filter_link_block(block, line_number)
+                line_number += _count_line_breaks(block)
+                start = end
+                # 已处理的页不会再访问，及时释放，避免大文件的映射页全部计入常驻内存
+                released = start - start % mmap.PAGESIZE
+                if released and hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_DONTNEED'):
+                    mm.madvise(mmap.MADV_DONTNEED, 0, released)
+
+
+def iter_link_lines(input_file):
+    """
+    逐行读取链接文件，跳过空行和注释行，产出 (行号, 去除首尾空白后的链接)。
+    行号从 1 开始，与文件中的实际行对应。
+    """
+    with open(input_file, 'r', encoding='utf-8') as f:
+        yield from _filter_link_lines(f)
+
+
+class SocksNode:
+    """
+    解析后的 SOCKS 节点，与输出格式无关。
+    使用 __slots__ 而不是字典保存字段，持有数十万个节点时内存占用明显更小；
+    各格式的转换函数 (clash_proxy_from_node 等) 只在输出时按需读取这些字段。
+    """
+
+    __slots__ = ('name', 'server', 'port', 'username', 'password')
+
+    def __init__(self, name, server, port, username=None, password=None):
+        self.name = name
+        self.server = server
+        self.port = port
+        self.username = username
+        self.password = password
+
+    def __eq__(self, other):
+        if not isinstance(other, SocksNode):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return f"SocksNode(name={self.name!r}, server={self.server!r}, port={self.port!r})"
+
+
+def parse_socks_node(line_number, link_string, warn=print_warning):
+    """
+    解析单条SOCKS链接字符串为 SocksNode。
+    链接无效时以 ParseWarning 调用 warn (默认打印到标准错误) 并返回 None。
+    """
+    try:
+        parsed_url = urlparse(link_string)
+
+        if parsed_url.scheme not in ['socks', 'socks5']:
+            warn(ParseWarning(WARN_BAD_SCHEME, line_number, f"无效的协议 '{parsed_url.scheme}' 于链接: {link_string}。已跳过。"))
+            return None
+
+        if not parsed_url.hostname or not parsed_url.port:
+            warn(ParseWarning(WARN_MISSING_ADDRESS, line_number, f"链接中缺少主机名或端口: {link_string}。已跳过。"))
+            return None
+
+        # 从 fragment 获取代理名称，如果为空则自动生成
+        proxy_name = unquote(parsed_url.fragment) if parsed_url.fragment else f"SOCKS_{parsed_url.hostname}_{parsed_url.port}"
+
+        return SocksNode(proxy_name, parsed_url.hostname, parsed_url.port, parsed_url.username, parsed_url.password)
+
+    except Exception as e:
+        warn(ParseWarning(WARN_PARSE_ERROR, line_number, f"解析链接 '{link_string}' 时发生错误: {e}。已跳过。"))
+        return None
+
+
+def parse_links(lines, warn=print_warning):
+    """
+    解析可迭代的链接文本 (如打开的文件或字符串列表，每项一行)，按顺序产出 (行号, 节点)。
+    空行和注释行跳过，无效链接以 ParseWarning 调用 warn 后跳过。
+    """
+    for line_number, line in _filter_link_lines(lines):
+        node = parse_socks_node(line_number, line, warn)
+        if node:
+            yield line_number, node
+
+
+def split_file_ranges(input_file, chunk_count):
+    """
+    将文件按字节大致均分为 chunk_count 段，返回 [(start, end), ...]。
+    除最后一段外，每段都恰好在换行符之后结束，不会把一行 (或一个多字节字符) 切开。
+    """
+    size = os.path.getsize(input_file)
+    ranges = []
+    start = 0
+    with open(input_file, 'rb') as f:
+        for k in range(1, chunk_count):
+            target = size * k // chunk_count
+            if target <= start:
+                continue
+            f.seek(target - 1)
+            f.readline()
+            end = f.tell()
+            if end >= size:
+                break
+            ranges.append((start, end))
+            start = end
+    if start < size:
+        ranges.append((start, size))
+    return ranges
+
+
+def _read_range(input_file, start, end):
+    with open(input_file, 'rb') as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _count_range_lines(task):
+    return _count_line_breaks(_read_range(*task))
+
+
+def _parse_range(task):
+    """
+    在子进程中解析一段文件，返回 [(行号, 节点或 None, 该行产生的 ParseWarning 或 None), ...]。
+    警告不直接输出，而是交回主进程按行号顺序处理。
+    """
+    input_file, start, end, first_line_number = task
+    block = _read_range(input_file, start, end)
+    results = []
+    warnings = []
+    for line_number, line in _filter_link_block(block, first_line_number):
+        node = parse_socks_node(line_number, line, warnings.append)
+        warning = warnings.pop() if warnings else None
+        if node or warning:
+            results.append((line_number, node, warning))
+    return results
+
+
+def parse_link_file(input_file, jobs=1, warn=print_warning):
+    """
+    读取并解析链接文件，按文件顺序产出 (行号, 节点)，无效链接以 ParseWarning 调用 warn (默认打印警告) 后跳过。
+
+    jobs > 1 时把文件按字节切块，用 jobs 个进程并行解析。各块的结果和警告按原顺序合并，
+    因此输出 (包括之后的去重重命名) 与单进程完全一致。文件较小时自动退回单进程。
+    """
+    chunk_count = 1
+    if jobs > 1:
+        size = os.path.getsize(input_file)
+        chunk_count = min(jobs * 4, size // PARALLEL_MIN_CHUNK_SIZE)
+        chunk_count = max(chunk_count, size // PARALLEL_MAX_CHUNK_SIZE)
+
+    if chunk_count <= 1:
+        with open(input_file, 'r', encoding='utf-8') as f:
+            yield from parse_links(f, warn)
+        return
+
+    # 进程池 (连带 multiprocessing、logging 等) 只在并行解析时才导入，不拖慢单进程运行的启动
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = split_file_ranges(input_file, chunk_count)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # 先统计每块的行数，得到每块第一行的行号
+        line_counts = executor.map(_count_range_lines, [(input_file, start, end) for start, end in ranges])
+        tasks = []
+        first_line_number = 1
+        for (start, end), line_count in zip(ranges, line_counts):
+            tasks.append((input_file, start, end, first_line_number))
+            first_line_number += line_count
+
+        # 同时在途的块数有上限，避免结果在内存中堆积
+        tasks = iter(tasks)
+        pending = collections.deque(executor.submit(_parse_range, task) for task in itertools.islice(tasks, jobs * 2))
+        while pending:
+            results = pending.popleft().result()
+            next_task = next(tasks, None)
+            if next_task is not None:
+                pending.append(executor.submit(_parse_range, next_task))
+            for line_number, node, warning in results:
+                if warning:
+                    warn(warning)
+                if node:
+                    yield line_number, node
+
+
+class NameDeduper:
+    """
+    代理名称去重器。
+
+    结果与原先的 `while name in names: count += 1` 循环完全一致：名称重复时依次尝试
+    name_2、name_3 ...，取第一个未被占用的名称。占用情况保存在集合中，并为每个基础名
+    记录上次分配到的序号，下次从该序号之后继续尝试 (已占用的名称不会被释放，所以更小的
+    序号一定仍被占用)，大量同名节点时不再退化为平方复杂度。
+    """
+
+    def __init__(self):
+        self.names = []  # 按加入顺序排列的最终名称
+        self._taken = set()
+        self._last_suffix = {}
+
+    def __contains__(self, name):
+        return name in self._taken
+
+    def __len__(self):
+        return len(self.names)
+
+    def claim(self, name):
+        """为 name 分配一个未被占用的名称并登记，返回最终名称。"""
+        unique_name = name
+        if name in self._taken:
+            count = self._last_suffix.get(name, 1)
+            while True:
+                count += 1
+                unique_name = f"{name}_{count}"
+                if unique_name not in self._taken:
+                    break
+            self._last_suffix[name] = count
+
+        self._taken.add(unique_name)
+        self.names.append(unique_name)
+        return unique_name
+
+
+def split_fragments(text, placeholders):
+    """
+    把用占位名称渲染出的完整模板文本切分为片段列表。
+    placeholders 为 {占位文本: (类别, 分隔符)}；返回的列表中静态部分为 str，
+    占位处为 (类别, 分隔符) 元组。每个占位文本至少要出现一次。
+    """
+    pattern = re.compile('|'.join(re.escape(p) for p in sorted(placeholders, key=len, reverse=True)))
+    fragments = []
+    seen = set()
+    position = 0
+    for match in pattern.finditer(text):
+        fragments.append(text[position:match.start()])
+        fragments.append(placeholders[match.group()])
+        seen.add(match.group())
+        position = match.end()
+    fragments.append(text[position:])
+
+    missing = set(placeholders) - seen
+    if missing:
+        raise ValueError(f"模板渲染结果中未找到占位: {', '.join(sorted(missing))}")
+    return fragments
+
+
+def write_fragments(fragments, pieces, out):
+    """
+    按片段列表写出：静态片段原样写出，(类别, 分隔符) 处写出 分隔符.join(pieces[类别])。
+    静态片段为 bytes (见 load_cached_fragments) 时 out 为二进制流，占位处的文本编码为 UTF-8 后写出。
+    同一类别出现多次时只拼接一次，pieces 中的值也可以是只能遍历一次的生成器。
+    """
+    binary = any(isinstance(fragment, bytes) for fragment in fragments)
+    joined = {}
+    for fragment in fragments:
+        if isinstance(fragment, (str, bytes)):
+            out.write(fragment)
+            continue
+        if fragment not in joined:
+            kind, separator = fragment
+            text = separator.join(pieces[kind])
+            joined[fragment] = text.encode('utf-8') if binary else text
+        out.write(joined[fragment])
+
+
+def load_cached_fragments(cache_dir, name, key, build):
+    """
+    返回模板的片段列表，静态片段为 UTF-8 编码的 bytes，供 write_fragments 直接拼接写出。
+    build() 返回 split_fragments 的结果；它与 key (可 repr 的元组，需包含模板内容的哈希和所有影响渲染的选项)
+    一起 pickle 到 cache_dir，之后的运行直接读取，不再解析和序列化模板。cache_dir 为 None 或读写失败时每次调用 build()。
+    """
+    import hashlib  # 只有模板片段缓存和增量状态用到，不在启动时导入
+    import pickle
+
+    digest = hashlib.sha256(repr((STATE_VERSION, name, key)).encode('utf-8')).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{FRAGMENTS_CACHE_PREFIX}{name}_{digest[:16]}.pickle") if cache_dir else None
+    if cache_path:
+        try:
+            with open(cache_path, 'rb') as f:
+                cached_digest, fragments = pickle.load(f)
+            if cached_digest == digest:
+                return fragments
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"警告: 模板片段缓存 '{cache_path}' 损坏，将重新生成: {e}", file=sys.stderr)
+
+    fragments = [fragment.encode('utf-8') if isinstance(fragment, str) else fragment for fragment in build()]
+    if cache_path:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # 先写临时文件再原子替换，避免并发运行读到写了一半的缓存
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump((digest, fragments), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"警告: 无法写入模板片段缓存 '{cache_path}': {e}", file=sys.stderr)
+    return fragments
+
+
+class IncrementalState:
+    """
+    增量转换的状态文件 (pickle)，保存上次运行的：
+    - 链接行摘要 -> 解析出的节点字段，未变化的行不再解析；
+    - 模板渲染出的静态片段，模板不变时逐字节复用；
+    - 每个节点 / 组成员渲染出的文本，内容不变时直接复用。
+    保存时只保留本次用到的条目，状态文件不会随时间无限增长。
+    """
+
+    def __init__(self, path, target):
+        self.path = path
+        self.target = target
+        self.reused_nodes = 0
+        self.parsed_nodes = 0
+        self._old = {'nodes': {}, 'pieces': {}, 'fragments': (None, None)}
+        self._new = {'nodes': {}, 'pieces': {}, 'fragments': (None, None)}
+
+        import pickle
+        try:
+            with open(path, 'rb') as f:
+                state = pickle.load(f)
+            if state.get('version') == STATE_VERSION and state.get('target') == target:
+                self._old = state['data']
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"警告: 增量状态文件 '{path}' 无法读取，将重新生成: {e}", file=sys.stderr)
+
+    def iter_nodes(self, input_file, warn=print_warning):
+        """与 parse_link_file 相同，但内容未变的行直接复用上次的解析结果。"""
+        import hashlib
+
+        old_nodes = self._old['nodes']
+        new_nodes = self._new['nodes']
+        for line_number, line in iter_link_lines(input_file):
+            key = hashlib.blake2b(line.encode('utf-8'), digest_size=16).digest()
+            fields = old_nodes.get(key)
+            if fields is None:
+                # 无效链接不缓存，每次都重新解析以输出警告
+                node = parse_socks_node(line_number, line, warn)
+                if node is None:
+                    continue
+                fields = tuple(getattr(node, field) for field in SocksNode.__slots__)
+                self.parsed_nodes += 1
+            else:
+                node = SocksNode(*fields)
+                self.reused_nodes += 1
+            new_nodes[key] = fields
+            yield line_number, node
+
+    def fragments(self, key, build):
+        """返回 key (通常为模板摘要) 对应的静态片段；与上次不同时调用 build() 重新生成。"""
+        old_key, fragments = self._old['fragments']
+        if old_key != key:
+            fragments = build()
+        self._new['fragments'] = (key, fragments)
+        return fragments
+
+    def piece(self, key, render):
+        """返回 key 对应的已渲染文本，上次没有时调用 render() 生成。"""
+        new_pieces = self._new['pieces']
+        text = new_pieces.get(key)
+        if text is None:
+            text = self._old['pieces'].get(key)
+            if text is None:
+                text = render()
+            new_pieces[key] = text
+        return text
+
+    def save(self):
+        """原子地写回状态文件，只保留本次运行用到的条目。"""
+        import pickle
+
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': STATE_VERSION, 'target': self.target, 'data': self._new}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self.path)
+
+
+def _cpu_time():
+    """本进程及已结束子进程 (--jobs 的工作进程) 的用户态 + 内核态 CPU 时间。"""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+class StageProfiler:
+    """
+    --profile 的实现：按阶段统计墙钟时间、CPU 时间和 tracemalloc 记录的峰值内存。
+    未启用时 stage() 什么也不做。profile_path 不为空时还会用 cProfile 记录整个运行过程，
+    在 report() 时写出 pstats 文件 (可用 python3 -m pstats 查看)。
+    报告写到 sys.stderr，在警告汇总之后打印。
+    """
+
+    def __init__(self, enabled=False, profile_path=None):
+        self.enabled = enabled or bool(profile_path)
+        self.profile_path = profile_path
+        self.stages = []  # (阶段名, 墙钟秒数, CPU 秒数, 峰值内存字节数)
+        self.notes = []  # 报告开头附带的说明，如使用的 YAML 实现
+        self._profile = None
+        if self.enabled:
+            import tracemalloc  # 只有 --profile 用到，它会连带导入 linecache、tokenize 等
+            tracemalloc.start()
+        if profile_path:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if not self.enabled:
+            yield
+            return
+        import tracemalloc
+        tracemalloc.reset_peak()
+        start_wall = time.perf_counter()
+        start_cpu = _cpu_time()
+        try:
+            yield
+        finally:
+            self.stages.append((name, time.perf_counter() - start_wall, _cpu_time() - start_cpu,
+                                tracemalloc.get_traced_memory()[1]))
+
+    def note(self, text):
+        """记录一条在报告中显示的说明；未启用时忽略。"""
+        if self.enabled:
+            self.notes.append(text)
+
+    def report(self):
+        """打印各阶段的统计结果并停止记录；启用了 cProfile 时写出 pstats 文件。"""
+        if not self.enabled:
+            return
+        if self._profile:
+            self._profile.disable()
+        import tracemalloc
+        tracemalloc.stop()
+
+        print("性能分析 (峰值内存为 tracemalloc 统计的 Python 对象内存):", file=sys.stderr)
+        for text in self.notes:
+            print(f"  {text}", file=sys.stderr)
+        for name, wall, cpu, peak in self.stages:
+            print(f"  {name:<10} 墙钟 {wall:8.3f}s  CPU {cpu:8.3f}s  峰值内存 {peak / (1024 * 1024):8.1f} MB", file=sys.stderr)
+        total_wall = sum(stage[1] for stage in self.stages)
+        total_cpu = sum(stage[2] for stage in self.stages)
+        print(f"  {'合计':<8} 墙钟 {total_wall:8.3f}s  CPU {total_cpu:8.3f}s", file=sys.stderr)
+
+        if self._profile:
+            try:
+                self._profile.dump_stats(self.profile_path)
+                print(f"  cProfile 结果已写入到 '{self.profile_path}'", file=sys.stderr)
+            except OSError as e:
+                print(f"警告: 无法写入 cProfile 结果 '{self.profile_path}': {e}", file=sys.stderr)
+
+
+def yaml_implementation():
+    """
+    返回 (Loader, Dumper, 名称)。PyYAML 编译了 libyaml 时为 C 实现的 CSafeLoader / CSafeDumper ('libyaml')，
+    否则 (或环境变量 SS2CLASH_YAML=python 时) 回退到纯 Python 的 SafeLoader / SafeDumper ('python')。
+    PyYAML 在这里才导入，ss2singbox.py / ss2surge.py 不依赖它。
+    """
+    import yaml
+
+    if os.environ.get(YAML_IMPLEMENTATION_ENV) != 'python':
+        try:
+            return yaml.CSafeLoader, yaml.CSafeDumper, 'libyaml'
+        except AttributeError:  # 未编译 libyaml 扩展时 yaml 模块中没有这两个类
+            pass
+    return yaml.SafeLoader, yaml.SafeDumper, 'python'
+
+
+def config_relative_dir(directory, output_file):
+    """
+    配置中引用 directory 下文件时使用的路径前缀：相对于输出配置文件所在目录 (未指定输出文件时为当前目录)，
+    以 './' 或 '../' 开头，分隔符统一为 '/'。
+    """
+    config_dir = os.path.dirname(os.path.abspath(output_file)) if output_file else os.getcwd()
+    prefix = os.path.relpath(os.path.abspath(directory), config_dir).replace(os.sep, '/')
+    return prefix if prefix.startswith('.') else f"./{prefix}"
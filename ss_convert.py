@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SOCKS 链接转换的库接口：在进程内生成 Clash / sing-box / Surge 配置，供 post.py 或常驻服务直接调用，
+不必为每次转换启动一个解释器。与命令行脚本不同，这里不调用 sys.exit、不打印，也不替换 sys.stderr，
+无效链接和重名节点以 ConversionWarning 列表返回：每种原因最多保留 warning_limit 条示例，
+总数在 warning_counts 中，输入再大内存占用也不随警告数量增长。
+用法:
+    from ss_convert import convert
+    with open('socks_links.txt', encoding='utf-8') as f:
+        result = convert(f, 'clash')
+    result.data      # 配置文件内容 (UTF-8 bytes)，与 ss2clash.py -o 写出的文件逐字节相同
+    result.warnings  # [ConversionWarning(reason='bad_scheme', line_number=3, message='...'), ...]
+    result.warning_counts  # {'bad_scheme': 1204, 'rename': 37, ...}
+需要与 ss_clash.py、ss_clash_template.py、ss_singbox.py、ss_surge.py、ss_common.py、ss_rules.py 放在同一目录。
+模板缓存文件损坏或无法写入时的提示仍写到 sys.stderr；不使用磁盘缓存时传入 cache_dir=None。
+"""
+
+import collections
+import copy
+import functools
+import io
+
+from ss_common import (NameDeduper, SocksNode, ParseWarning, WarningSummary, WARN_RENAME, WARNING_EXAMPLE_LIMIT,  # 需与本模块位于同一目录
+                       TEMPLATE_CACHE_DIR, parse_links)
+
+TARGETS = ('clash', 'singbox', 'surge')
+
+# 与 ss_common.ParseWarning 相同：reason 为 ss_common.WARN_* 之一，line_number 为输入中的行号
+ConversionWarning = ParseWarning
+# convert 的结果：data 为配置内容 (写入 out 时为 None)，node_count 为输出的节点数，
+# warnings 为按行号排列的警告示例 (每种原因最多 warning_limit 条)，warning_counts 为 {原因: 总条数}
+ConversionResult = collections.namedtuple('ConversionResult', 'target data node_count warnings warning_counts')
+
+
+class ConversionError(ValueError):
+    """无法生成配置：目标格式未知，或输入中没有任何有效的 SOCKS 链接。"""
+
+
+@functools.lru_cache(maxsize=None)
+def _template_fragments(target, cache_dir):
+    """
+    Clash / sing-box 模板的静态片段 (bytes)，在进程内缓存：常驻服务中只有第一次转换需要读取磁盘缓存或解析模板。
+    转换模块在这里才导入，只生成 Surge 配置时不需要 PyYAML。
+    """
+    if target == 'clash':
+        import ss_clash
+        return ss_clash.clash_cached_fragments(cache_dir)
+    import ss_singbox
+    return ss_singbox.singbox_cached_fragments(cache_dir)
+
+
+def _dedupe_names(nodes, names, warnings, label):
+    """与命令行脚本相同的重名处理：names 与 nodes 一一对应，重复的依次改为 name_2、name_3 ...，返回去重后的名称列表。"""
+    deduper = NameDeduper()
+    for (line_number, _), name in zip(nodes, names):
+        new_name = deduper.claim(name)
+        if new_name != name:
+            warnings(ConversionWarning(WARN_RENAME, line_number, f"{label} '{name}' 重复。已重命名为 '{new_name}'。"))
+    return deduper.names
+
+
+def _write_target(target, nodes, warnings, out, cache_dir):
+    """把 (行号, SocksNode) 列表写为 target 格式的配置，out 为二进制流。nodes 中的节点名称不会被修改。"""
+    if target == 'surge':
+        import ss_surge
+        proxy_names = _dedupe_names(nodes, [ss_surge.surge_proxy_name(node) for _, node in nodes], warnings, "代理名称")
+        proxy_lines = (ss_surge.surge_proxy_line(name, node) for name, (_, node) in zip(proxy_names, nodes))
+        out.write(ss_surge.build_surge_config(proxy_lines, proxy_names).encode('utf-8'))
+        return
+
+    label = "代理名称" if target == 'clash' else "代理标签(tag)"
+    proxy_names = _dedupe_names(nodes, [node.name for _, node in nodes], warnings, label)
+    # 渲染时读取的是 node.name，改名的节点使用副本，调用方的节点保持原样 (convert_many 中其他格式还要用到原名)
+    renamed = [node if node.name == name else SocksNode(name, node.server, node.port, node.username, node.password)
+               for (_, node), name in zip(nodes, proxy_names)]
+    fragments = _template_fragments(target, cache_dir)
+    if target == 'clash':
+        import ss_clash
+        ss_clash.write_clash_spliced(fragments, renamed, proxy_names, out)
+    else:
+        import ss_singbox
+        ss_singbox.write_singbox_spliced(fragments, renamed, proxy_names, out)
+
+
+def _parse(links, warnings):
+    """解析链接，返回 [(行号, SocksNode), ...]；links 中的元素可以是 str 或 UTF-8 bytes。"""
+    lines = (line.decode('utf-8') if isinstance(line, bytes) else line for line in links)
+    return list(parse_links(lines, warnings))
+
+
+def convert(links, target, out=None, cache_dir=TEMPLATE_CACHE_DIR, warning_limit=WARNING_EXAMPLE_LIMIT):
+    """
+    把 links (可迭代的链接文本，每项一行，如打开的文件或字符串列表) 转换为 target ('clash'、'singbox' 或 'surge') 格式的配置。
+    out 为 None 时返回的 ConversionResult.data 为配置内容 (bytes)；提供二进制流 out 时直接流式写入 out，data 为 None。
+    输出与对应命令行脚本的默认输出 (-o 写出的文件) 逐字节相同。
+    每种警告只保留前 warning_limit 条示例 (与命令行的 --warning-limit 相同)，需要全部警告时传入一个足够大的值。
+    target 未知或没有任何有效链接时抛出 ConversionError，其余错误 (如模板解析失败) 原样抛出。
+    """
+    if target not in TARGETS:
+        raise ConversionError(f"未知的目标格式 '{target}'，可选: {', '.join(TARGETS)}")
+    warnings = WarningSummary(warning_limit, echo=False)
+    nodes = _parse(links, warnings)
+    if not nodes:
+        raise ConversionError("输入中未找到有效的SOCKS链接。")
+    return _convert_nodes(nodes, target, warnings, out, cache_dir)
+
+
+def convert_many(links, targets=TARGETS, cache_dir=TEMPLATE_CACHE_DIR, warning_limit=WARNING_EXAMPLE_LIMIT):
+    """
+    只解析一次 links，生成多种格式的配置，返回 {目标: ConversionResult}。
+    解析产生的警告出现在每个结果的 warnings / warning_counts 中，重名警告只计入对应格式的结果。
+    """
+    unknown = [target for target in targets if target not in TARGETS]
+    if unknown:
+        raise ConversionError(f"未知的目标格式 '{unknown[0]}'，可选: {', '.join(TARGETS)}")
+    warnings = WarningSummary(warning_limit, echo=False)
+    nodes = _parse(links, warnings)
+    if not nodes:
+        raise ConversionError("输入中未找到有效的SOCKS链接。")
+    return {target: _convert_nodes(nodes, target, copy.deepcopy(warnings), None, cache_dir) for target in targets}
+
+
+def _convert_nodes(nodes, target, warnings, out, cache_dir):
+    buffer = io.BytesIO() if out is None else out
+    _write_target(target, nodes, warnings, buffer, cache_dir)
+    data = buffer.getvalue() if out is None else None
+    # 各原因的示例分别按行号排列，合并后与命令行脚本的输出顺序一致
+    examples = sorted((warning for reason_examples in warnings.examples.values() for warning in reason_examples),
+                      key=lambda warning: warning.line_number)
+    return ConversionResult(target, data, len(nodes), examples, dict(warnings.counts))
@@ -0,0 +1,648 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+离线模拟 Clash 的规则匹配：给定主机名和/或 IP，找出第一条命中的规则及其策略组。
+规则先编译成索引 (DOMAIN/DOMAIN-SUFFIX 用按标签倒序的字典树，DOMAIN-KEYWORD 用 Aho-Corasick 自动机，
+IP-CIDR/IP-CIDR6 用按位的基数树)，每次查询只需沿索引走一遍，而不是逐条扫描几千条规则。
+用法: python3 ss_match.py query clash.yaml www.google.com 8.8.8.8 www.bilibili.com,119.3.1.1
+      python3 ss_match.py audit clash.yaml access.log -j 8 [--csv --host-column 2 --ip-column 3]
+      python3 ss_match.py stats - [--log access.log]
+需要与 ss_rules.py、ss_common.py 放在同一目录；不提供配置文件 (用 -) 时使用 ss2clash.py 内置模板的规则。
+"""
+
+import argparse
+import collections
+import csv
+import functools
+import ipaddress
+import itertools
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import yaml  # 需要安装 PyYAML: pip install PyYAML
+
+from ss_common import split_file_ranges, _read_range, yaml_implementation
+from ss_rules import NO_VALUE_RULE_TYPES, DomainTrie, normalize_domain, reorder_rules, split_rule
+
+# 不带 no-resolve 时会为域名请求触发 DNS 解析的规则类型
+RESOLVING_RULE_TYPES = ('IP-CIDR', 'IP-CIDR6', 'GEOIP')
+
+# 查询结果：规则序号、规则原文和策略组；没有任何规则命中 (包括没有 MATCH) 时为 None
+RuleMatch = collections.namedtuple('RuleMatch', 'index rule target')
+
+# 主机名匹配结果的缓存条数，访问日志中同一主机名通常会反复出现
+HOST_CACHE_SIZE = 1 << 16
+# audit 每次处理的字节数，同时在途的块数为 2 * 进程数，内存占用与日志大小无关
+AUDIT_CHUNK_SIZE = 4 << 20
+# audit 为落到 MATCH 的主机名保留的候选条数 (只保留计数最高的这些，其余丢弃并计入误差)
+AUDIT_UNMATCHED_CAPACITY = 10000
+
+
+class KeywordAutomaton:
+    """
+    DOMAIN-KEYWORD 的 Aho-Corasick 自动机：一次扫描主机名即可找出所有包含在其中的关键字。
+    每个状态记录经由失败链可达的关键字中规则序号最小的一个。
+    """
+
+    def __init__(self):
+        self.goto = [{}]
+        self.fail = [0]
+        self.best = [None]
+
+    def add(self, keyword, index):
+        state = 0
+        for char in keyword:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto[state][char] = next_state
+                self.goto.append({})
+                self.fail.append(0)
+                self.best.append(None)
+            state = next_state
+        if self.best[state] is None or index < self.best[state]:
+            self.best[state] = index
+
+    def build(self):
+        """添加完所有关键字后计算失败链 (广度优先)。"""
+        queue = collections.deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                fallback = self.goto[fail].get(char, 0)
+                self.fail[next_state] = fallback if fallback != next_state else 0
+                inherited = self.best[self.fail[next_state]]
+                if inherited is not None and (self.best[next_state] is None or inherited < self.best[next_state]):
+                    self.best[next_state] = inherited
+                queue.append(next_state)
+
+    def match(self, text):
+        """返回 text 中出现的关键字里规则序号最小的一个，没有则返回 None。"""
+        goto, fail, best_of = self.goto, self.fail, self.best
+        best = None
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            index = best_of[state]
+            if index is not None and (best is None or index < best):
+                best = index
+        return best
+
+
+class PrefixTree:
+    """
+    IP-CIDR / IP-CIDR6 的按位基数树。节点为 [0 子节点, 1 子节点, 规则序号]，
+    查询时沿地址的二进制位向下走，取路径上规则序号最小的一个。
+    """
+
+    def __init__(self):
+        self.roots = {4: [None, None, None], 6: [None, None, None]}
+
+    def add(self, network, index):
+        node = self.roots[network.version]
+        bits = network.max_prefixlen
+        value = int(network.network_address)
+        for position in range(network.prefixlen):
+            bit = (value >> (bits - 1 - position)) & 1
+            if node[bit] is None:
+                node[bit] = [None, None, None]
+            node = node[bit]
+        if node[2] is None or index < node[2]:
+            node[2] = index
+
+    def match(self, address):
+        node = self.roots[address.version]
+        bits = address.max_prefixlen
+        value = int(address)
+        best = node[2]
+        for position in range(bits):
+            node = node[(value >> (bits - 1 - position)) & 1]
+            if node is None:
+                break
+            index = node[2]
+            if index is not None and (best is None or index < best):
+                best = index
+        return best
+
+
+class RuleMatcher:
+    """
+    把 Clash 规则列表编译成索引，按第一条命中的语义回答查询。
+    支持 DOMAIN、DOMAIN-SUFFIX、DOMAIN-KEYWORD、IP-CIDR、IP-CIDR6、PROCESS-NAME 和 MATCH；
+    geoip 为 {国家代码: 网段列表} 时 GEOIP 规则按这些网段匹配，否则 GEOIP 规则不会命中。
+    其他类型的规则不会命中，并计入 unsupported ({类型: 条数})。
+
+    离线模拟无法做 DNS 解析：只提供主机名时 IP 类规则不会命中；同时提供 IP 时视为已经解析，
+    IP 类规则无论是否带 no-resolve 都参与匹配。
+    """
+
+    def __init__(self, rules, geoip=None):
+        self.rules = list(rules)
+        self.targets = []
+        self.domains = DomainTrie()
+        self.keywords = KeywordAutomaton()
+        self.networks = PrefixTree()
+        self.processes = {}
+        self.final_index = None
+        self.unsupported = collections.Counter()
+        self.geoip = geoip = {code.upper(): list(networks) for code, networks in (geoip or {}).items()}
+
+        for index, rule in enumerate(self.rules):
+            rule_type, value, target, _ = split_rule(rule)
+            self.targets.append(target)
+            if target is None:
+                self.unsupported[rule_type] += 1
+            elif rule_type in ('DOMAIN', 'DOMAIN-SUFFIX'):
+                self.domains.add(value, rule_type == 'DOMAIN-SUFFIX', index)
+            elif rule_type == 'DOMAIN-KEYWORD':
+                self.keywords.add(value.lower(), index)
+            elif rule_type in ('IP-CIDR', 'IP-CIDR6'):
+                try:
+                    self.networks.add(ipaddress.ip_network(value, strict=False), index)
+                except ValueError:
+                    self.unsupported[rule_type] += 1
+            elif rule_type == 'GEOIP' and value.upper() in geoip:
+                for network in geoip[value.upper()]:
+                    self.networks.add(network, index)
+            elif rule_type == 'PROCESS-NAME':
+                self.processes.setdefault(value, index)
+            elif rule_type in ('MATCH', 'FINAL'):
+                if self.final_index is None:
+                    self.final_index = index
+            else:
+                self.unsupported[rule_type] += 1
+
+        self.keywords.build()
+        self._match_host = functools.lru_cache(maxsize=HOST_CACHE_SIZE)(self._match_host_uncached)
+
+    def _match_host_uncached(self, host):
+        domain_index = self.domains.match(host)
+        keyword_index = self.keywords.match(host)
+        if domain_index is None or (keyword_index is not None and keyword_index < domain_index):
+            return keyword_index
+        return domain_index
+
+    def match(self, host=None, ip=None, process=None):
+        """
+        返回第一条命中的规则 (RuleMatch)，都未命中时返回 None。
+        host 为主机名；ip 为 IP 地址字符串或 ipaddress 对象；process 为进程名。
+        host 本身是 IP 字面量时按 IP 处理。无效的 IP 抛出 ValueError。
+        """
+        if host:
+            host = normalize_domain(host)
+            # 只有以数字结尾或含 ':' 的才可能是 IP 字面量，避免对每个主机名都抛一次异常
+            if host and (host[-1].isdigit() or ':' in host):
+                try:
+                    host, ip = None, ip or ipaddress.ip_address(host)
+                except ValueError:
+                    pass
+
+        candidates = []
+        if host:
+            candidates.append(self._match_host(host))
+        if ip is not None:
+            if isinstance(ip, str):
+                ip = ipaddress.ip_address(ip.strip())
+            candidates.append(self.networks.match(ip))
+        if process:
+            candidates.append(self.processes.get(process))
+        candidates.append(self.final_index)
+
+        index = min((index for index in candidates if index is not None), default=None)
+        if index is None:
+            return None
+        return RuleMatch(index, self.rules[index], self.targets[index])
+
+
+def load_clash_rules(config_path=None):
+    """读取 ss2clash.py 生成的 Clash 配置中的 rules；config_path 为 None 时使用 ss2clash.py 内置模板的规则。"""
+    if config_path is None:
+        import ss_clash
+        return ss_clash.load_clash_template()['rules']
+    with open(config_path, 'r', encoding='utf-8') as f:
+        clash_config = yaml.load(f, Loader=yaml_implementation()[0])  # 有 libyaml 时使用 CSafeLoader
+    if not isinstance(clash_config, dict) or not isinstance(clash_config.get('rules'), list):
+        raise ValueError(f"'{config_path}' 中没有 rules 列表")
+    return [str(rule) for rule in clash_config['rules']]
+
+
+def load_geoip_networks(specs):
+    """解析 --geoip CODE=FILE 参数，FILE 中每行一个网段 (忽略空行和 # 注释)，返回 {国家代码: 网段列表}。"""
+    geoip = {}
+    for spec in specs or []:
+        code, _, path = spec.partition('=')
+        if not path:
+            raise ValueError(f"--geoip 参数格式应为 CODE=FILE: '{spec}'")
+        with open(path, 'r', encoding='utf-8') as f:
+            geoip.setdefault(code.upper(), []).extend(
+                ipaddress.ip_network(line.strip(), strict=False) for line in f if line.strip() and not line.lstrip().startswith('#'))
+    return geoip
+
+
+def parse_query(text):
+    """
+    把一条查询拆分为 (host, ip)。支持 'host'、'ip' 和 'host,ip' 三种写法。
+    """
+    host, _, ip = text.strip().partition(',')
+    return host.strip() or None, ip.strip() or None
+
+
+def build_matcher(args):
+    """按命令行参数加载规则并编译 RuleMatcher，出错时打印信息并退出。"""
+    try:
+        rules = load_clash_rules(None if args.config == '-' else args.config)
+        matcher = RuleMatcher(rules, load_geoip_networks(args.geoip))
+    except FileNotFoundError as e:
+        print(f"错误: 文件 '{e.filename}' 未找到。", file=sys.stderr)
+        sys.exit(1)
+    except (ValueError, yaml.YAMLError) as e:
+        print(f"错误: 加载规则失败: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    if matcher.unsupported:
+        details = ", ".join(f"{rule_type} {count} 条" for rule_type, count in matcher.unsupported.items())
+        print(f"警告: 以下规则无法离线模拟，视为不命中: {details}", file=sys.stderr)
+    return matcher
+
+
+def query_command(args):
+    matcher = build_matcher(args)
+
+    queries = args.queries
+    if args.input_file:
+        with open(args.input_file, 'r', encoding='utf-8') as f:
+            queries = queries + [line for line in (line.strip() for line in f) if line and not line.startswith('#')]
+
+    for query in queries:
+        host, ip = parse_query(query)
+        try:
+            result = matcher.match(host, ip)
+        except ValueError:
+            print(f"警告: 无效的 IP 地址: '{query}'", file=sys.stderr)
+            continue
+        if result is None:
+            print(f"{query}\t(未命中任何规则)")
+        else:
+            print(f"{query}\t{result.target}\t第 {result.index + 1} 条: {result.rule}")
+
+
+class TopCounter:
+    """
+    容量有限的计数器，只保留计数最高的 capacity 项，用于在有限内存内统计高频项。
+    每次裁剪时被丢弃项的最大计数累加到 error：任一项的真实计数不超过 (保留的计数 + error)。
+    """
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.counts = collections.Counter()
+        self.error = 0
+
+    def update(self, counts, error=0):
+        """合并另一组计数 (如一个块的精确计数，或另一个 TopCounter 的 counts 和 error)。"""
+        self.counts.update(counts)
+        self.error += error
+        if len(self.counts) > self.capacity:
+            ranked = self.counts.most_common()
+            self.error += ranked[self.capacity][1]  # 被丢弃项中的最大计数
+            self.counts = collections.Counter(dict(ranked[:self.capacity]))
+
+    def most_common(self, n):
+        return self.counts.most_common(n)
+
+
+# 审计子进程中编译好的 RuleMatcher，由 _init_audit_worker 创建
+_audit_matcher = None
+
+
+def _init_audit_worker(rules, geoip):
+    global _audit_matcher
+    _audit_matcher = RuleMatcher(rules, geoip)
+
+
+def _audit_range(task):
+    """
+    在子进程中审计日志的一段，返回 (行数, 无效行数, {策略组: 命中数}, {规则序号: 命中数}, 落到 MATCH 的主机名计数, 误差)。
+    csv_columns 为 None 时每行是 'host'、'ip' 或 'host,ip'，否则为 CSV 中 (主机名列, IP 列) 的下标；
+    skip_header 为 True 时跳过文件的第一行。主机名和 IP 都为空的行 (如 ',') 与无效 IP 一样计为无效行。
+    """
+    input_file, start, end, csv_columns, delimiter, skip_header, unmatched_capacity = task
+    matcher = _audit_matcher
+    lines = _read_range(input_file, start, end).decode('utf-8', errors='replace').splitlines()
+    if skip_header and start == 0:
+        lines = lines[1:]
+    if csv_columns is not None:
+        host_column, ip_column = csv_columns
+        rows = ((row[host_column] if host_column is not None and host_column < len(row) else None,
+                 row[ip_column] if ip_column is not None and ip_column < len(row) else None)
+                for row in csv.reader(lines, delimiter=delimiter) if row)
+    else:
+        rows = (parse_query(line) for line in lines if line.strip() and not line.lstrip().startswith('#'))
+
+    total = invalid = 0
+    groups = collections.Counter()
+    rule_hits = collections.Counter()
+    unmatched = collections.Counter()
+    for host, ip in rows:
+        total += 1
+        host, ip = host and host.strip(), ip and ip.strip()
+        if not host and not ip:  # 如 ',' 或 CSV 中主机名列和 IP 列都为空的行
+            invalid += 1
+            continue
+        try:
+            result = matcher.match(host or None, ip or None)
+        except ValueError:
+            invalid += 1
+            continue
+        if result is None:
+            groups[None] += 1
+            continue
+        groups[result.target] += 1
+        rule_hits[result.index] += 1
+        if result.index == matcher.final_index:
+            unmatched[normalize_domain(host) if host else ip] += 1
+
+    top = TopCounter(unmatched_capacity)
+    top.update(unmatched)
+    return total, invalid, groups, rule_hits, top.counts, top.error
+
+
+def audit_log(matcher, input_file, jobs=1, csv_columns=None, delimiter=',', skip_header=False,
+              unmatched_capacity=AUDIT_UNMATCHED_CAPACITY):
+    """
+    用 matcher 回放访问日志，返回统计结果字典：总行数、无效行数、各策略组命中数、各条规则 (按序号) 的命中数，
+    以及落到 MATCH 的主机名 (TopCounter，计数可能偏小，误差见其 error)。
+    日志按 AUDIT_CHUNK_SIZE 切块处理，jobs > 1 时用多个进程并行；同时在途的块数有上限，内存占用与日志大小无关。
+    """
+    chunk_count = max(1, -(-os.path.getsize(input_file) // AUDIT_CHUNK_SIZE))
+    tasks = [(input_file, start, end, csv_columns, delimiter, skip_header, unmatched_capacity)
+             for start, end in split_file_ranges(input_file, chunk_count)]
+
+    summary = {'lines': 0, 'invalid': 0, 'groups': collections.Counter(), 'rules': collections.Counter(),
+               'unmatched': TopCounter(unmatched_capacity)}
+
+    def merge(result):
+        total, invalid, groups, rule_hits, unmatched, error = result
+        summary['lines'] += total
+        summary['invalid'] += invalid
+        summary['groups'].update(groups)
+        summary['rules'].update(rule_hits)
+        summary['unmatched'].update(unmatched, error)
+
+    if jobs <= 1 or len(tasks) <= 1:
+        _init_audit_worker(matcher.rules, matcher.geoip)
+        for task in tasks:
+            merge(_audit_range(task))
+        return summary
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_audit_worker, initargs=(matcher.rules, matcher.geoip)) as executor:
+        tasks = iter(tasks)
+        pending = collections.deque(executor.submit(_audit_range, task) for task in itertools.islice(tasks, jobs * 2))
+        while pending:
+            merge(pending.popleft().result())
+            next_task = next(tasks, None)
+            if next_task is not None:
+                pending.append(executor.submit(_audit_range, next_task))
+    return summary
+
+
+def compare_rule_lists(old_rules, new_rules, input_file, geoip=None, example_limit=10):
+    """
+    用访问日志 (每行 'host'、'ip' 或 'host,ip') 并排回放两份规则，逐条比较命中的策略组。
+    返回 {'requests': 比较的查询数, 'mismatches': 不一致的条数, 'examples': [(查询, 旧策略组, 新策略组), ...],
+    'old_depth' / 'new_depth': 两份规则各自的平均检查深度 (命中规则的序号 + 1)}。
+    """
+    old_matcher, new_matcher = RuleMatcher(old_rules, geoip), RuleMatcher(new_rules, geoip)
+    result = {'requests': 0, 'mismatches': 0, 'examples': [], 'old_depth': 0.0, 'new_depth': 0.0}
+    with open(input_file, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if not line.strip() or line.lstrip().startswith('#'):
+                continue
+            host, ip = parse_query(line)
+            try:
+                old, new = old_matcher.match(host, ip), new_matcher.match(host, ip)
+            except ValueError:
+                continue
+            result['requests'] += 1
+            if old is not None:
+                result['old_depth'] += old.index + 1
+            if new is not None:
+                result['new_depth'] += new.index + 1
+            old_target, new_target = old and old.target, new and new.target
+            if old_target != new_target:
+                result['mismatches'] += 1
+                if len(result['examples']) < example_limit:
+                    result['examples'].append((line.strip(), old_target, new_target))
+    if result['requests']:
+        result['old_depth'] /= result['requests']
+        result['new_depth'] /= result['requests']
+    return result
+
+
+def audit_log_from_args(matcher, args):
+    """按 audit / stats 共用的命令行参数 (--csv、--host-column 等) 回放 args.log_file，出错时打印信息并退出。"""
+    csv_columns = None
+    if args.csv:
+        to_index = lambda column: column - 1 if column else None
+        csv_columns = (to_index(args.host_column), to_index(args.ip_column))
+        if csv_columns == (None, None):
+            print("错误: --csv 需要至少指定 --host-column 或 --ip-column。", file=sys.stderr)
+            sys.exit(1)
+
+    try:
+        return audit_log(matcher, args.log_file, args.jobs, csv_columns, args.delimiter, args.csv and args.skip_header)
+    except FileNotFoundError:
+        print(f"错误: 日志文件 '{args.log_file}' 未找到。", file=sys.stderr)
+        sys.exit(1)
+
+
+def audit_command(args):
+    matcher = build_matcher(args)
+    summary = audit_log_from_args(matcher, args)
+
+    groups = summary['groups']
+    unmatched = summary['unmatched']
+    if args.json:
+        print(json.dumps({
+            'lines': summary['lines'],
+            'invalid': summary['invalid'],
+            'groups': {str(group): count for group, count in groups.most_common()},
+            'unmatched_top': [{'query': query, 'count': count} for query, count in unmatched.most_common(args.top)],
+            'unmatched_error': unmatched.error
+        }, indent=2, ensure_ascii=False))
+        return
+
+    matched = sum(groups.values())
+    print(f"共 {summary['lines']} 条查询，无效 {summary['invalid']} 条。")
+    print("各策略组命中数:")
+    for group, count in groups.most_common():
+        print(f"  {group if group is not None else '(未命中任何规则)'}\t{count}\t{count / matched:.2%}")
+    if matcher.final_index is not None:
+        final_rule = matcher.rules[matcher.final_index]
+        print(f"落到 {final_rule} 的前 {args.top} 个查询" + (f" (计数可能偏小，误差不超过 {unmatched.error}):" if unmatched.error else ":"))
+        for query, count in unmatched.most_common(args.top):
+            print(f"  {query}\t{count}")
+
+
+def _weighted_mean(weights, values):
+    total = sum(weights.values())
+    return sum(count * values[index] for index, count in weights.items()) / total if total else 0.0
+
+
+def rule_statistics(rules, rule_hits=None):
+    """
+    统计规则列表：各类型、各策略组的条数，DOMAIN-KEYWORD 规则的位置，以及逐条匹配时的代价估计。
+    客户端对普通 rules 逐条检查，DOMAIN-KEYWORD 需要对主机名做子串扫描；不带 no-resolve 的 IP-CIDR / GEOIP
+    会让此前没有命中的域名请求先做一次 DNS 解析。rule_hits ({规则序号: 命中数}，来自 audit_log) 不为空时，
+    还按命中频率估计平均检查深度，并用 ss_rules.reorder_rules 给出保持语义的重排建议。返回可直接转为 JSON 的字典。
+    """
+    parsed = [split_rule(rule) for rule in rules]
+    final_index = next((index for index, (rule_type, *_) in enumerate(parsed) if rule_type in NO_VALUE_RULE_TYPES), len(rules))
+    keyword_positions = [index for index, (rule_type, *_) in enumerate(parsed) if rule_type == 'DOMAIN-KEYWORD']
+    first_resolve = next((index for index, (rule_type, _, target, options) in enumerate(parsed)
+                          if rule_type in RESOLVING_RULE_TYPES and target is not None and 'no-resolve' not in options), None)
+
+    groups = collections.OrderedDict()
+    for rule_type, _, target, _ in parsed:
+        groups.setdefault(target, collections.Counter())[rule_type] += 1
+    stats = {
+        'rules': len(rules),
+        'types': dict(collections.Counter(rule_type for rule_type, *_ in parsed).most_common()),
+        'groups': {str(group): {'rules': sum(types.values()), 'types': dict(types.most_common())} for group, types in groups.items()},
+        'keywords': [{'index': index, 'rule': rules[index], 'target': parsed[index][2]} for index in keyword_positions],
+        'worst_case': {
+            'rules_checked': final_index,
+            'keyword_scans': sum(1 for index in keyword_positions if index < final_index),
+            'first_resolving_rule': None if first_resolve is None else {'index': first_resolve, 'rule': rules[first_resolve]}
+        }
+    }
+    if not rule_hits:
+        return stats
+
+    # 第 i 条规则命中时已经检查了 i + 1 条规则、做了 keywords_through[i] 次子串扫描
+    keywords_through = list(itertools.accumulate(1 if rule_type == 'DOMAIN-KEYWORD' else 0 for rule_type, *_ in parsed))
+    depth = [index + 1 for index in range(len(rules))]
+    total = sum(rule_hits.values())
+    order = reorder_rules(rules, rule_hits)
+    new_depth = [0] * len(rules)
+    for position, index in enumerate(order):
+        new_depth[index] = position + 1
+
+    group_hits = collections.defaultdict(collections.Counter)
+    for index, count in rule_hits.items():
+        group_hits[parsed[index][2]][index] = count
+    stats['profile'] = {
+        'requests': total,
+        'average_depth': _weighted_mean(rule_hits, depth),
+        'average_keyword_scans': _weighted_mean(rule_hits, keywords_through),
+        'resolving_share': (sum(count for index, count in rule_hits.items() if first_resolve is not None and index > first_resolve) / total
+                            if total else 0.0),
+        'keyword_scans': {str(index): sum(count for hit, count in rule_hits.items() if hit >= index) for index in keyword_positions},
+        'groups': {str(group): {'hits': sum(hits.values()), 'average_depth': _weighted_mean(hits, depth),
+                                'reordered_depth': _weighted_mean(hits, new_depth)}
+                   for group, hits in sorted(group_hits.items(), key=lambda item: -sum(item[1].values()))},
+        'reordered_average_depth': _weighted_mean(rule_hits, new_depth),
+        'moves': [{'rule': rules[index], 'hits': count, 'from': index + 1, 'to': new_depth[index]}
+                  for index, count in rule_hits.most_common() if new_depth[index] != index + 1]
+    }
+    return stats
+
+
+def stats_command(args):
+    matcher = build_matcher(args)
+    rule_hits = audit_log_from_args(matcher, args)['rules'] if args.log_file else None
+    stats = rule_statistics(matcher.rules, rule_hits)
+    if args.json:
+        print(json.dumps(stats, indent=2, ensure_ascii=False))
+        return
+
+    total = stats['rules']
+    print(f"共 {total} 条规则。")
+    print("按类型:")
+    for rule_type, count in stats['types'].items():
+        print(f"  {rule_type}\t{count}\t{count / total:.1%}")
+    print("按策略组 (按首次出现的顺序):")
+    for group, group_stats in stats['groups'].items():
+        types = ", ".join(f"{rule_type} {count}" for rule_type, count in group_stats['types'].items())
+        print(f"  {group}\t{group_stats['rules']}\t{types}")
+
+    profile = stats.get('profile')
+    keywords = stats['keywords']
+    print(f"DOMAIN-KEYWORD 规则 {len(keywords)} 条，逐条匹配时每条都要对主机名做一次子串扫描"
+          + (" (括号中为扫描到它的请求数):" if profile else ":"))
+    for keyword in keywords[:args.top]:
+        scans = f" ({profile['keyword_scans'][str(keyword['index'])]})" if profile else ""
+        print(f"  第 {keyword['index'] + 1} 条\t{keyword['rule']}{scans}")
+    if len(keywords) > args.top:
+        print(f"  ... 其余 {len(keywords) - args.top} 条")
+
+    worst = stats['worst_case']
+    print(f"最坏情况: 没有命中任何规则的请求要检查 {worst['rules_checked']} 条规则，其中 {worst['keyword_scans']} 次子串扫描。")
+    if worst['first_resolving_rule']:
+        resolving = worst['first_resolving_rule']
+        print(f"  第 {resolving['index'] + 1} 条规则 ({resolving['rule']}) 起会为此前未命中的域名请求做 DNS 解析。")
+
+    if not profile:
+        print("提供访问日志 (--log) 可估计平均检查深度并给出重排建议。")
+        return
+    print(f"按日志中的 {profile['requests']} 个请求估计: 平均检查 {profile['average_depth']:.1f} 条规则，"
+          f"{profile['average_keyword_scans']:.1f} 次子串扫描，{profile['resolving_share']:.1%} 的请求经过第一条触发解析的规则。")
+    print("各策略组 (命中数、平均检查深度、重排后):")
+    for group, group_stats in itertools.islice(profile['groups'].items(), args.top):
+        print(f"  {group}\t{group_stats['hits']}\t{group_stats['average_depth']:.1f}\t{group_stats['reordered_depth']:.1f}")
+    print(f"重排建议: 在互不重叠的规则间按命中数前移 (见 ss2clash.py --reorder-rules)，平均检查深度 "
+          f"{profile['average_depth']:.1f} -> {profile['reordered_average_depth']:.1f}。命中最多且位置变化的规则:")
+    for move in profile['moves'][:args.top]:
+        print(f"  {move['rule']}\t{move['hits']}\t第 {move['from']} 条 -> 第 {move['to']} 条")
+
+
+def add_log_arguments(parser):
+    """audit / stats 共用的日志格式参数。"""
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="使用的进程数 (默认 1)。")
+    parser.add_argument("--csv", action="store_true", help="日志为 CSV 格式，用 --host-column / --ip-column 指定列。")
+    parser.add_argument("--host-column", type=int, help="CSV 中主机名所在的列 (从 1 开始)。")
+    parser.add_argument("--ip-column", type=int, help="CSV 中 IP 所在的列 (从 1 开始)。")
+    parser.add_argument("--delimiter", default=",", help="CSV 分隔符 (默认 ',')。")
+    parser.add_argument("--skip-header", action="store_true", help="CSV 第一行为表头，不计入统计。")
+    parser.add_argument("--geoip", action="append", metavar="CODE=FILE", help="GEOIP 规则使用的网段列表文件 (每行一个网段)，可多次指定。")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="离线模拟 Clash 规则匹配，查询主机名/IP 命中的策略组。")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    query_parser = subparsers.add_parser("query", help="查询若干主机名或 IP 命中的规则。")
+    query_parser.add_argument("config", help="ss2clash.py 生成的 Clash YAML 配置，'-' 表示使用 ss2clash.py 内置模板的规则。")
+    query_parser.add_argument("queries", nargs="*", help="要查询的主机名、IP，或 'host,ip'。")
+    query_parser.add_argument("-i", "--input-file", help="从文件读取查询，每行一条。")
+    query_parser.add_argument("--geoip", action="append", metavar="CODE=FILE", help="GEOIP 规则使用的网段列表文件 (每行一个网段)，可多次指定。未提供时 GEOIP 规则不会命中。")
+    query_parser.set_defaults(func=query_command)
+
+    audit_parser = subparsers.add_parser("audit", help="用访问日志回放规则，统计各策略组命中数和落到 MATCH 的高频主机名。")
+    audit_parser.add_argument("config", help="ss2clash.py 生成的 Clash YAML 配置，'-' 表示使用 ss2clash.py 内置模板的规则。")
+    audit_parser.add_argument("log_file", help="访问日志，默认每行为 'host'、'ip' 或 'host,ip'。")
+    add_log_arguments(audit_parser)
+    audit_parser.add_argument("--top", type=int, default=20, help="列出落到 MATCH 的前若干个查询 (默认 20)。")
+    audit_parser.add_argument("--json", action="store_true", help="以 JSON 输出统计结果。")
+    audit_parser.set_defaults(func=audit_command)
+
+    stats_parser = subparsers.add_parser("stats", help="统计各类型、各策略组的规则数，估计逐条匹配的代价，提供日志时给出重排建议。")
+    stats_parser.add_argument("config", help="ss2clash.py 生成的 Clash YAML 配置，'-' 表示使用 ss2clash.py 内置模板的规则。")
+    stats_parser.add_argument("--log", dest="log_file", help="访问日志 (格式同 audit)，用来估计命中频率。")
+    add_log_arguments(stats_parser)
+    stats_parser.add_argument("--top", type=int, default=20, help="各列表最多列出的条数 (默认 20)。")
+    stats_parser.add_argument("--json", action="store_true", help="以 JSON 输出统计结果。")
+    stats_parser.set_defaults(func=stats_command)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+sing-box 远程 rule-set 的本地缓存：把 ss2singbox.py 模板中 route.rule_set 引用的远程 .srs 预先下载
+(或从本地镜像目录拷贝) 到缓存目录，ss2singbox.py --rule-set-cache 再把这些条目改写为 type: local，
+客户端冷启动时不必再等待几十个 HTTP 请求。
+缓存目录中的 index.json 记录每个 rule-set 的 URL、文件名、sha256、大小以及 ETag / Last-Modified，
+再次 prefetch 时用条件请求重新验证，未变化的文件不会重新下载。
+用法: python3 ss_rule_cache.py prefetch rule-cache [--mirror /path/to/mirror] [--offline]
+      python3 ss_rule_cache.py verify rule-cache
+      python3 ss2singbox.py socks_links.txt -o singbox.json --rule-set-cache rule-cache
+需要与 ss_singbox.py、ss_common.py 放在同一目录。
+"""
+
+import argparse
+import collections
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# 缓存目录中的元数据文件
+CACHE_INDEX_FILE = "index.json"
+CACHE_INDEX_VERSION = 1
+# rule-set format -> 缓存文件的扩展名
+RULE_SET_FORMAT_EXTENSIONS = {'binary': '.srs', 'source': '.json'}
+DOWNLOAD_TIMEOUT = 30
+DOWNLOAD_JOBS = 8
+USER_AGENT = "ss_rule_cache/1.0"
+# 缓存文件的权限：mkstemp 创建的临时文件为 0600，以其他用户运行的 sing-box 服务会读不到 type: local 的 rule-set
+CACHE_FILE_MODE = 0o644
+
+# index.json 中的一个条目：filename 为缓存目录中的文件名，etag / last_modified 为下载时服务器返回的值 (可能为 None)，
+# source 为 'http' 或 'mirror'，fetched 为写入缓存的 Unix 时间
+CachedRuleSet = collections.namedtuple('CachedRuleSet', 'tag url format filename sha256 size etag last_modified source fetched')
+
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_filename(tag, rule_set_format):
+    return tag + RULE_SET_FORMAT_EXTENSIONS.get(rule_set_format, '')
+
+
+def read_cache_index(cache_dir):
+    """
+    读取 index.json，返回 {tag: CachedRuleSet}；文件不存在或版本不符时返回空字典。
+    文件损坏 (如写入中断、不是 JSON 对象或条目字段不符) 时警告一次，同样按空缓存处理，所有 rule-set 保持远程下载。
+    """
+    path = os.path.join(cache_dir, CACHE_INDEX_FILE)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            index = json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (ValueError, OSError) as e:  # json.JSONDecodeError 与 UnicodeDecodeError 都是 ValueError
+        print(f"警告: 无法读取缓存索引 '{path}': {e}，忽略整个缓存。", file=sys.stderr)
+        return {}
+    if isinstance(index, dict) and index.get('version') != CACHE_INDEX_VERSION:
+        return {}
+    try:
+        entries = {tag: CachedRuleSet(tag=tag, **fields) for tag, fields in index.get('rule_sets', {}).items()}
+    except (TypeError, AttributeError):
+        print(f"警告: 缓存索引 '{path}' 格式不正确，忽略整个缓存。", file=sys.stderr)
+        return {}
+    for tag, entry in list(entries.items()):
+        if not valid_cache_entry(entry):
+            print(f"警告: 缓存索引中 rule-set '{tag}' 的条目格式不正确，仍使用远程地址。", file=sys.stderr)
+            del entries[tag]
+    return entries
+
+
+def valid_cache_entry(entry):
+    """
+    index.json 中的条目字段类型是否正确，且 filename 是缓存目录中的普通文件名
+    (不是绝对路径、不含目录分隔符或 '..')，避免被改动的索引让配置引用缓存目录以外的文件。
+    """
+    optional_str = lambda value: value is None or isinstance(value, str)
+    return (all(isinstance(value, str) for value in (entry.tag, entry.url, entry.filename, entry.sha256, entry.source))
+            and isinstance(entry.size, int) and not isinstance(entry.size, bool)
+            and all(optional_str(value) for value in (entry.format, entry.etag, entry.last_modified))
+            and entry.filename not in ('', '.', '..') and os.path.basename(entry.filename) == entry.filename
+            and '/' not in entry.filename and not os.path.isabs(entry.filename))
+
+
+def write_cache_index(cache_dir, entries):
+    """原子地写出 index.json (先写临时文件再替换)。"""
+    index = {'version': CACHE_INDEX_VERSION,
+             'rule_sets': {tag: entry._asdict() for tag, entry in sorted(entries.items())}}
+    for fields in index['rule_sets'].values():
+        del fields['tag']
+    fd, tmp_path = tempfile.mkstemp(prefix=".index-", dir=cache_dir)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        json.dump(index, f, indent=2, ensure_ascii=False)
+    os.chmod(tmp_path, CACHE_FILE_MODE)
+    os.replace(tmp_path, os.path.join(cache_dir, CACHE_INDEX_FILE))
+
+
+def load_rule_set_cache(cache_dir, index=None):
+    """
+    返回缓存中可用的 {tag: CachedRuleSet}：文件存在且 sha256 与 index.json 一致。
+    不一致的条目 (文件缺失、被改动或下载中断) 跳过并警告，对应的 rule-set 保持远程下载。
+    index 为已读取的 read_cache_index() 结果，为 None 时读取 cache_dir 中的 index.json。
+    """
+    if index is None:
+        index = read_cache_index(cache_dir)
+    usable = {}
+    for tag, entry in index.items():
+        path = os.path.join(cache_dir, entry.filename)
+        try:
+            valid = os.path.getsize(path) == entry.size and file_sha256(path) == entry.sha256
+        except OSError:
+            valid = False
+        if valid:
+            usable[tag] = entry
+        else:
+            print(f"警告: 缓存的 rule-set '{tag}' 文件缺失或校验失败，仍使用远程地址。", file=sys.stderr)
+    return usable
+
+
+def remote_rule_sets(singbox_config):
+    """配置 route.rule_set 中 type 为 remote 且带 url 的条目。"""
+    return [entry for entry in singbox_config['route'].get('rule_set', [])
+            if entry.get('type') == 'remote' and entry.get('url')]
+
+
+def mirror_candidates(mirror_dir, entry):
+    """
+    entry 在镜像目录中可能的位置，依次为：<tag>.<扩展名>、<主机名>/<URL 路径> (wget -x 的目录结构)、<URL 路径>。
+    """
+    url = urllib.parse.urlsplit(entry['url'])
+    url_path = urllib.parse.unquote(url.path).lstrip('/')
+    return [os.path.join(mirror_dir, cache_filename(entry['tag'], entry.get('format'))),
+            os.path.join(mirror_dir, url.netloc, *url_path.split('/')),
+            os.path.join(mirror_dir, *url_path.split('/'))]
+
+
+def _store(cache_dir, entry, write, source, etag=None, last_modified=None):
+    """调用 write(f) 把内容写入临时文件，计算 sha256 后原子地替换缓存文件，返回新的 CachedRuleSet。"""
+    filename = cache_filename(entry['tag'], entry.get('format'))
+    fd, tmp_path = tempfile.mkstemp(prefix=".fetch-", dir=cache_dir)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        sha256 = file_sha256(tmp_path)
+        size = os.path.getsize(tmp_path)
+        os.chmod(tmp_path, CACHE_FILE_MODE)
+        os.replace(tmp_path, os.path.join(cache_dir, filename))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return CachedRuleSet(entry['tag'], entry['url'], entry.get('format'), filename, sha256, size,
+                         etag, last_modified, source, int(time.time()))
+
+
+def fetch_rule_set(cache_dir, entry, cached, mirror_dir=None, offline=False, timeout=DOWNLOAD_TIMEOUT):
+    """
+    把一个远程 rule-set 写入缓存，返回 (CachedRuleSet 或 None, 状态说明)。
+    优先从镜像目录拷贝 (内容与缓存相同时不改动)；镜像中没有时，offline 为 False 则用 HTTP 下载，
+    已有缓存时带上 If-None-Match / If-Modified-Since，服务器返回 304 时保留原文件。
+    """
+    if cached is not None and cached.url != entry['url']:
+        cached = None  # 模板中的地址变了，旧缓存不能再用于重新验证
+
+    if mirror_dir:
+        for candidate in mirror_candidates(mirror_dir, entry):
+            if not os.path.isfile(candidate):
+                continue
+            if cached is not None and cached.size == os.path.getsize(candidate) and cached.sha256 == file_sha256(candidate):
+                return cached, "镜像未变化"
+            with open(candidate, 'rb') as f_in:
+                return _store(cache_dir, entry, lambda f_out: shutil.copyfileobj(f_in, f_out), 'mirror'), f"已从镜像拷贝 {candidate}"
+
+    if offline:
+        return cached, "离线模式，镜像中没有该文件" + ("，保留旧缓存" if cached else "")
+
+    request = urllib.request.Request(entry['url'], headers={'User-Agent': USER_AGENT})
+    if cached is not None and cached.source == 'http':
+        if cached.etag:
+            request.add_header('If-None-Match', cached.etag)
+        if cached.last_modified:
+            request.add_header('If-Modified-Since', cached.last_modified)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            fetched = _store(cache_dir, entry, lambda f_out: shutil.copyfileobj(response, f_out), 'http',
+                             response.headers.get('ETag'), response.headers.get('Last-Modified'))
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached, "服务器返回 304，未变化"
+        return cached, f"下载失败: HTTP {e.code}"
+    except (urllib.error.URLError, OSError) as e:
+        return cached, f"下载失败: {e}"
+    if cached is not None and cached.sha256 == fetched.sha256:
+        return fetched, "已重新验证，内容未变化"
+    return fetched, "已下载"
+
+
+def prefetch_command(args):
+    import ss_singbox  # 只需要其中的模板
+
+    singbox_config = json.loads(ss_singbox.SINGBOX_TEMPLATE)
+    entries = remote_rule_sets(singbox_config)
+    skipped = [entry.get('tag') for entry in singbox_config['route'].get('rule_set', [])
+               if entry.get('type') == 'remote' and not entry.get('url')]
+    for tag in skipped:
+        print(f"警告: 模板中的 rule-set '{tag}' 没有 url，无法缓存。", file=sys.stderr)
+
+    os.makedirs(args.cache_dir, exist_ok=True)
+    index = read_cache_index(args.cache_dir)
+    fetch = lambda entry: fetch_rule_set(args.cache_dir, entry, index.get(entry['tag']),
+                                         args.mirror, args.offline, args.timeout)
+    with ThreadPoolExecutor(max(1, args.jobs)) as executor:
+        results = list(executor.map(fetch, entries))
+
+    cached_count = 0
+    for entry, (cached, status) in zip(entries, results):
+        print(f"{entry['tag']}\t{status}")
+        if cached is not None:
+            index[entry['tag']] = cached
+            cached_count += 1
+    write_cache_index(args.cache_dir, index)
+    print(f"{cached_count}/{len(entries)} 个远程 rule-set 已缓存到 '{args.cache_dir}'", file=sys.stderr)
+    if cached_count < len(entries):
+        sys.exit(1)
+
+
+def verify_command(args):
+    index = read_cache_index(args.cache_dir)
+    usable = load_rule_set_cache(args.cache_dir, index)
+    for tag, entry in sorted(usable.items()):
+        print(f"{tag}\t{entry.sha256[:12]}\t{entry.size} 字节\t{entry.source}\t{entry.etag or '-'}")
+    print(f"{len(usable)}/{len(index)} 个缓存条目校验通过。", file=sys.stderr)
+    if len(usable) < len(index):
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="预取 sing-box 模板引用的远程 rule-set，供 ss2singbox.py --rule-set-cache 离线使用。")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prefetch_parser = subparsers.add_parser("prefetch", help="下载或从镜像拷贝远程 rule-set 到缓存目录，已缓存的条目用 ETag / sha256 重新验证。")
+    prefetch_parser.add_argument("cache_dir", help="缓存目录。")
+    prefetch_parser.add_argument("--mirror", metavar="DIR", help="本地镜像目录，优先从这里拷贝 (文件名为 <tag>.srs，或按 URL 的主机名/路径存放)。")
+    prefetch_parser.add_argument("--offline", action="store_true", help="只使用镜像目录，不访问网络。")
+    prefetch_parser.add_argument("-j", "--jobs", type=int, default=DOWNLOAD_JOBS, help=f"同时下载的数量 (默认 {DOWNLOAD_JOBS})。")
+    prefetch_parser.add_argument("--timeout", type=float, default=DOWNLOAD_TIMEOUT, help=f"每个请求的超时秒数 (默认 {DOWNLOAD_TIMEOUT})。")
+    prefetch_parser.set_defaults(func=prefetch_command)
+
+    verify_parser = subparsers.add_parser("verify", help="按 index.json 中的 sha256 校验缓存文件。")
+    verify_parser.add_argument("cache_dir", help="缓存目录。")
+    verify_parser.set_defaults(func=verify_command)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,468 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Clash 规则列表 (如 CLASH_TEMPLATE_YAML 的 rules 段) 的分析与优化工具。
+规则按 Clash 的格式表示为字符串: '类型,值,策略组[,参数...]'，MATCH 为 'MATCH,策略组'。
+所有优化都保持"从上到下、第一条命中的规则生效"的语义不变。
+"""
+
+import collections
+import heapq
+import ipaddress
+import re
+
+IP_CIDR_RULE_TYPES = ('IP-CIDR', 'IP-CIDR6')
+DOMAIN_RULE_TYPES = ('DOMAIN', 'DOMAIN-SUFFIX')
+# 不带值、只有策略组的规则类型
+NO_VALUE_RULE_TYPES = ('MATCH', 'FINAL')
+# 少于这个条数的连续规则不拆成 rule-provider，直接留在 rules 中
+RULE_PROVIDER_MIN_RULES = 10
+# 只能留在主配置 rules 中的规则类型
+INLINE_ONLY_RULE_TYPES = NO_VALUE_RULE_TYPES + ('GEOIP', 'RULE-SET')
+
+# Clash 规则类型 -> sing-box rule-set (headless 规则) 中的字段
+SINGBOX_RULE_FIELDS = {
+    'DOMAIN': 'domain',
+    'DOMAIN-SUFFIX': 'domain_suffix',
+    'DOMAIN-KEYWORD': 'domain_keyword',
+    'IP-CIDR': 'ip_cidr',
+    'IP-CIDR6': 'ip_cidr',
+    'PROCESS-NAME': 'process_name'
+}
+# 这些字段与域名、IP 字段写在同一条 headless 规则中是"且"的关系，需要各自单独成一条
+SINGBOX_SEPARATE_FIELDS = ('process_name',)
+# sing-box source 格式 rule-set 的版本 (2 对应 sing-box 1.10 及以上)
+SINGBOX_RULE_SET_VERSION = 2
+
+# split_rule_providers 的结果：name 为 rule-providers 中的名称，behavior 为 domain / ipcidr / classical，
+# payload 为该 behavior 格式的条目列表
+RuleProvider = collections.namedtuple('RuleProvider', 'name behavior payload')
+# split_rule_lists 的结果：name 为 RULE-SET 引用的名称，lines 为不带策略组的规则行 (Surge .list 等 classical 格式)
+RuleList = collections.namedtuple('RuleList', 'name target lines')
+# split_singbox_rule_sets 的结果：tag 为 route.rule_set 中的标签，source 为 sing-box source 格式的 rule-set 字典
+SingboxRuleSet = collections.namedtuple('SingboxRuleSet', 'tag target source')
+
+
+def split_rule(rule):
+    """
+    把规则字符串拆分为 (类型, 值, 策略组, 参数元组)。
+    MATCH 等没有值的规则，值为 None；格式不完整的规则策略组为 None。
+    """
+    parts = [part.strip() for part in rule.split(',')]
+    rule_type = parts[0].upper()
+    if rule_type in NO_VALUE_RULE_TYPES:
+        return rule_type, None, parts[1] if len(parts) > 1 else None, tuple(parts[2:])
+    if len(parts) < 3:
+        return rule_type, parts[1] if len(parts) > 1 else None, None, ()
+    return rule_type, parts[1], parts[2], tuple(parts[3:])
+
+
+def join_rule(rule_type, value, target, options=()):
+    """split_rule 的逆操作。"""
+    parts = [rule_type] + ([value] if value is not None else []) + [target] + list(options)
+    return ','.join(parts)
+
+
+def normalize_domain(domain):
+    """域名规则按不区分大小写、忽略末尾 '.' 的方式比较。"""
+    return domain.strip().rstrip('.').lower()
+
+
+class DomainTrie:
+    """
+    按标签倒序 (com -> google -> www) 存放 DOMAIN / DOMAIN-SUFFIX 规则的字典树。
+    每个节点是一个 dict：子节点以标签为键，规则以 DomainTrie.SUFFIX / DomainTrie.EXACT 为键，值为规则序号。
+    同一位置只保留最先插入的规则，与 Clash 第一条命中的语义一致。
+    """
+
+    SUFFIX = object()
+    EXACT = object()
+
+    def __init__(self):
+        self.root = {}
+
+    def add(self, domain, suffix, index):
+        """插入一条规则 (suffix 为 True 表示 DOMAIN-SUFFIX)；该位置已有规则时不覆盖。"""
+        node = self.root
+        for label in reversed(normalize_domain(domain).split('.')):
+            node = node.setdefault(label, {})
+        node.setdefault(self.SUFFIX if suffix else self.EXACT, index)
+
+    def match(self, domain, suffix_only=False):
+        """
+        返回能匹配 domain 的规则中序号最小的一个，没有则返回 None。
+        suffix_only 为 True 时只考虑 DOMAIN-SUFFIX 规则，用于判断另一条 DOMAIN-SUFFIX 规则是否被覆盖。
+        """
+        best = None
+        node = self.root
+        for label in reversed(normalize_domain(domain).split('.')):
+            node = node.get(label)
+            if node is None:
+                return best
+            index = node.get(self.SUFFIX)
+            if index is not None and (best is None or index < best):
+                best = index
+        index = None if suffix_only else node.get(self.EXACT)
+        if index is not None and (best is None or index < best):
+            best = index
+        return best
+
+
+def remove_shadowed_domain_rules(rules):
+    """
+    删除永远不会被命中的 DOMAIN-SUFFIX / DOMAIN 规则，返回 (新规则列表, {策略组: 删除条数})。
+    一条规则能匹配的所有域名都已被前面的 DOMAIN-SUFFIX、DOMAIN 或 DOMAIN-KEYWORD 规则匹配时，
+    它在第一条命中的语义下不会再生效，删除后任何请求的匹配结果都不变。
+    被不同策略组的规则覆盖的也一并删除 (它本来就是死规则)，其余规则的相对顺序保持不变。
+    """
+    trie = DomainTrie()
+    keywords = []
+    result = []
+    removed = collections.Counter()
+
+    for rule in rules:
+        rule_type, value, target, _ = split_rule(rule)
+        if rule_type in DOMAIN_RULE_TYPES and value and target is not None:
+            suffix = rule_type == 'DOMAIN-SUFFIX'
+            domain = normalize_domain(value)
+            # DOMAIN-SUFFIX,d 匹配的域名都以 d 结尾，包含 d 的关键字一定也包含在这些域名中
+            if trie.match(domain, suffix_only=suffix) is not None or any(keyword in domain for keyword in keywords):
+                removed[target] += 1
+                continue
+            trie.add(domain, suffix, len(result))
+        elif rule_type == 'DOMAIN-KEYWORD' and value and target is not None:
+            keywords.append(value.lower())
+        result.append(rule)
+
+    return result, dict(removed)
+
+
+def _ip_rule_network(rule):
+    """IP-CIDR / IP-CIDR6 规则的 (分组键, 网段)，其他规则或无法解析的网段返回 None。
+    分组键为 (类型, 策略组, 参数)，只有分组键相同的规则才能合并或互相覆盖。"""
+    rule_type, value, target, options = split_rule(rule)
+    if rule_type not in IP_CIDR_RULE_TYPES or target is None:
+        return None
+    try:
+        network = ipaddress.ip_network(value, strict=False)
+    except ValueError:
+        return None
+    return (rule_type, target, options), network
+
+
+def _resolves(key):
+    """不带 no-resolve 的 IP 规则在匹配域名请求时会先做 DNS 解析。"""
+    return 'no-resolve' not in key[2]
+
+
+def aggregate_ip_cidr_rules(rules):
+    """
+    合并、去重 IP-CIDR / IP-CIDR6 规则，返回新的规则列表。
+    - 网段被前面某条类型、策略组和参数都相同的规则完全覆盖时直接删除：能走到它的请求一定已经命中了前一条。
+    - 连续的一段 IP 规则中，分组键相同的网段按 ipaddress.collapse_addresses 合并，放在该分组首次出现的位置。
+      只有在被前移的网段与中间其他策略组的网段互不重叠、且这一段规则是否触发 DNS 解析
+      (是否带 no-resolve) 一致时才合并；遇到其他类型的规则 (域名、GEOIP 等) 就不再跨越，
+      因为同时带域名和 IP 的请求可能先命中那些规则。
+    """
+    result = []
+    covering = {}  # 分组键 -> 已输出的网段，用于删除被前面规则覆盖的网段
+    segment = {}   # 当前可合并的一段中：分组键 -> 网段列表 (按分组首次出现顺序)
+    segment_resolves = None
+
+    def flush():
+        for key, networks in segment.items():
+            rule_type, target, options = key
+            for network in ipaddress.collapse_addresses(networks):
+                result.append(join_rule(rule_type, str(network), target, options))
+                covering.setdefault(key, []).append(network)
+        segment.clear()
+
+    for rule in rules:
+        parsed = _ip_rule_network(rule)
+        if parsed is None:
+            flush()
+            segment_resolves = None
+            result.append(rule)
+            continue
+
+        key, network = parsed
+        earlier = covering.get(key, []) + segment.get(key, [])
+        if any(network.version == other.version and network.subnet_of(other) for other in earlier):
+            continue
+
+        overlaps_other_group = any(
+            network.version == other.version and network.overlaps(other)
+            for other_key, networks in segment.items() if other_key != key for other in networks
+        )
+        if overlaps_other_group or (segment and _resolves(key) != segment_resolves):
+            flush()
+        segment_resolves = _resolves(key)
+        segment.setdefault(key, []).append(network)
+
+    flush()
+    return result
+
+
+def _provider_behavior(rule_type, value, options):
+    """规则在 rule-provider 中的 (behavior, 条目, 引用时需要的参数)。"""
+    if rule_type == 'DOMAIN-SUFFIX':
+        return 'domain', f"+.{value}", ()
+    if rule_type == 'DOMAIN':
+        return 'domain', value, ()
+    if rule_type in IP_CIDR_RULE_TYPES:
+        # no-resolve 只能加在 RULE-SET 引用上，带与不带的网段要分到不同的 provider
+        return 'ipcidr', value, tuple(option for option in options if option == 'no-resolve')
+    return 'classical', ','.join((rule_type, value) + options), ()
+
+
+def split_rule_providers(rules, min_rules=RULE_PROVIDER_MIN_RULES):
+    """
+    把规则拆分为 rule-provider，返回 (新的 rules 列表, [RuleProvider, ...])。
+    只合并连续且策略组相同的规则：同一段内无论哪条命中结果都一样，因此段内可以按 behavior
+    分成 domain / classical / ipcidr 几个 provider，依次用 RULE-SET 引用 (IP 段放在最后，
+    以免为能被域名规则命中的请求提前做 DNS 解析)；不同段之间的先后顺序保持不变。
+    少于 min_rules 条的段以及 MATCH、GEOIP 等规则保留原样。
+    """
+    result = []
+    providers = []
+    run = []  # 当前连续同策略组的 (类型, 值, 参数) 列表
+    run_target = None
+
+    def flush():
+        if len(run) < min_rules:
+            result.extend(join_rule(rule_type, value, run_target, options) for rule_type, value, options in run)
+        else:
+            grouped = collections.OrderedDict(((behavior, extra), []) for behavior, extra in
+                                              [('domain', ()), ('classical', ()), ('ipcidr', ('no-resolve',)), ('ipcidr', ())])
+            for rule_type, value, options in run:
+                behavior, entry, extra = _provider_behavior(rule_type, value, options)
+                grouped[(behavior, extra)].append(entry)
+            slug = re.sub(r'\W+', '', run_target) or 'group'
+            for (behavior, extra), payload in grouped.items():
+                if not payload:
+                    continue
+                name = f"{len(providers) + 1:02d}_{slug}_{behavior}" + ('_no_resolve' if extra else '')
+                providers.append(RuleProvider(name, behavior, payload))
+                result.append(join_rule('RULE-SET', name, run_target, extra))
+        run.clear()
+
+    for rule in rules:
+        rule_type, value, target, options = split_rule(rule)
+        if rule_type in INLINE_ONLY_RULE_TYPES or target is None or value is None:
+            flush()
+            run_target = None
+            result.append(rule)
+            continue
+        if target != run_target:
+            flush()
+            run_target = target
+        run.append((rule_type, value, options))
+
+    flush()
+    return result, providers
+
+
+def split_rule_lists(rules, min_rules=RULE_PROVIDER_MIN_RULES):
+    """
+    把每一段连续、策略组相同的规则移到一个外部规则列表中，返回 (新的 rules 列表, [RuleList, ...])。
+    与 split_rule_providers 不同，段内规则保持原来的顺序和参数 (如 no-resolve)，
+    因此即使客户端按列表顺序逐条匹配、遇到不带 no-resolve 的 IP 规则时解析域名，结果也与原规则相同。
+    少于 min_rules 条的段以及 MATCH / FINAL、GEOIP 等规则保留原样。
+    """
+    result = []
+    rule_lists = []
+    run = []  # 当前连续同策略组的 (类型, 值, 参数) 列表
+    run_target = None
+
+    def flush():
+        if len(run) < min_rules:
+            result.extend(join_rule(rule_type, value, run_target, options) for rule_type, value, options in run)
+        else:
+            name = f"{len(rule_lists) + 1:02d}_" + (re.sub(r'\W+', '', run_target) or 'group')
+            lines = [','.join((rule_type, value) + options) for rule_type, value, options in run]
+            rule_lists.append(RuleList(name, run_target, lines))
+            result.append(join_rule('RULE-SET', name, run_target))
+        run.clear()
+
+    for rule in rules:
+        rule_type, value, target, options = split_rule(rule)
+        if rule_type in INLINE_ONLY_RULE_TYPES or target is None or value is None:
+            flush()
+            run_target = None
+            result.append(rule)
+            continue
+        if target != run_target:
+            flush()
+            run_target = target
+        run.append((rule_type, value, options))
+
+    flush()
+    return result, rule_lists
+
+
+def split_singbox_rule_sets(rules):
+    """
+    把规则编译为 sing-box source 格式的 rule-set，返回 (新的 rules 列表, [SingboxRuleSet, ...])。
+    每一段连续、策略组相同且 sing-box 支持的规则 (见 SINGBOX_RULE_FIELDS) 编译为一个 rule-set，
+    在新的 rules 列表中以 'RULE-SET,tag,策略组' 代替，段与段之间的先后顺序保持不变。
+    sing-box 的路由规则同样是第一条命中生效，且不会为匹配 ip_cidr 自动解析域名 (相当于 Clash 的 no-resolve)，
+    因此同一段内的域名、IP 条目可以写在同一条 headless 规则中，no-resolve 参数直接丢弃。
+    MATCH、GEOIP 及其他不支持的规则保留原样，由调用方处理。
+    """
+    result = []
+    rule_sets = []
+    run = collections.OrderedDict()  # 当前连续同策略组的规则：sing-box 字段 -> 条目列表
+    run_target = None
+
+    def flush():
+        if run:
+            # 同一段内重复的条目只保留一个 (多个策略组映射到同一出站时会出现)
+            fields = [(field, list(dict.fromkeys(values))) for field, values in run.items()]
+            combined = {field: values for field, values in fields if field not in SINGBOX_SEPARATE_FIELDS}
+            headless_rules = ([combined] if combined else []) + [
+                {field: values} for field, values in fields if field in SINGBOX_SEPARATE_FIELDS]
+            tag = f"clash-{len(rule_sets) + 1:02d}-" + (re.sub(r'\W+', '', run_target).lower() or 'group')
+            rule_sets.append(SingboxRuleSet(tag, run_target, {'version': SINGBOX_RULE_SET_VERSION, 'rules': headless_rules}))
+            result.append(join_rule('RULE-SET', tag, run_target))
+        run.clear()
+
+    for rule in rules:
+        rule_type, value, target, _ = split_rule(rule)
+        field = SINGBOX_RULE_FIELDS.get(rule_type)
+        if field is None or target is None or value is None:
+            flush()
+            run_target = None
+            result.append(rule)
+            continue
+        if target != run_target:
+            flush()
+            run_target = target
+        run.setdefault(field, []).append(value)
+
+    flush()
+    return result, rule_sets
+
+
+def _reorder_segment_key(rule_type, value, target, options):
+    """
+    reorder_rules 中规则所属的段：DOMAIN / DOMAIN-SUFFIX 为 'domain'，IP-CIDR / IP-CIDR6 按是否触发 DNS 解析
+    分为 ('ip', True/False)。其他规则 (关键字、进程、GEOIP、MATCH 等) 与几乎所有规则都可能同时命中，返回 None，位置固定。
+    """
+    if target is None or value is None:
+        return None
+    if rule_type in DOMAIN_RULE_TYPES:
+        return 'domain'
+    if rule_type in IP_CIDR_RULE_TYPES:
+        try:
+            ipaddress.ip_network(value, strict=False)
+        except ValueError:
+            return None
+        return 'ip', 'no-resolve' not in options
+    return None
+
+
+def _domain_conflicts(entries):
+    """
+    entries 为同一段内的 (位置, 规则类型, 值, 策略组)，返回 {位置: 必须排在它前面的位置集合}：
+    两条规则能匹配同一个域名 (相同位置，或一条 DOMAIN-SUFFIX 是另一条的上级) 且策略组不同时，保持原来的先后。
+    """
+    root = {}  # 按标签倒序的字典树，节点中 rules_key 对应的列表为该域名上的 (位置, 是否 DOMAIN-SUFFIX, 策略组)
+    rules_key = DomainTrie.EXACT
+    nodes = []
+    for position, rule_type, value, target in entries:
+        node = root
+        for label in reversed(normalize_domain(value).split('.')):
+            node = node.setdefault(label, {})
+        node.setdefault(rules_key, []).append((position, rule_type == 'DOMAIN-SUFFIX', target))
+        nodes.append(node)
+
+    def subtree(node):
+        for key, child in node.items():
+            if key is rules_key:
+                yield from child
+            else:
+                yield from subtree(child)
+
+    before = {position: set() for position, _, _, _ in entries}
+    for (position, rule_type, value, target), node in zip(entries, nodes):
+        # 路径上的 DOMAIN-SUFFIX (上级) 以及同一位置的规则
+        walk = root
+        labels = list(reversed(normalize_domain(value).split('.')))
+        for depth, label in enumerate(labels):
+            walk = walk[label]
+            for other, other_suffix, other_target in walk.get(rules_key, []):
+                if (other_suffix or depth == len(labels) - 1) and other_target != target and other != position:
+                    first, second = sorted((position, other))
+                    before[second].add(first)
+        # DOMAIN-SUFFIX 覆盖的下级规则
+        if rule_type == 'DOMAIN-SUFFIX':
+            for other, _, other_target in subtree(node):
+                if other_target != target and other != position:
+                    first, second = sorted((position, other))
+                    before[second].add(first)
+    return before
+
+
+def _ip_conflicts(entries):
+    """与 _domain_conflicts 相同，用于 IP 段：网段重叠且策略组不同时保持原来的先后。"""
+    networks = [(position, ipaddress.ip_network(value, strict=False), target) for position, _, value, target in entries]
+    before = {position: set() for position, _, _ in networks}
+    for i, (position, network, target) in enumerate(networks):
+        for other, other_network, other_target in networks[:i]:
+            if other_target != target and network.version == other_network.version and network.overlaps(other_network):
+                before[position].add(other)
+    return before
+
+
+def _reorder_segment(entries, kind, weights):
+    """在冲突约束下对一段规则做拓扑排序，每次取可放置的规则中权重最高的 (相同时取原位置靠前的)。"""
+    before = _domain_conflicts(entries) if kind == 'domain' else _ip_conflicts(entries)
+    after = collections.defaultdict(list)
+    for position, earlier in before.items():
+        for other in earlier:
+            after[other].append(position)
+    waiting = {position: len(earlier) for position, earlier in before.items()}
+    ready = [(-weights.get(position, 0), position) for position, count in waiting.items() if count == 0]
+    heapq.heapify(ready)
+    order = []
+    while ready:
+        _, position = heapq.heappop(ready)
+        order.append(position)
+        for other in after[position]:
+            waiting[other] -= 1
+            if waiting[other] == 0:
+                heapq.heappush(ready, (-weights.get(other, 0), other))
+    return order
+
+
+def reorder_rules(rules, weights):
+    """
+    按命中频率重排规则，返回新顺序下各规则在原列表中的位置 (列表)。weights 为 {原位置: 命中数}。
+    只在连续的 DOMAIN / DOMAIN-SUFFIX 规则段、以及连续且是否触发 DNS 解析一致的 IP-CIDR / IP-CIDR6 规则段内部移动，
+    其他规则和各段的位置不变；段内能匹配同一请求、策略组又不同的两条规则保持原来的先后，
+    其余规则按命中数从高到低尽量前移。任何请求第一条命中的规则可能换成另一条，但策略组不变。
+    """
+    order = []
+    segment = []
+    segment_kind = None
+
+    def flush():
+        if len(segment) > 1:
+            order.extend(_reorder_segment(segment, segment_kind, weights))
+        else:
+            order.extend(position for position, _, _, _ in segment)
+        segment.clear()
+
+    for position, rule in enumerate(rules):
+        rule_type, value, target, options = split_rule(rule)
+        kind = _reorder_segment_key(rule_type, value, target, options)
+        if kind != segment_kind or kind is None:
+            flush()
+            segment_kind = kind
+        if kind is None:
+            order.append(position)
+        else:
+            segment.append((position, rule_type, value, target))
+
+    flush()
+    return order
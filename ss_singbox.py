@@ -0,0 +1,1112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ss2singbox.py 的转换逻辑和 sing-box 模板：解析 SOCKS 链接并生成 sing-box 配置。
+作为模块导入时缓存为 .pyc，命令行入口为 ss2singbox.py。
+需要与 ss_common.py 放在同一目录；--rule-sets 还需要 ss_clash.py、ss_clash_template.py、ss_rules.py，
+--rule-set-cache 还需要 ss_rule_cache.py。
+"""
+
+import argparse
+import sys
+import os
+import json
+import textwrap
+import collections
+import functools
+
+from ss_common import (  # 需与本脚本位于同一目录
+    WarningSummary, ParseWarning, WARN_RENAME, WARNING_EXAMPLE_LIMIT,
+    NameDeduper, SocksNode, IncrementalState, parse_link_file, parse_socks_node,
+    split_fragments, write_fragments, load_cached_fragments, StageProfiler, config_relative_dir,
+    PROXIES_SENTINEL, MEMBERS_SENTINEL, TEMPLATE_CACHE_DIR
+)
+
+# 用户提供的 sing-box JSON 配置模板 (已更新并允许局域网连接)
+SINGBOX_TEMPLATE = """
+{
+  "log": {
+    "level": "info",
+    "timestamp": true
+  },
+  "experimental": {
+    "clash_api": {
+      "external_controller": "0.0.0.0:9095",
+      "external_ui": "ui",
+      "secret": "",
+      "external_ui_download_url": "https://gh-proxy.com/https://github.com/Zephyruso/zashboard/archive/refs/heads/gh-pages.zip",
+      "external_ui_download_detour": "direct",
+      "default_mode": "rule"
+    },
+    "cache_file": {
+      "enabled": true,
+      "store_fakeip": false
+    }
+  },
+  "dns": {
+    "servers": [
+      {
+        "tag": "proxyDns",
+        "address": "tls://8.8.8.8",
+        "detour": "Proxy"
+      },
+      {
+        "tag": "localDns",
+        "address": "https://223.5.5.5/dns-query",
+        "detour": "direct"
+      }
+    ],
+    "rules": [
+      {
+        "outbound": "any",
+        "server": "localDns"
+      },
+      {
+        "rule_set": "geosite-cn",
+        "server": "localDns"
+      },
+      {
+        "clash_mode": "direct",
+        "server": "localDns"
+      },
+      {
+        "clash_mode": "global",
+        "server": "proxyDns"
+      },
+      {
+        "rule_set": "geosite-geolocation-!cn",
+        "server": "proxyDns"
+      }
+    ],
+    "final": "localDns",
+    "strategy": "ipv4_only"
+  },
+  "inbounds": [
+    {
+      "tag": "tun-in",
+      "type": "tun",
+      "address": [
+        "172.19.0.0/30"
+      ],
+      "mtu": 9000,
+      "auto_route": true,
+      "strict_route": true,
+      "stack": "system",
+      "platform": {
+        "http_proxy": {
+          "enabled": true,
+          "server": "127.0.0.1",
+          "server_port": 2080
+        }
+      }
+    },
+        {
+      "tag": "mixed-in",
+      "type": "mixed",
+      "listen": "0.0.0.0",
+      "listen_port": 10233
+    }
+  ],
+  "outbounds": [
+    {
+      "tag": "Proxy",
+      "type": "selector",
+      "outbounds": [
+        "auto",
+        "direct"
+      ]
+    },
+    {
+      "tag": "OpenAI",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Google",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Telegram",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Twitter",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Facebook",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "BiliBili",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ]
+    },
+    {
+      "tag": "Bahamut",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Spotify",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ]
+    },
+    {
+      "tag": "TikTok",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Netflix",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Disney+",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "Apple",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ]
+    },
+    {
+      "tag": "Microsoft",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ]
+    },
+    {
+      "tag": "Games",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ]
+    },
+    {
+      "tag": "Streaming",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ]
+    },
+    {
+      "tag": "Global",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "CHINA",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ]
+    },
+    {
+      "tag": "Others",
+      "type": "selector",
+      "outbounds": [
+        "direct",
+        "Proxy"
+      ],
+      "default": "Proxy"
+    },
+    {
+      "tag": "auto",
+      "type": "urltest",
+      "outbounds": [
+      ],
+      "url": "http://clients3.google.com/generate_204",
+      "interval": "10m",
+      "tolerance": 150
+    },
+    {
+      "type": "direct",
+      "tag": "direct"
+    }
+  ],
+  "route": {
+    "auto_detect_interface": true,
+    "final": "Proxy",
+    "rules": [
+      {
+        "inbound": [
+          "tun-in",
+          "mixed-in"
+        ],
+        "action": "sniff"
+      },
+      {
+        "type": "logical",
+        "mode": "or",
+        "rules": [
+          {
+            "port": 53
+          },
+          {
+            "protocol": "dns"
+          }
+        ],
+        "action": "hijack-dns"
+      },
+      {
+        "rule_set": "geosite-category-ads-all",
+        "clash_mode": "rule",
+        "action": "reject"
+      },
+      {
+        "rule_set": "geosite-category-ads-all",
+        "clash_mode": "global",
+        "outbound": "Proxy"
+      },
+      {
+        "clash_mode": "direct",
+        "outbound": "direct"
+      },
+      {
+        "clash_mode": "global",
+        "outbound": "Proxy"
+      },
+      {
+        "domain": [
+          "clash.razord.top",
+          "yacd.metacubex.one",
+          "yacd.haishan.me",
+          "d.metacubex.one",
+          "cdn.393633.xyz"
+        ],
+        "outbound": "direct"
+      },
+      {
+        "ip_is_private": true,
+        "outbound": "direct"
+      },
+      {
+        "rule_set": "geosite-openai",
+        "outbound": "OpenAI"
+      },
+      {
+        "rule_set": [
+          "geosite-youtube",
+          "geoip-google",
+          "geosite-google",
+          "geosite-github"
+        ],
+        "outbound": "Google"
+      },
+      {
+        "rule_set": [
+          "geoip-telegram",
+          "geosite-telegram"
+        ],
+        "outbound": "Telegram"
+      },
+      {
+        "rule_set": [
+          "geoip-twitter",
+          "geosite-twitter"
+        ],
+        "outbound": "Twitter"
+      },
+      {
+        "rule_set": [
+          "geoip-facebook",
+          "geosite-facebook"
+        ],
+        "outbound": "Facebook"
+      },
+      {
+        "rule_set": "geosite-bilibili",
+        "outbound": "BiliBili"
+      },
+      {
+        "rule_set": "geosite-bahamut",
+        "outbound": "Bahamut"
+      },
+      {
+        "rule_set": "geosite-spotify",
+        "outbound": "Spotify"
+      },
+      {
+        "rule_set": "geosite-tiktok",
+        "outbound": "TikTok"
+      },
+      {
+        "rule_set": [
+          "geoip-netflix",
+          "geosite-netflix"
+        ],
+        "outbound": "Netflix"
+      },
+      {
+        "rule_set": "geosite-disney",
+        "outbound": "Disney+"
+      },
+      {
+        "rule_set": [
+          "geoip-apple",
+          "geosite-apple",
+          "geosite-amazon"
+        ],
+        "outbound": "Apple"
+      },
+      {
+        "rule_set": "geosite-microsoft",
+        "outbound": "Microsoft"
+      },
+      {
+        "rule_set": [
+          "geosite-category-games",
+          "geosite-dmm"
+        ],
+        "outbound": "Games"
+      },
+      {
+        "rule_set": [
+          "geosite-hbo",
+          "geosite-primevideo"
+        ],
+        
+        "domain": [
+            "hxd.as174.de"
+            ],
+        "outbound": "Streaming"
+      },
+      {
+        "rule_set": "geosite-geolocation-!cn",
+        "outbound": "Global"
+      },
+      {
+        "rule_set": [
+          "geoip-cn",
+          "geosite-cn"
+        ],
+        "outbound": "CHINA"
+      }
+    ],
+    "rule_set": [
+      {
+        "tag": "geosite-category-ads-all",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/category-ads-all.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-openai",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/Toperlock/sing-box-geosite@main/rule/OpenAI.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-youtube",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/youtube.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geoip-google",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geoip/google.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-google",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/google.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-github",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/github.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geoip-telegram",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geoip/telegram.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-telegram",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/telegram.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geoip-twitter",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geoip/twitter.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-twitter",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/twitter.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geoip-facebook",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geoip/facebook.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-facebook",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/facebook.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-bilibili",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/bilibili.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-bahamut",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/bahamut.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-spotify",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/spotify.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-tiktok",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/tiktok.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geoip-netflix",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geoip/netflix.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-netflix",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/netflix.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-disney",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/disney.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geoip-apple",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo-lite/geoip/apple.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-apple",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/apple.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-amazon",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/amazon.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-microsoft",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/microsoft.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-category-games",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/category-games.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-dmm",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/dmm.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-hbo",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/hbo.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-primevideo",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/primevideo.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-geolocation-!cn",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/geolocation-!cn.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geoip-cn",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geoip/cn.srs",
+        "download_detour": "direct"
+      },
+      {
+        "tag": "geosite-cn",
+        "type": "remote",
+        "format": "binary",
+        "url": "https://testingcf.jsdelivr.net/gh/MetaCubeX/meta-rules-dat@sing/geo/geosite/cn.srs",
+        "download_detour": "direct"
+      }
+    ]
+  }
+}
+"""
+
+def singbox_outbound_from_node(node):
+    """将 ss_common.SocksNode 转换为sing-box出站（outbound）字典。"""
+    return {
+        'type': 'socks',
+        'tag': node.name,
+        'server': node.server,
+        'server_port': node.port,
+        'version': '5'
+    }
+
+
+def parse_socks_to_singbox_outbound(line_number, link_string):
+    """
+    解析单条SOCKS链接字符串并转换为sing-box出站（outbound）字典。
+    """
+    node = parse_socks_node(line_number, link_string)
+    return singbox_outbound_from_node(node) if node else None
+
+
+# ss2clash.py 模板中的策略组 -> 本模板中对应的出站；值为 None 的策略组编译为 reject 动作
+CLASH_GROUP_OUTBOUNDS = {
+    '🚀 节点选择': 'Proxy',
+    '📲 Telegram': 'Telegram',
+    '📹 YouTube': 'Google',
+    '🎥 Netflix': 'Netflix',
+    '🎥 Disney+': 'Disney+',
+    '📺 巴哈姆特': 'Bahamut',
+    '📺 哔哩哔哩': 'BiliBili',
+    '📺 EMBY': 'Streaming',
+    '🌍 国外媒体': 'Streaming',
+    '🌏 国内媒体': 'CHINA',
+    '📢 谷歌 FCM': 'Google',
+    '😺 GitHub': 'Global',
+    'Ⓜ️ 微软云盘': 'Microsoft',
+    'Ⓜ️ 微软服务': 'Microsoft',
+    '🍎 苹果服务': 'Apple',
+    '🎮 游戏平台': 'Games',
+    '🎶 ChatGPT': 'OpenAI',
+    '🎯 全球直连': 'direct',
+    '🛑 广告拦截': None,
+    '🍃 应用净化': None,
+    '🐟 漏网之鱼': 'Proxy',
+    'DIRECT': 'direct',
+    'REJECT': None
+}
+# 未在 CLASH_GROUP_OUTBOUNDS 中列出的策略组使用的出站
+DEFAULT_RULE_SET_OUTBOUND = 'Proxy'
+# 编译规则时代表 reject 动作的策略组名
+REJECT_TARGET = 'REJECT'
+# --rule-set-format 对应的扩展名：binary 为 sing-box rule-set compile 生成的 .srs，source 为 JSON
+LOCAL_RULE_SET_EXTENSIONS = {'binary': '.srs', 'source': '.json'}
+
+# sing-box 路由规则中与 rule_set 同属一组 (组内任一字段命中即可) 的目标地址字段，以及只描述动作的字段；
+# 其余字段 (clash_mode、inbound 等) 与 rule_set 是“且”的关系
+ROUTE_RULE_DESTINATION_FIELDS = frozenset(('domain', 'domain_suffix', 'domain_keyword', 'domain_regex', 'ip_cidr', 'ip_is_private'))
+ROUTE_RULE_ACTION_FIELDS = frozenset(('action', 'outbound'))
+# apply_local_rule_sets 生成的路由规则改变时加一，使已缓存的 --rule-sets 模板片段失效
+LOCAL_RULE_SETS_VERSION = 2
+
+# --rule-sets 的参数：directory 为写出 rule-set 文件的目录，path_prefix 为配置中引用这些文件的路径前缀，
+# format 为 binary / source，optimize_rules 为 True 时先按 ss2clash.py --optimize-rules 精简规则，
+# cache_dir 为 ss2clash.py 的模板缓存目录 (--no-template-cache 时为 None)
+LocalRuleSetOptions = collections.namedtuple('LocalRuleSetOptions', 'directory path_prefix format optimize_rules cache_dir')
+
+
+@functools.lru_cache(maxsize=None)
+def clash_local_rule_sets(optimize_rules=False, cache_dir=TEMPLATE_CACHE_DIR):
+    """
+    把 ss2clash.py 模板的规则按 CLASH_GROUP_OUTBOUNDS 映射到本模板的出站，并编译为 rule-set
+    (见 ss_rules.split_singbox_rule_sets)，返回 (路由规则列表, [SingboxRuleSet, ...], final 出站)。
+    路由规则按 Clash 规则的顺序排列；GEOIP 规则引用模板中同名的 geoip-<国家代码> rule-set。
+    cache_dir 为 ss2clash.py 模板解析结果的缓存目录，为 None 时直接解析模板。同一进程内只计算一次，警告也只打印一次。
+    """
+    import ss_clash  # 模板很大，只在使用 --rule-sets 时导入
+    from ss_rules import NO_VALUE_RULE_TYPES, split_rule, join_rule, split_singbox_rule_sets
+
+    rules = ss_clash.optimized_template_rules(cache_dir) if optimize_rules else ss_clash.load_clash_template(cache_dir)['rules']
+    mapped = []
+    unknown_groups = collections.Counter()
+    for rule in rules:
+        rule_type, value, target, options = split_rule(rule)
+        if target is None:
+            continue
+        if target not in CLASH_GROUP_OUTBOUNDS:
+            unknown_groups[target] += 1
+        outbound = CLASH_GROUP_OUTBOUNDS.get(target, DEFAULT_RULE_SET_OUTBOUND) or REJECT_TARGET
+        mapped.append(join_rule(rule_type, value, outbound, options))
+    for group, count in unknown_groups.items():
+        print(f"警告: 策略组 '{group}' 没有对应的 sing-box 出站，{count} 条规则改用 '{DEFAULT_RULE_SET_OUTBOUND}'。", file=sys.stderr)
+
+    compiled, rule_sets = split_singbox_rule_sets(mapped)
+    route_rules = []
+    skipped = collections.Counter()
+    final = None
+    for rule in compiled:
+        rule_type, value, target, _ = split_rule(rule)
+        if rule_type in NO_VALUE_RULE_TYPES:
+            final = target
+            break  # MATCH 之后的规则不会被命中
+        if rule_type == 'RULE-SET':
+            tag = value
+        elif rule_type == 'GEOIP':
+            tag = f"geoip-{value.lower()}"
+        else:
+            skipped[rule_type] += 1
+            continue
+        route_rules.append({'rule_set': tag, 'action': 'reject'} if target == REJECT_TARGET else {'rule_set': tag, 'outbound': target})
+    for rule_type, count in skipped.items():
+        print(f"警告: sing-box rule-set 不支持 {rule_type} 规则，已跳过 {count} 条。", file=sys.stderr)
+    return route_rules, rule_sets, final
+
+
+def local_rule_set_filename(tag, options):
+    return tag + LOCAL_RULE_SET_EXTENSIONS[options.format]
+
+
+def strip_template_rule_set(rule):
+    """
+    --rule-sets 下模板中一条路由规则的去留，返回保留的规则或 None：
+    不引用 rule-set 的原样保留；只有 rule_set 和动作的由编译出的规则替代，返回 None；
+    还带有 domain 等目标地址字段的只去掉 rule_set (这些字段 Clash 规则中没有)；
+    还带有 clash_mode 等其他条件的原样保留，仍引用远程 rule-set，单独去掉 rule_set 会让它匹配所有流量。
+    """
+    if 'rule_set' not in rule:
+        return rule
+    fields = rule.keys() - {'rule_set'} - ROUTE_RULE_ACTION_FIELDS
+    if not fields:
+        return None
+    if fields <= ROUTE_RULE_DESTINATION_FIELDS:
+        return {key: value for key, value in rule.items() if key != 'rule_set'}
+    return rule
+
+
+def apply_local_rule_sets(singbox_config, options):
+    """
+    把模板中只按远程 rule-set 分流的路由规则替换为 clash_local_rule_sets 编译出的本地 rule-set (type: local)。
+    模板中其余的路由规则按原顺序保留在前面 (见 strip_template_rule_set)；
+    DNS 规则、保留的模板规则和 GEOIP 仍引用的远程 rule-set 保留，其余远程 rule-set 删除，启动时不再下载。
+    返回 [SingboxRuleSet, ...] 供 write_local_rule_set_files 写出。
+    """
+    route = singbox_config['route']
+    route_rules, rule_sets, final = clash_local_rule_sets(options.optimize_rules, options.cache_dir)
+    remote_rule_sets = {entry['tag']: entry for entry in route['rule_set']}
+    local_tags = {rule_set.tag for rule_set in rule_sets}
+
+    compiled = []
+    for rule in route_rules:
+        if rule['rule_set'] in local_tags or rule['rule_set'] in remote_rule_sets:
+            compiled.append(dict(rule))
+        else:
+            print(f"警告: 模板中没有 rule-set '{rule['rule_set']}'，已跳过对应的 GEOIP 规则。", file=sys.stderr)
+    template_rules = [kept for kept in map(strip_template_rule_set, route['rules']) if kept is not None]
+    route['rules'] = template_rules + compiled
+    if final:
+        route['final'] = final
+
+    referenced = set()
+    for rule in singbox_config['dns']['rules'] + route['rules']:
+        tags = rule.get('rule_set', [])
+        referenced.update([tags] if isinstance(tags, str) else tags)
+    route['rule_set'] = [
+        {'tag': rule_set.tag, 'type': 'local', 'format': options.format,
+         'path': f"{options.path_prefix}/{local_rule_set_filename(rule_set.tag, options)}"}
+        for rule_set in rule_sets
+    ] + [entry for tag, entry in remote_rule_sets.items() if tag in referenced]
+    return rule_sets
+
+
+def write_local_rule_set_files(rule_sets, options):
+    """
+    把 rule-set 写到 options.directory。source JSON 总是写出；binary 格式再调用
+    sing-box rule-set compile 编译为 .srs，需要 PATH 中有 sing-box。
+    """
+    os.makedirs(options.directory, exist_ok=True)
+    for rule_set in rule_sets:
+        source_path = os.path.join(options.directory, rule_set.tag + LOCAL_RULE_SET_EXTENSIONS['source'])
+        with open(source_path, 'w', encoding='utf-8') as f_out:
+            json.dump(rule_set.source, f_out, indent=2, ensure_ascii=False)
+        if options.format == 'binary':
+            import shutil  # 只有 binary 格式用到，不在启动时导入
+            import subprocess
+
+            binary_path = os.path.join(options.directory, local_rule_set_filename(rule_set.tag, options))
+            subprocess.run([shutil.which('sing-box'), 'rule-set', 'compile', '--output', binary_path, source_path],
+                           check=True, capture_output=True)
+
+
+# --rule-set-cache 的参数：path_prefix 为配置中引用缓存目录的路径前缀，
+# entries 为 ((tag, url, 文件名, sha256), ...)，缓存内容变化时增量模式的模板片段随之失效
+RuleSetCacheOptions = collections.namedtuple('RuleSetCacheOptions', 'path_prefix entries')
+
+
+def rule_set_cache_options(cache_dir, output_file):
+    """读取并校验 ss_rule_cache.py 预取的缓存，返回 RuleSetCacheOptions。"""
+    from ss_rule_cache import load_rule_set_cache  # 需与本脚本位于同一目录；只有 --rule-set-cache 用到 (导入 urllib.request 较慢)
+
+    cached = load_rule_set_cache(cache_dir)
+    entries = tuple((entry.tag, entry.url, entry.filename, entry.sha256) for _, entry in sorted(cached.items()))
+    return RuleSetCacheOptions(config_relative_dir(cache_dir, output_file), entries)
+
+
+def apply_rule_set_cache(singbox_config, options):
+    """
+    把 route.rule_set 中已缓存 (tag 和 url 都与缓存一致) 的远程 rule-set 改写为 type: local，
+    引用它们的路由规则和 DNS 规则不变；未缓存的仍从远程下载。
+    """
+    cached = {tag: (url, filename) for tag, url, filename, _ in options.entries}
+    rule_sets = singbox_config['route'].get('rule_set', [])
+    for i, entry in enumerate(rule_sets):
+        url, filename = cached.get(entry['tag'], (None, None))
+        if entry.get('type') == 'remote' and url is not None and url == entry.get('url'):
+            rule_sets[i] = {'tag': entry['tag'], 'type': 'local', 'format': entry['format'],
+                            'path': f"{options.path_prefix}/{filename}"}
+
+
+def build_singbox_config(outbounds_list, outbound_tags, local_rule_sets=None, rule_set_cache=None):
+    """
+    加载sing-box模板，把节点加入 'auto' 和 'Proxy' 组，并追加到出站列表末尾。
+    local_rule_sets (LocalRuleSetOptions) 不为空时，路由规则改用 ss2clash.py 规则编译出的本地 rule-set；
+    rule_set_cache (RuleSetCacheOptions) 不为空时，其余远程 rule-set 中已缓存的改为引用本地缓存。
+    """
+    singbox_config = json.loads(SINGBOX_TEMPLATE)
+    if local_rule_sets:
+        apply_local_rule_sets(singbox_config, local_rule_sets)
+    if rule_set_cache:
+        apply_rule_set_cache(singbox_config, rule_set_cache)
+
+    # 找到 'auto' (url-test) 和 'Proxy' (selector) 组
+    auto_group = next((item for item in singbox_config['outbounds'] if item.get('tag') == 'auto'), None)
+    proxy_group = next((item for item in singbox_config['outbounds'] if item.get('tag') == 'Proxy'), None)
+
+    if auto_group:
+        auto_group['outbounds'].extend(outbound_tags)
+    else:
+        print("警告: 在模板中未找到 tag 为 'auto' 的 url-test 出站组。", file=sys.stderr)
+
+    if proxy_group:
+        proxy_group['outbounds'].extend(outbound_tags)
+    else:
+        print("警告: 在模板中未找到 tag 为 'Proxy' 的 selector 出站组。", file=sys.stderr)
+
+    # 将所有解析出的代理添加到主出站列表中
+    singbox_config['outbounds'].extend(outbounds_list)
+
+    return singbox_config
+
+
+# 'auto' / 'Proxy' 组成员在 json.dumps(config, indent=2) 输出中的缩进
+SINGBOX_MEMBER_INDENT = ' ' * 8
+
+
+def _json_scalar(value):
+    """与 json.dumps(value, ensure_ascii=False) 相同；字符串和整数不经过 json.dumps，省去每次新建编码器的开销。"""
+    if isinstance(value, str):
+        return json.encoder.encode_basestring(value)
+    if type(value) is int:
+        return str(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def singbox_outbound_piece(outbound):
+    """出站字典位于模板 outbounds 列表中时的 JSON 文本，缩进与 json.dumps(config, indent=2) 一致。"""
+    if any(isinstance(value, (dict, list)) for value in outbound.values()):
+        return textwrap.indent(json.dumps(outbound, indent=2, ensure_ascii=False), ' ' * 4)
+    # 节点出站只有标量字段，逐个编码后按缩进拼接，比整体带缩进的 json.dumps (纯 Python 实现) 快得多
+    fields = ',\n'.join(f'      {_json_scalar(key)}: {_json_scalar(value)}' for key, value in outbound.items())
+    return f'    {{\n{fields}\n    }}'
+
+
+def singbox_member_piece(tag):
+    """出站组成员在 JSON 输出中的一行 (不含逗号和换行)。"""
+    return SINGBOX_MEMBER_INDENT + _json_scalar(tag)
+
+
+def singbox_template_fragments(local_rule_sets=None, rule_set_cache=None):
+    """
+    用占位节点渲染模板，切分为静态片段和 ('outbounds', ',\\n')、('members', ',\\n') 两类占位。
+    在占位处拼接 singbox_outbound_piece / singbox_member_piece 的结果，即得到与完整 json.dumps 相同的输出。
+    """
+    sentinel_outbound = singbox_outbound_from_node(SocksNode(PROXIES_SENTINEL, PROXIES_SENTINEL, 1))
+    singbox_config = build_singbox_config([sentinel_outbound], [MEMBERS_SENTINEL], local_rule_sets, rule_set_cache)
+    return split_fragments(json.dumps(singbox_config, indent=2, ensure_ascii=False), {
+        singbox_outbound_piece(sentinel_outbound): ('outbounds', ',\n'),
+        singbox_member_piece(MEMBERS_SENTINEL): ('members', ',\n')
+    })
+
+
+def singbox_fragments_key(local_rule_sets=None, rule_set_cache=None):
+    """模板片段的缓存键：模板内容的哈希加上所有影响渲染结果的选项 (本地 rule-set 的目录和模板缓存目录不影响配置内容)。"""
+    import hashlib
+
+    template_digest = hashlib.sha256(SINGBOX_TEMPLATE.encode('utf-8'))
+    if local_rule_sets:
+        from ss_clash_template import CLASH_TEMPLATE_YAML  # 路由规则来自 ss2clash.py 的模板，它改动后片段也要重新生成
+        template_digest.update(CLASH_TEMPLATE_YAML.encode('utf-8'))
+        template_digest.update(str(LOCAL_RULE_SETS_VERSION).encode('ascii'))
+    return (template_digest.hexdigest(), local_rule_sets and tuple(local_rule_sets[1:4]), rule_set_cache)
+
+
+def singbox_cached_fragments(cache_dir=TEMPLATE_CACHE_DIR, local_rule_sets=None, rule_set_cache=None):
+    """
+    singbox_template_fragments 的结果，静态片段为 bytes 并缓存在 cache_dir (见 ss_common.load_cached_fragments)，
+    缓存命中时不再解析和序列化模板。
+    """
+    return load_cached_fragments(cache_dir, 'singbox', singbox_fragments_key(local_rule_sets, rule_set_cache),
+                                 lambda: singbox_template_fragments(local_rule_sets, rule_set_cache))
+
+
+def write_singbox_spliced(fragments, nodes, outbound_tags, out):
+    """
+    拼接模式的输出，out 为二进制流：在 singbox_cached_fragments 的静态片段之间只序列化出站和组成员。
+    输出与 build_singbox_config 后完整 json.dumps 的结果逐字节相同。
+    """
+    write_fragments(fragments, {
+        'outbounds': (singbox_outbound_piece(singbox_outbound_from_node(node)) for node in nodes),
+        'members': (singbox_member_piece(tag) for tag in outbound_tags)
+    }, out)
+
+
+def write_singbox_incremental(nodes, outbound_tags, out, state, local_rule_sets=None, rule_set_cache=None):
+    """
+    增量模式的输出：模板的静态片段和未变化节点的文本取自 state (ss_common.IncrementalState)，
+    只渲染新增或改动的节点。输出与完整生成的 JSON 逐字节相同。
+    """
+    fragments = state.fragments(singbox_fragments_key(local_rule_sets, rule_set_cache),
+                                lambda: singbox_template_fragments(local_rule_sets, rule_set_cache))
+    pieces = {
+        'outbounds': [state.piece(('outbound', node.name, node.server, node.port),
+                                  lambda node=node: singbox_outbound_piece(singbox_outbound_from_node(node)))
+                      for node in nodes],
+        'members': [state.piece(('member', tag), lambda tag=tag: singbox_member_piece(tag))
+                    for tag in outbound_tags]
+    }
+    write_fragments(fragments, pieces, out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="将TXT文件中的SOCKS链接转换为sing-box JSON配置。")
+    parser.add_argument("input_file", help="包含SOCKS链接的TXT文件路径 (每行一个链接)。")
+    parser.add_argument("-o", "--output-file", help="保存生成的sing-box JSON文件的路径。如果未提供，则打印到标准输出。")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="解析链接使用的进程数 (默认 1)。超大文件可设为CPU核数，输出与单进程完全一致。")
+    parser.add_argument("--rule-sets", metavar="DIR", help="把 ss2clash.py 的模板规则按出站编译为本地 rule-set 写入 DIR，按远程 rule-set 分流的路由规则改为引用这些 type: local 的 rule-set。DNS 规则和带 clash_mode 等条件的模板规则仍使用远程 geosite rule-set。")
+    parser.add_argument("--rule-set-format", choices=list(LOCAL_RULE_SET_EXTENSIONS), default="binary", help="本地 rule-set 的格式 (默认 binary，即 .srs，需要 PATH 中有 sing-box)。source 格式的 JSON 总会一并写出。")
+    parser.add_argument("--optimize-rules", action="store_true", help="编译前按 ss2clash.py --optimize-rules 精简规则，匹配结果不变。")
+    parser.add_argument("--rule-set-cache", metavar="DIR", help="ss_rule_cache.py prefetch 生成的缓存目录。已缓存且校验通过的远程 rule-set 改为 type: local 引用缓存文件。")
+    parser.add_argument("--no-template-cache", action="store_true", help="不读写模板片段缓存，每次都重新解析和序列化内置JSON模板。")
+    parser.add_argument("--state", help="增量模式的状态文件路径。未变化的链接和模板片段直接复用上次的结果 (此模式下忽略 --jobs)。")
+    parser.add_argument("--warning-limit", type=int, default=WARNING_EXAMPLE_LIMIT, metavar="N", help=f"每种警告 (无效协议、缺少主机或端口、解析错误、重名) 只显示前 N 条，其余只计数并在最后汇总 (默认 {WARNING_EXAMPLE_LIMIT})。")
+    parser.add_argument("--warnings-json", metavar="FILE", help="把按原因汇总的警告 (条数和前 N 条示例) 写为 JSON 文件。")
+    parser.add_argument("--profile", action="store_true", help="在标准错误中报告各阶段的墙钟时间、CPU 时间和峰值内存 (tracemalloc 会明显拖慢运行)。")
+    parser.add_argument("--profile-output", help="同时用 cProfile 记录运行过程，并把 pstats 结果写入该文件 (隐含 --profile)。")
+
+    args = parser.parse_args()
+
+    nodes = []
+    deduper = NameDeduper() # 用于检查重名和添加到策略组
+    outbound_tags = deduper.names
+    state = IncrementalState(args.state, 'singbox') if args.state else None
+    profiler = StageProfiler(args.profile, args.profile_output)
+    warnings = WarningSummary(args.warning_limit)  # 按原因计数，只保留前 N 条示例，内存占用与输入大小无关
+    cache_dir = None if args.no_template_cache else TEMPLATE_CACHE_DIR
+
+    local_rule_sets = None
+    if args.rule_sets:
+        rule_set_format = args.rule_set_format
+        import shutil
+
+        if rule_set_format == 'binary' and not shutil.which('sing-box'):
+            print("警告: PATH 中未找到 sing-box，无法编译 .srs，改用 source 格式的 rule-set。", file=sys.stderr)
+            rule_set_format = 'source'
+        # 配置中的 rule-set 路径相对于配置文件所在目录 (sing-box 以 -D 指定的工作目录解析相对路径)
+        path_prefix = config_relative_dir(args.rule_sets, args.output_file)
+        local_rule_sets = LocalRuleSetOptions(args.rule_sets, path_prefix, rule_set_format, args.optimize_rules, cache_dir)
+    rule_set_cache = None
+    if args.rule_set_cache:
+        rule_set_cache = rule_set_cache_options(args.rule_set_cache, args.output_file)
+        print(f"rule-set 缓存: '{args.rule_set_cache}' 中有 {len(rule_set_cache.entries)} 个可用的 rule-set。", file=sys.stderr)
+
+    try:
+        with profiler.stage("parse"):  # 读取、解析和去重
+            node_source = state.iter_nodes(args.input_file, warnings) if state else parse_link_file(args.input_file, args.jobs, warnings)
+            for line_number, node in node_source:
+                # 处理潜在的重名节点
+                original_tag = node.name
+                tag_to_check = deduper.claim(original_tag)
+            
+                if tag_to_check != original_tag:
+                    warnings(ParseWarning(WARN_RENAME, line_number, f"代理标签(tag) '{original_tag}' 重复。已重命名为 '{tag_to_check}'。"))
+                    node.name = tag_to_check
+            
+                nodes.append(node)
+
+    except FileNotFoundError:
+        print(f"错误: 输入文件 '{args.input_file}' 未找到。", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"错误: 读取或处理文件 '{args.input_file}' 时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    warnings.report()
+    if args.warnings_json:
+        warnings.write_json(args.warnings_json)
+
+    if not nodes:
+        print("输入文件中未找到有效的SOCKS链接。未生成sing-box配置。", file=sys.stderr)
+        sys.exit(0)
+
+    binary = False
+    if state:
+        # 增量模式：模板静态片段和未变化节点的文本直接复用，只渲染改动的部分
+        render = lambda out: write_singbox_incremental(nodes, outbound_tags, out, state, local_rule_sets, rule_set_cache)
+    else:
+        # 模板的静态片段 (优先使用磁盘缓存) 之间只拼接出站和组成员，片段缓存失效时才重新序列化模板
+        with profiler.stage("template"):
+            fragments = singbox_cached_fragments(cache_dir, local_rule_sets, rule_set_cache)
+        binary = True
+        render = lambda out: write_singbox_spliced(fragments, nodes, outbound_tags, out)
+
+    try:
+        # 生成JSON输出
+        with profiler.stage("write"):  # 序列化并写出
+            if args.output_file:
+                with (open(args.output_file, 'wb') if binary else open(args.output_file, 'w', encoding='utf-8')) as f_out:
+                    render(f_out)
+                print(f"sing-box 配置已成功写入到 '{args.output_file}'")
+            else:
+                # 如果有警告信息，先打印一个分隔符
+                if warnings.total:
+                     print("\n---\n", file=sys.stdout)
+                if binary:
+                    sys.stdout.flush()  # 分隔符等已写入文本层的内容先输出
+                render(sys.stdout.buffer if binary else sys.stdout)
+                print()
+
+        if local_rule_sets:
+            with profiler.stage("rule-sets"):
+                rule_sets = clash_local_rule_sets(local_rule_sets.optimize_rules, local_rule_sets.cache_dir)[1]
+                write_local_rule_set_files(rule_sets, local_rule_sets)
+            print(f"{len(rule_sets)} 个 rule-set 已写入到 '{local_rule_sets.directory}'", file=sys.stderr)
+
+        if state:
+            with profiler.stage("state"):
+                state.save()
+            print(f"增量模式: 复用 {state.reused_nodes} 个节点，重新解析 {state.parsed_nodes} 个节点。", file=sys.stderr)
+
+    except Exception as e:
+        print(f"错误: 生成或写入JSON时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    profiler.report()
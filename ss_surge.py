@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ss2surge.py 的转换逻辑：解析 SOCKS 链接并生成 Surge 配置。
+作为模块导入时缓存为 .pyc，命令行入口为 ss2surge.py。
+需要与 ss_common.py 放在同一目录；--clash-rules 还需要 ss_clash.py、ss_clash_template.py、ss_rules.py。
+"""
+
+import argparse
+import sys
+import os
+import collections
+import functools
+
+from ss_common import (  # 需与本脚本位于同一目录
+    WarningSummary, ParseWarning, WARN_RENAME, WARNING_EXAMPLE_LIMIT,
+    NameDeduper, IncrementalState, parse_link_file, parse_socks_node,
+    split_fragments, write_fragments, StageProfiler, config_relative_dir, PROXIES_SENTINEL, MEMBERS_SENTINEL
+)
+
+# 包含全部节点的选择组
+SURGE_PROXY_GROUP = "PROXY_SELECT"
+# ss2clash.py 模板中直接由节点组成的策略组，在 Surge 中都对应 SURGE_PROXY_GROUP
+CLASH_NODE_GROUPS = ('🚀 节点选择', '自动选择')
+# Surge 内置策略，不需要定义策略组
+SURGE_BUILTIN_POLICIES = ('DIRECT', 'REJECT', 'REJECT-TINY', 'REJECT-DROP')
+# 与 Surge 语法相同、可以直接翻译的 Clash 规则类型
+SURGE_RULE_TYPES = ('DOMAIN', 'DOMAIN-SUFFIX', 'DOMAIN-KEYWORD', 'IP-CIDR', 'IP-CIDR6', 'GEOIP', 'PROCESS-NAME')
+# 外部规则列表文件的扩展名
+RULE_LIST_EXTENSION = ".list"
+
+# --clash-rules 的参数：cache_dir 为 ss2clash.py 的模板缓存目录，optimize_rules 同 ss2clash.py --optimize-rules，
+# list_directory 不为空时把规则拆分为外部 .list 文件写入该目录，配置中以 path_prefix 引用
+ClashRuleOptions = collections.namedtuple('ClashRuleOptions', 'cache_dir optimize_rules list_directory path_prefix')
+
+
+def surge_proxy_name(node):
+    """由节点名称生成 Surge 代理名称。"""
+    # Surge 代理名称中不应包含某些特殊字符，这里简单替换空格为下划线，可以根据需要扩展
+    return node.name.replace(" ", "_")
+
+
+def surge_proxy_line(proxy_name, node):
+    """生成节点对应的 Surge 代理行字符串。"""
+    # Surge SOCKS5 代理行格式:
+    # ProxyName = socks5, server, port, username=user, password=pass, udp-relay=true
+    # ProxyName = socks5, server, port, udp-relay=true (无认证)
+    
+    proxy_line_parts = [
+        f"{proxy_name} = socks5",
+        node.server,
+        str(node.port)
+    ]
+
+    username = node.username
+    password = node.password
+
+    if username and password:
+        proxy_line_parts.append(f"username={username}")
+        proxy_line_parts.append(f"password={password}")
+    elif username: # 如 socks://Og%3D%3D@...
+        proxy_line_parts.append(f"password={username}") # 假设单个凭证是密码
+    elif password:
+        proxy_line_parts.append(f"password={password}")
+    
+    proxy_line_parts.append("udp-relay=true") # 默认启用 UDP 转发
+
+    return ", ".join(proxy_line_parts)
+
+
+def parse_socks_link_for_surge(line_number, link_string):
+    """
+    解析单条SOCKS链接字符串并转换为Surge代理行字符串和代理名称。
+    返回 (proxy_name, proxy_line_string) 或 (None, None)。
+    """
+    node = parse_socks_node(line_number, link_string)
+    if not node:
+        return None, None
+
+    proxy_name = surge_proxy_name(node)
+    return proxy_name, surge_proxy_line(proxy_name, node)
+
+
+def surge_policy(group):
+    """Clash 策略组在 Surge 中对应的策略名。"""
+    return SURGE_PROXY_GROUP if group in CLASH_NODE_GROUPS else group
+
+
+def translate_clash_rules(rules, skipped):
+    """
+    把 Clash 规则逐条翻译为 Surge 规则行 (生成器)，策略组按 surge_policy 映射，MATCH 翻译为 FINAL。
+    Surge 不支持的规则类型跳过，并按类型计入 skipped (collections.Counter)。
+    """
+    from ss_rules import NO_VALUE_RULE_TYPES, split_rule, join_rule  # 只在使用 --clash-rules 时导入
+
+    for rule in rules:
+        rule_type, value, target, options = split_rule(rule)
+        if target is None:
+            skipped[rule_type] += 1
+        elif rule_type in NO_VALUE_RULE_TYPES:
+            yield join_rule('FINAL', None, surge_policy(target), options)
+        elif rule_type in SURGE_RULE_TYPES:
+            yield join_rule(rule_type, value, surge_policy(target), options)
+        else:
+            skipped[rule_type] += 1
+
+
+@functools.lru_cache(maxsize=None)
+def clash_surge_rules(options):
+    """
+    读取 ss2clash.py 模板的规则和策略组并翻译为 Surge 格式，返回 (策略组行列表, 规则行列表, [RuleList, ...])。
+    规则只遍历一遍；options.list_directory 不为空时连续同策略组的规则拆分为外部 .list 文件
+    (见 ss_rules.split_rule_lists)，规则行中以 RULE-SET 引用。策略组行按模板中的顺序列出规则用到的策略组，
+    组成员同样按 surge_policy 映射。同一进程内只计算一次，警告也只打印一次。
+    """
+    import ss_clash  # 模板很大，只在使用 --clash-rules 时导入
+    from ss_rules import split_rule, join_rule, split_rule_lists
+
+    clash_config = ss_clash.load_clash_template(options.cache_dir)
+    rules = ss_clash.optimized_template_rules(options.cache_dir) if options.optimize_rules else clash_config['rules']
+    skipped = collections.Counter()
+    rule_lines = list(translate_clash_rules(rules, skipped))
+    for rule_type, count in skipped.items():
+        print(f"警告: Surge 不支持 {rule_type} 规则，已跳过 {count} 条。", file=sys.stderr)
+
+    rule_lists = []
+    if options.list_directory:
+        rule_lines, rule_lists = split_rule_lists(rule_lines)
+        rule_lines = [join_rule('RULE-SET', f"{options.path_prefix}/{value}{RULE_LIST_EXTENSION}", target)
+                      if rule_type == 'RULE-SET' else rule
+                      for rule, (rule_type, value, target, _) in ((rule, split_rule(rule)) for rule in rule_lines)]
+
+    used_policies = {split_rule(rule)[2] for rule in rule_lines}
+    group_lines = []
+    for group in clash_config.get('proxy-groups', []):
+        name = surge_policy(group['name'])
+        if name not in used_policies or name == SURGE_PROXY_GROUP or name in SURGE_BUILTIN_POLICIES:
+            continue
+        members = list(dict.fromkeys(surge_policy(member) for member in group.get('proxies', [])))
+        group_lines.append(f"{name} = select, {', '.join(members or [SURGE_PROXY_GROUP])}")
+    return group_lines, rule_lines, rule_lists
+
+
+def write_rule_list_files(rule_lists, directory):
+    """把 RuleList 写为 Surge 的 .list 文件 (每行一条不带策略组的规则)。"""
+    os.makedirs(directory, exist_ok=True)
+    for rule_list in rule_lists:
+        with open(os.path.join(directory, rule_list.name + RULE_LIST_EXTENSION), 'w', encoding='utf-8') as f_out:
+            f_out.write(''.join(f"{line}\n" for line in rule_list.lines))
+
+
+def build_surge_config(proxy_lines, proxy_names_for_group, clash_rules=None):
+    """
+    由代理行和代理名称构建完整的 Surge 配置文本。
+    clash_rules (ClashRuleOptions) 不为空时，[Proxy Group] 和 [Rule] 改用 ss2clash.py 模板翻译出的策略组和规则。
+    """
+    config_parts = []
+
+    # [General]
+    config_parts.append("[General]")
+    config_parts.append("loglevel = notify")
+    config_parts.append("dns-server = system, 223.5.5.5, 119.29.29.29, 1.1.1.1") # 添加 system DNS 和一些公共DNS
+    config_parts.append("skip-proxy = 127.0.0.1, 192.168.0.0/16, 10.0.0.0/8, 172.16.0.0/12, localhost, *.local, captive.apple.com")
+    config_parts.append("bypass-tun = 192.168.0.0/16, 10.0.0.0/8, 172.16.0.0/12")
+    config_parts.append("external-controller-access = admin@0.0.0.0:6170") # 示例，按需修改密码和端口
+    config_parts.append("show-error-page-for-reject = true")
+    config_parts.append("http-listen = 0.0.0.0:6152") # HTTP代理端口
+    config_parts.append("socks5-listen = 0.0.0.0:6153") # SOCKS5代理端口
+    config_parts.append("always-real-ip = *.apple.com, *.icloud.com") # 示例
+    config_parts.append("") # 空行分隔
+
+    # [Replica] (可选，如果需要同步设备间的配置)
+    # config_parts.append("[Replica]")
+    # config_parts.append("device_id = xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx") # 替换为你的设备ID
+    # config_parts.append("icloud_container_enabled = true")
+    # config_parts.append("")
+
+    # [Proxy]
+    config_parts.append("[Proxy]")
+    config_parts.extend(proxy_lines)
+    config_parts.append("") # 空行分隔
+
+    # [Proxy Group]
+    config_parts.append("[Proxy Group]")
+    select_group_proxies = ", ".join(proxy_names_for_group + ["DIRECT"])
+    config_parts.append(f"PROXY_SELECT = select, {select_group_proxies}")
+    # 可以添加一个 URL-Test 组作为示例
+    # url_test_proxies = ", ".join(proxy_names_for_group)
+    # if url_test_proxies: # 确保有代理才创建
+    #     config_parts.append(f"AUTO_SPEED_TEST = url-test, {url_test_proxies}, url = http://www.gstatic.com/generate_204, interval = 300, tolerance = 100")
+    if clash_rules:
+        group_lines, rule_lines, _ = clash_surge_rules(clash_rules)
+        config_parts.extend(group_lines)
+        config_parts.append("")
+        config_parts.append("[Rule]")
+        config_parts.extend(rule_lines)
+        config_parts.append("")
+        return "\n".join(config_parts)
+    config_parts.append("") # 空行分隔
+
+    # [Rule]
+    config_parts.append("[Rule]")
+    config_parts.append("# Localhost & LAN")
+    config_parts.append("DOMAIN-SUFFIX,local,DIRECT")
+    config_parts.append("IP-CIDR,127.0.0.1/32,DIRECT") # 更精确的 localhost
+    config_parts.append("IP-CIDR,192.168.0.0/16,DIRECT")
+    config_parts.append("IP-CIDR,10.0.0.0/8,DIRECT")
+    config_parts.append("IP-CIDR,172.16.0.0/12,DIRECT")
+    config_parts.append("# Common China GeoIP Rule")
+    config_parts.append("GEOIP,CN,DIRECT")
+    config_parts.append("# Common Ad Block (example, needs a ruleset)")
+    config_parts.append("# RULE-SET,https://raw.githubusercontent.com/DivineEngine/Profiles/master/Surge/Ruleset/Guard/Advertising.list,REJECT")
+    config_parts.append("# Final Rule")
+    config_parts.append("FINAL,PROXY_SELECT") # 默认走选择的代理
+    config_parts.append("")
+
+    return "\n".join(config_parts)
+
+
+def surge_template_fragments(clash_rules=None):
+    """
+    用占位名称渲染配置，切分为静态片段和 ('proxies', '\\n')、('members', ', ') 两类占位。
+    Surge 配置由代码直接拼接，切分本身开销很小，因此每次重新生成，不存入状态文件。
+    """
+    return split_fragments(build_surge_config([PROXIES_SENTINEL], [MEMBERS_SENTINEL], clash_rules), {
+        PROXIES_SENTINEL: ('proxies', '\n'),
+        MEMBERS_SENTINEL: ('members', ', ')
+    })
+
+
+def write_surge_incremental(nodes, proxy_names, out, state, clash_rules=None):
+    """
+    增量模式的输出：未变化节点的代理行取自 state (ss_common.IncrementalState)，只渲染新增或改动的节点。
+    输出与 build_surge_config 的结果逐字节相同。
+    """
+    pieces = {
+        'proxies': [state.piece(('proxy', name, node.server, node.port, node.username, node.password),
+                                lambda name=name, node=node: surge_proxy_line(name, node))
+                    for name, node in zip(proxy_names, nodes)],
+        'members': proxy_names
+    }
+    write_fragments(surge_template_fragments(clash_rules), pieces, out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="将TXT文件中的SOCKS链接转换为Surge .conf配置。")
+    parser.add_argument("input_file", help="包含SOCKS链接的TXT文件路径 (每行一个链接)。")
+    parser.add_argument("-o", "--output-file", help="保存生成的Surge .conf文件的路径。如果未提供，则打印到标准输出。")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="解析链接使用的进程数 (默认 1)。超大文件可设为CPU核数，输出与单进程完全一致。")
+    parser.add_argument("--clash-rules", action="store_true", help="把 ss2clash.py 模板的全部规则和策略组翻译为 Surge 规则，代替内置的几条示例规则。")
+    parser.add_argument("--rule-lists", metavar="DIR", help="把翻译出的规则按策略组拆分为外部 .list 文件写入 DIR，主配置只保留 RULE-SET 引用 (隐含 --clash-rules)。")
+    parser.add_argument("--optimize-rules", action="store_true", help="翻译前按 ss2clash.py --optimize-rules 精简规则，匹配结果不变 (隐含 --clash-rules)。")
+    parser.add_argument("--no-template-cache", action="store_true", help="不读写 ss2clash.py 的模板解析缓存。")
+    parser.add_argument("--state", help="增量模式的状态文件路径。未变化的链接直接复用上次的结果 (此模式下忽略 --jobs)。")
+    parser.add_argument("--warning-limit", type=int, default=WARNING_EXAMPLE_LIMIT, metavar="N", help=f"每种警告 (无效协议、缺少主机或端口、解析错误、重名) 只显示前 N 条，其余只计数并在最后汇总 (默认 {WARNING_EXAMPLE_LIMIT})。")
+    parser.add_argument("--warnings-json", metavar="FILE", help="把按原因汇总的警告 (条数和前 N 条示例) 写为 JSON 文件。")
+    parser.add_argument("--profile", action="store_true", help="在标准错误中报告各阶段的墙钟时间、CPU 时间和峰值内存 (tracemalloc 会明显拖慢运行)。")
+    parser.add_argument("--profile-output", help="同时用 cProfile 记录运行过程，并把 pstats 结果写入该文件 (隐含 --profile)。")
+
+    args = parser.parse_args()
+
+    nodes = []
+    deduper = NameDeduper()
+    proxy_names_for_group = deduper.names # 用于[Proxy Group]，与 nodes 一一对应
+    state = IncrementalState(args.state, 'surge') if args.state else None
+    profiler = StageProfiler(args.profile, args.profile_output)
+    warnings = WarningSummary(args.warning_limit)  # 按原因计数，只保留前 N 条示例，内存占用与输入大小无关
+
+    clash_rules = None
+    if args.clash_rules or args.rule_lists or args.optimize_rules:
+        import ss_clash
+        cache_dir = None if args.no_template_cache else ss_clash.TEMPLATE_CACHE_DIR
+        # Surge 以配置文件所在目录解析 RULE-SET 的相对路径
+        path_prefix = config_relative_dir(args.rule_lists, args.output_file) if args.rule_lists else None
+        clash_rules = ClashRuleOptions(cache_dir, args.optimize_rules, args.rule_lists, path_prefix)
+
+    try:
+        with profiler.stage("parse"):  # 读取、解析和去重
+            node_source = state.iter_nodes(args.input_file, warnings) if state else parse_link_file(args.input_file, args.jobs, warnings)
+            for line_number, node in node_source:
+                # 处理潜在的重名节点
+                original_name = surge_proxy_name(node)
+                name_to_check = deduper.claim(original_name)
+            
+                if name_to_check != original_name:
+                    warnings(ParseWarning(WARN_RENAME, line_number, f"代理名称 '{original_name}' 重复。已重命名为 '{name_to_check}'。"))
+
+                nodes.append(node)
+
+    except FileNotFoundError:
+        print(f"错误: 输入文件 '{args.input_file}' 未找到。", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"错误: 读取或处理文件 '{args.input_file}' 时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    warnings.report()
+    if args.warnings_json:
+        warnings.write_json(args.warnings_json)
+
+    if not nodes:
+        print("输入文件中未找到有效的SOCKS链接。未生成Surge配置。", file=sys.stderr)
+        sys.exit(0)
+
+    if state:
+        # 增量模式：未变化节点的代理行直接复用，只渲染改动的部分
+        render = lambda out: write_surge_incremental(nodes, proxy_names_for_group, out, state, clash_rules)
+    else:
+        # 构建Surge配置文本 (代理行到输出前才生成)
+        with profiler.stage("template"):
+            proxy_lines = (surge_proxy_line(name, node) for name, node in zip(proxy_names_for_group, nodes))
+            surge_config_output = build_surge_config(proxy_lines, proxy_names_for_group, clash_rules)
+        render = lambda out: out.write(surge_config_output)
+
+    try:
+        with profiler.stage("write"):  # 序列化并写出
+            if args.output_file:
+                with open(args.output_file, 'w', encoding='utf-8') as f_out:
+                    render(f_out)
+                print(f"Surge 配置已成功写入到 '{args.output_file}'")
+            else:
+                if warnings.total:
+                     print("\n---\n")
+                render(sys.stdout)
+                print()
+
+        if clash_rules and clash_rules.list_directory:
+            with profiler.stage("lists"):
+                rule_lists = clash_surge_rules(clash_rules)[2]
+                write_rule_list_files(rule_lists, clash_rules.list_directory)
+            print(f"{len(rule_lists)} 个规则列表已写入到 '{clash_rules.list_directory}'", file=sys.stderr)
+
+        if state:
+            with profiler.stage("state"):
+                state.save()
+            print(f"增量模式: 复用 {state.reused_nodes} 个节点，重新解析 {state.parsed_nodes} 个节点。", file=sys.stderr)
+
+    except Exception as e:
+        print(f"错误: 生成或写入Surge配置文件时发生错误: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    profiler.report()